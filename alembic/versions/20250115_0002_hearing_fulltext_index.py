@@ -0,0 +1,37 @@
+"""Full-text search index on hearings.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-01-15
+
+Adds:
+- hearings.search_vector: stored tsvector over title (weight A) and full_text (weight B)
+- ix_hearings_search_vector: GIN index used by SearchService.search_transcripts
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        ALTER TABLE hearings ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(full_text, '')), 'B')
+        ) STORED
+    """)
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS ix_hearings_search_vector ON hearings USING gin (search_vector)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS ix_hearings_search_vector')
+    op.execute('ALTER TABLE hearings DROP COLUMN IF EXISTS search_vector')
@@ -0,0 +1,50 @@
+"""Durable pipeline job queue.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-01-20
+
+Adds:
+- pipeline_jobs: stage runs leased by `psc worker` processes
+- ix_pipeline_jobs_status_run_after: index used to find the next due job
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'pipeline_jobs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('uuid_generate_v4()')),
+        sa.Column('kind', sa.String(50), nullable=False),
+        sa.Column('payload', postgresql.JSONB, nullable=False, server_default='{}'),
+        sa.Column('run_id', sa.String(64), index=True),
+        sa.Column('status', sa.String(20), nullable=False, server_default='queued'),
+        sa.Column('priority', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('attempts', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('max_attempts', sa.Integer, nullable=False, server_default='3'),
+        sa.Column('run_after', sa.DateTime, nullable=False, server_default=sa.text("(now() at time zone 'utc')")),
+        sa.Column('locked_by', sa.String(100)),
+        sa.Column('locked_at', sa.DateTime),
+        sa.Column('heartbeat_at', sa.DateTime),
+        sa.Column('finished_at', sa.DateTime),
+        sa.Column('last_error', sa.Text),
+        sa.Column('result', postgresql.JSONB),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index('ix_pipeline_jobs_status_run_after', 'pipeline_jobs', ['status', 'run_after'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pipeline_jobs_status_run_after', table_name='pipeline_jobs')
+    op.drop_table('pipeline_jobs')
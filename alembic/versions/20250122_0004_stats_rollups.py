@@ -0,0 +1,65 @@
+"""Precomputed stats rollups.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-01-22
+
+Adds:
+- stats_rollups: additive dashboard counters per state, day, metric and
+  dimension, maintained by src.core.services.stats
+- ix_hearings_created_at: recent-hearing counts on /api/stats
+
+Backfills the counters from the existing hearings, segments and analyses
+(the same buckets `psc db reconcile-stats` computes).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'stats_rollups',
+        sa.Column('state_code', sa.String(2), primary_key=True),
+        sa.Column('day', sa.Date, primary_key=True),
+        sa.Column('metric', sa.String(50), primary_key=True),
+        sa.Column('dimension', sa.String(100), primary_key=True, server_default=''),
+        sa.Column('value', sa.Numeric(18, 4), nullable=False, server_default='0'),
+    )
+    op.create_index('ix_hearings_created_at', 'hearings', ['created_at'])
+
+    op.execute("""
+        INSERT INTO stats_rollups (state_code, day, metric, dimension, value)
+        SELECT state_code, date(created_at), 'hearings', '', COUNT(*)
+        FROM hearings GROUP BY 1, 2
+        UNION ALL
+        SELECT state_code, date(created_at), 'hearings_by_status', COALESCE(transcript_status, ''), COUNT(*)
+        FROM hearings GROUP BY 1, 2, 4
+        UNION ALL
+        SELECT state_code, date(created_at), 'duration_seconds', '', SUM(duration_seconds)
+        FROM hearings WHERE duration_seconds IS NOT NULL GROUP BY 1, 2
+        UNION ALL
+        SELECT state_code, date(created_at), 'transcription_cost', COALESCE(whisper_model, ''), SUM(processing_cost_usd)
+        FROM hearings WHERE processing_cost_usd IS NOT NULL GROUP BY 1, 2, 4
+        UNION ALL
+        SELECT h.state_code, date(h.created_at), 'segments', '', COUNT(*)
+        FROM transcript_segments s JOIN hearings h ON h.id = s.hearing_id GROUP BY 1, 2
+        UNION ALL
+        SELECT h.state_code, date(a.created_at), 'analyses', '', COUNT(*)
+        FROM analyses a JOIN hearings h ON h.id = a.hearing_id GROUP BY 1, 2
+        UNION ALL
+        SELECT h.state_code, date(a.created_at), 'analysis_cost', COALESCE(a.model, ''), SUM(a.cost_usd)
+        FROM analyses a JOIN hearings h ON h.id = a.hearing_id WHERE a.cost_usd IS NOT NULL GROUP BY 1, 2, 4
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_hearings_created_at', table_name='hearings')
+    op.drop_table('stats_rollups')
@@ -0,0 +1,41 @@
+"""Segment embeddings for hybrid search.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-01-24
+
+Adds:
+- transcript_segments.embedding: vector(1536), filled by the embed stage
+- ix_segments_embedding: ivfflat (cosine) index for nearest-neighbour queries
+- ix_segments_text_search: GIN index over to_tsvector('english', text) for
+  the full-text half of /api/search/semantic
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('ALTER TABLE transcript_segments ADD COLUMN IF NOT EXISTS embedding vector(1536)')
+    # ivfflat lists ~ rows / 1000 up to 1M rows; rebuild (REINDEX) once the
+    # table has grown well past the size it was built at
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS ix_segments_embedding ON transcript_segments '
+        'USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100)'
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_segments_text_search ON transcript_segments "
+        "USING gin (to_tsvector('english', text))"
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS ix_segments_text_search')
+    op.execute('DROP INDEX IF EXISTS ix_segments_embedding')
+    op.execute('ALTER TABLE transcript_segments DROP COLUMN IF EXISTS embedding')
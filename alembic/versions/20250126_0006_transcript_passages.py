@@ -0,0 +1,54 @@
+"""Transcript passages for phrase search.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-01-26
+
+Adds:
+- transcript_passages: overlapping windows of consecutive segments, written
+  by the transcribe stage (core.services.passages)
+- transcript_passages.search_vector: stored tsvector with a GIN index, for
+  /api/search/passages
+
+Hearings transcribed before this revision get passages from
+`psc pipeline passages`.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'transcript_passages',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('uuid_generate_v4()')),
+        sa.Column('hearing_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('hearings.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('passage_index', sa.Integer, nullable=False),
+        sa.Column('first_segment_index', sa.Integer, nullable=False),
+        sa.Column('last_segment_index', sa.Integer, nullable=False),
+        sa.Column('start_time', sa.Float),
+        sa.Column('end_time', sa.Float),
+        sa.Column('speakers', sa.String(500)),
+        sa.Column('text', sa.Text, nullable=False),
+        sa.Column('segment_offsets', sa.JSON),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index('ix_passages_hearing_index', 'transcript_passages', ['hearing_id', 'passage_index'])
+    op.execute("""
+        ALTER TABLE transcript_passages ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('english', coalesce(text, ''))) STORED
+    """)
+    op.execute('CREATE INDEX ix_passages_search_vector ON transcript_passages USING gin (search_vector)')
+
+
+def downgrade() -> None:
+    op.drop_table('transcript_passages')
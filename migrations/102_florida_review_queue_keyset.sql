@@ -0,0 +1,13 @@
+-- Keyset indexes for the entity review queue
+-- /admin/review/queue pages through pending links ordered by
+-- (COALESCE(confidence_score, -1), id); these partial indexes serve each
+-- link type's branch of that query without sorting or OFFSET scans.
+
+CREATE INDEX IF NOT EXISTS idx_fl_hearing_dockets_review_queue
+    ON fl_hearing_dockets ((COALESCE(confidence_score, -1)), id) WHERE needs_review = TRUE;
+
+CREATE INDEX IF NOT EXISTS idx_fl_hearing_utilities_review_queue
+    ON fl_hearing_utilities ((COALESCE(confidence_score, -1)), id) WHERE needs_review = TRUE;
+
+CREATE INDEX IF NOT EXISTS idx_fl_hearing_topics_review_queue
+    ON fl_hearing_topics ((COALESCE(confidence_score, -1)), id) WHERE needs_review = TRUE;
@@ -5,17 +5,45 @@ from core.services.transcription import (
     TranscriptionResult,
     TranscriptionSegment,
 )
+from core.services.transcription_cache import TranscriptionCache
+from core.services.job_queue import JobQueue, JobWorker
 from core.services.llm import (
     LLMService,
     LLMResponse,
     Message,
+    OpenAILLMService,
+    get_llm_service,
 )
+from core.services.llm_batch import (
+    BatchRequest,
+    BatchStore,
+    LocalBatchProvider,
+    OpenAIBatchProvider,
+)
+from core.services.stats_rollup import RollupStore, RollupTracker
+from core.services.passages import build_passages, match_start_time
+from core.services.export import EXPORT_FORMATS, export_chunks
 
 __all__ = [
     'TranscriptionService',
     'TranscriptionResult',
     'TranscriptionSegment',
+    'TranscriptionCache',
+    'JobQueue',
+    'JobWorker',
     'LLMService',
     'LLMResponse',
     'Message',
+    'OpenAILLMService',
+    'get_llm_service',
+    'BatchRequest',
+    'BatchStore',
+    'LocalBatchProvider',
+    'OpenAIBatchProvider',
+    'RollupStore',
+    'RollupTracker',
+    'build_passages',
+    'match_start_time',
+    'EXPORT_FORMATS',
+    'export_chunks',
 ]
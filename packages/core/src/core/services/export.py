@@ -0,0 +1,167 @@
+"""
+Streaming transcript exports.
+
+Turns an iterable of row dicts into NDJSON, CSV, WebVTT or SRT text,
+one chunk at a time, so an export endpoint can hand the generator to a
+streaming response and never hold more than a chunk in memory:
+
+    rows = (row._asdict() for row in query.yield_per(1000))
+    chunks = export_chunks(rows, "csv", SEGMENT_FIELDS)
+
+NDJSON and CSV take any rows; WebVTT and SRT are subtitle cues and need
+start_time, end_time and text (speaker, if present, becomes the cue's
+voice). Values JSON can't encode (dates, UUIDs) are written as strings.
+"""
+
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+# Format name -> media type
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "vtt": "text/vtt; charset=utf-8",
+    "srt": "application/x-subrip; charset=utf-8",
+}
+
+# Subtitle formats (timestamps relative to one recording)
+CUE_FORMATS = ("vtt", "srt")
+
+# Default columns for segment exports
+SEGMENT_FIELDS = [
+    "hearing_id",
+    "segment_index",
+    "start_time",
+    "end_time",
+    "speaker",
+    "speaker_role",
+    "text",
+]
+
+# Target size of each streamed chunk
+CHUNK_SIZE = 64 * 1024
+
+
+def cue_timestamp(seconds: Optional[float], separator: str = ".") -> str:
+    """HH:MM:SS.mmm (WebVTT) or HH:MM:SS,mmm (SRT, separator=",")."""
+    millis = int(round((seconds or 0) * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+def _cue_text(row: Dict[str, Any]) -> str:
+    # A blank line ends a cue, so collapse the text onto one line
+    return " ".join((row.get("text") or "").split())
+
+
+def ndjson_lines(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """One JSON object per line."""
+    for row in rows:
+        yield json.dumps(row, default=str, ensure_ascii=False) + "\n"
+
+
+def csv_lines(rows: Iterable[Dict[str, Any]], fields: Sequence[str]) -> Iterator[str]:
+    """Header row, then one line per row (missing fields are empty)."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(fields), extrasaction="ignore")
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # Header alone when there are no rows
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def vtt_lines(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """WebVTT cues; speakers become <v> voice spans."""
+    yield "WEBVTT\n\n"
+    for row in rows:
+        text = _cue_text(row)
+        if row.get("speaker"):
+            text = f"<v {row['speaker']}>{text}"
+        yield (
+            f"{cue_timestamp(row.get('start_time'))} --> {cue_timestamp(row.get('end_time'))}\n"
+            f"{text}\n\n"
+        )
+
+
+def srt_lines(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """SRT cues, numbered from 1; speakers prefix the text."""
+    for number, row in enumerate(rows, start=1):
+        text = _cue_text(row)
+        if row.get("speaker"):
+            text = f"{row['speaker']}: {text}"
+        yield (
+            f"{number}\n"
+            f"{cue_timestamp(row.get('start_time'), ',')} --> {cue_timestamp(row.get('end_time'), ',')}\n"
+            f"{text}\n\n"
+        )
+
+
+def export_lines(
+    rows: Iterable[Dict[str, Any]],
+    fmt: str,
+    fields: Sequence[str] = SEGMENT_FIELDS,
+) -> Iterator[str]:
+    """Lines of rows in an export format."""
+    if fmt == "ndjson":
+        return ndjson_lines(rows)
+    if fmt == "csv":
+        return csv_lines(rows, fields)
+    if fmt == "vtt":
+        return vtt_lines(rows)
+    if fmt == "srt":
+        return srt_lines(rows)
+    raise ValueError(f"Unknown export format: {fmt}")
+
+
+def export_chunks(
+    rows: Iterable[Dict[str, Any]],
+    fmt: str,
+    fields: Sequence[str] = SEGMENT_FIELDS,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    UTF-8 chunks of about chunk_size bytes.
+
+    Lines are batched so a large export isn't sent as one write (and one
+    network frame) per row.
+    """
+    pending: List[str] = []
+    size = 0
+    for line in export_lines(rows, fmt, fields):
+        pending.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield "".join(pending).encode()
+            pending, size = [], 0
+    if pending:
+        yield "".join(pending).encode()
+
+
+def export_filename(stem: str, fmt: str) -> str:
+    """Download filename for an export (ASCII, safe in a quoted header value)."""
+    safe = "".join(c if (c.isascii() and c.isalnum()) or c in "-_." else "_" for c in stem)
+    return f"{safe or 'export'}.{fmt}"
+
+
+__all__ = [
+    'EXPORT_FORMATS',
+    'CUE_FORMATS',
+    'SEGMENT_FIELDS',
+    'cue_timestamp',
+    'ndjson_lines',
+    'csv_lines',
+    'vtt_lines',
+    'srt_lines',
+    'export_lines',
+    'export_chunks',
+    'export_filename',
+]
@@ -0,0 +1,440 @@
+"""
+Durable database-backed job queue.
+
+Jobs are rows in a table (see the job models) rather than in-process
+state, so queued work survives restarts and can be processed by any
+number of worker processes on any number of hosts.
+
+- Leasing: workers claim the next due job with SELECT ... FOR UPDATE
+  SKIP LOCKED on PostgreSQL, so concurrent workers never block on or
+  double-claim a row. SQLite has no row locks; there the claim is a
+  conditional UPDATE and a worker that loses the race just polls again.
+- Heartbeats: a running job's heartbeat_at is refreshed while its handler
+  runs. Jobs whose heartbeat is older than the lease are requeued (the
+  worker died or lost its connection).
+- Retries: failed jobs go back to the queue with exponential backoff
+  until max_attempts, then stay failed with the last error.
+
+The queue works on any model with the columns of the job models
+(kind, payload, status, priority, attempts, max_attempts, run_after,
+locked_by, locked_at, heartbeat_at, finished_at, last_error, result,
+run_id, created_at).
+"""
+
+import logging
+import os
+import random
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Job statuses
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+PAUSED = "paused"
+
+# Handler: (payload, db) -> result dict. Raising marks the attempt failed.
+JobHandler = Callable[[Dict[str, Any], Session], Optional[Dict[str, Any]]]
+
+
+class JobQueue:
+    """
+    Enqueue, lease and settle jobs stored in a table.
+
+    Usage:
+        queue = JobQueue(PipelineJob)
+        queue.enqueue(db, "transcribe", {"hearing_id": "..."}, run_id=run_id)
+        db.commit()
+
+        job = queue.lease(db, worker_id)
+        ...
+        queue.complete(db, job.id, worker_id, {"cost_usd": 0.12})
+    """
+
+    def __init__(
+        self,
+        model,
+        lease_seconds: int = 300,
+        backoff_base_seconds: int = 30,
+        backoff_max_seconds: int = 3600,
+    ):
+        self.model = model
+        self.lease_seconds = lease_seconds
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+
+    def enqueue(
+        self,
+        db: Session,
+        kind: str,
+        payload: Dict[str, Any],
+        run_id: Optional[str] = None,
+        priority: int = 0,
+        max_attempts: int = 3,
+        run_after: Optional[datetime] = None,
+    ):
+        """Add a job to the session. The caller commits."""
+        job = self.model(
+            kind=kind,
+            payload=payload,
+            run_id=run_id,
+            status=QUEUED,
+            priority=priority,
+            attempts=0,
+            max_attempts=max_attempts,
+            run_after=run_after or datetime.utcnow(),
+        )
+        db.add(job)
+        return job
+
+    def lease(self, db: Session, worker_id: str):
+        """
+        Claim the next due job for worker_id.
+
+        Returns:
+            The job (status running, attempts incremented) or None
+        """
+        Job = self.model
+        now = datetime.utcnow()
+
+        stmt = (
+            select(Job.id)
+            .where(Job.status == QUEUED, Job.run_after <= now)
+            .order_by(Job.priority.desc(), Job.run_after, Job.id)
+            .limit(1)
+        )
+        if db.get_bind().dialect.name == "postgresql":
+            stmt = stmt.with_for_update(skip_locked=True)
+
+        job_id = db.execute(stmt).scalar()
+        if job_id is None:
+            db.rollback()
+            return None
+
+        # On PostgreSQL the row is locked and this always matches; on
+        # SQLite another worker may have claimed it since the SELECT
+        claimed = db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == QUEUED)
+            .values(
+                status=RUNNING,
+                attempts=Job.attempts + 1,
+                locked_by=worker_id,
+                locked_at=now,
+                heartbeat_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+
+        if not claimed:
+            return None
+        return db.get(Job, job_id, populate_existing=True)
+
+    def heartbeat(self, db: Session, job_id: Any, worker_id: str) -> bool:
+        """
+        Extend the lease on a running job.
+
+        Returns:
+            False if the job is no longer leased by worker_id
+        """
+        Job = self.model
+        updated = db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.locked_by == worker_id, Job.status == RUNNING)
+            .values(heartbeat_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+        return bool(updated)
+
+    def complete(
+        self,
+        db: Session,
+        job_id: Any,
+        worker_id: str,
+        result: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Mark a leased job succeeded.
+
+        Whatever else the handler left in the session (e.g. follow-up jobs)
+        is committed in the same transaction, or discarded if the job is no
+        longer leased by worker_id.
+        """
+        Job = self.model
+        updated = db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.locked_by == worker_id, Job.status == RUNNING)
+            .values(
+                status=SUCCEEDED,
+                result=result or {},
+                finished_at=datetime.utcnow(),
+                locked_by=None,
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not updated:
+            db.rollback()
+            return False
+        db.commit()
+        return True
+
+    def fail(self, db: Session, job_id: Any, worker_id: str, error: str) -> bool:
+        """
+        Record a failed attempt.
+
+        The job is requeued with exponential backoff if it has attempts
+        left, otherwise it is marked failed.
+        """
+        Job = self.model
+        job = db.get(Job, job_id, populate_existing=True)
+        if not job or job.locked_by != worker_id or job.status != RUNNING:
+            db.rollback()
+            return False
+
+        now = datetime.utcnow()
+        job.last_error = error[:2000]
+        job.locked_by = None
+        if job.attempts < job.max_attempts:
+            job.status = QUEUED
+            job.run_after = now + timedelta(seconds=self.backoff_seconds(job.attempts))
+        else:
+            job.status = FAILED
+            job.finished_at = now
+        db.commit()
+        return True
+
+    def backoff_seconds(self, attempts: int) -> float:
+        """Exponential backoff with up to 10% jitter."""
+        delay = min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** (attempts - 1))
+        return delay * random.uniform(1.0, 1.1)
+
+    def requeue_expired(self, db: Session) -> int:
+        """
+        Requeue running jobs whose heartbeat is older than the lease.
+
+        Jobs that have used all their attempts are failed instead.
+
+        Returns:
+            Number of jobs recovered
+        """
+        Job = self.model
+        now = datetime.utcnow()
+        expired = (
+            Job.status == RUNNING,
+            Job.heartbeat_at < now - timedelta(seconds=self.lease_seconds),
+        )
+
+        requeued = db.execute(
+            update(Job)
+            .where(*expired, Job.attempts < Job.max_attempts)
+            .values(status=QUEUED, run_after=now, locked_by=None, last_error="Lease expired")
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        failed = db.execute(
+            update(Job)
+            .where(*expired, Job.attempts >= Job.max_attempts)
+            .values(status=FAILED, finished_at=now, locked_by=None, last_error="Lease expired")
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+
+        if requeued or failed:
+            logger.warning(f"Recovered {requeued + failed} jobs with expired leases")
+        return requeued + failed
+
+    def set_status(
+        self,
+        db: Session,
+        from_status: str,
+        to_status: str,
+        run_id: Optional[str] = None,
+    ) -> int:
+        """
+        Move all jobs in from_status to to_status (e.g. pause/resume/cancel
+        queued work). Running jobs are left to finish.
+        """
+        Job = self.model
+        stmt = update(Job).where(Job.status == from_status)
+        if run_id:
+            stmt = stmt.where(Job.run_id == run_id)
+        values = {"status": to_status}
+        if to_status == CANCELLED:
+            values["finished_at"] = datetime.utcnow()
+        updated = db.execute(
+            stmt.values(**values).execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+        return updated
+
+    def counts(self, db: Session, run_id: Optional[str] = None) -> Dict[str, int]:
+        """Job counts by status."""
+        Job = self.model
+        query = db.query(Job.status, func.count(Job.id)).group_by(Job.status)
+        if run_id:
+            query = query.filter(Job.run_id == run_id)
+        return dict(query.all())
+
+    def run_jobs(self, db: Session, run_id: str) -> List[Any]:
+        """All jobs belonging to a run."""
+        Job = self.model
+        return db.query(Job).filter(Job.run_id == run_id).order_by(Job.created_at).all()
+
+    def run_cost(self, db: Session, run_id: str) -> float:
+        """Total cost_usd reported by the succeeded jobs of a run."""
+        Job = self.model
+        results = db.query(Job.result).filter(
+            Job.run_id == run_id, Job.status == SUCCEEDED
+        ).all()
+        return sum(float((r.result or {}).get("cost_usd") or 0) for r in results)
+
+
+def default_worker_id() -> str:
+    """host:pid, unique per worker process."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobWorker:
+    """
+    Leases jobs from a JobQueue and runs their handlers.
+
+    Each job runs in a fresh session from session_factory while a
+    background thread heartbeats the lease. Run several workers (threads
+    or processes) against the same table to process jobs in parallel.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        session_factory: Callable[[], Session],
+        handlers: Dict[str, JobHandler],
+        worker_id: Optional[str] = None,
+        poll_interval: float = 2.0,
+        heartbeat_interval: float = 30.0,
+    ):
+        self.queue = queue
+        self.session_factory = session_factory
+        self.handlers = handlers
+        self.worker_id = worker_id or default_worker_id()
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        """Stop after the current job finishes."""
+        self._stop_event.set()
+
+    def run(self, max_jobs: Optional[int] = None, stop_when_idle: bool = False) -> int:
+        """
+        Process jobs until stopped.
+
+        Args:
+            max_jobs: Stop after this many jobs
+            stop_when_idle: Stop when no job is due instead of polling
+
+        Returns:
+            Number of jobs processed
+        """
+        processed = 0
+        logger.info(f"Worker {self.worker_id} started")
+
+        while not self._stop_event.is_set():
+            if max_jobs is not None and processed >= max_jobs:
+                break
+
+            db = self.session_factory()
+            try:
+                self.queue.requeue_expired(db)
+                job = self.queue.lease(db, self.worker_id)
+            finally:
+                db.close()
+
+            if job is None:
+                if stop_when_idle:
+                    break
+                self._stop_event.wait(self.poll_interval)
+                continue
+
+            self.run_job(job)
+            processed += 1
+
+        logger.info(f"Worker {self.worker_id} stopped after {processed} jobs")
+        return processed
+
+    def run_job(self, job):
+        """Run a leased job's handler and settle it."""
+        handler = self.handlers.get(job.kind)
+        beat_stop = threading.Event()
+        beat = threading.Thread(
+            target=self._heartbeat_loop, args=(job.id, beat_stop), daemon=True
+        )
+        beat.start()
+
+        db = self.session_factory()
+        try:
+            if handler is None:
+                raise ValueError(f"No handler for job kind {job.kind!r}")
+
+            logger.info(f"Job {job.id} ({job.kind}) attempt {job.attempts}/{job.max_attempts}")
+            result = handler(job.payload or {}, db)
+            self.queue.complete(db, job.id, self.worker_id, result)
+
+        except Exception as e:
+            logger.exception(f"Job {job.id} ({job.kind}) failed")
+            db.rollback()
+            self.queue.fail(db, job.id, self.worker_id, str(e) or type(e).__name__)
+
+        finally:
+            beat_stop.set()
+            beat.join()
+            db.close()
+
+    def _heartbeat_loop(self, job_id: Any, beat_stop: threading.Event):
+        db = self.session_factory()
+        try:
+            while not beat_stop.wait(self.heartbeat_interval):
+                if not self.queue.heartbeat(db, job_id, self.worker_id):
+                    logger.warning(f"Lost lease on job {job_id}")
+                    return
+        except Exception:
+            logger.exception(f"Heartbeat failed for job {job_id}")
+        finally:
+            db.close()
+
+
+def run_workers(workers: List[JobWorker], **run_kwargs) -> int:
+    """Run several workers on threads in this process until all stop."""
+    if len(workers) == 1:
+        return workers[0].run(**run_kwargs)
+
+    counts = [0] * len(workers)
+
+    def target(i):
+        counts[i] = workers[i].run(**run_kwargs)
+
+    threads = [
+        threading.Thread(target=target, args=(i,), name=w.worker_id)
+        for i, w in enumerate(workers)
+    ]
+    for t in threads:
+        t.start()
+    try:
+        while any(t.is_alive() for t in threads):
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        for w in workers:
+            w.stop()
+        for t in threads:
+            t.join()
+    return sum(counts)
@@ -1,13 +1,46 @@
 """
-Abstract LLM service interface.
+LLM service interface and rate-limited OpenAI implementation.
 
 Provides a protocol for LLM-based analysis services that can be
-implemented by different providers (OpenAI, Azure, Anthropic, etc.)
+implemented by different providers (OpenAI, Azure, Anthropic, etc.),
+and OpenAILLMService, which every analysis path goes through:
+
+- Rate limiting: token buckets sized from the account's requests-per-minute
+  and tokens-per-minute budgets. A request waits until both buckets can
+  cover it (prompt tokens + max_tokens), then the token bucket is settled
+  with the usage the API reports.
+- 429 handling: Retry-After / retry-after-ms is honored and pauses every
+  caller sharing the service, not just the one that was rejected, so a
+  burst does not turn into a 429 storm. Connection errors and 5xx are
+  retried with jittered exponential backoff.
+- Connection reuse: one AsyncOpenAI client (one HTTP connection pool) per
+  service, running on a background event loop. Sync callers (pipeline
+  stages in worker threads) and async callers share it.
+
+Use get_llm_service() so all callers in a process share one limiter per
+model and API key.
 """
 
+import asyncio
+import json
+import logging
+import os
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, List, Dict, Any, Mapping, Tuple
+
+logger = logging.getLogger(__name__)
+
+# USD per 1M (input, output) tokens
+MODEL_PRICING: Dict[str, Tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+}
 
 
 @dataclass
@@ -66,4 +99,350 @@ class LLMService(ABC):
         pass
 
 
-__all__ = ['LLMResponse', 'Message', 'LLMService']
+class TokenBucket:
+    """
+    Budget of `per_minute` units, refilled continuously.
+
+    Not thread-safe; OpenAILLMService only touches its buckets from its
+    event loop.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` units are available (0 if they are now)."""
+        self._refill()
+        # A request larger than the whole budget waits for a full bucket
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self.level -= min(amount, self.capacity)
+
+    def give(self, amount: float) -> None:
+        """Return units (or charge more, with a negative amount)."""
+        self._refill()
+        self.level = min(self.capacity, self.level + amount)
+
+    def drain(self) -> None:
+        self._refill()
+        self.level = min(self.level, 0.0)
+
+
+def parse_retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """Seconds to wait from retry-after-ms / Retry-After headers, if present."""
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(0.0, float(value) / 1000.0)
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class OpenAILLMService(LLMService):
+    """
+    OpenAI chat completions behind a shared rate limiter.
+
+    Usage:
+        llm = get_llm_service("gpt-4o-mini", api_key=key,
+                              requests_per_minute=500, tokens_per_minute=200_000)
+        response = llm.complete([Message("user", prompt)], json_mode=True)
+        response = await llm.acomplete([Message("user", prompt)], json_mode=True)
+    """
+
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        api_key: Optional[str] = None,
+        requests_per_minute: int = 500,
+        tokens_per_minute: int = 200_000,
+        max_retries: int = 6,
+        backoff_base_seconds: float = 2.0,
+        backoff_max_seconds: float = 60.0,
+        timeout_seconds: float = 600.0,
+        input_cost_per_1m: Optional[float] = None,
+        output_cost_per_1m: Optional[float] = None,
+    ):
+        self.model = model
+        self.api_key = api_key
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.timeout_seconds = timeout_seconds
+
+        default_input, default_output = MODEL_PRICING.get(model, MODEL_PRICING["gpt-4o-mini"])
+        self.input_cost_per_1m = default_input if input_cost_per_1m is None else input_cost_per_1m
+        self.output_cost_per_1m = default_output if output_cost_per_1m is None else output_cost_per_1m
+
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        # Monotonic time before which no request is sent (set by 429s)
+        self.paused_until = 0.0
+
+        self._client = None
+        self._encoder = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._acquire_lock: Optional[asyncio.Lock] = None
+
+    # --- LLMService ---
+
+    def complete(
+        self,
+        messages: List[Message],
+        temperature: float = 0.2,
+        max_tokens: Optional[int] = None,
+        json_mode: bool = False,
+    ) -> LLMResponse:
+        """Blocking completion; safe to call from any number of threads."""
+        prompt_tokens = self._prompt_tokens(messages)
+        future = asyncio.run_coroutine_threadsafe(
+            self._complete(messages, prompt_tokens, temperature, max_tokens, json_mode),
+            self._ensure_loop(),
+        )
+        return future.result()
+
+    async def acomplete(
+        self,
+        messages: List[Message],
+        temperature: float = 0.2,
+        max_tokens: Optional[int] = None,
+        json_mode: bool = False,
+    ) -> LLMResponse:
+        """Async completion, awaitable from any event loop."""
+        # Tokenizing is CPU-bound; keep it off both the caller's and the service loop
+        prompt_tokens = await asyncio.to_thread(self._prompt_tokens, messages)
+        future = asyncio.run_coroutine_threadsafe(
+            self._complete(messages, prompt_tokens, temperature, max_tokens, json_mode),
+            self._ensure_loop(),
+        )
+        return await asyncio.wrap_future(future)
+
+    def count_tokens(self, text: str) -> int:
+        if self._encoder is None:
+            try:
+                import tiktoken
+                self._encoder = tiktoken.encoding_for_model("gpt-4o")
+            except Exception:
+                # Not installed, or the encoding can't be downloaded
+                logger.warning("tiktoken unavailable; estimating tokens from text length")
+                self._encoder = False
+        if self._encoder is False:
+            # ~4 characters per token for English text
+            return len(text) // 4 + 1
+        return len(self._encoder.encode(text))
+
+    def get_cost_estimate(self, input_tokens: int, output_tokens: int) -> float:
+        return (
+            (input_tokens * self.input_cost_per_1m / 1_000_000) +
+            (output_tokens * self.output_cost_per_1m / 1_000_000)
+        )
+
+    def close(self) -> None:
+        """Close the HTTP client and stop the background loop."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.close(), loop).result()
+            self._client = None
+        loop.call_soon_threadsafe(loop.stop)
+
+    # --- internals ---
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name=f"llm-{self.model}", daemon=True
+                )
+                thread.start()
+                self._loop = loop
+            return self._loop
+
+    def _get_client(self):
+        """AsyncOpenAI client, created on the service loop; retries are ours."""
+        if self._client is None:
+            from openai import AsyncOpenAI
+            self._client = AsyncOpenAI(
+                api_key=self.api_key,
+                max_retries=0,
+                timeout=self.timeout_seconds,
+            )
+        return self._client
+
+    async def _acquire(self, estimated_tokens: int) -> None:
+        """Wait until a request of estimated_tokens fits both budgets, then take it."""
+        if self._acquire_lock is None:
+            self._acquire_lock = asyncio.Lock()
+        # One waiter at a time, so requests are admitted in arrival order
+        async with self._acquire_lock:
+            while True:
+                delay = max(
+                    self.paused_until - time.monotonic(),
+                    self.request_bucket.wait_time(1),
+                    self.token_bucket.wait_time(estimated_tokens),
+                )
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+            self.request_bucket.take(1)
+            self.token_bucket.take(estimated_tokens)
+
+    def _prompt_tokens(self, messages: List[Message]) -> int:
+        """Prompt size for the token budget, counted before reaching the service loop."""
+        return sum(self.count_tokens(m.content) for m in messages)
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.backoff_max_seconds, self.backoff_base_seconds * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _complete(
+        self,
+        messages: List[Message],
+        prompt_tokens: int,
+        temperature: float,
+        max_tokens: Optional[int],
+        json_mode: bool,
+    ) -> LLMResponse:
+        import openai
+
+        estimated_tokens = prompt_tokens + (max_tokens or 1000)
+
+        kwargs: Dict[str, Any] = {
+            "model": self.model,
+            "messages": [{"role": m.role, "content": m.content} for m in messages],
+            "temperature": temperature,
+        }
+        if max_tokens:
+            kwargs["max_tokens"] = max_tokens
+        if json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+
+        last_error = ""
+        for attempt in range(self.max_retries + 1):
+            await self._acquire(estimated_tokens)
+            try:
+                response = await self._get_client().chat.completions.create(**kwargs)
+            except openai.RateLimitError as e:
+                retry_after = parse_retry_after(e.response.headers if e.response is not None else None)
+                delay = retry_after if retry_after is not None else self._backoff(attempt)
+                # Everyone sharing the limiter backs off, not just this request
+                self.paused_until = max(self.paused_until, time.monotonic() + delay)
+                self.token_bucket.drain()
+                last_error = f"Rate limited: {e}"
+                logger.warning(f"Rate limited on attempt {attempt + 1}, pausing {delay:.1f}s")
+                continue
+            except (openai.APIConnectionError, openai.InternalServerError) as e:
+                # APITimeoutError is an APIConnectionError
+                self.token_bucket.give(estimated_tokens)
+                last_error = str(e)
+                delay = self._backoff(attempt)
+                logger.warning(f"LLM request failed on attempt {attempt + 1} ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            except openai.APIError as e:
+                self.token_bucket.give(estimated_tokens)
+                return LLMResponse(success=False, model=self.model, error=str(e))
+
+            input_tokens = response.usage.prompt_tokens if response.usage else prompt_tokens
+            output_tokens = response.usage.completion_tokens if response.usage else 0
+            # Settle the estimate against what was actually used
+            self.token_bucket.give(estimated_tokens - input_tokens - output_tokens)
+
+            content = response.choices[0].message.content or ""
+            result = LLMResponse(
+                success=True,
+                content=content,
+                model=response.model or self.model,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cost_usd=self.get_cost_estimate(input_tokens, output_tokens),
+            )
+            if json_mode:
+                try:
+                    result.parsed_json = json.loads(content)
+                except json.JSONDecodeError as e:
+                    result.success = False
+                    result.error = f"Invalid JSON response: {e}"
+            return result
+
+        return LLMResponse(
+            success=False,
+            model=self.model,
+            error=f"Gave up after {self.max_retries + 1} attempts: {last_error}",
+        )
+
+
+_services: Dict[Tuple[str, Optional[str]], OpenAILLMService] = {}
+_services_lock = threading.Lock()
+
+
+def get_llm_service(
+    model: str = "gpt-4o-mini",
+    api_key: Optional[str] = None,
+    requests_per_minute: Optional[int] = None,
+    tokens_per_minute: Optional[int] = None,
+) -> OpenAILLMService:
+    """
+    Process-wide OpenAILLMService for a model and API key.
+
+    The rate budgets are taken from the first call for a given model/key
+    (default: LLM_REQUESTS_PER_MINUTE / LLM_TOKENS_PER_MINUTE env vars).
+    """
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
+    with _services_lock:
+        service = _services.get((model, api_key))
+        if service is None:
+            service = OpenAILLMService(
+                model=model,
+                api_key=api_key,
+                requests_per_minute=requests_per_minute or int(os.getenv("LLM_REQUESTS_PER_MINUTE", "500")),
+                tokens_per_minute=tokens_per_minute or int(os.getenv("LLM_TOKENS_PER_MINUTE", "200000")),
+            )
+            _services[(model, api_key)] = service
+        return service
+
+
+__all__ = [
+    'LLMResponse',
+    'Message',
+    'LLMService',
+    'MODEL_PRICING',
+    'TokenBucket',
+    'parse_retry_after',
+    'OpenAILLMService',
+    'get_llm_service',
+]
@@ -0,0 +1,390 @@
+"""
+Offline batch submission for bulk LLM work.
+
+For backfills, requests are written to a JSONL file in the OpenAI Batch
+API format, submitted as one batch, and the results are collected later
+(within the 24h completion window, at about half the per-token price).
+There is no per-request latency and no rate-limit pressure on online
+callers.
+
+- BatchProvider: submit a JSONL file, check a batch, read its results.
+  OpenAIBatchProvider uses the Batch API; LocalBatchProvider completes
+  batches from a directory with a stand-in responder, for tests and dry
+  runs.
+- BatchStore: one JSON manifest per submitted batch, recording what it
+  contains, so a later poll (e.g. the next nightly run) can ingest it.
+
+Callers choose custom_ids that identify the work item (e.g. the hearing
+id), which makes ingest idempotent: results for items that already have
+output are skipped.
+"""
+
+import json
+import logging
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.services.llm import MODEL_PRICING, LLMResponse, Message
+
+logger = logging.getLogger(__name__)
+
+# Batch API requests are billed at this fraction of the online price
+BATCH_PRICE_FACTOR = 0.5
+
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+
+# Batch statuses (OpenAI Batch API names)
+BATCH_COMPLETED = "completed"
+BATCH_FAILED = "failed"
+BATCH_EXPIRED = "expired"
+BATCH_CANCELLED = "cancelled"
+FINISHED_STATUSES = {BATCH_COMPLETED, BATCH_FAILED, BATCH_EXPIRED, BATCH_CANCELLED}
+
+# Manifest status once a finished batch's results have been ingested
+INGESTED = "ingested"
+
+
+@dataclass
+class BatchRequest:
+    """One chat completion in a batch."""
+    custom_id: str
+    messages: List[Message]
+    max_tokens: Optional[int] = None
+    temperature: float = 0.2
+    json_mode: bool = False
+
+    def to_line(self, model: str) -> Dict[str, Any]:
+        body: Dict[str, Any] = {
+            "model": model,
+            "messages": [{"role": m.role, "content": m.content} for m in self.messages],
+            "temperature": self.temperature,
+        }
+        if self.max_tokens:
+            body["max_tokens"] = self.max_tokens
+        if self.json_mode:
+            body["response_format"] = {"type": "json_object"}
+        return {
+            "custom_id": self.custom_id,
+            "method": "POST",
+            "url": CHAT_COMPLETIONS_ENDPOINT,
+            "body": body,
+        }
+
+
+@dataclass
+class BatchJob:
+    """State of a submitted batch."""
+    id: str
+    status: str
+    request_counts: Dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+
+def write_batch_file(path: Path, requests: Iterable[BatchRequest], model: str) -> int:
+    """Write requests as Batch API JSONL. Returns the number written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for request in requests:
+            f.write(json.dumps(request.to_line(model)) + "\n")
+            count += 1
+    return count
+
+
+def parse_batch_result(line: Dict[str, Any], json_mode: bool = True) -> Tuple[str, LLMResponse]:
+    """(custom_id, LLMResponse) from one line of a batch output or error file."""
+    custom_id = line.get("custom_id", "")
+    response = line.get("response") or {}
+    body = response.get("body") or {}
+
+    if line.get("error") or response.get("status_code", 200) != 200:
+        error = line.get("error") or body.get("error") or {}
+        message = error.get("message") if isinstance(error, dict) else str(error)
+        return custom_id, LLMResponse(success=False, error=message or "Batch request failed")
+
+    model = body.get("model")
+    usage = body.get("usage") or {}
+    input_tokens = usage.get("prompt_tokens", 0)
+    output_tokens = usage.get("completion_tokens", 0)
+    content = body["choices"][0]["message"].get("content") or ""
+
+    result = LLMResponse(
+        success=True,
+        content=content,
+        model=model,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cost_usd=batch_cost(model or "", input_tokens, output_tokens),
+    )
+    if json_mode:
+        try:
+            result.parsed_json = json.loads(content)
+        except json.JSONDecodeError as e:
+            result.success = False
+            result.error = f"Invalid JSON response: {e}"
+    return custom_id, result
+
+
+def batch_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """Cost of a batch request in USD."""
+    # Batch responses report dated model names, e.g. gpt-4o-mini-2024-07-18
+    prices = next(
+        (p for name, p in sorted(MODEL_PRICING.items(), key=lambda kv: -len(kv[0])) if model.startswith(name)),
+        MODEL_PRICING["gpt-4o-mini"],
+    )
+    input_cost, output_cost = prices
+    return BATCH_PRICE_FACTOR * (
+        (input_tokens * input_cost / 1_000_000) +
+        (output_tokens * output_cost / 1_000_000)
+    )
+
+
+class BatchProvider(ABC):
+    """Submits JSONL request files as offline batches."""
+
+    name = ""
+
+    @abstractmethod
+    def submit(self, path: Path, metadata: Optional[Dict[str, str]] = None) -> str:
+        """Submit a request file; returns the provider's batch id."""
+
+    @abstractmethod
+    def retrieve(self, batch_id: str) -> BatchJob:
+        """Current state of a batch."""
+
+    @abstractmethod
+    def results(self, batch_id: str) -> Iterator[Dict[str, Any]]:
+        """Output and error lines of a finished batch."""
+
+
+class OpenAIBatchProvider(BatchProvider):
+    """OpenAI Batch API."""
+
+    name = "openai"
+
+    def __init__(self, api_key: Optional[str] = None, completion_window: str = "24h"):
+        self.api_key = api_key
+        self.completion_window = completion_window
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            from openai import OpenAI
+            self._client = OpenAI(api_key=self.api_key)
+        return self._client
+
+    def submit(self, path: Path, metadata: Optional[Dict[str, str]] = None) -> str:
+        with open(path, "rb") as f:
+            input_file = self.client.files.create(file=f, purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=CHAT_COMPLETIONS_ENDPOINT,
+            completion_window=self.completion_window,
+            metadata=metadata,
+        )
+        return batch.id
+
+    def retrieve(self, batch_id: str) -> BatchJob:
+        batch = self.client.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        errors = getattr(batch, "errors", None)
+        return BatchJob(
+            id=batch.id,
+            status=batch.status,
+            request_counts={
+                "total": counts.total,
+                "completed": counts.completed,
+                "failed": counts.failed,
+            } if counts else {},
+            error="; ".join(e.message for e in errors.data if e.message) if errors and errors.data else None,
+        )
+
+    def results(self, batch_id: str) -> Iterator[Dict[str, Any]]:
+        batch = self.client.batches.retrieve(batch_id)
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if line.strip():
+                    yield json.loads(line)
+
+
+# (request body) -> response message content
+Responder = Callable[[Dict[str, Any]], str]
+
+
+class LocalBatchProvider(BatchProvider):
+    """
+    File-based stand-in for the Batch API.
+
+    A submitted file is copied to <root>/<batch_id>/input.jsonl; the first
+    retrieve() answers every request with `responder` and writes
+    output.jsonl in the Batch API output format.
+    """
+
+    name = "local"
+
+    def __init__(self, root: Path, responder: Optional[Responder] = None):
+        self.root = Path(root)
+        self.responder = responder or (lambda body: "{}")
+
+    def submit(self, path: Path, metadata: Optional[Dict[str, str]] = None) -> str:
+        batch_id = f"localbatch_{uuid.uuid4().hex[:16]}"
+        batch_dir = self.root / batch_id
+        batch_dir.mkdir(parents=True)
+        (batch_dir / "input.jsonl").write_bytes(Path(path).read_bytes())
+        return batch_id
+
+    def retrieve(self, batch_id: str) -> BatchJob:
+        batch_dir = self.root / batch_id
+        if not batch_dir.exists():
+            return BatchJob(id=batch_id, status=BATCH_FAILED, error="Unknown batch")
+
+        output_path = batch_dir / "output.jsonl"
+        if not output_path.exists():
+            self._complete(batch_dir)
+
+        total = sum(1 for _ in open(output_path, encoding="utf-8"))
+        return BatchJob(
+            id=batch_id,
+            status=BATCH_COMPLETED,
+            request_counts={"total": total, "completed": total, "failed": 0},
+        )
+
+    def results(self, batch_id: str) -> Iterator[Dict[str, Any]]:
+        with open(self.root / batch_id / "output.jsonl", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _complete(self, batch_dir: Path) -> None:
+        lines = []
+        with open(batch_dir / "input.jsonl", encoding="utf-8") as f:
+            for i, raw in enumerate(f):
+                if not raw.strip():
+                    continue
+                request = json.loads(raw)
+                body = request["body"]
+                content = self.responder(body)
+                prompt_tokens = sum(len(m["content"]) // 4 for m in body["messages"])
+                lines.append({
+                    "id": f"batch_req_{i}",
+                    "custom_id": request["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "request_id": f"req_{i}",
+                        "body": {
+                            "model": body["model"],
+                            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}}],
+                            "usage": {
+                                "prompt_tokens": prompt_tokens,
+                                "completion_tokens": len(content) // 4,
+                            },
+                        },
+                    },
+                    "error": None,
+                })
+        with open(batch_dir / "output.jsonl", "w", encoding="utf-8") as f:
+            for line in lines:
+                f.write(json.dumps(line) + "\n")
+
+
+class BatchStore:
+    """
+    JSON manifests of submitted batches, one file per batch.
+
+    A manifest records the provider batch id, model, the custom_ids it
+    contains and its status; request files are kept next to it.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def request_path(self, kind: str) -> Path:
+        """Path for a new request file."""
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+        return self.root / "requests" / f"{kind}_{stamp}_{uuid.uuid4().hex[:8]}.jsonl"
+
+    def save(self, manifest: Dict[str, Any]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.root / f"{manifest['batch_id']}.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest, indent=2, default=str))
+        tmp.replace(path)
+
+    def record(
+        self,
+        batch_id: str,
+        kind: str,
+        provider: str,
+        model: str,
+        custom_ids: List[str],
+        request_file: Path,
+    ) -> Dict[str, Any]:
+        manifest = {
+            "batch_id": batch_id,
+            "kind": kind,
+            "provider": provider,
+            "model": model,
+            "custom_ids": custom_ids,
+            "request_file": str(request_file),
+            "status": "submitted",
+            "submitted_at": datetime.utcnow().isoformat(),
+        }
+        self.save(manifest)
+        return manifest
+
+    def manifests(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        if not self.root.exists():
+            return []
+        manifests = []
+        for path in sorted(self.root.glob("*.json")):
+            manifest = json.loads(path.read_text())
+            if kind is None or manifest.get("kind") == kind:
+                manifests.append(manifest)
+        return manifests
+
+    def open_manifests(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Manifests whose results have not been ingested yet."""
+        return [m for m in self.manifests(kind) if m["status"] != INGESTED]
+
+    def pending_ids(self, kind: Optional[str] = None) -> set:
+        """custom_ids in batches not yet ingested."""
+        return {cid for m in self.open_manifests(kind) for cid in m["custom_ids"]}
+
+    def mark(self, manifest: Dict[str, Any], status: str, **fields: Any) -> None:
+        manifest.update(status=status, updated_at=datetime.utcnow().isoformat(), **fields)
+        self.save(manifest)
+
+
+def get_batch_provider(name: str, root: Path, api_key: Optional[str] = None) -> BatchProvider:
+    """Provider by name: "openai" or "local" (completes under root/local)."""
+    if name == "openai":
+        return OpenAIBatchProvider(api_key=api_key)
+    if name == "local":
+        return LocalBatchProvider(Path(root) / "local")
+    raise ValueError(f"Unknown batch provider: {name}")
+
+
+__all__ = [
+    'BATCH_PRICE_FACTOR',
+    'BatchRequest',
+    'BatchJob',
+    'BatchProvider',
+    'OpenAIBatchProvider',
+    'LocalBatchProvider',
+    'BatchStore',
+    'write_batch_file',
+    'parse_batch_result',
+    'batch_cost',
+    'get_batch_provider',
+]
@@ -0,0 +1,174 @@
+"""
+Windowed transcript passages for phrase search.
+
+Whisper segments are a few seconds long, so a phrase is often split
+across two segments ("...the storm" / "protection plan...") and never
+matches a per-segment full-text query. Passages are sliding windows of
+`window` consecutive segments advanced by `stride`; each passage's text
+is its segments' text joined in order, indexed for full-text search.
+
+Consecutive windows overlap by window - stride segments, so a phrase
+spanning up to window - stride + 1 segments lies entirely inside at
+least one passage.
+
+Each passage records where its segments start in its text
+(segment_offsets: [[char offset, start time], ...]), so a search hit
+gets the timestamp of the segment the match begins in without fetching
+the segments (match_start_time()).
+"""
+
+from bisect import bisect_right, insort
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+DEFAULT_WINDOW = 6
+DEFAULT_STRIDE = 3
+
+
+def build_passages(
+    segments: Sequence[Mapping[str, Any]],
+    window: int = DEFAULT_WINDOW,
+    stride: int = DEFAULT_STRIDE,
+) -> List[Dict[str, Any]]:
+    """
+    Window a hearing's segments into passages.
+
+    Args:
+        segments: Segment rows with segment_index, start_time, end_time,
+            text and optionally speaker_name / speaker_label
+        window: Segments per passage
+        stride: Segments between the starts of consecutive passages;
+            must be less than window (or 1 when window is 1)
+
+    Returns:
+        Passage rows (passage_index, first/last_segment_index, start_time,
+        end_time, speakers, text, segment_offsets), without hearing_id
+    """
+    if window < 1 or stride < 1 or (window > 1 and stride >= window):
+        raise ValueError(f"Invalid passage window {window} / stride {stride}")
+
+    ordered = sorted(
+        (s for s in segments if (s.get("text") or "").strip()),
+        key=lambda s: s.get("segment_index") or 0,
+    )
+
+    passages = []
+    start = 0
+    while start < len(ordered):
+        passages.append(_passage(len(passages), ordered[start:start + window]))
+        if start + window >= len(ordered):
+            break
+        start += stride
+    return passages
+
+
+def _passage(passage_index: int, segments: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+    parts = []
+    offsets = []
+    speakers: List[str] = []
+    position = 0
+    for seg in segments:
+        seg_text = " ".join(seg["text"].split())
+        offsets.append([position, seg.get("start_time")])
+        parts.append(seg_text)
+        position += len(seg_text) + 1
+
+        speaker = seg.get("speaker_name") or seg.get("speaker_label")
+        if speaker and speaker not in speakers:
+            speakers.append(speaker)
+
+    return {
+        "passage_index": passage_index,
+        "first_segment_index": segments[0].get("segment_index"),
+        "last_segment_index": segments[-1].get("segment_index"),
+        "start_time": segments[0].get("start_time"),
+        "end_time": segments[-1].get("end_time"),
+        "speakers": ", ".join(speakers)[:500] or None,
+        "text": " ".join(parts),
+        "segment_offsets": offsets,
+    }
+
+
+def match_segment_position(
+    text: str,
+    segment_offsets: Optional[Sequence[Sequence[Any]]],
+    terms: Sequence[str],
+) -> Optional[int]:
+    """
+    Position in segment_offsets of the segment where the first matching
+    term begins.
+
+    Terms are matched case-insensitively as substrings; a phrase split
+    across segments resolves to the segment it starts in. Falls back to
+    the passage's first segment when no term is found literally (e.g. a
+    stemmed full-text match).
+    """
+    if not segment_offsets:
+        return None
+
+    lowered = (text or "").lower()
+    positions = [
+        pos for pos in (lowered.find(" ".join(term.lower().split())) for term in terms if term)
+        if pos != -1
+    ]
+    if not positions:
+        return 0
+
+    starts = [offset for offset, _ in segment_offsets]
+    return max(bisect_right(starts, min(positions)) - 1, 0)
+
+
+def match_start_time(
+    text: str,
+    segment_offsets: Optional[Sequence[Sequence[Any]]],
+    terms: Sequence[str],
+) -> Optional[float]:
+    """Start time of the segment where the first matching term begins (see match_segment_position)."""
+    position = match_segment_position(text, segment_offsets, terms)
+    if position is None:
+        return None
+    return segment_offsets[position][1]
+
+
+def select_non_overlapping(
+    hits: Sequence[Any],
+    span: Callable[[Any], Tuple[Any, int, int]],
+    limit: int,
+) -> List[Any]:
+    """
+    Keep the best of overlapping passage hits.
+
+    Overlapping windows usually match the same words, so a ranked list of
+    hits keeps each hit only if its segment range doesn't overlap a
+    better-ranked hit from the same hearing.
+
+    Args:
+        hits: Ranked hits, best first
+        span: hit -> (hearing_id, first_segment_index, last_segment_index)
+        limit: Max hits to keep
+    """
+    kept: List[Any] = []
+    # Kept ranges of a hearing are disjoint, so sorted by start they are
+    # also sorted by end: only the last one starting at or before `last`
+    # can reach `first`
+    taken: Dict[Any, List[Tuple[int, int]]] = {}
+    for hit in hits:
+        hearing_id, first, last = span(hit)
+        ranges = taken.setdefault(hearing_id, [])
+        before = bisect_right(ranges, (last, float("inf"))) - 1
+        if before >= 0 and ranges[before][1] >= first:
+            continue
+        insort(ranges, (first, last))
+        kept.append(hit)
+        if len(kept) >= limit:
+            break
+    return kept
+
+
+__all__ = [
+    'DEFAULT_WINDOW',
+    'DEFAULT_STRIDE',
+    'build_passages',
+    'match_segment_position',
+    'match_start_time',
+    'select_non_overlapping',
+]
@@ -0,0 +1,342 @@
+"""
+Precomputed stats rollups.
+
+Dashboard stats endpoints read additive counters from a rollup table
+instead of aggregating the whole corpus on every request. A counter is
+keyed by (state_code, day, metric, dimension), e.g.
+("FL", 2026-01-20, "hearings_by_status", "transcribed"), and every change
+is an increment upserted in the writer's transaction, so a rollback
+undoes it along with the write it describes.
+
+A counter's day is the creation day of the row it counts, not the day of
+the change: updating a month-old hearing adjusts that month-old day. That
+is the only bucketing reconciliation can recompute from the source tables,
+so trackers and manual increments must follow it too.
+
+- RollupStore: increments, reads (totals, sums since a day) and
+  reconciliation against counts recomputed from the source tables.
+- RollupTracker: session flush hook that turns inserts, updates and
+  deletes of tracked models into increments, so pipeline stages,
+  scrapers and admin routes keep the rollups current without extra code.
+  Writes that bypass the ORM (bulk inserts, Query.update / Query.delete)
+  record their increments with RollupStore.add, or are corrected by the
+  next reconciliation.
+
+The store works on any model with state_code, day, metric, dimension and
+value columns whose primary key is the first four.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import event, func, inspect
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# (state_code, day, metric, dimension)
+RollupKey = Tuple[str, date, str, str]
+# (state_code, metric, dimension, value)
+Contribution = Tuple[str, str, str, Any]
+
+KEY_COLUMNS = ("state_code", "day", "metric", "dimension")
+
+# Differences below this are rounding, not drift
+RECONCILE_TOLERANCE = 1e-4
+
+
+def utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def _as_date(value) -> date:
+    """date(...) results come back as strings on SQLite."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return value
+
+
+class RollupStore:
+    """
+    Increment and read counters in a rollup table.
+
+    Usage:
+        rollups = RollupStore(StatsRollup)
+        rollups.add(db, "FL", "segments", 1200)
+        db.commit()
+
+        totals = rollups.totals(db, state_code="FL")
+        totals["hearings_by_status"]  # {"transcribed": 812.0, ...}
+    """
+
+    def __init__(self, model):
+        self.model = model
+
+    # --- writes ---
+
+    def add(
+        self,
+        db: Session,
+        state_code: str,
+        metric: str,
+        value: Any,
+        dimension: Optional[str] = "",
+        day: Optional[date] = None,
+    ) -> None:
+        """
+        Increment one counter (negative values decrement) in db's transaction.
+
+        `day` is the creation day (or created_at) of the counted row; it
+        defaults to today, for rows created in this transaction.
+        """
+        day = _as_date(day) if day else utc_today()
+        self.add_many(db, {(state_code, day, metric, dimension or ""): value})
+
+    def add_many(self, db: Session, deltas: Mapping[RollupKey, Any]) -> None:
+        rows = [
+            dict(zip(KEY_COLUMNS, key, strict=True), value=float(value))
+            for key, value in deltas.items()
+            if value and abs(float(value)) >= RECONCILE_TOLERANCE
+        ]
+        if not rows:
+            return
+
+        connection = db.connection()
+        table = self.model.__table__
+        dialect = connection.dialect.name
+
+        if dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+            statement = insert(table)
+            statement = statement.on_conflict_do_update(
+                index_elements=list(KEY_COLUMNS),
+                set_={"value": table.c.value + statement.excluded.value},
+            )
+            connection.execute(statement, rows)
+            return
+
+        for row in rows:
+            key_filter = [table.c[column] == row[column] for column in KEY_COLUMNS]
+            updated = connection.execute(
+                table.update().where(*key_filter).values(value=table.c.value + row["value"])
+            ).rowcount
+            if not updated:
+                connection.execute(table.insert().values(**row))
+
+    # --- reads ---
+
+    def totals(self, db: Session, state_code: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """All-time value of every counter: {metric: {dimension: value}}."""
+        m = self.model
+        query = db.query(m.metric, m.dimension, func.sum(m.value)).group_by(m.metric, m.dimension)
+        if state_code:
+            query = query.filter(m.state_code == state_code)
+
+        totals: Dict[str, Dict[str, float]] = defaultdict(dict)
+        for metric, dimension, value in query.all():
+            totals[metric][dimension] = float(value or 0)
+        return totals
+
+    def by_state(self, db: Session, metric: str) -> Dict[str, float]:
+        """All-time value of a metric per state."""
+        m = self.model
+        rows = db.query(m.state_code, func.sum(m.value)).filter(
+            m.metric == metric
+        ).group_by(m.state_code).all()
+        return {state: float(value or 0) for state, value in rows}
+
+    def sum_since(
+        self,
+        db: Session,
+        metric: str,
+        since: date,
+        state_code: Optional[str] = None,
+    ) -> float:
+        """Value of a metric on rows created on or after `since`, over all dimensions."""
+        m = self.model
+        query = db.query(func.sum(m.value)).filter(m.metric == metric, m.day >= since)
+        if state_code:
+            query = query.filter(m.state_code == state_code)
+        return float(query.scalar() or 0)
+
+    # --- reconciliation ---
+
+    def reconcile(self, db: Session, expected: Mapping[RollupKey, Any]) -> int:
+        """
+        Bring the counters in line with `expected` (recomputed from the source tables).
+
+        Differences are applied as increments, so writers committing during
+        the reconciliation are not overwritten; anything they race with is
+        fixed by the next run. Counters left at zero are removed.
+
+        Returns:
+            Number of counters corrected
+        """
+        m = self.model
+        current: Dict[RollupKey, float] = {
+            (state, _as_date(day), metric, dimension): float(value or 0)
+            for state, day, metric, dimension, value in db.query(
+                m.state_code, m.day, m.metric, m.dimension, m.value
+            ).all()
+        }
+        expected = {
+            (state, _as_date(day), metric, dimension or ""): float(value or 0)
+            for (state, day, metric, dimension), value in expected.items()
+        }
+
+        corrections = {}
+        for key in set(current) | set(expected):
+            difference = expected.get(key, 0.0) - current.get(key, 0.0)
+            if abs(difference) >= RECONCILE_TOLERANCE:
+                corrections[key] = difference
+
+        self.add_many(db, corrections)
+        db.query(m).filter(m.value == 0).delete(synchronize_session=False)
+        if corrections:
+            logger.info(f"Corrected {len(corrections)} stats rollup counters")
+        return len(corrections)
+
+
+def _keep_history(target, value, oldvalue, initiator):
+    return value
+
+
+class RollupTracker:
+    """
+    Turn ORM changes to tracked models into rollup increments.
+
+    Each tracked model has a contribution function mapping an object's
+    values to the counters it adds to. On flush, an insert adds the
+    object's contribution, a delete subtracts it and an update adds the
+    difference between the new and old contributions, all on the object's
+    creation day (read from `day_attribute`, today when unset). The
+    increments are written in the flush's transaction.
+
+    Usage:
+        tracker = RollupTracker(rollups)
+        tracker.track(Hearing, ["state_code", "transcript_status"], lambda v, h: [
+            (v["state_code"], "hearings", "", 1),
+            (v["state_code"], "hearings_by_status", v["transcript_status"] or "", 1),
+        ], day_attribute="created_at")
+        tracker.listen(SessionLocal)
+    """
+
+    def __init__(self, store: RollupStore):
+        self.store = store
+        self._tracked: Dict[
+            type, Tuple[Sequence[str], Callable[[Dict[str, Any], Any], Iterable[Contribution]], Optional[str]]
+        ] = {}
+
+    def track(
+        self,
+        model,
+        attributes: Sequence[str],
+        contribution: Callable[[Dict[str, Any], Any], Iterable[Contribution]],
+        day_attribute: Optional[str] = None,
+    ) -> None:
+        """
+        Track a model.
+
+        Args:
+            model: Mapped class
+            attributes: Attributes the contribution reads from its values dict
+            contribution: (values, obj) -> [(state_code, metric, dimension, value)]
+            day_attribute: Creation timestamp the counters are bucketed by,
+                matching the reconciliation's expected counters
+        """
+        self._tracked[model] = (tuple(attributes), contribution, day_attribute)
+        for name in attributes:
+            # Load the old value when an unloaded attribute is set, so an
+            # update can subtract what the object contributed before it
+            event.listen(getattr(model, name), "set", _keep_history, active_history=True, retval=True)
+
+    def listen(self, target) -> None:
+        """Track flushes of a Session, sessionmaker or Session class."""
+        event.listen(target, "before_flush", self._before_flush)
+        event.listen(target, "after_flush", self._after_flush)
+
+    def _values(self, obj, attributes: Sequence[str], old: bool) -> Dict[str, Any]:
+        state = inspect(obj)
+        values = {}
+        for name in attributes:
+            if name in state.unloaded and not old:
+                getattr(obj, name)
+            history = state.attrs[name].history
+            if old:
+                previous = history.deleted or history.unchanged
+                values[name] = previous[0] if previous else None
+            else:
+                current = history.added or history.unchanged
+                values[name] = current[0] if current else None
+        return values
+
+    def _day(self, obj, day_attribute: Optional[str], old: bool) -> date:
+        # History never loads: a server-default created_at is expired right
+        # after its insert, and a row inserted now belongs to today anyway
+        value = None
+        if day_attribute:
+            history = inspect(obj).attrs[day_attribute].history
+            values = (history.deleted or history.unchanged) if old else (history.added or history.unchanged)
+            value = values[0] if values else None
+        return _as_date(value) if value else utc_today()
+
+    def _contribution(self, obj, old: bool) -> Optional[Dict[RollupKey, float]]:
+        tracked = self._tracked.get(type(obj))
+        if tracked is None:
+            return None
+        attributes, contribution, day_attribute = tracked
+        day = self._day(obj, day_attribute, old)
+        totals: Dict[RollupKey, float] = defaultdict(float)
+        for state_code, metric, dimension, value in contribution(self._values(obj, attributes, old), obj):
+            totals[(state_code, day, metric, dimension or "")] += float(value or 0)
+        return totals
+
+    def _before_flush(self, session: Session, flush_context, instances) -> None:
+        # Old contributions are read before the flush, while deleted rows
+        # and expired attributes can still be loaded
+        old = {}
+        for obj in list(session.dirty) + list(session.deleted):
+            if type(obj) not in self._tracked:
+                continue
+            state = inspect(obj)
+            attributes, _, day_attribute = self._tracked[type(obj)]
+            for name in (*attributes, day_attribute) if day_attribute else attributes:
+                if name in state.unloaded:
+                    getattr(obj, name)
+            old[id(obj)] = self._contribution(obj, old=True)
+        session.info["_rollup_old"] = old
+
+    def _after_flush(self, session: Session, flush_context) -> None:
+        old = session.info.pop("_rollup_old", {})
+        deltas: Dict[RollupKey, float] = defaultdict(float)
+
+        def apply(contribution, sign):
+            for key, value in (contribution or {}).items():
+                deltas[key] += sign * value
+
+        for obj in session.new:
+            apply(self._contribution(obj, old=False), 1)
+        for obj in session.dirty:
+            if id(obj) in old and session.is_modified(obj):
+                apply(self._contribution(obj, old=False), 1)
+                apply(old[id(obj)], -1)
+        for obj in session.deleted:
+            apply(old.get(id(obj)), -1)
+
+        self.store.add_many(session, deltas)
+
+
+__all__ = [
+    'Contribution',
+    'RollupKey',
+    'RollupStore',
+    'RollupTracker',
+    'utc_today',
+]
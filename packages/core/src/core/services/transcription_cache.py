@@ -0,0 +1,139 @@
+"""
+Transcription cache - content-addressed store for Whisper responses.
+
+Caches the parsed response for each audio chunk so re-runs (after
+segment deletion, retries, or duplicate YouTube/RSS entries for one
+meeting) only pay for audio that has never been transcribed.
+
+Keys are SHA-256 over the chunk bytes, model name and prompt; entries
+are JSON files evicted least-recently-used once the cache exceeds its
+size limit.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 1GB
+
+
+class TranscriptionCache:
+    """
+    On-disk cache of parsed Whisper responses.
+
+    Safe to share between worker threads; writes are atomic renames so
+    several processes can also point at the same directory.
+
+    Usage:
+        cache = TranscriptionCache("data/transcript_cache")
+        key = cache.make_key(chunk_path, "whisper-1", prompt)
+        result = cache.get(key)
+        if result is None:
+            result = transcribe(chunk_path)
+            cache.put(key, result)
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+
+    @staticmethod
+    def make_key(audio_path: Path, model: str, prompt: Optional[str]) -> str:
+        """Hash chunk contents together with the model and prompt."""
+        digest = hashlib.sha256()
+        with open(audio_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        digest.update(b"\0" + model.encode() + b"\0" + (prompt or "").encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for key, or None."""
+        path = self._path(key)
+        try:
+            value = json.loads(path.read_text())
+            os.utime(path)  # Mark as recently used for eviction
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def put(self, key: str, value: Dict[str, Any]):
+        """Store a response, evicting old entries if over the size limit."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(value).encode()
+
+        try:
+            # Overwriting an entry only adds the difference in size
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write transcription cache entry {key[:12]}: {e}")
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data) - replaced
+            if self._size > self.max_bytes:
+                self._evict()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters since this cache was created."""
+        return {"cache_hits": self.hits, "cache_misses": self.misses}
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _scan_size(self) -> int:
+        return sum(p.stat().st_size for p in self.cache_dir.glob("*/*.json"))
+
+    def _evict(self):
+        """Drop least recently used entries until 90% of the limit (lock held)."""
+        entries = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+            except OSError:
+                continue
+
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+
+        self._size = total
+        if evicted:
+            logger.info(f"Evicted {evicted} transcription cache entries")
@@ -1,7 +1,8 @@
 """Utility functions and helpers."""
 
 from core.utils.config import env_str, env_int, env_float, env_bool, env_list
-from core.utils.http import create_client, create_async_client, RateLimiter, with_retry
+from core.utils.http import create_client, create_async_client, RateLimiter, AsyncTokenBucket, CachedResponse, HTTPCache, with_retry
+from core.utils.pagination import InvalidCursor, SortKey, Page, paginate
 
 __all__ = [
     'env_str',
@@ -12,5 +13,12 @@ __all__ = [
     'create_client',
     'create_async_client',
     'RateLimiter',
+    'AsyncTokenBucket',
+    'CachedResponse',
+    'HTTPCache',
     'with_retry',
+    'InvalidCursor',
+    'SortKey',
+    'Page',
+    'paginate',
 ]
@@ -2,10 +2,18 @@
 HTTP client utilities with retry and rate limiting.
 """
 
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
 import time
 import logging
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, Dict, Any
 from functools import wraps
+from urllib.parse import urlencode
 
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
@@ -69,13 +77,283 @@ class RateLimiter:
 
     async def wait_async(self):
         """Async wait if necessary to maintain rate limit."""
-        import asyncio
         elapsed = time.time() - self.last_request_time
         if elapsed < self.min_interval:
             await asyncio.sleep(self.min_interval - elapsed)
         self.last_request_time = time.time()
 
 
+class AsyncTokenBucket:
+    """
+    Token bucket shared by concurrent coroutines.
+
+    Tokens refill at `rate` per second up to `burst`; each acquire() takes
+    one, waiting for the refill when the bucket is empty. With burst=1 no
+    two requests start closer than 1/rate seconds apart, however many
+    tasks share the bucket.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait for and take one token."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+@dataclass
+class CachedResponse:
+    """
+    Result of an HTTPCache fetch.
+
+    `content` is the full body, read from the cache on a 304. `changed`
+    is False when the body matches the last committed one.
+    """
+    key: str
+    status_code: int
+    content: bytes
+    changed: bool
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status_code == 304
+
+    @property
+    def digest(self) -> str:
+        return hashlib.sha256(self.content).hexdigest()
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class HTTPCache:
+    """
+    Conditional-request cache for URLs that scrapers poll repeatedly.
+
+    For each request (URL plus query/form parameters) the cache keeps the
+    ETag and Last-Modified validators, a SHA-256 digest of the body and,
+    when the server sent a validator, the body itself, in a SQLite file.
+    fetch() sends If-None-Match / If-Modified-Since; on a 304 the stored
+    body is returned instead of being downloaded again. `changed` tells
+    the caller whether the body differs from the last committed one, so
+    an unchanged feed can skip parsing and database work:
+
+        cache = HTTPCache("data/http_cache.sqlite3")
+        feed = cache.fetch(session.get, feed_url, timeout=30)
+        if feed.changed:
+            save_items(parse(feed.content))
+        cache.commit(feed)
+
+    Nothing is written until commit(), so a run that fails after fetching
+    sees the body as changed again next time. `send` is a requests or
+    httpx get/post; its transport errors propagate unchanged. The file can
+    be shared by threads and processes. With path=None the cache is off:
+    every fetch is unconditional and reports changed.
+
+    The file keeps at most max_entries requests: commits periodically
+    evict the least recently committed ones. Requests that are rarely
+    repeated (search result pages) are better sent without the cache.
+    """
+
+    # Commits between evictions
+    prune_interval = 100
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 10_000):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._commits_until_prune = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections don't survive fork; reopen in a child process
+        if self._conn is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS http_cache ("
+                " key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT,"
+                " digest TEXT NOT NULL, body BLOB, updated_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_http_cache_updated_at ON http_cache (updated_at)")
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    @staticmethod
+    def request_key(url: str, params: Optional[dict] = None, data: Optional[dict] = None) -> str:
+        """Cache key for a request: the URL with sorted query and form parameters."""
+        key = url
+        if params:
+            key += '?' + urlencode(sorted(params.items()))
+        if data:
+            key += ' ' + urlencode(sorted(data.items()))
+        return key
+
+    def _entry(self, key: str) -> Optional[tuple]:
+        """(etag, last_modified, digest, body) last committed for key."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            return self._connect().execute(
+                "SELECT etag, last_modified, digest, body FROM http_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+    @staticmethod
+    def _conditional_headers(entry: Optional[tuple]) -> Dict[str, str]:
+        headers = {}
+        if entry and entry[3] is not None:
+            etag, last_modified = entry[0], entry[1]
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        return headers
+
+    @staticmethod
+    def _request_kwargs(params, data, headers, kwargs) -> Dict[str, Any]:
+        request = dict(kwargs)
+        if params is not None:
+            request['params'] = params
+        if data is not None:
+            request['data'] = data
+        if headers:
+            request['headers'] = {**kwargs.get('headers', {}), **headers}
+        return request
+
+    @staticmethod
+    def _result(key: str, entry: Optional[tuple], response) -> CachedResponse:
+        if response.status_code == 304 and entry and entry[3] is not None:
+            content = entry[3]
+            changed = False
+        else:
+            # httpx treats 304 as an error, so check it before raising
+            response.raise_for_status()
+            content = response.content
+            changed = entry is None or hashlib.sha256(content).hexdigest() != entry[2]
+        return CachedResponse(
+            key=key,
+            status_code=response.status_code,
+            content=content,
+            changed=changed,
+            etag=response.headers.get('ETag') or (entry[0] if entry else None),
+            last_modified=response.headers.get('Last-Modified') or (entry[1] if entry else None),
+        )
+
+    def fetch(
+        self,
+        send: Callable[..., Any],
+        url: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        **kwargs,
+    ) -> CachedResponse:
+        """
+        Send a request through `send`, conditionally if the URL is cached.
+
+        Raises the transport's HTTP error for 4xx/5xx responses.
+        """
+        key = self.request_key(url, params, data)
+        entry = self._entry(key)
+        headers = self._conditional_headers(entry)
+        response = send(url, **self._request_kwargs(params, data, headers, kwargs))
+        return self._result(key, entry, response)
+
+    async def afetch(
+        self,
+        send: Callable[..., Awaitable[Any]],
+        url: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        **kwargs,
+    ) -> CachedResponse:
+        """
+        fetch() for async transports (e.g. httpx.AsyncClient.get).
+
+        The SQLite lookup runs in a worker thread, off the event loop.
+        """
+        key = self.request_key(url, params, data)
+        entry = await asyncio.to_thread(self._entry, key) if self.enabled else None
+        headers = self._conditional_headers(entry)
+        response = await send(url, **self._request_kwargs(params, data, headers, kwargs))
+        return self._result(key, entry, response)
+
+    def commit(self, result: CachedResponse):
+        """
+        Record a fetched body as processed.
+
+        The body is stored only when the server sent a validator; without
+        one it can never be answered with a 304, so the digest is enough.
+        """
+        if not self.enabled:
+            return
+        has_validator = bool(result.etag or result.last_modified)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT INTO http_cache (key, etag, last_modified, digest, body, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET etag = excluded.etag,"
+                " last_modified = excluded.last_modified, digest = excluded.digest,"
+                " body = excluded.body, updated_at = excluded.updated_at",
+                (
+                    result.key, result.etag, result.last_modified, result.digest,
+                    result.content if has_validator else None, time.time(),
+                ),
+            )
+            if self.max_entries and self._commits_until_prune <= 0:
+                conn.execute(
+                    "DELETE FROM http_cache WHERE key IN ("
+                    " SELECT key FROM http_cache ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+                self._commits_until_prune = self.prune_interval
+            self._commits_until_prune -= 1
+            conn.commit()
+
+    async def acommit(self, result: CachedResponse):
+        """commit() in a worker thread, for use on an event loop."""
+        if self.enabled:
+            await asyncio.to_thread(self.commit, result)
+
+    def fetch_json(self, send: Callable[..., Any], url: str, **kwargs) -> Any:
+        """Fetch, commit straight away and decode JSON (for clients returning data)."""
+        result = self.fetch(send, url, **kwargs)
+        self.commit(result)
+        return result.json()
+
+    async def afetch_json(self, send: Callable[..., Awaitable[Any]], url: str, **kwargs) -> Any:
+        """Async fetch_json()."""
+        result = await self.afetch(send, url, **kwargs)
+        await self.acommit(result)
+        return result.json()
+
+
 def with_retry(
     max_attempts: int = 3,
     min_wait: float = 1.0,
@@ -101,5 +379,8 @@ __all__ = [
     'create_client',
     'create_async_client',
     'RateLimiter',
+    'AsyncTokenBucket',
+    'CachedResponse',
+    'HTTPCache',
     'with_retry',
 ]
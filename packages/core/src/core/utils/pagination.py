@@ -0,0 +1,211 @@
+"""
+Keyset (cursor) pagination.
+
+OFFSET pagination reads and discards every row before the page, so deep
+pages cost more the further they are. A keyset page instead filters on
+the sort key of the last row already seen ("rows after this one") and
+reads only `limit` rows, which an index on the sort columns serves in
+constant time at any depth.
+
+    keys = [SortKey(Hearing.hearing_date, descending=True, nullable=True),
+            SortKey(Hearing.id, descending=True)]
+    page = paginate(query, keys, limit=50, after=after, kind="hearings")
+    page.items, page.next_cursor
+
+The last key must be unique (usually the primary key) so the order is
+total. Cursors are opaque URL-safe tokens encoding the endpoint kind and
+the last row's sort key; a cursor from another endpoint is rejected.
+NULLs sort last in both directions.
+"""
+
+import base64
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Generic, List, Optional, Sequence, TypeVar
+
+from sqlalchemy import and_, false, literal, or_, tuple_
+
+T = TypeVar("T")
+
+
+class InvalidCursor(ValueError):
+    """Cursor is malformed or was issued by another endpoint."""
+
+
+# =============================================================================
+# CURSOR TOKENS
+# =============================================================================
+
+def _dump(value: Any) -> Any:
+    # Tag non-JSON types so they decode to the type the column compares with
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {"u": str(value)}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    return value
+
+
+def _load(value: Any) -> Any:
+    if isinstance(value, dict):
+        (tag, raw), = value.items()
+        if tag == "dt":
+            return datetime.fromisoformat(raw)
+        if tag == "d":
+            return date.fromisoformat(raw)
+        if tag == "u":
+            return uuid.UUID(raw)
+        if tag == "n":
+            return Decimal(raw)
+        raise ValueError(f"Unknown cursor value tag: {tag}")
+    return value
+
+
+def encode_cursor(kind: str, values: Sequence[Any]) -> str:
+    """Opaque token for a sort key (dates, datetimes, UUIDs and Decimals keep their type)."""
+    payload = json.dumps([kind, [_dump(v) for v in values]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, kind: str, length: Optional[int] = None) -> List[Any]:
+    """
+    Sort key from a token made by encode_cursor().
+
+    Raises:
+        InvalidCursor: malformed token, another kind, or the wrong number of values
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        token_kind, values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = [_load(v) for v in values]
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {token}") from e
+    if token_kind != kind or (length is not None and len(values) != length):
+        raise InvalidCursor(f"Invalid cursor: {token}")
+    return values
+
+
+# =============================================================================
+# KEYSET QUERIES
+# =============================================================================
+
+@dataclass
+class SortKey:
+    """
+    One column of a keyset sort order.
+
+    name is the attribute read from result rows for the next cursor
+    (defaults to the column's key); set it for labeled expressions.
+    """
+    column: Any
+    descending: bool = False
+    nullable: bool = False
+    name: Optional[str] = None
+
+    @property
+    def attr(self) -> str:
+        return self.name or self.column.key
+
+    def order_by(self):
+        ordered = self.column.desc() if self.descending else self.column.asc()
+        return ordered.nullslast() if self.nullable else ordered
+
+    def after(self, value: Any):
+        """Rows strictly after value in this column's order."""
+        if value is None:
+            # NULLs sort last: nothing comes after a NULL
+            return false()
+        condition = self.column < value if self.descending else self.column > value
+        if self.nullable:
+            condition = or_(condition, self.column.is_(None))
+        return condition
+
+    def equals(self, value: Any):
+        return self.column.is_(None) if value is None else self.column == value
+
+
+def keyset_order(keys: Sequence[SortKey]) -> list:
+    """ORDER BY clauses for keys."""
+    return [key.order_by() for key in keys]
+
+
+def keyset_after(keys: Sequence[SortKey], values: Sequence[Any]):
+    """
+    WHERE condition for rows after the row with sort key `values`.
+
+    Same-direction, non-null keys compare as a row value, (k1, k2) > (v1, v2),
+    which an index on (k1, k2) serves directly. Otherwise it expands to
+    (k1 after v1) OR (k1 = v1 AND k2 after v2) OR ..., which handles mixed
+    directions and nullable columns.
+    """
+    if len({key.descending for key in keys}) == 1 and not any(key.nullable for key in keys):
+        row = tuple_(*[key.column for key in keys])
+        row_values = tuple_(*[literal(v, type_=key.column.type) for key, v in zip(keys, values, strict=True)])
+        return row < row_values if keys[0].descending else row > row_values
+
+    branches = []
+    for i, key in enumerate(keys):
+        ties = [keys[j].equals(values[j]) for j in range(i)]
+        branches.append(and_(*ties, key.after(values[i])))
+    return or_(*branches)
+
+
+@dataclass
+class Page(Generic[T]):
+    """One keyset page; next_cursor is None on the last page."""
+    items: List[T]
+    next_cursor: Optional[str]
+
+
+def paginate(
+    query,
+    keys: Sequence[SortKey],
+    limit: int,
+    after: Optional[str],
+    kind: str,
+    entity: Optional[Callable[[Any], Any]] = None,
+) -> Page:
+    """
+    Fetch one page of an ORM query in keyset order.
+
+    Args:
+        query: Filtered query (no ORDER BY, OFFSET or LIMIT)
+        keys: Sort order; the last key must be unique
+        limit: Page size
+        after: next_cursor of the previous page, or None for the first page
+        kind: Endpoint name embedded in cursors
+        entity: Maps a result row to the object holding the sort key
+            attributes, for multi-entity queries (default: the row itself)
+
+    Raises:
+        InvalidCursor: after is not a cursor this endpoint issued
+    """
+    if after:
+        query = query.filter(keyset_after(keys, decode_cursor(after, kind, len(keys))))
+
+    # One extra row tells us whether there is a next page
+    rows = query.order_by(*keyset_order(keys)).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = entity(rows[-1]) if entity else rows[-1]
+        next_cursor = encode_cursor(kind, [getattr(last, key.attr) for key in keys])
+    return Page(items=rows, next_cursor=next_cursor)
+
+
+__all__ = [
+    'InvalidCursor',
+    'encode_cursor',
+    'decode_cursor',
+    'SortKey',
+    'keyset_order',
+    'keyset_after',
+    'Page',
+    'paginate',
+]
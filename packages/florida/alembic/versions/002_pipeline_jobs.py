@@ -0,0 +1,55 @@
+"""Durable pipeline job queue
+
+Revision ID: 002_pipeline_jobs
+Revises: 001_initial
+Create Date: 2026-01-20
+
+Creates:
+- fl_pipeline_jobs: transcribe/analyze runs leased by `florida-cli worker`
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '002_pipeline_jobs'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'fl_pipeline_jobs',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('kind', sa.String(50), nullable=False),
+        sa.Column('payload', postgresql.JSONB(), nullable=False, server_default='{}'),
+        sa.Column('run_id', sa.String(64), index=True),
+
+        # Queue state
+        sa.Column('status', sa.String(20), nullable=False, server_default='queued'),
+        sa.Column('priority', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('max_attempts', sa.Integer(), nullable=False, server_default='3'),
+        sa.Column('run_after', sa.DateTime(), nullable=False, server_default=sa.text("(now() at time zone 'utc')")),
+
+        # Lease
+        sa.Column('locked_by', sa.String(100)),
+        sa.Column('locked_at', sa.DateTime()),
+        sa.Column('heartbeat_at', sa.DateTime()),
+
+        # Outcome
+        sa.Column('finished_at', sa.DateTime()),
+        sa.Column('last_error', sa.Text()),
+        sa.Column('result', postgresql.JSONB()),
+
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now()),
+    )
+    op.create_index('ix_fl_pipeline_jobs_status_run_after', 'fl_pipeline_jobs', ['status', 'run_after'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_fl_pipeline_jobs_status_run_after', table_name='fl_pipeline_jobs')
+    op.drop_table('fl_pipeline_jobs')
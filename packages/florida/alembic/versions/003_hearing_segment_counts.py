@@ -0,0 +1,47 @@
+"""Denormalized transcript counts on hearings
+
+Revision ID: 003_hearing_segment_counts
+Revises: 002_pipeline_jobs
+Create Date: 2026-01-22
+
+Adds:
+- fl_hearings.segment_count: maintained by the transcribe stage so the
+  dashboard hearings list doesn't count segments per row
+
+Backfills segment_count and word_count from fl_transcript_segments.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003_hearing_segment_counts'
+down_revision: Union[str, None] = '002_pipeline_jobs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'fl_hearings',
+        sa.Column('segment_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.execute("""
+        UPDATE fl_hearings h
+        SET segment_count = s.segment_count,
+            word_count = s.word_count
+        FROM (
+            SELECT
+                hearing_id,
+                COUNT(*) AS segment_count,
+                COALESCE(SUM(array_length(regexp_split_to_array(trim(text), '\\s+'), 1)), 0) AS word_count
+            FROM fl_transcript_segments
+            GROUP BY hearing_id
+        ) s
+        WHERE s.hearing_id = h.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('fl_hearings', 'segment_count')
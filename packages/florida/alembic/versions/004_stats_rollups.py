@@ -0,0 +1,65 @@
+"""Precomputed stats rollups
+
+Revision ID: 004_stats_rollups
+Revises: 003_hearing_segment_counts
+Create Date: 2026-01-22
+
+Adds:
+- fl_stats_rollups: additive dashboard counters per day, metric and
+  dimension, maintained by florida.services.stats
+- ix_fl_hearings_created_at: recent-hearing counts on /admin/stats
+
+Backfills the counters from the existing hearings and analyses (the same
+buckets `florida-cli reconcile-stats` computes).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004_stats_rollups'
+down_revision: Union[str, None] = '003_hearing_segment_counts'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'fl_stats_rollups',
+        sa.Column('state_code', sa.String(2), primary_key=True, server_default='FL'),
+        sa.Column('day', sa.Date, primary_key=True),
+        sa.Column('metric', sa.String(50), primary_key=True),
+        sa.Column('dimension', sa.String(100), primary_key=True, server_default=''),
+        sa.Column('value', sa.Numeric(18, 4), nullable=False, server_default='0'),
+    )
+    op.create_index('ix_fl_hearings_created_at', 'fl_hearings', ['created_at'])
+
+    op.execute("""
+        INSERT INTO fl_stats_rollups (state_code, day, metric, dimension, value)
+        SELECT 'FL', date(created_at), 'hearings', '', COUNT(*)
+        FROM fl_hearings GROUP BY 2
+        UNION ALL
+        SELECT 'FL', date(created_at), 'hearings_by_status', COALESCE(transcript_status, ''), COUNT(*)
+        FROM fl_hearings GROUP BY 2, 4
+        UNION ALL
+        SELECT 'FL', date(created_at), 'duration_seconds', '', SUM(duration_seconds)
+        FROM fl_hearings WHERE duration_seconds IS NOT NULL GROUP BY 2
+        UNION ALL
+        SELECT 'FL', date(created_at), 'segments', '', SUM(segment_count)
+        FROM fl_hearings WHERE segment_count > 0 GROUP BY 2
+        UNION ALL
+        SELECT 'FL', date(created_at), 'transcription_cost', COALESCE(whisper_model, ''), SUM(processing_cost_usd)
+        FROM fl_hearings WHERE processing_cost_usd IS NOT NULL GROUP BY 2, 4
+        UNION ALL
+        SELECT 'FL', date(created_at), 'analyses', '', COUNT(*)
+        FROM fl_analyses GROUP BY 2
+        UNION ALL
+        SELECT 'FL', date(created_at), 'analysis_cost', COALESCE(model, ''), SUM(cost_usd)
+        FROM fl_analyses WHERE cost_usd IS NOT NULL GROUP BY 2, 4
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_fl_hearings_created_at', table_name='fl_hearings')
+    op.drop_table('fl_stats_rollups')
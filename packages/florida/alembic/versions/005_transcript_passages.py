@@ -0,0 +1,53 @@
+"""Transcript passages for phrase search
+
+Revision ID: 005_transcript_passages
+Revises: 004_stats_rollups
+Create Date: 2026-01-26
+
+Adds:
+- fl_transcript_passages: overlapping windows of consecutive segments,
+  written by the transcribe stage, so phrases split across segments match
+- fl_transcript_passages.text_tsvector: generated tsvector with a GIN index,
+  searched by /api/search and /search/transcripts
+
+Hearings transcribed before this revision get passages from
+`florida-cli build-passages`; until then their segments are searched
+directly (see florida.services.passages).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005_transcript_passages'
+down_revision: Union[str, None] = '004_stats_rollups'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'fl_transcript_passages',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('hearing_id', sa.Integer(), sa.ForeignKey('fl_hearings.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('passage_index', sa.Integer(), nullable=False),
+        sa.Column('first_segment_index', sa.Integer(), nullable=False),
+        sa.Column('last_segment_index', sa.Integer(), nullable=False),
+        sa.Column('start_time', sa.Float()),
+        sa.Column('end_time', sa.Float()),
+        sa.Column('speakers', sa.String(500)),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.Column('segment_offsets', sa.JSON()),
+    )
+    op.execute("""
+        ALTER TABLE fl_transcript_passages
+        ADD COLUMN text_tsvector tsvector
+        GENERATED ALWAYS AS (to_tsvector('english', COALESCE(text, ''))) STORED
+    """)
+    op.create_index('ix_fl_passages_hearing_index', 'fl_transcript_passages', ['hearing_id', 'passage_index'])
+    op.execute('CREATE INDEX idx_fl_passages_fts ON fl_transcript_passages USING GIN(text_tsvector)')
+
+
+def downgrade() -> None:
+    op.drop_table('fl_transcript_passages')
@@ -0,0 +1,45 @@
+"""Resumable sync checkpoints
+
+Revision ID: 006_sync_checkpoints
+Revises: 005_transcript_passages
+Create Date: 2026-01-27
+
+Creates:
+- fl_sync_checkpoints: per-combination progress of concurrent ClerkOffice
+  docket syncs, so `florida-cli sync-dockets --concurrent` resumes after
+  a crash
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '006_sync_checkpoints'
+down_revision: Union[str, None] = '005_transcript_passages'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'fl_sync_checkpoints',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('run_id', sa.String(64), nullable=False, index=True),
+        sa.Column('source', sa.String(50), nullable=False),
+        sa.Column('key', sa.String(100), nullable=False),
+        sa.Column('params', postgresql.JSONB()),
+
+        sa.Column('status', sa.String(20), nullable=False, server_default='pending'),
+        sa.Column('item_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_error', sa.Text()),
+
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now()),
+        sa.Column('completed_at', sa.DateTime()),
+        sa.UniqueConstraint('run_id', 'key', name='uq_fl_sync_checkpoints_run_key'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('fl_sync_checkpoints')
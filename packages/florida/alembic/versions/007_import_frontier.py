@@ -0,0 +1,70 @@
+"""Thunderstone import frontier
+
+Revision ID: 007_import_frontier
+Revises: 006_sync_checkpoints
+Create Date: 2026-01-28
+
+Creates:
+- fl_import_frontier: (profile, search term) rows of the comprehensive
+  Thunderstone import, leased by worker processes like pipeline jobs
+- fl_thunderstone_ids: document ids claimed by importer workers
+- ix_fl_documents_thunderstone_id: for per-batch duplicate checks
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '007_import_frontier'
+down_revision: Union[str, None] = '006_sync_checkpoints'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'fl_import_frontier',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('profile', sa.String(50), nullable=False),
+        sa.Column('term', sa.String(200), nullable=False),
+        sa.Column('last_page', sa.Integer(), nullable=False, server_default='0'),
+
+        # Queue state (see fl_pipeline_jobs)
+        sa.Column('kind', sa.String(50), nullable=False, server_default='thunderstone_term'),
+        sa.Column('payload', postgresql.JSONB(), nullable=False, server_default='{}'),
+        sa.Column('run_id', sa.String(64), index=True),
+        sa.Column('status', sa.String(20), nullable=False, server_default='queued'),
+        sa.Column('priority', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('max_attempts', sa.Integer(), nullable=False, server_default='3'),
+        sa.Column('run_after', sa.DateTime(), nullable=False, server_default=sa.text("(now() at time zone 'utc')")),
+
+        # Lease
+        sa.Column('locked_by', sa.String(100)),
+        sa.Column('locked_at', sa.DateTime()),
+        sa.Column('heartbeat_at', sa.DateTime()),
+
+        # Outcome
+        sa.Column('finished_at', sa.DateTime()),
+        sa.Column('last_error', sa.Text()),
+        sa.Column('result', postgresql.JSONB()),
+
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now()),
+        sa.UniqueConstraint('profile', 'term', name='uq_fl_import_frontier_profile_term'),
+    )
+    op.create_index('ix_fl_import_frontier_status_run_after', 'fl_import_frontier', ['status', 'run_after'])
+
+    op.create_table(
+        'fl_thunderstone_ids',
+        sa.Column('thunderstone_id', sa.String(100), primary_key=True),
+    )
+    op.create_index('ix_fl_documents_thunderstone_id', 'fl_documents', ['thunderstone_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_fl_documents_thunderstone_id', table_name='fl_documents')
+    op.drop_table('fl_thunderstone_ids')
+    op.drop_index('ix_fl_import_frontier_status_run_after', table_name='fl_import_frontier')
+    op.drop_table('fl_import_frontier')
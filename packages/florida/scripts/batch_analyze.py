@@ -4,21 +4,40 @@ Batch analyze Florida hearings using GPT-4o-mini.
 
 Analyzes all hearings that don't have an analysis yet.
 Saves summaries, commissioner sentiment, outcomes, etc.
+
+Requests go through the shared rate-limited LLM service, so --concurrency
+hearings can be in flight without tripping the OpenAI rate limits
+(LLM_REQUESTS_PER_MINUTE / LLM_TOKENS_PER_MINUTE).
+
+With --batch, hearings are instead submitted through the offline Batch API
+(about half the cost): each run ingests finished batches, then submits
+hearings not yet analyzed or in flight. Set LLM_BATCH_PROVIDER=local to
+complete batches with a file-based stand-in.
 """
 
 import os
 import sys
 import json
-import time
+import asyncio
 import logging
 from datetime import datetime
+from pathlib import Path
 
 # Add package to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
-from openai import OpenAI
+
+from core.services.llm import Message, OpenAILLMService, get_llm_service
+from core.services.llm_batch import (
+    INGESTED,
+    BatchRequest,
+    BatchStore,
+    get_batch_provider,
+    parse_batch_result,
+    write_batch_file,
+)
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -30,9 +49,10 @@ DATABASE_URL = os.getenv('FL_DATABASE_URL', 'postgresql://csadmin:6IyN%2A%40%2Ab
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 MODEL = "gpt-4o-mini"
 
-# Cost tracking
-INPUT_COST_PER_1M = 0.15
-OUTPUT_COST_PER_1M = 0.60
+# Offline batch mode (--batch)
+BATCH_PROVIDER = os.getenv('LLM_BATCH_PROVIDER', 'openai')
+BATCH_DIR = Path(os.getenv('LLM_BATCH_DIR', 'data/florida/analysis_batches'))
+BATCH_KIND = "fl_analyze"
 
 SYSTEM_PROMPT = """You are a senior regulatory affairs analyst specializing in public utility commission (PSC/PUC) proceedings. Your analysis will inform executives about regulatory developments.
 
@@ -121,8 +141,8 @@ def get_transcript_text(db, hearing_id: int, max_chars: int = 100000) -> str:
     return full_text
 
 
-def analyze_hearing(client: OpenAI, hearing: dict, transcript_text: str) -> dict:
-    """Run GPT analysis on hearing transcript."""
+def build_messages(hearing: dict, transcript_text: str) -> list:
+    """System and user messages for a hearing."""
 
     # Try to extract docket from title (common format: "... for Docket No. 20250123-XX")
     import re
@@ -135,46 +155,28 @@ def analyze_hearing(client: OpenAI, hearing: dict, transcript_text: str) -> dict
         docket_number=docket_number,
         transcript_text=transcript_text
     )
+    return [Message("system", SYSTEM_PROMPT), Message("user", prompt)]
 
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            response = client.chat.completions.create(
-                model=MODEL,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.2,
-                response_format={"type": "json_object"},
-                max_tokens=4000
-            )
-
-            content = response.choices[0].message.content
-            data = json.loads(content)
-
-            # Calculate cost
-            input_tokens = response.usage.prompt_tokens
-            output_tokens = response.usage.completion_tokens
-            cost = (input_tokens * INPUT_COST_PER_1M / 1_000_000) + (output_tokens * OUTPUT_COST_PER_1M / 1_000_000)
-
-            return {
-                "success": True,
-                "data": data,
-                "cost_usd": cost,
-                "input_tokens": input_tokens,
-                "output_tokens": output_tokens
-            }
-
-        except Exception as e:
-            if "rate_limit" in str(e).lower() or "429" in str(e):
-                wait = 60 * (2 ** attempt)
-                logger.warning(f"Rate limited, waiting {wait}s...")
-                time.sleep(wait)
-                continue
-            raise
 
-    return {"success": False, "error": "Max retries exceeded"}
+async def analyze_hearing(llm: OpenAILLMService, hearing: dict, transcript_text: str) -> dict:
+    """Run GPT analysis on hearing transcript."""
+    response = await llm.acomplete(
+        build_messages(hearing, transcript_text),
+        temperature=0.2,
+        max_tokens=4000,
+        json_mode=True,
+    )
+
+    if not response.success:
+        return {"success": False, "error": response.error}
+
+    return {
+        "success": True,
+        "data": response.parsed_json,
+        "cost_usd": response.cost_usd,
+        "input_tokens": response.input_tokens,
+        "output_tokens": response.output_tokens
+    }
 
 
 def save_analysis(db, hearing_id: int, result: dict):
@@ -236,7 +238,111 @@ def save_analysis(db, hearing_id: int, result: dict):
     db.commit()
 
 
-def main(limit: int = 10):
+async def analyze_all(db, llm: OpenAILLMService, hearings: list, concurrency: int) -> float:
+    """Analyze hearings with up to `concurrency` requests in flight; save as each finishes."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def analyze_one(hearing: dict, transcript: str):
+        async with semaphore:
+            return hearing, await analyze_hearing(llm, hearing, transcript)
+
+    tasks = []
+    for hearing in hearings:
+        if hearing['segment_count'] == 0:
+            logger.warning(f"  Skipping {hearing['id']} - no transcript segments")
+            continue
+
+        transcript = get_transcript_text(db, hearing['id'])
+        if len(transcript) < 500:
+            logger.warning(f"  Skipping {hearing['id']} - transcript too short ({len(transcript)} chars)")
+            continue
+
+        tasks.append(analyze_one(hearing, transcript))
+
+    total_cost = 0
+    for i, task in enumerate(asyncio.as_completed(tasks), 1):
+        hearing, result = await task
+        logger.info(f"[{i}/{len(tasks)}] {hearing['title'][:60]}...")
+
+        if result['success']:
+            save_analysis(db, hearing['id'], result)
+            total_cost += result['cost_usd']
+            logger.info(f"  Done: ${result['cost_usd']:.4f} ({result['input_tokens']} in, {result['output_tokens']} out)")
+            logger.info(f"  Mood: {result['data'].get('commissioner_mood')}, Outcome: {result['data'].get('likely_outcome', '')[:60]}...")
+        else:
+            logger.error(f"  Failed: {result.get('error')}")
+
+    return total_cost
+
+
+def submit_batch(db, hearings: list, store: BatchStore, provider) -> None:
+    """Submit hearings that are not already in a batch as one offline batch."""
+    in_flight = store.pending_ids(BATCH_KIND)
+
+    requests = []
+    for hearing in hearings:
+        if str(hearing['id']) in in_flight:
+            continue
+        transcript = get_transcript_text(db, hearing['id'])
+        if len(transcript) < 500:
+            logger.warning(f"  Skipping {hearing['id']} - transcript too short ({len(transcript)} chars)")
+            continue
+        requests.append(BatchRequest(
+            custom_id=str(hearing['id']),
+            messages=build_messages(hearing, transcript),
+            max_tokens=4000,
+            temperature=0.2,
+            json_mode=True,
+        ))
+
+    if not requests:
+        logger.info("No hearings to submit")
+        return
+
+    request_file = store.request_path(BATCH_KIND)
+    write_batch_file(request_file, requests, MODEL)
+    batch_id = provider.submit(request_file, metadata={"kind": BATCH_KIND})
+    store.record(batch_id, BATCH_KIND, provider.name, MODEL, [r.custom_id for r in requests], request_file)
+    logger.info(f"Submitted {len(requests)} hearings as batch {batch_id}")
+
+
+def ingest_batches(db, store: BatchStore, provider) -> float:
+    """Save results of finished batches; hearings already analyzed are skipped."""
+    total_cost = 0
+    for manifest in store.open_manifests(BATCH_KIND):
+        job = provider.retrieve(manifest['batch_id'])
+        if not job.finished:
+            logger.info(f"Batch {job.id}: {job.status} {job.request_counts}")
+            store.mark(manifest, job.status, request_counts=job.request_counts)
+            continue
+
+        saved = skipped = failed = 0
+        for line in provider.results(job.id):
+            custom_id, response = parse_batch_result(line, json_mode=True)
+            if not response.success:
+                logger.error(f"  Hearing {custom_id} failed: {response.error}")
+                failed += 1
+                continue
+
+            exists = db.execute(
+                text("SELECT 1 FROM fl_analyses WHERE hearing_id = :hearing_id"),
+                {"hearing_id": int(custom_id)},
+            ).first()
+            if exists:
+                skipped += 1
+                continue
+
+            save_analysis(db, int(custom_id), {"data": response.parsed_json, "cost_usd": response.cost_usd})
+            total_cost += response.cost_usd
+            saved += 1
+
+        store.mark(manifest, INGESTED, batch_status=job.status, batch_error=job.error)
+        logger.info(f"Batch {job.id} ({job.status}): {saved} saved, {skipped} already analyzed, {failed} failed")
+
+    return total_cost
+
+
+def main(limit: int = 10, concurrency: int = 8, batch: bool = False):
     """Analyze unanalyzed hearings."""
 
     if not OPENAI_API_KEY:
@@ -247,7 +353,11 @@ def main(limit: int = 10):
     Session = sessionmaker(bind=engine)
     db = Session()
 
-    client = OpenAI(api_key=OPENAI_API_KEY)
+    if batch:
+        store = BatchStore(BATCH_DIR)
+        provider = get_batch_provider(BATCH_PROVIDER, BATCH_DIR, api_key=OPENAI_API_KEY)
+        total_cost = ingest_batches(db, store, provider)
+        logger.info(f"Ingested batch results: ${total_cost:.4f}")
 
     # Get hearings with transcripts but without analysis
     result = db.execute(text("""
@@ -271,31 +381,13 @@ def main(limit: int = 10):
 
     logger.info(f"Found {len(hearings)} hearings to analyze")
 
-    total_cost = 0
-    for i, hearing in enumerate(hearings, 1):
-        logger.info(f"[{i}/{len(hearings)}] Analyzing: {hearing['title'][:60]}...")
-
-        if hearing['segment_count'] == 0:
-            logger.warning(f"  Skipping - no transcript segments")
-            continue
-
-        transcript = get_transcript_text(db, hearing['id'])
-        if len(transcript) < 500:
-            logger.warning(f"  Skipping - transcript too short ({len(transcript)} chars)")
-            continue
-
-        result = analyze_hearing(client, hearing, transcript)
-
-        if result['success']:
-            save_analysis(db, hearing['id'], result)
-            total_cost += result['cost_usd']
-            logger.info(f"  Done: ${result['cost_usd']:.4f} ({result['input_tokens']} in, {result['output_tokens']} out)")
-            logger.info(f"  Mood: {result['data'].get('commissioner_mood')}, Outcome: {result['data'].get('likely_outcome', '')[:60]}...")
-        else:
-            logger.error(f"  Failed: {result.get('error')}")
+    if batch:
+        submit_batch(db, hearings, store, provider)
+        db.close()
+        return
 
-        # Rate limit protection
-        time.sleep(2)
+    llm = get_llm_service(MODEL, api_key=OPENAI_API_KEY)
+    total_cost = asyncio.run(analyze_all(db, llm, hearings, concurrency))
 
     logger.info(f"\nTotal cost: ${total_cost:.4f}")
     db.close()
@@ -305,5 +397,7 @@ if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser()
     parser.add_argument("--limit", type=int, default=10, help="Max hearings to analyze")
+    parser.add_argument("--concurrency", type=int, default=8, help="Hearings analyzed at once")
+    parser.add_argument("--batch", action="store_true", help="Ingest finished batches, then submit a new offline batch")
     args = parser.parse_args()
-    main(args.limit)
+    main(args.limit, args.concurrency, args.batch)
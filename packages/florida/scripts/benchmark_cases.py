@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark the /admin/cases list.
+
+Seeds a synthetic fixture (10k dockets by default, each with documents
+filed under the base or full docket number, hearings, case events and
+the odd selling window), then times list_cases at several page sizes and
+counts the SQL statements each call issues. The statement count should
+stay flat as the page grows.
+
+Everything is written inside one transaction and rolled back at the end,
+so it is safe to point at a development database. Needs PostgreSQL
+(list_cases filters docket numbers with a regex).
+
+Usage:
+    python scripts/benchmark_cases.py
+    python scripts/benchmark_cases.py --dockets 10000 --page-sizes 10,50,200
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add parent to path for imports
+script_dir = Path(__file__).resolve().parent
+src_dir = script_dir.parent / 'src'
+sys.path.insert(0, str(src_dir))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from sqlalchemy import event
+
+from florida.models import SessionLocal, FLDocket
+from florida.models.base import engine
+from florida.models.document import FLDocument
+from florida.models.hearing import FLHearing
+from florida.models.sales import FLCaseEvent, FLSellingWindow
+from florida.api.routes.admin import list_cases
+
+SECTORS = ['EI', 'GU', 'WU', 'WS', 'TP']
+
+
+def seed(db, docket_count: int) -> None:
+    """Synthetic dockets with related rows, flushed but not committed."""
+    rng = random.Random(42)
+    start = date(2015, 1, 1)
+
+    dockets, documents, hearings, events, windows = [], [], [], [], []
+    for i in range(docket_count):
+        year = 2015 + i % 10
+        sequence = 9000 + i // 10  # clear of real sequence numbers
+        sector = SECTORS[i % len(SECTORS)]
+        number = f"{year}{sequence:04d}-{sector}"
+        base = number.split('-')[0]
+        filed = start + timedelta(days=rng.randrange(3650))
+
+        dockets.append({
+            "docket_number": number,
+            "year": year,
+            "sequence": sequence,
+            "sector_code": sector,
+            "title": f"Benchmark docket {i}",
+            "utility_name": f"Utility {i % 40}",
+            "status": "Open" if i % 3 else "Closed",
+            "filed_date": filed,
+        })
+        document_count = rng.randrange(8)
+        for j in range(document_count):
+            documents.append({
+                # Documents often carry only the base number
+                "docket_number": base if j % 2 else number,
+                "title": f"Filing {j}",
+                "filed_date": filed + timedelta(days=j),
+            })
+        if document_count > 1:
+            # Legacy suffix-less docket the base-numbered documents point at;
+            # list_cases filters these out
+            dockets.append({"docket_number": base, "year": year, "sequence": sequence})
+        for j in range(rng.randrange(3)):
+            hearings.append({
+                "docket_number": number,
+                "title": f"Hearing {j} on {number}",
+                "hearing_date": filed + timedelta(days=30 * (j + 1)),
+            })
+        for j in range(rng.randrange(5)):
+            events.append({"docket_number": number, "event_date": filed + timedelta(days=7 * j)})
+        if i % 10 == 0:
+            windows.append({
+                "docket_number": number,
+                "window_date": filed + timedelta(days=90),
+                "is_active": True,
+            })
+
+    # Dockets first: the others reference fl_dockets.docket_number
+    db.bulk_insert_mappings(FLDocket, dockets)
+    db.flush()
+    db.bulk_insert_mappings(FLDocument, documents)
+    db.bulk_insert_mappings(FLHearing, hearings)
+    db.bulk_insert_mappings(FLCaseEvent, events)
+    db.bulk_insert_mappings(FLSellingWindow, windows)
+    db.flush()
+
+    print(
+        f"Seeded {docket_count} dockets ({len(dockets) - docket_count} legacy), {len(documents)} documents, "
+        f"{len(hearings)} hearings, {len(events)} events, {len(windows)} selling windows"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the /admin/cases list")
+    parser.add_argument("--dockets", type=int, default=10000, help="Dockets to seed")
+    parser.add_argument("--page-sizes", default="10,50,200", help="Comma-separated page sizes")
+    parser.add_argument("--runs", type=int, default=5, help="Timed calls per page size")
+    args = parser.parse_args()
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    db = SessionLocal()
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        seed(db, args.dockets)
+
+        for page_size in (int(p) for p in args.page_sizes.split(',')):
+            timings = []
+            for _ in range(args.runs):
+                statements.clear()
+                start = time.perf_counter()
+                result = list_cases(
+                    state="FL", status=None, utility=None, case_type=None, year=None,
+                    limit=page_size, offset=0, db=db,
+                )
+                timings.append(time.perf_counter() - start)
+            timings.sort()
+            print(
+                f"limit={page_size:>4}: {len(result.items)} items, {len(statements)} queries, "
+                f"median {timings[len(timings) // 2] * 1000:.1f}ms"
+            )
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+        db.rollback()
+        db.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
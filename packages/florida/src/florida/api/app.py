@@ -35,6 +35,8 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Browsers hide non-safelisted response headers from cross-origin scripts
+        expose_headers=["X-Next-Cursor"],
     )
 
     # Include routers
@@ -0,0 +1,105 @@
+"""
+Streaming exports for Florida transcripts.
+
+Export endpoints return a whole hearing, docket or search result set in
+one request: rows come through a server-side cursor (yield_per) and are
+encoded chunk by chunk by core.services.export, so memory stays flat
+however many segments there are.
+"""
+from typing import Sequence
+
+from fastapi import HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from core.services.export import (
+    CUE_FORMATS,
+    EXPORT_FORMATS,
+    SEGMENT_FIELDS,
+    export_chunks,
+    export_filename,
+)
+from florida.models.hearing import FLHearing, FLTranscriptSegment
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = 1000
+
+# Columns for exports spanning several hearings
+MULTI_HEARING_FIELDS = ["docket_number", "hearing_title", "hearing_date"] + SEGMENT_FIELDS
+
+
+def export_format_query():
+    """The `format` query parameter shared by export endpoints."""
+    return Query(
+        "ndjson",
+        alias="format",
+        pattern=f"^({'|'.join(EXPORT_FORMATS)})$",
+        description="ndjson, csv, vtt (WebVTT) or srt",
+    )
+
+
+def require_single_hearing(fmt: str) -> None:
+    """Subtitle timestamps restart with each recording, so they need one hearing."""
+    if fmt in CUE_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{fmt} export is only available for a single hearing",
+        )
+
+
+def segment_export_query(db: Session, with_hearing: bool = False):
+    """Segment columns for export (joined to the hearing for multi-hearing exports)."""
+    columns = [
+        FLTranscriptSegment.hearing_id,
+        FLTranscriptSegment.segment_index,
+        FLTranscriptSegment.start_time,
+        FLTranscriptSegment.end_time,
+        func.coalesce(FLTranscriptSegment.speaker_name, FLTranscriptSegment.speaker_label).label("speaker"),
+        FLTranscriptSegment.speaker_role,
+        FLTranscriptSegment.text,
+    ]
+    if not with_hearing:
+        return db.query(*columns)
+    return db.query(
+        FLHearing.docket_number,
+        FLHearing.title.label("hearing_title"),
+        FLHearing.hearing_date,
+        *columns,
+    ).join(FLHearing, FLHearing.id == FLTranscriptSegment.hearing_id)
+
+
+def stream_export(
+    db: Session,
+    query,
+    fmt: str,
+    filename: str,
+    fields: Sequence[str] = SEGMENT_FIELDS,
+) -> StreamingResponse:
+    """
+    Stream an ordered column query as an export download.
+
+    The query runs as the body is sent; the session is closed when the
+    stream ends so the cursor's connection is always released.
+    """
+    def rows():
+        try:
+            for row in query.yield_per(EXPORT_BATCH_SIZE):
+                yield row._asdict()
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        export_chunks(rows(), fmt, fields),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{export_filename(filename, fmt)}"'},
+    )
+
+
+__all__ = [
+    'MULTI_HEARING_FIELDS',
+    'export_format_query',
+    'require_single_hearing',
+    'segment_export_query',
+    'stream_export',
+]
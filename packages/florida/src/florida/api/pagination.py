@@ -0,0 +1,58 @@
+"""
+Keyset pagination for Florida list endpoints.
+
+Page-numbered endpoints keep working (page=N is an OFFSET page), but
+every response also carries next_cursor; passing it back as `after`
+fetches the following page by sort key instead of skipping rows, so deep
+pages cost the same as the first. Totals are counted on the first page
+by default and skipped while scrolling (include_total overrides).
+"""
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+
+from core.utils.pagination import InvalidCursor, SortKey, encode_cursor, keyset_order, paginate
+
+
+def want_total(include_total: Optional[bool], after: Optional[str]) -> bool:
+    """Whether to count matching rows for this request."""
+    return include_total if include_total is not None else after is None
+
+
+def keyset_page(
+    query,
+    keys: Sequence[SortKey],
+    page: int,
+    page_size: int,
+    after: Optional[str],
+    kind: str,
+    entity: Optional[Callable[[Any], Any]] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Rows and next_cursor for one page.
+
+    A cursor wins over page; page > 1 without a cursor is an OFFSET page
+    (which still returns a cursor for the page after it).
+
+    Raises:
+        HTTPException: 400 if after is not a cursor this endpoint issued
+    """
+    if page > 1 and not after:
+        rows = (
+            query.order_by(*keyset_order(keys))
+            .offset((page - 1) * page_size).limit(page_size + 1).all()
+        )
+        if len(rows) <= page_size:
+            return rows, None
+        # Hand back a cursor so the client can switch to keyset pages
+        rows = rows[:page_size]
+        last = entity(rows[-1]) if entity else rows[-1]
+        return rows, encode_cursor(kind, [getattr(last, key.attr) for key in keys])
+    try:
+        result = paginate(query, keys, limit=page_size, after=after, kind=kind, entity=entity)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return result.items, result.next_cursor
+
+
+__all__ = ['want_total', 'keyset_page']
@@ -5,22 +5,41 @@ Adapted from the multi-state backend to work with Florida-specific models.
 """
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sqlalchemy import func, text
 
+from core.utils.pagination import SortKey
+from florida.api.pagination import keyset_page, want_total
 from florida.models import get_db
-from florida.models.hearing import FLHearing, FLTranscriptSegment
+from florida.models.hearing import FLHearing, FLTranscriptPassage, FLTranscriptSegment
 from florida.models.analysis import FLAnalysis
 from florida.models.docket import FLDocket
 from florida.models.linking import FLHearingDocket
+from florida.models.job import FLPipelineJob
+from florida.services.stats import (
+    ANALYSIS_COST,
+    DURATION_SECONDS,
+    HEARINGS,
+    HEARINGS_BY_STATUS,
+    SEGMENTS,
+    STATE_CODE,
+    TRANSCRIPTION_COST,
+    rollups,
+)
 from florida.scraper import (
     get_scraper_status as _get_scraper_status,
     start_scraper_async,
     stop_scraper as _stop_scraper,
 )
 from florida.pipeline.stages import FLTranscribeStage, FLAnalyzeStage
+from florida.pipeline.jobs import (
+    enqueue_stage_jobs,
+    find_hearings_for_stage,
+    job_queue,
+)
+from core.services.job_queue import QUEUED, RUNNING, PAUSED, CANCELLED
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -206,59 +225,45 @@ def toggle_source(source_id: int, db: Session = Depends(get_db)):
 
 @router.get("/stats", response_model=AdminStatsResponse)
 def get_admin_stats(db: Session = Depends(get_db)):
-    """Get comprehensive admin statistics."""
+    """Get comprehensive admin statistics (from the fl_stats_rollups counters)."""
     now = datetime.now(timezone.utc)
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    week_start = today_start - timedelta(days=7)
-    month_start = today_start - timedelta(days=30)
+    today = now.date()
+
+    totals = rollups.totals(db, state_code=STATE_CODE)
 
     # Basic counts
-    total_hearings = db.query(func.count(FLHearing.id)).scalar() or 0
-    total_segments = db.query(func.count(FLTranscriptSegment.id)).scalar() or 0
-    total_analyses = db.query(func.count(FLAnalysis.id)).scalar() or 0
+    total_hearings = int(sum(totals[HEARINGS].values()))
+    total_segments = int(sum(totals[SEGMENTS].values()))
 
     # Duration in hours
-    total_seconds = db.query(func.sum(FLHearing.duration_seconds)).scalar() or 0
+    total_seconds = sum(totals[DURATION_SECONDS].values())
     total_hours = round(total_seconds / 3600, 1)
 
-    # Hearings by transcript_status
-    status_counts = db.query(
-        FLHearing.transcript_status,
-        func.count(FLHearing.id)
-    ).group_by(FLHearing.transcript_status).all()
-    hearings_by_status = {s or 'pending': c for s, c in status_counts}
+    # Hearings by transcript_status ('' is a NULL status)
+    hearings_by_status = {
+        status or 'pending': int(count)
+        for status, count in totals[HEARINGS_BY_STATUS].items() if count
+    }
 
     # Hearings by state (Florida only)
     hearings_by_state = {"FL": total_hearings}
 
-    # Costs from analyses
-    total_analysis_cost = db.query(func.sum(FLAnalysis.cost_usd)).scalar() or 0
-    total_transcription_cost = db.query(func.sum(FLHearing.processing_cost_usd)).scalar() or 0
+    # Costs
+    total_analysis_cost = sum(totals[ANALYSIS_COST].values())
+    total_transcription_cost = sum(totals[TRANSCRIPTION_COST].values())
 
-    # Cost breakdown by model
+    # Cost breakdown by model ('' is a NULL model)
     cost_by_model = {}
-
-    # Analysis costs - first try FLAnalysis table which has model info
-    analysis_by_model = db.query(
-        func.coalesce(FLAnalysis.model, 'gpt-4o-mini'),
-        func.sum(FLAnalysis.cost_usd)
-    ).filter(FLAnalysis.cost_usd.isnot(None)).group_by(func.coalesce(FLAnalysis.model, 'gpt-4o-mini')).all()
-
-    for model_name, cost in analysis_by_model:
-        if model_name and cost:
-            cost_by_model[model_name] = float(cost or 0)
-
-    # Transcription costs by whisper model
-    transcription_by_model = db.query(
-        func.coalesce(FLHearing.whisper_model, 'whisper-large-v3-turbo'),
-        func.sum(FLHearing.processing_cost_usd)
-    ).filter(FLHearing.processing_cost_usd.isnot(None)).group_by(func.coalesce(FLHearing.whisper_model, 'whisper-large-v3-turbo')).all()
-
-    for model_name, cost in transcription_by_model:
-        if model_name and cost:
-            cost_by_model[model_name] = cost_by_model.get(model_name, 0) + float(cost or 0)
-
-    # Recent activity
+    for metric, default_model in (
+        (ANALYSIS_COST, 'gpt-4o-mini'),
+        (TRANSCRIPTION_COST, 'whisper-large-v3-turbo'),
+    ):
+        for model_name, cost in totals[metric].items():
+            if cost:
+                model_name = model_name or default_model
+                cost_by_model[model_name] = cost_by_model.get(model_name, 0) + cost
+
+    # Recent activity (range scans on idx_fl_hearings_created_at)
     hearings_24h = db.query(func.count(FLHearing.id)).filter(
         FLHearing.created_at >= now - timedelta(hours=24)
     ).scalar() or 0
@@ -266,33 +271,16 @@ def get_admin_stats(db: Session = Depends(get_db)):
         FLHearing.created_at >= now - timedelta(days=7)
     ).scalar() or 0
 
-    # Pipeline status counts based on transcript_status
-    pending_count = db.query(func.count(FLHearing.id)).filter(
-        FLHearing.transcript_status.is_(None)
-    ).scalar() or 0
-
-    # Count hearings with transcripts but no analysis
-    transcribed_no_analysis = db.execute(text("""
-        SELECT COUNT(*) FROM fl_hearings h
-        LEFT JOIN fl_analyses a ON a.hearing_id = h.id
-        WHERE h.transcript_status = 'transcribed' AND a.id IS NULL
-    """)).scalar() or 0
-
-    # Error count (hearings with 'error' in transcript_status)
-    error_count = db.query(func.count(FLHearing.id)).filter(
-        FLHearing.transcript_status == 'error'
-    ).scalar() or 0
+    # Pipeline status counts based on transcript_status. The analyze stage
+    # moves hearings on to 'analyzed', so 'transcribed' ones await analysis.
+    pending_count = int(totals[HEARINGS_BY_STATUS].get('', 0))
+    transcribed_count = int(totals[HEARINGS_BY_STATUS].get('transcribed', 0))
+    error_count = int(totals[HEARINGS_BY_STATUS].get('error', 0))
 
     # Cost calculations
-    cost_today = db.query(func.sum(FLAnalysis.cost_usd)).filter(
-        FLAnalysis.created_at >= today_start
-    ).scalar() or 0
-    cost_week = db.query(func.sum(FLAnalysis.cost_usd)).filter(
-        FLAnalysis.created_at >= week_start
-    ).scalar() or 0
-    cost_month = db.query(func.sum(FLAnalysis.cost_usd)).filter(
-        FLAnalysis.created_at >= month_start
-    ).scalar() or 0
+    cost_today = rollups.sum_since(db, ANALYSIS_COST, today, state_code=STATE_CODE)
+    cost_week = rollups.sum_since(db, ANALYSIS_COST, today - timedelta(days=7), state_code=STATE_CODE)
+    cost_month = rollups.sum_since(db, ANALYSIS_COST, today - timedelta(days=30), state_code=STATE_CODE)
 
     return AdminStatsResponse(
         total_states=1,
@@ -302,20 +290,20 @@ def get_admin_stats(db: Session = Depends(get_db)):
         total_hours=total_hours,
         hearings_by_status=hearings_by_status,
         hearings_by_state=hearings_by_state,
-        total_transcription_cost=float(total_transcription_cost),
-        total_analysis_cost=float(total_analysis_cost),
-        total_cost=float(total_transcription_cost) + float(total_analysis_cost),
+        total_transcription_cost=round(total_transcription_cost, 4),
+        total_analysis_cost=round(total_analysis_cost, 4),
+        total_cost=round(total_transcription_cost + total_analysis_cost, 4),
         cost_by_model=cost_by_model,
         hearings_last_24h=hearings_24h,
         hearings_last_7d=hearings_7d,
         sources_healthy=1,
         sources_error=0,
-        pipeline_jobs_pending=pending_count + transcribed_no_analysis,
+        pipeline_jobs_pending=pending_count + transcribed_count,
         pipeline_jobs_running=0,
         pipeline_jobs_error=error_count,
-        cost_today=float(cost_today),
-        cost_this_week=float(cost_week),
-        cost_this_month=float(cost_month)
+        cost_today=round(cost_today, 4),
+        cost_this_week=round(cost_week, 4),
+        cost_this_month=round(cost_month, 4)
     )
 
 
@@ -331,6 +319,8 @@ def list_hearings_admin(
     date_to: Optional[str] = None,
     page: int = 1,
     page_size: int = 50,
+    after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: Optional[bool] = Query(None, description="Count matches (default: first page only)"),
     db: Session = Depends(get_db)
 ):
     """List hearings with pipeline status for admin dashboard."""
@@ -359,27 +349,32 @@ def list_hearings_admin(
         query = query.filter(FLHearing.hearing_date <= date_to)
 
     # Get total count
-    total = query.count()
+    total = query.count() if want_total(include_total, after) else None
 
-    # Order by most recent first
-    query = query.order_by(FLHearing.created_at.desc())
+    # Analysis flag in the same query; segment_count is denormalized on the hearing
+    analysis_ids = (
+        db.query(FLAnalysis.hearing_id, FLAnalysis.id.label("analysis_id"))
+        .subquery()
+    )
+    query = (
+        query.outerjoin(analysis_ids, analysis_ids.c.hearing_id == FLHearing.id)
+        .add_columns(analysis_ids.c.analysis_id)
+    )
 
-    # Pagination
-    offset = (page - 1) * page_size
-    hearings = query.offset(offset).limit(page_size).all()
+    # Most recent first
+    keys = [
+        SortKey(FLHearing.created_at, descending=True, nullable=True),
+        SortKey(FLHearing.id, descending=True),
+    ]
+    rows, next_cursor = keyset_page(
+        query, keys, page, page_size, after, "admin-hearings", entity=lambda row: row[0]
+    )
 
     # Build response
     items = []
-    for h in hearings:
-        # Get segment count
-        segment_count = db.query(func.count(FLTranscriptSegment.id)).filter(
-            FLTranscriptSegment.hearing_id == h.id
-        ).scalar() or 0
-
-        # Check if analyzed
-        has_analysis = db.query(FLAnalysis.id).filter(
-            FLAnalysis.hearing_id == h.id
-        ).first() is not None
+    for h, analysis_id in rows:
+        segment_count = h.segment_count or 0
+        has_analysis = analysis_id is not None
 
         # Determine pipeline status
         if has_analysis:
@@ -409,14 +404,15 @@ def list_hearings_admin(
             "has_analysis": has_analysis
         })
 
-    total_pages = (total + page_size - 1) // page_size
+    total_pages = (total + page_size - 1) // page_size if total is not None else None
 
     return {
         "items": items,
         "total": total,
         "page": page,
         "page_size": page_size,
-        "total_pages": total_pages
+        "total_pages": total_pages,
+        "next_cursor": next_cursor,
     }
 
 
@@ -433,13 +429,18 @@ def retry_hearing(
 
     # Reset the transcript status to allow reprocessing
     if stage == 'analyze' or stage is None:
-        # Delete existing analysis to allow re-analysis
-        db.query(FLAnalysis).filter(FLAnalysis.hearing_id == hearing_id).delete()
+        # Delete existing analysis to allow re-analysis (through the
+        # session, so the stats rollups see it)
+        for analysis in db.query(FLAnalysis).filter(FLAnalysis.hearing_id == hearing_id):
+            db.delete(analysis)
 
     if stage == 'transcribe' or (stage is None and hearing.transcript_status == 'error'):
         hearing.transcript_status = None
         # Optionally delete segments to re-transcribe
         db.query(FLTranscriptSegment).filter(FLTranscriptSegment.hearing_id == hearing_id).delete()
+        db.query(FLTranscriptPassage).filter(FLTranscriptPassage.hearing_id == hearing_id).delete()
+        hearing.segment_count = 0
+        hearing.word_count = None
 
     db.commit()
 
@@ -470,15 +471,31 @@ def cancel_hearing(hearing_id: int, db: Session = Depends(get_db)):
 # PIPELINE STATUS & CONTROL
 # ============================================================================
 
-# Simple in-memory pipeline state (would use Redis in production)
-_pipeline_state = {
-    "status": "idle",
-    "started_at": None,
-    "current_hearing_id": None,
-    "current_stage": None,
-    "hearings_processed": 0,
-    "errors_count": 0
-}
+# Pipeline work lives in the fl_pipeline_jobs queue and is processed by
+# `florida-cli worker` processes; these endpoints enqueue and report on it.
+
+
+def _pipeline_activity(db: Session) -> dict:
+    """Overall pipeline status from the job queue."""
+    counts = job_queue.counts(db)
+    if counts.get(RUNNING) or counts.get(QUEUED):
+        status = "running"
+    elif counts.get(PAUSED):
+        status = "paused"
+    else:
+        status = "idle"
+
+    current = db.query(FLPipelineJob).filter(
+        FLPipelineJob.status == RUNNING
+    ).order_by(FLPipelineJob.locked_at.desc()).first()
+
+    return {
+        "status": status,
+        "counts": counts,
+        "started_at": current.locked_at.isoformat() if current and current.locked_at else None,
+        "current_hearing_id": (current.payload or {}).get("hearing_id") if current else None,
+        "current_stage": current.kind if current else None,
+    }
 
 
 @router.get("/pipeline/status", response_model=PipelineStatusResponse)
@@ -520,18 +537,19 @@ def get_pipeline_status(db: Session = Depends(get_db)):
     total_cost = db.query(func.sum(FLAnalysis.cost_usd)).scalar() or 0
 
     # Get current hearing if processing
+    activity = _pipeline_activity(db)
     current_title = None
-    if _pipeline_state.get("current_hearing_id"):
-        h = db.query(FLHearing).filter(FLHearing.id == _pipeline_state["current_hearing_id"]).first()
+    if activity["current_hearing_id"]:
+        h = db.query(FLHearing).filter(FLHearing.id == activity["current_hearing_id"]).first()
         if h:
             current_title = h.title
 
     return PipelineStatusResponse(
-        status=_pipeline_state.get("status", "idle"),
-        started_at=_pipeline_state.get("started_at"),
-        current_hearing_id=_pipeline_state.get("current_hearing_id"),
+        status=activity["status"],
+        started_at=activity["started_at"],
+        current_hearing_id=activity["current_hearing_id"],
         current_hearing_title=current_title,
-        current_stage=_pipeline_state.get("current_stage"),
+        current_stage=activity["current_stage"],
         hearings_processed=analyzed,
         errors_count=errors,
         total_cost_usd=float(total_cost or 0),
@@ -561,137 +579,54 @@ class PipelineStartRequest(BaseModel):
     limit: int = 10  # Max hearings to process
 
 
-def _run_pipeline_stages(
-    stage: Optional[str],
-    limit: int,
-    max_cost: Optional[float],
-    db_session_factory
-):
-    """Background task to run pipeline stages."""
-    from florida.models import SessionLocal
-    db = db_session_factory()
-
-    try:
-        _pipeline_state["status"] = "running"
-        _pipeline_state["hearings_processed"] = 0
-        _pipeline_state["errors_count"] = 0
-
-        stages_to_run = [stage] if stage else ["transcribe", "analyze"]
-        total_cost = 0.0
-
-        for current_stage in stages_to_run:
-            if _pipeline_state["status"] == "stopping":
-                break
-
-            _pipeline_state["current_stage"] = current_stage
-
-            # Initialize stage
-            if current_stage == "transcribe":
-                pipeline_stage = FLTranscribeStage()
-                # Find hearings needing transcription (no segments yet)
-                hearings = db.execute(text("""
-                    SELECT h.id FROM fl_hearings h
-                    WHERE NOT EXISTS (
-                        SELECT 1 FROM fl_transcript_segments s WHERE s.hearing_id = h.id
-                    )
-                    AND (h.transcript_status IS NULL OR h.transcript_status NOT IN ('transcribed', 'analyzed', 'error', 'skipped'))
-                    LIMIT :limit
-                """), {"limit": limit}).fetchall()
-                hearing_ids = [r[0] for r in hearings]
-
-            elif current_stage == "analyze":
-                pipeline_stage = FLAnalyzeStage()
-                # Find hearings needing analysis (have segments but no analysis)
-                hearings = db.execute(text("""
-                    SELECT DISTINCT h.id FROM fl_hearings h
-                    JOIN fl_transcript_segments s ON s.hearing_id = h.id
-                    LEFT JOIN fl_analyses a ON a.hearing_id = h.id
-                    WHERE a.id IS NULL
-                    LIMIT :limit
-                """), {"limit": limit}).fetchall()
-                hearing_ids = [r[0] for r in hearings]
-            else:
-                continue
-
-            # Process each hearing
-            for hearing_id in hearing_ids:
-                if _pipeline_state["status"] == "stopping":
-                    break
-
-                if max_cost and total_cost >= max_cost:
-                    break
-
-                hearing = db.query(FLHearing).filter(FLHearing.id == hearing_id).first()
-                if not hearing:
-                    continue
-
-                _pipeline_state["current_hearing_id"] = hearing.id
-
-                try:
-                    is_valid, validation_error = pipeline_stage.validate(hearing, db)
-                    if not is_valid:
-                        continue
-
-                    result = pipeline_stage.execute(hearing, db)
-
-                    if result.success:
-                        _pipeline_state["hearings_processed"] += 1
-                        total_cost += result.cost_usd
-                    else:
-                        _pipeline_state["errors_count"] += 1
-
-                except Exception as e:
-                    _pipeline_state["errors_count"] += 1
-
-        _pipeline_state["status"] = "idle"
-        _pipeline_state["current_stage"] = None
-        _pipeline_state["current_hearing_id"] = None
-
-    except Exception as e:
-        _pipeline_state["status"] = "error"
-        _pipeline_state["errors_count"] += 1
-    finally:
-        db.close()
-
-
 @router.post("/pipeline/start")
 def start_pipeline(
     request: PipelineStartRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
-    Start the pipeline to process hearings.
+    Queue hearings for processing.
 
     Accepts JSON body:
     - only_stage: "transcribe" or "analyze" (optional, runs both if not specified)
     - limit: Max hearings to process (default 10)
     - max_cost: Maximum USD to spend (optional)
-    """
-    if _pipeline_state["status"] == "running":
-        raise HTTPException(status_code=409, detail="Pipeline is already running")
 
-    _pipeline_state["status"] = "starting"
-    _pipeline_state["started_at"] = datetime.now(timezone.utc).isoformat()
-    _pipeline_state["current_stage"] = request.only_stage
+    Without only_stage, each transcribed hearing is queued for analysis
+    when its transcription finishes.
+    """
+    if request.only_stage and request.only_stage not in ("transcribe", "analyze"):
+        raise HTTPException(status_code=400, detail=f"Unknown stage: {request.only_stage}")
 
-    # Get the session factory for background task
-    from florida.models import SessionLocal
+    if _pipeline_activity(db)["status"] == "running":
+        raise HTTPException(status_code=409, detail="Pipeline is already running")
 
-    # Run in background
-    background_tasks.add_task(
-        _run_pipeline_stages,
-        request.only_stage,
-        request.limit,
-        request.max_cost,
-        SessionLocal
-    )
+    run_id = None
+    queued = 0
+    if request.only_stage in (None, "transcribe"):
+        hearing_ids = find_hearings_for_stage(db, "transcribe", request.limit)
+        run_id = enqueue_stage_jobs(
+            db, "transcribe", hearing_ids,
+            then=None if request.only_stage else ["analyze"],
+            max_cost_usd=request.max_cost,
+        )
+        queued += len(hearing_ids)
+    if request.only_stage in (None, "analyze"):
+        hearing_ids = find_hearings_for_stage(db, "analyze", request.limit)
+        run_id = enqueue_stage_jobs(
+            db, "analyze", hearing_ids,
+            max_cost_usd=request.max_cost,
+            run_id=run_id,
+        )
+        queued += len(hearing_ids)
 
     return {
         "message": "Pipeline started",
+        "run_id": run_id,
         "stages": [request.only_stage] if request.only_stage else ["transcribe", "analyze"],
         "limit": request.limit,
         "max_cost": request.max_cost,
+        "queued": queued,
         "status": "starting"
     }
 
@@ -707,39 +642,18 @@ class PipelineRunRequest(BaseModel):
 @router.post("/pipeline/run")
 def run_pipeline_compat(
     request: PipelineRunRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
     Run pipeline (dashboard compatibility endpoint).
 
-    Maps to the start endpoint with appropriate parameters.
+    Queues the hearings needing this stage.
     """
-    from florida.models import SessionLocal
-
-    # Find hearings needing this stage
-    if request.stage == "transcribe":
-        hearings = db.execute(text("""
-            SELECT h.id FROM fl_hearings h
-            WHERE NOT EXISTS (
-                SELECT 1 FROM fl_transcript_segments s WHERE s.hearing_id = h.id
-            )
-            AND (h.transcript_status IS NULL OR h.transcript_status NOT IN ('transcribed', 'analyzed', 'error', 'skipped'))
-            LIMIT :limit
-        """), {"limit": request.limit}).fetchall()
-    elif request.stage == "analyze":
-        hearings = db.execute(text("""
-            SELECT DISTINCT h.id FROM fl_hearings h
-            JOIN fl_transcript_segments s ON s.hearing_id = h.id
-            LEFT JOIN fl_analyses a ON a.hearing_id = h.id
-            WHERE a.id IS NULL
-            LIMIT :limit
-        """), {"limit": request.limit}).fetchall()
-    else:
+    try:
+        hearing_ids = find_hearings_for_stage(db, request.stage, request.limit)
+    except ValueError:
         raise HTTPException(status_code=400, detail=f"Unknown stage: {request.stage}")
 
-    hearing_ids = [r[0] for r in hearings]
-
     if not hearing_ids:
         return {
             "status": "completed",
@@ -751,27 +665,17 @@ def run_pipeline_compat(
             "errors": []
         }
 
-    # Run in background
-    _pipeline_state["status"] = "running"
-    _pipeline_state["started_at"] = datetime.now(timezone.utc).isoformat()
-    _pipeline_state["current_stage"] = request.stage
-
-    background_tasks.add_task(
-        _run_pipeline_stages,
-        request.stage,
-        request.limit,
-        None,
-        SessionLocal
-    )
+    run_id = enqueue_stage_jobs(db, request.stage, hearing_ids)
 
     return {
         "status": "running",
+        "run_id": run_id,
         "stage": request.stage,
         "total": len(hearing_ids),
         "successful": 0,
         "failed": 0,
         "total_cost_usd": 0,
-        "started_at": _pipeline_state["started_at"]
+        "started_at": datetime.now(timezone.utc).isoformat()
     }
 
 
@@ -875,24 +779,25 @@ def get_pending_hearings(
 
 
 @router.post("/pipeline/stop")
-def stop_pipeline():
-    """Stop the pipeline."""
-    _pipeline_state["status"] = "stopping"
-    return {"message": "Pipeline stop requested", "status": "stopping"}
+def stop_pipeline(db: Session = Depends(get_db)):
+    """Stop the pipeline: cancel queued jobs, let running ones finish."""
+    cancelled = job_queue.set_status(db, QUEUED, CANCELLED)
+    cancelled += job_queue.set_status(db, PAUSED, CANCELLED)
+    return {"message": "Pipeline stop requested", "status": "stopping", "cancelled": cancelled}
 
 
 @router.post("/pipeline/pause")
-def pause_pipeline():
-    """Pause the pipeline."""
-    _pipeline_state["status"] = "paused"
-    return {"message": "Pipeline paused", "status": "paused"}
+def pause_pipeline(db: Session = Depends(get_db)):
+    """Pause the pipeline: hold queued jobs until resumed."""
+    paused = job_queue.set_status(db, QUEUED, PAUSED)
+    return {"message": "Pipeline paused", "status": "paused", "paused": paused}
 
 
 @router.post("/pipeline/resume")
-def resume_pipeline():
+def resume_pipeline(db: Session = Depends(get_db)):
     """Resume the pipeline."""
-    _pipeline_state["status"] = "running"
-    return {"message": "Pipeline resumed", "status": "running"}
+    resumed = job_queue.set_status(db, PAUSED, QUEUED)
+    return {"message": "Pipeline resumed", "status": "running", "resumed": resumed}
 
 
 @router.get("/pipeline/activity")
@@ -968,9 +873,19 @@ def skip_pipeline_hearing(hearing_id: int, db: Session = Depends(get_db)):
 @router.post("/pipeline/retry-all")
 def retry_all_errors(db: Session = Depends(get_db)):
     """Retry all hearings with errors."""
+    created_day = func.date(FLHearing.created_at)
+    errors_by_day = db.query(created_day, func.count(FLHearing.id)).filter(
+        FLHearing.transcript_status == 'error'
+    ).group_by(created_day).all()
     error_count = db.query(FLHearing).filter(
         FLHearing.transcript_status == 'error'
     ).update({FLHearing.transcript_status: None})
+    # Bulk update bypasses the rollup flush hook. Counters are bucketed by
+    # the hearings' creation day; a race with the count above is left to
+    # reconciliation.
+    for day, count in errors_by_day:
+        rollups.add(db, STATE_CODE, HEARINGS_BY_STATUS, -count, 'error', day=day)
+        rollups.add(db, STATE_CODE, HEARINGS_BY_STATUS, count, '', day=day)
     db.commit()
 
     return {"message": f"Reset {error_count} hearings for retry", "count": error_count}
@@ -1025,7 +940,6 @@ def list_pipeline_runs(
 @router.post("/pipeline/run-stage")
 def run_pipeline_stage(
     request: RunStageRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
@@ -1550,6 +1464,8 @@ def list_dockets(
     search: Optional[str] = None,
     page: int = 1,
     page_size: int = 50,
+    after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: Optional[bool] = Query(None, description="Count matches (default: first page only)"),
     db: Session = Depends(get_db)
 ):
     """List dockets with filtering and pagination."""
@@ -1568,10 +1484,12 @@ def list_dockets(
             (FLDocket.utility_name.ilike(f"%{search}%"))
         )
 
-    total = query.count()
-    dockets = query.order_by(FLDocket.filed_date.desc().nullslast()).offset(
-        (page - 1) * page_size
-    ).limit(page_size).all()
+    total = query.count() if want_total(include_total, after) else None
+    keys = [
+        SortKey(FLDocket.filed_date, descending=True, nullable=True),
+        SortKey(FLDocket.id, descending=True),
+    ]
+    dockets, next_cursor = keyset_page(query, keys, page, page_size, after, "admin-dockets")
 
     return {
         "items": [
@@ -1592,7 +1510,8 @@ def list_dockets(
         "total": total,
         "page": page,
         "page_size": page_size,
-        "total_pages": (total + page_size - 1) // page_size
+        "total_pages": (total + page_size - 1) // page_size if total is not None else None,
+        "next_cursor": next_cursor,
     }
 
 
@@ -1939,6 +1858,41 @@ class CaseListResponse(BaseModel):
     offset: int
 
 
+def _case_counts(db: Session, docket_numbers: List[str]) -> dict:
+    """
+    Document, hearing and event counts for a page of dockets, keyed by docket number.
+
+    Documents and hearings often carry only the base docket number
+    ("20250011" for "20250011-EI"), so those counts are grouped over both
+    forms and callers add the two. Events are recorded with the full number.
+    "windows" is the set of dockets with an active selling window.
+    """
+    from florida.models.document import FLDocument
+    from florida.models.sales import FLCaseEvent, FLSellingWindow
+
+    if not docket_numbers:
+        return {"documents": {}, "hearings": {}, "events": {}, "windows": set()}
+
+    keys = set(docket_numbers) | {n.split('-')[0] for n in docket_numbers}
+
+    def grouped(column, values):
+        return dict(
+            db.query(column, func.count()).filter(column.in_(values)).group_by(column).all()
+        )
+
+    windows = db.query(FLSellingWindow.docket_number).filter(
+        FLSellingWindow.docket_number.in_(docket_numbers),
+        FLSellingWindow.is_active == True
+    ).distinct().all()
+
+    return {
+        "documents": grouped(FLDocument.docket_number, keys),
+        "hearings": grouped(FLHearing.docket_number, keys),
+        "events": grouped(FLCaseEvent.docket_number, docket_numbers),
+        "windows": {row[0] for row in windows},
+    }
+
+
 @router.get("/cases", response_model=CaseListResponse)
 def list_cases(
     state: str = "FL",
@@ -1956,10 +1910,6 @@ def list_cases(
     Pulls from fl_dockets, enriches with counts from fl_documents, fl_hearings, fl_case_events.
     This is the main endpoint for the Cases page in the sales dashboard.
     """
-    from florida.models.document import FLDocument
-    from florida.models.hearing import FLHearing
-    from florida.models.sales import FLCaseEvent, FLSellingWindow
-
     query = db.query(FLDocket)
 
     # Exclude junk records created from order numbers
@@ -2012,39 +1962,16 @@ def list_cases(
         FLDocket.filed_date.desc().nullslast()
     ).offset(offset).limit(limit).all()
 
-    # Enrich with counts
+    # Enrich with counts: a fixed number of grouped queries for the whole page
+    counts = _case_counts(db, [d.docket_number for d in dockets])
+
     results = []
     for d in dockets:
-        # Extract base docket number (first 8 digits) for matching documents
-        # Documents often don't have the sector suffix (e.g., "20250011" not "20250011-EI")
-        base_docket = d.docket_number.split('-')[0] if d.docket_number else None
-
-        # Document count - match on base docket number OR full docket number
-        doc_count = db.query(func.count(FLDocument.id)).filter(
-            or_(
-                FLDocument.docket_number == d.docket_number,
-                FLDocument.docket_number == base_docket
-            )
-        ).scalar() or 0
-
-        # Hearing count - match on docket_number directly (also check base number)
-        hearing_count = db.query(func.count(FLHearing.id)).filter(
-            or_(
-                FLHearing.docket_number == d.docket_number,
-                FLHearing.docket_number == base_docket
-            )
-        ).scalar() or 0
-
-        # Event count - match on full docket number (events have proper format)
-        event_count = db.query(func.count(FLCaseEvent.id)).filter(
-            FLCaseEvent.docket_number == d.docket_number
-        ).scalar() or 0
-
-        # Check for active selling windows
-        has_windows = db.query(FLSellingWindow.id).filter(
-            FLSellingWindow.docket_number == d.docket_number,
-            FLSellingWindow.is_active == True
-        ).first() is not None
+        base_docket = d.docket_number.split('-')[0]
+        doc_count = counts["documents"].get(d.docket_number, 0) + counts["documents"].get(base_docket, 0)
+        hearing_count = counts["hearings"].get(d.docket_number, 0) + counts["hearings"].get(base_docket, 0)
+        event_count = counts["events"].get(d.docket_number, 0)
+        has_windows = d.docket_number in counts["windows"]
 
         results.append({
             "docket_number": d.docket_number,
@@ -7,16 +7,27 @@ providing a compatibility layer for the Florida-specific data.
 
 from typing import Optional, List
 from datetime import datetime
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import text, func
+from sqlalchemy import func
 from pydantic import BaseModel
 
+from core.utils.pagination import SortKey
+from florida.api.pagination import keyset_page, want_total
 from florida.models import get_db
 from florida.models.hearing import FLHearing, FLTranscriptSegment
 from florida.models.analysis import FLAnalysis
 from florida.models.docket import FLDocket
 from florida.models.watchlist import FLWatchlist
+from florida.services.passages import count_passage_matches, search_passages
+from florida.services.stats import (
+    DURATION_SECONDS,
+    HEARINGS,
+    SEGMENTS,
+    STATE_CODE,
+    TRANSCRIPTION_COST,
+    rollups,
+)
 
 router = APIRouter(tags=["dashboard"])
 
@@ -155,14 +166,15 @@ class Segment(BaseModel):
 
 class TranscriptResponse(BaseModel):
     hearing_id: int
-    total_segments: int
+    total_segments: Optional[int] = None
     segments: List[Segment]
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 class SearchResult(BaseModel):
-    segment_id: int
+    segment_id: Optional[int] = None  # Segment the match begins in
     hearing_id: int
     hearing_title: str
     state_code: str = "FL"
@@ -251,6 +263,7 @@ def get_state(state_code: str, db: Session = Depends(get_db)):
 
 @router.get("/api/hearings", response_model=List[HearingListItem])
 def get_hearings(
+    response: Response,
     states: Optional[str] = None,
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
@@ -259,9 +272,15 @@ def get_hearings(
     page_size: int = Query(20, ge=1, le=100),
     sort_by: str = "hearing_date",
     sort_order: str = "desc",
+    after: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
     db: Session = Depends(get_db)
 ):
-    """Get list of hearings with analysis indicators."""
+    """
+    Get list of hearings with analysis indicators.
+
+    The body stays a plain list for the dashboard; the cursor for the next
+    page is returned in the X-Next-Cursor header.
+    """
     # Query hearings with their analysis
     query = db.query(FLHearing, FLAnalysis).outerjoin(
         FLAnalysis, FLAnalysis.hearing_id == FLHearing.id
@@ -275,54 +294,39 @@ def get_hearings(
     if search_query:
         query = query.filter(FLHearing.title.ilike(f"%{search_query}%"))
 
-    # Sorting
-    if sort_by == "hearing_date":
-        order_col = FLHearing.hearing_date
-    elif sort_by == "created_at":
-        order_col = FLHearing.created_at
-    else:
-        order_col = FLHearing.hearing_date
-
-    if sort_order == "asc":
-        query = query.order_by(order_col.asc())
+    # Sorting (id breaks ties so keyset pages are stable)
+    descending = sort_order != "asc"
+    if sort_by == "created_at":
+        order_key = SortKey(FLHearing.created_at, descending=descending, nullable=True)
     else:
-        query = query.order_by(order_col.desc())
-
-    # Pagination
-    offset = (page - 1) * page_size
-    results = query.offset(offset).limit(page_size).all()
-
-    # Get segment counts and build response
-    response = []
-    for h, analysis in results:
-        segment_count = db.query(func.count(FLTranscriptSegment.id)).filter(
-            FLTranscriptSegment.hearing_id == h.id
-        ).scalar() or 0
-        response.append(hearing_to_list_item(h, segment_count, analysis))
+        sort_by = "hearing_date"
+        order_key = SortKey(FLHearing.hearing_date, descending=descending)
+    keys = [order_key, SortKey(FLHearing.id, descending=descending)]
+
+    # Cursors are only valid for the sort they were issued under
+    kind = f"dashboard-hearings:{sort_by}:{'desc' if descending else 'asc'}"
+    results, next_cursor = keyset_page(
+        query, keys, page, page_size, after, kind, entity=lambda row: row[0]
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
-    return response
+    # segment_count is denormalized on the hearing, so this is the only query
+    return [hearing_to_list_item(h, h.segment_count or 0, analysis) for h, analysis in results]
 
 
 @router.get("/api/hearings/{hearing_id}", response_model=HearingDetail)
 def get_hearing(hearing_id: int, db: Session = Depends(get_db)):
     """Get hearing details with analysis."""
-    hearing = db.query(FLHearing).filter(FLHearing.id == hearing_id).first()
-    if not hearing:
+    row = db.query(FLHearing, FLAnalysis).outerjoin(
+        FLAnalysis, FLAnalysis.hearing_id == FLHearing.id
+    ).filter(FLHearing.id == hearing_id).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Hearing not found")
+    hearing, analysis = row
 
-    # Get segment count and word count
-    segment_count = db.query(func.count(FLTranscriptSegment.id)).filter(
-        FLTranscriptSegment.hearing_id == hearing_id
-    ).scalar() or 0
-
-    # Get word count from segments
-    word_count_result = db.execute(text("""
-        SELECT COALESCE(SUM(array_length(regexp_split_to_array(text, '\s+'), 1)), 0)
-        FROM fl_transcript_segments WHERE hearing_id = :hid
-    """), {"hid": hearing_id}).scalar() or 0
-
-    # Get analysis if exists
-    analysis = db.query(FLAnalysis).filter(FLAnalysis.hearing_id == hearing_id).first()
+    # Counts are denormalized on the hearing by the transcribe stage
+    segment_count = hearing.segment_count or 0
 
     # Build response - exclude fields we'll override from analysis
     base = hearing_to_list_item(hearing, segment_count, analysis)
@@ -344,7 +348,7 @@ def get_hearing(hearing_id: int, db: Session = Depends(get_db)):
         risk_factors=safe_parse_risk_factors(analysis.risk_factors_json) if analysis else None,
         quotes=safe_parse_quotes(analysis.quotes_json) if analysis else None,
         segment_count=segment_count,
-        word_count=int(word_count_result),
+        word_count=hearing.word_count or 0,
     )
 
 
@@ -353,24 +357,27 @@ def get_transcript(
     hearing_id: int,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
+    after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: Optional[bool] = Query(None, description="Count segments (default: first page only)"),
     db: Session = Depends(get_db)
 ):
-    """Get transcript segments for a hearing."""
+    """
+    Get transcript segments for a hearing.
+
+    Scroll with `after` (the previous response's next_cursor) rather than
+    page: each page then seeks straight to its segment_index.
+    """
     # Verify hearing exists
     hearing = db.query(FLHearing).filter(FLHearing.id == hearing_id).first()
     if not hearing:
         raise HTTPException(status_code=404, detail="Hearing not found")
 
-    # Get total count
-    total = db.query(func.count(FLTranscriptSegment.id)).filter(
-        FLTranscriptSegment.hearing_id == hearing_id
-    ).scalar() or 0
+    # Get total count (denormalized on the hearing by the transcribe stage)
+    total = (hearing.segment_count or 0) if want_total(include_total, after) else None
 
-    # Get segments with pagination
-    offset = (page - 1) * page_size
-    segments = db.query(FLTranscriptSegment).filter(
-        FLTranscriptSegment.hearing_id == hearing_id
-    ).order_by(FLTranscriptSegment.segment_index).offset(offset).limit(page_size).all()
+    query = db.query(FLTranscriptSegment).filter(FLTranscriptSegment.hearing_id == hearing_id)
+    keys = [SortKey(FLTranscriptSegment.segment_index, nullable=True), SortKey(FLTranscriptSegment.id)]
+    segments, next_cursor = keyset_page(query, keys, page, page_size, after, "transcript")
 
     return TranscriptResponse(
         hearing_id=hearing_id,
@@ -389,6 +396,7 @@ def get_transcript(
         ],
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
     )
 
 
@@ -402,56 +410,37 @@ def search_transcripts(
     page_size: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db)
 ):
-    """Full-text search across transcripts."""
+    """
+    Full-text search across transcripts.
+
+    Searches passages of consecutive segments, so phrases split between
+    segments match; start_time and timestamp_url point at the segment
+    where the match begins.
+    """
     offset = (page - 1) * page_size
 
-    # Build search query
-    results = db.execute(text("""
-        SELECT
-            s.id as segment_id,
-            s.hearing_id,
-            h.title as hearing_title,
-            h.hearing_date,
-            s.text,
-            s.start_time,
-            s.end_time,
-            s.speaker_name as speaker,
-            s.speaker_role,
-            h.source_url,
-            ts_rank(s.text_tsvector, plainto_tsquery('english', :q)) as rank
-        FROM fl_transcript_segments s
-        JOIN fl_hearings h ON s.hearing_id = h.id
-        WHERE s.text_tsvector @@ plainto_tsquery('english', :q)
-        ORDER BY rank DESC
-        LIMIT :limit OFFSET :offset
-    """), {"q": q, "limit": page_size, "offset": offset}).fetchall()
-
-    # Get total count
-    total = db.execute(text("""
-        SELECT COUNT(*)
-        FROM fl_transcript_segments s
-        WHERE s.text_tsvector @@ plainto_tsquery('english', :q)
-    """), {"q": q}).scalar() or 0
+    hits = search_passages(db, q, limit=page_size, offset=offset)
+    total = count_passage_matches(db, q)
 
     return SearchResponse(
         query=q,
         results=[
             SearchResult(
-                segment_id=r.segment_id,
-                hearing_id=r.hearing_id,
-                hearing_title=r.hearing_title or "",
-                hearing_date=r.hearing_date.isoformat() if r.hearing_date else None,
-                text=r.text or "",
-                start_time=r.start_time or 0,
-                end_time=r.end_time or 0,
-                speaker=r.speaker,
-                speaker_role=r.speaker_role,
-                source_url=r.source_url,
-                video_url=r.source_url,
-                timestamp_url=f"{r.source_url}#t={int(r.start_time or 0)}" if r.source_url else None,
-                snippet=r.text[:200] + "..." if r.text and len(r.text) > 200 else r.text,
+                segment_id=hit.segment_id,
+                hearing_id=hit.hearing_id,
+                hearing_title=hit.hearing_title or "",
+                hearing_date=hit.hearing_date.isoformat() if hit.hearing_date else None,
+                text=hit.text,
+                start_time=hit.match_time,
+                end_time=hit.end_time,
+                speaker=hit.speaker_name or hit.speakers,
+                speaker_role=hit.speaker_role,
+                source_url=hit.source_url,
+                video_url=hit.source_url,
+                timestamp_url=f"{hit.source_url}#t={int(hit.match_time)}" if hit.source_url else None,
+                snippet=hit.text[:200] + "..." if len(hit.text) > 200 else hit.text,
             )
-            for r in results
+            for hit in hits
         ],
         total_count=total,
         page=page,
@@ -461,16 +450,17 @@ def search_transcripts(
 
 @router.get("/api/stats", response_model=Stats)
 def get_stats(db: Session = Depends(get_db)):
-    """Get dashboard statistics."""
-    total_hearings = db.query(func.count(FLHearing.id)).scalar() or 0
-    total_segments = db.query(func.count(FLTranscriptSegment.id)).scalar() or 0
+    """Get dashboard statistics (from the fl_stats_rollups counters)."""
+    totals = rollups.totals(db, state_code=STATE_CODE)
+    total_hearings = int(sum(totals[HEARINGS].values()))
+    total_segments = int(sum(totals[SEGMENTS].values()))
 
     # Calculate total hours from duration
-    total_seconds = db.query(func.sum(FLHearing.duration_seconds)).scalar() or 0
+    total_seconds = sum(totals[DURATION_SECONDS].values())
     total_hours = total_seconds / 3600 if total_seconds else 0
 
     # Get processing costs
-    total_cost = db.query(func.sum(FLHearing.processing_cost_usd)).scalar() or 0
+    total_cost = sum(totals[TRANSCRIPTION_COST].values())
 
     return Stats(
         total_hearings=total_hearings,
@@ -478,7 +468,7 @@ def get_stats(db: Session = Depends(get_db)):
         total_hours=round(total_hours, 1),
         hearings_by_status={"complete": total_hearings},
         hearings_by_state={"FL": total_hearings},
-        total_cost=float(total_cost),
+        total_cost=round(total_cost, 4),
     )
 
 
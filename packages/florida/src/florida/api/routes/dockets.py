@@ -11,7 +11,14 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 from pydantic import BaseModel
 
-from florida.models import get_db, FLDocket
+from florida.api.exports import (
+    MULTI_HEARING_FIELDS,
+    export_format_query,
+    require_single_hearing,
+    segment_export_query,
+    stream_export,
+)
+from florida.models import get_db, FLDocket, FLHearing, FLTranscriptSegment
 
 router = APIRouter(prefix="/dockets", tags=["dockets"])
 
@@ -176,3 +183,29 @@ def search_dockets(
     ).limit(limit).all()
 
     return [DocketResponse.model_validate(d) for d in dockets]
+
+
+@router.get("/{docket_number}/export")
+def export_docket_transcripts(
+    docket_number: str,
+    fmt: str = export_format_query(),
+    db: Session = Depends(get_db)
+):
+    """
+    Download the transcripts of every hearing in a docket, streamed.
+
+    Hearings oldest first, segments in order; ndjson or csv only.
+    """
+    require_single_hearing(fmt)
+    docket = db.query(FLDocket.id).filter(FLDocket.docket_number == docket_number).first()
+    if not docket:
+        raise HTTPException(status_code=404, detail="Docket not found")
+
+    query = segment_export_query(db, with_hearing=True).filter(
+        FLHearing.docket_number == docket_number
+    ).order_by(
+        FLHearing.hearing_date,
+        FLHearing.id,
+        FLTranscriptSegment.segment_index,
+    )
+    return stream_export(db, query, fmt, f"docket-{docket_number}", MULTI_HEARING_FIELDS)
@@ -11,6 +11,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 from pydantic import BaseModel
 
+from core.utils.pagination import SortKey
+from florida.api.exports import export_format_query, segment_export_query, stream_export
+from florida.api.pagination import keyset_page, want_total
 from florida.models import get_db, FLHearing, FLTranscriptSegment
 
 router = APIRouter(prefix="/hearings", tags=["hearings"])
@@ -63,10 +66,11 @@ class HearingDetailResponse(HearingResponse):
 class HearingListResponse(BaseModel):
     """Paginated hearing list response."""
     items: List[HearingResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     per_page: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class HearingStats(BaseModel):
@@ -86,6 +90,8 @@ def list_hearings(
     hearing_type: Optional[str] = None,
     status: Optional[str] = None,
     year: Optional[int] = None,
+    after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: Optional[bool] = Query(None, description="Count matches (default: first page only)"),
     db: Session = Depends(get_db)
 ):
     """
@@ -94,6 +100,8 @@ def list_hearings(
     Query parameters:
     - page: Page number (1-indexed)
     - per_page: Results per page (max 200)
+    - after: Cursor for the next page (next_cursor of the previous response)
+    - include_total: Count matches (default: only without a cursor)
     - docket: Filter by docket number
     - hearing_type: Filter by hearing type
     - status: Filter by transcript status
@@ -110,12 +118,14 @@ def list_hearings(
     if year:
         query = query.filter(func.extract('year', FLHearing.hearing_date) == year)
 
-    total = query.count()
-    pages = (total + per_page - 1) // per_page
+    total = query.count() if want_total(include_total, after) else None
+    pages = (total + per_page - 1) // per_page if total is not None else None
 
-    hearings = query.order_by(FLHearing.hearing_date.desc()).offset(
-        (page - 1) * per_page
-    ).limit(per_page).all()
+    keys = [
+        SortKey(FLHearing.hearing_date, descending=True),
+        SortKey(FLHearing.id, descending=True),
+    ]
+    hearings, next_cursor = keyset_page(query, keys, page, per_page, after, "hearings")
 
     return HearingListResponse(
         items=[HearingResponse.model_validate(h) for h in hearings],
@@ -123,6 +133,7 @@ def list_hearings(
         page=page,
         per_page=per_page,
         pages=pages,
+        next_cursor=next_cursor,
     )
 
 
@@ -179,6 +190,28 @@ def get_hearings_by_docket(
     return [HearingResponse.model_validate(h) for h in hearings]
 
 
+@router.get("/{hearing_id}/export")
+def export_hearing_transcript(
+    hearing_id: int,
+    fmt: str = export_format_query(),
+    db: Session = Depends(get_db)
+):
+    """
+    Download a hearing's whole transcript in one streamed response.
+
+    Formats: ndjson and csv (one row per segment), vtt and srt (subtitle
+    cues with speaker names).
+    """
+    hearing = db.query(FLHearing.id).filter(FLHearing.id == hearing_id).first()
+    if not hearing:
+        raise HTTPException(status_code=404, detail="Hearing not found")
+
+    query = segment_export_query(db).filter(
+        FLTranscriptSegment.hearing_id == hearing_id
+    ).order_by(FLTranscriptSegment.segment_index)
+    return stream_export(db, query, fmt, f"hearing-{hearing_id}")
+
+
 @router.get("/{hearing_id}", response_model=HearingDetailResponse)
 def get_hearing(hearing_id: int, db: Session = Depends(get_db)):
     """Get a specific hearing with transcript segments."""
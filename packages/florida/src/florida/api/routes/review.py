@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy import func, text
+from sqlalchemy import Float, String, Text, cast, func, literal, literal_column, null, select, text, tuple_, union_all
 from sqlalchemy.orm import Session
 
 from florida.models import (
@@ -129,92 +129,142 @@ def get_review_stats(db: Session = Depends(get_db)) -> ReviewQueueStats:
 # Review Queue Listings
 # =============================================================================
 
+# Queue order: lowest confidence first (unscored links before everything),
+# then link type, then link id. Cursors encode the last row's position.
+QUEUE_TYPES = ('docket', 'utility', 'topic')
+
+
+def _encode_queue_cursor(sort_score: float, entity_type: str, link_id: int) -> str:
+    return f"{float(sort_score)!r}:{entity_type}:{link_id}"
+
+
+def _decode_queue_cursor(cursor: str) -> tuple:
+    try:
+        sort_score, entity_type, link_id = cursor.split(':')
+        position = (float(sort_score), QUEUE_TYPES.index(entity_type), int(link_id))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}") from None
+    return position
+
+
+def _queue_branch(entity_type: str, after: Optional[tuple], limit: int):
+    """Pending links of one type, joined to their hearing and entity, in queue order."""
+    rank = QUEUE_TYPES.index(entity_type)
+    if entity_type == 'docket':
+        link, entity = FLHearingDocket, FLDocket
+        entity_id = FLHearingDocket.docket_id
+        columns = [FLDocket.docket_number.label('entity_name'), FLDocket.title.label('entity_title'),
+                   cast(null(), String).label('role'), cast(null(), String).label('category'),
+                   cast(null(), Float).label('relevance_score')]
+    elif entity_type == 'utility':
+        link, entity = FLHearingUtility, FLUtility
+        entity_id = FLHearingUtility.utility_id
+        columns = [FLUtility.name.label('entity_name'), cast(null(), Text).label('entity_title'),
+                   FLHearingUtility.role.label('role'), cast(null(), String).label('category'),
+                   cast(null(), Float).label('relevance_score')]
+    else:
+        link, entity = FLHearingTopic, FLTopic
+        entity_id = FLHearingTopic.topic_id
+        columns = [FLTopic.name.label('entity_name'), cast(null(), Text).label('entity_title'),
+                   cast(null(), String).label('role'), FLTopic.category.label('category'),
+                   FLHearingTopic.relevance_score.label('relevance_score')]
+
+    # Inline -1 (not a bound parameter) so the expression matches the index
+    sort_score = func.coalesce(link.confidence_score, literal_column('-1'))
+    query = select(
+        literal(entity_type).label('type'),
+        literal(rank).label('type_rank'),
+        sort_score.label('sort_score'),
+        link.id.label('link_id'),
+        link.hearing_id.label('hearing_id'),
+        FLHearing.title.label('hearing_title'),
+        FLHearing.hearing_date.label('hearing_date'),
+        entity_id.label('entity_id'),
+        *columns,
+        link.confidence_score.label('confidence_score'),
+        link.match_type.label('match_type'),
+        link.review_reason.label('review_reason'),
+        link.context_summary.label('context_summary'),
+    ).select_from(link).outerjoin(
+        FLHearing, FLHearing.id == link.hearing_id
+    ).outerjoin(
+        entity, entity.id == entity_id
+    ).where(link.needs_review == True)
+
+    if after is not None:
+        after_score, after_rank, after_id = after
+        # The type rank is constant within a branch, so the keyset condition
+        # reduces to a (sort_score, id) comparison the review index can serve
+        if rank > after_rank:
+            query = query.where(sort_score >= after_score)
+        elif rank < after_rank:
+            query = query.where(sort_score > after_score)
+        else:
+            query = query.where(tuple_(sort_score, link.id) > tuple_(after_score, after_id))
+
+    return query.order_by(sort_score, link.id).limit(limit).subquery()
+
+
 @router.get("/queue")
 def get_review_queue(
     entity_type: Optional[str] = None,  # docket, utility, topic
     limit: int = Query(default=50, le=100),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
     db: Session = Depends(get_db)
 ):
-    """Get entities needing review, optionally filtered by type."""
-    results = []
+    """
+    Get entities needing review, lowest confidence first, optionally filtered by type.
+
+    One query: each link type is a keyset-limited branch joined to its
+    hearing and entity, and the branches are merged with UNION ALL. Pass
+    next_cursor back as cursor to get the following page.
+    """
+    if entity_type is not None and entity_type not in QUEUE_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unknown entity type: {entity_type}")
+
+    after = _decode_queue_cursor(cursor) if cursor else None
+    types = [entity_type] if entity_type else QUEUE_TYPES
+
+    # One extra row tells us whether there is a next page
+    branches = [select(_queue_branch(t, after, limit + 1)) for t in types]
+    queue = union_all(*branches).subquery()
+    rows = db.execute(
+        select(queue).order_by(queue.c.sort_score, queue.c.type_rank, queue.c.link_id).limit(limit + 1)
+    ).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = _encode_queue_cursor(last.sort_score, last.type, last.link_id)
 
-    if entity_type is None or entity_type == 'docket':
-        docket_links = db.query(FLHearingDocket).filter(
-            FLHearingDocket.needs_review == True
-        ).order_by(
-            FLHearingDocket.confidence_score.asc().nullsfirst()
-        ).limit(limit).all()
-
-        for link in docket_links:
-            hearing = db.query(FLHearing).filter(FLHearing.id == link.hearing_id).first()
-            docket = db.query(FLDocket).filter(FLDocket.id == link.docket_id).first()
-            results.append({
-                "type": "docket",
-                "link_id": link.id,
-                "hearing_id": link.hearing_id,
-                "hearing_title": hearing.title if hearing else None,
-                "hearing_date": hearing.hearing_date.isoformat() if hearing and hearing.hearing_date else None,
-                "entity_id": link.docket_id,
-                "entity_name": docket.docket_number if docket else None,
-                "entity_title": docket.title if docket else None,
-                "confidence_score": link.confidence_score,
-                "match_type": link.match_type,
-                "review_reason": link.review_reason,
-                "context_summary": link.context_summary,
-            })
-
-    if entity_type is None or entity_type == 'utility':
-        utility_links = db.query(FLHearingUtility).filter(
-            FLHearingUtility.needs_review == True
-        ).order_by(
-            FLHearingUtility.confidence_score.asc().nullsfirst()
-        ).limit(limit).all()
-
-        for link in utility_links:
-            hearing = db.query(FLHearing).filter(FLHearing.id == link.hearing_id).first()
-            utility = db.query(FLUtility).filter(FLUtility.id == link.utility_id).first()
-            results.append({
-                "type": "utility",
-                "link_id": link.id,
-                "hearing_id": link.hearing_id,
-                "hearing_title": hearing.title if hearing else None,
-                "hearing_date": hearing.hearing_date.isoformat() if hearing and hearing.hearing_date else None,
-                "entity_id": link.utility_id,
-                "entity_name": utility.name if utility else None,
-                "role": link.role,
-                "confidence_score": link.confidence_score,
-                "match_type": link.match_type,
-                "review_reason": link.review_reason,
-                "context_summary": link.context_summary,
-            })
-
-    if entity_type is None or entity_type == 'topic':
-        topic_links = db.query(FLHearingTopic).filter(
-            FLHearingTopic.needs_review == True
-        ).order_by(
-            FLHearingTopic.confidence_score.asc().nullsfirst()
-        ).limit(limit).all()
-
-        for link in topic_links:
-            hearing = db.query(FLHearing).filter(FLHearing.id == link.hearing_id).first()
-            topic = db.query(FLTopic).filter(FLTopic.id == link.topic_id).first()
-            results.append({
-                "type": "topic",
-                "link_id": link.id,
-                "hearing_id": link.hearing_id,
-                "hearing_title": hearing.title if hearing else None,
-                "hearing_date": hearing.hearing_date.isoformat() if hearing and hearing.hearing_date else None,
-                "entity_id": link.topic_id,
-                "entity_name": topic.name if topic else None,
-                "category": topic.category if topic else None,
-                "relevance_score": link.relevance_score,
-                "confidence_score": link.confidence_score,
-                "match_type": link.match_type,
-                "review_reason": link.review_reason,
-                "context_summary": link.context_summary,
-            })
+    results = []
+    for row in rows:
+        item = {
+            "type": row.type,
+            "link_id": row.link_id,
+            "hearing_id": row.hearing_id,
+            "hearing_title": row.hearing_title,
+            "hearing_date": row.hearing_date.isoformat() if row.hearing_date else None,
+            "entity_id": row.entity_id,
+            "entity_name": row.entity_name,
+        }
+        if row.type == 'docket':
+            item["entity_title"] = row.entity_title
+        elif row.type == 'utility':
+            item["role"] = row.role
+        else:
+            item["category"] = row.category
+            item["relevance_score"] = row.relevance_score
+        item.update({
+            "confidence_score": row.confidence_score,
+            "match_type": row.match_type,
+            "review_reason": row.review_reason,
+            "context_summary": row.context_summary,
+        })
+        results.append(item)
 
-    return {"items": results, "total": len(results)}
+    return {"items": results, "total": len(results), "next_cursor": next_cursor}
 
 
 @router.get("/hearings")
@@ -4,17 +4,26 @@ Florida Unified Search API.
 Full-text search across all Florida content:
 - Dockets (title, utility name)
 - Documents (extracted text)
-- Transcripts (spoken content)
+- Transcripts (spoken content, by passage; see florida.services.passages)
 """
 
 import logging
 from typing import Optional, List, Literal
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import func, literal_column, text
 from pydantic import BaseModel
 
+from florida.api.exports import (
+    MULTI_HEARING_FIELDS,
+    export_format_query,
+    require_single_hearing,
+    segment_export_query,
+    stream_export,
+)
 from florida.models import get_db
+from florida.models.hearing import FLHearing, FLTranscriptSegment
+from florida.services.passages import query_terms, search_passages
 
 logger = logging.getLogger(__name__)
 
@@ -131,37 +140,20 @@ def unified_search(
             logger.warning(f"Document search error: {e}")
             db.rollback()
 
-    # Search transcript segments
+    # Search transcript passages (windows of segments, so phrases split
+    # between segments match)
     if content_type in (None, 'transcript'):
         try:
-            segment_results = db.execute(text("""
-                SELECT
-                    'transcript' as type,
-                    s.id::text as id,
-                    LEFT(s.text, 150) as title,
-                    COALESCE(s.speaker_name, s.speaker_label, 'Unknown Speaker')
-                        || ' - ' || h.hearing_date::text as subtitle,
-                    LEFT(s.text, 300) as excerpt,
-                    ts_rank(s.text_tsvector, plainto_tsquery('english', :q)) as rank,
-                    h.source_url as url
-                FROM fl_transcript_segments s
-                JOIN fl_hearings h ON s.hearing_id = h.id
-                WHERE s.text_tsvector @@ plainto_tsquery('english', :q)
-                ORDER BY rank DESC
-                LIMIT :limit
-            """), {"q": q, "limit": limit}).fetchall()
-
-            for row in segment_results:
-                title = row.title or ""
-                excerpt = row.excerpt or ""
+            for hit in search_passages(db, q, limit=limit):
+                excerpt = _excerpt(hit.text, q)
                 results.append(SearchResult(
-                    type=row.type,
-                    id=row.id,
-                    title=title[:150] + "..." if len(title) > 150 else title,
-                    subtitle=row.subtitle,
-                    excerpt=excerpt[:300] + "..." if len(excerpt) > 300 else excerpt,
-                    rank=float(row.rank) if row.rank else 0.0,
-                    url=row.url,
+                    type='transcript',
+                    id=str(hit.segment_id if hit.segment_id is not None else hit.passage_id),
+                    title=excerpt[:150] + "..." if len(excerpt) > 150 else excerpt,
+                    subtitle=f"{hit.speakers or 'Unknown Speaker'} - {hit.hearing_date}",
+                    excerpt=excerpt,
+                    rank=hit.rank,
+                    url=f"{hit.source_url}#t={int(hit.match_time)}" if hit.source_url else None,
                 ))
         except Exception as e:
             # Log the error for debugging
@@ -238,41 +230,87 @@ def search_transcripts(
     limit: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db)
 ):
-    """Search transcript segments with optional filters."""
-    query_parts = ["""
-        SELECT
-            s.id,
-            s.text,
-            s.speaker_name,
-            s.speaker_role,
-            s.start_time,
-            h.id as hearing_id,
-            h.hearing_date,
-            h.docket_number,
-            h.title as hearing_title,
-            ts_rank(s.text_tsvector, plainto_tsquery('english', :q)) as rank
-        FROM fl_transcript_segments s
-        JOIN fl_hearings h ON s.hearing_id = h.id
-        WHERE s.text_tsvector @@ plainto_tsquery('english', :q)
-    """]
-
-    params = {"q": q, "limit": limit}
-
-    if speaker:
-        query_parts.append("AND s.speaker_name ILIKE :speaker")
-        params["speaker"] = f"%{speaker}%"
-
-    if docket:
-        query_parts.append("AND h.docket_number = :docket")
-        params["docket"] = docket
-
-    query_parts.append("ORDER BY rank DESC LIMIT :limit")
+    """
+    Search transcripts with optional filters.
 
-    results = db.execute(text(" ".join(query_parts)), params).fetchall()
+    Matches passages of consecutive segments, so "quoted phrases" split
+    between segments are found. id, text, speaker_name, speaker_role and
+    start_time describe the segment where the match begins; the passage_*
+    fields describe the whole matching passage (passage_id is null for
+    hearings not yet split into passages).
+    """
+    hits = search_passages(db, q, limit=limit, speaker=speaker, docket=docket)
 
     return {
         "query": q,
         "filters": {"speaker": speaker, "docket": docket},
-        "total": len(results),
-        "results": [dict(row._mapping) for row in results],
+        "total": len(hits),
+        "results": [
+            {
+                "id": hit.segment_id,
+                "text": hit.segment_text,
+                "speaker_name": hit.speaker_name,
+                "speaker_role": hit.speaker_role,
+                "start_time": hit.match_time,
+                "hearing_id": hit.hearing_id,
+                "hearing_date": hit.hearing_date,
+                "docket_number": hit.docket_number,
+                "hearing_title": hit.hearing_title,
+                "rank": hit.rank,
+                "passage_id": hit.passage_id,
+                "passage_text": hit.text,
+                "passage_speakers": hit.speakers,
+                "passage_start_time": hit.start_time,
+                "passage_end_time": hit.end_time,
+            }
+            for hit in hits
+        ],
     }
+
+
+@router.get("/export")
+def export_search_results(
+    q: str = Query(..., min_length=2),
+    speaker: Optional[str] = None,
+    docket: Optional[str] = None,
+    fmt: str = export_format_query(),
+    db: Session = Depends(get_db)
+):
+    """
+    Download every transcript segment matching a search, streamed.
+
+    Same query syntax as /search/transcripts. No limit: segments come
+    newest hearing first, in transcript order. ndjson or csv only.
+    """
+    require_single_hearing(fmt)
+    tsquery = func.websearch_to_tsquery('english', q)
+    query = segment_export_query(db, with_hearing=True).filter(
+        literal_column("fl_transcript_segments.text_tsvector").op("@@")(tsquery)
+    )
+    if speaker:
+        query = query.filter(
+            (FLTranscriptSegment.speaker_name.ilike(f"%{speaker}%")) |
+            (FLTranscriptSegment.speaker_label.ilike(f"%{speaker}%"))
+        )
+    if docket:
+        query = query.filter(FLHearing.docket_number == docket)
+
+    query = query.order_by(
+        FLHearing.hearing_date.desc(),
+        FLHearing.id,
+        FLTranscriptSegment.segment_index,
+    )
+    return stream_export(db, query, fmt, f"search-{q[:40]}", MULTI_HEARING_FIELDS)
+
+
+def _excerpt(passage_text: str, q: str, context_chars: int = 300) -> str:
+    """Up to context_chars of the passage, starting shortly before the first match."""
+    lowered = passage_text.lower()
+    positions = [lowered.find(term.lower()) for term in query_terms(q)]
+    start = max(min([p for p in positions if p != -1], default=0) - 60, 0)
+    excerpt = passage_text[start:start + context_chars]
+    if start > 0:
+        excerpt = "..." + excerpt
+    if start + context_chars < len(passage_text):
+        excerpt += "..."
+    return excerpt
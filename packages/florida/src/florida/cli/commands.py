@@ -5,6 +5,7 @@ Provides command-line interface for Florida PSC operations:
 - Docket sync from ClerkOffice API
 - Document indexing from Thunderstone
 - Pipeline execution
+- Pipeline job worker
 - Status and statistics
 """
 
@@ -46,8 +47,11 @@ def cli(ctx, verbose):
 @click.option('--industries', '-i', multiple=True,
               type=click.Choice(['E', 'G', 'T', 'W', 'X']),
               help='Industries to sync (E=Electric, G=Gas, T=Telecom, W=Water, X=Other)')
+@click.option('--concurrent', is_flag=True,
+              help='Fetch docket types/industries in parallel with resumable checkpoints')
+@click.option('--fresh', is_flag=True, help='With --concurrent, start a new run instead of resuming')
 @click.pass_context
-def sync_dockets(ctx, year, status, limit, all_types, industries):
+def sync_dockets(ctx, year, status, limit, all_types, industries, concurrent, fresh):
     """Sync dockets from Florida PSC ClerkOffice API."""
     from florida.pipeline import DocketSyncStage
 
@@ -76,11 +80,15 @@ def sync_dockets(ctx, year, status, limit, all_types, industries):
             status=effective_status,
             industries=list(industries) if industries else None,
             limit=limit,
-            on_progress=progress
+            on_progress=progress,
+            concurrent=concurrent,
+            resume=not fresh,
         )
 
         click.echo("")
         click.echo(f"Sync complete:")
+        if result.run_id:
+            click.echo(f"  Run: {result.run_id} ({result.resumed_combinations} combinations resumed)")
         click.echo(f"  Total scraped: {result.total_scraped}")
         click.echo(f"  New dockets: {result.new_dockets}")
         click.echo(f"  Updated dockets: {result.updated_dockets}")
@@ -374,6 +382,114 @@ def init_database(ctx):
         click.echo(f"  ✗ Error: {e}")
 
 
+@cli.command()
+@click.option('--concurrency', '-c', type=int, default=1, help='Jobs processed at once in this process')
+@click.option('--poll-interval', type=float, default=2.0, help='Seconds to wait when the queue is empty')
+@click.option('--max-jobs', type=int, help='Exit after this many jobs (per worker thread)')
+@click.option('--drain', is_flag=True, help='Exit once no jobs are due instead of polling')
+@click.option('--worker-id', type=str, help='Worker name in leases (default host:pid)')
+@click.pass_context
+def worker(ctx, concurrency, poll_interval, max_jobs, drain, worker_id):
+    """
+    Process queued pipeline jobs.
+
+    Run any number of workers, on any number of hosts, against the same
+    database; jobs are leased so each runs once. SIGTERM/SIGINT finish
+    the current job and exit.
+    """
+    import signal
+
+    from core.services.job_queue import JobWorker, default_worker_id, run_workers
+    from florida.models import SessionLocal
+    from florida.pipeline.jobs import JOB_HANDLERS, job_queue
+
+    base_id = worker_id or default_worker_id()
+    workers = [
+        JobWorker(
+            job_queue,
+            SessionLocal,
+            JOB_HANDLERS,
+            worker_id=base_id if concurrency == 1 else f"{base_id}:{i}",
+            poll_interval=poll_interval,
+            heartbeat_interval=max(job_queue.lease_seconds / 5, 1),
+        )
+        for i in range(concurrency)
+    ]
+
+    def shutdown(signum, frame):
+        click.echo("Stopping after current jobs...")
+        for w in workers:
+            w.stop()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    click.echo(f"Worker {base_id} processing jobs with concurrency {concurrency}")
+    processed = run_workers(workers, max_jobs=max_jobs, stop_when_idle=drain)
+    click.echo(f"Processed {processed} jobs")
+
+
+@cli.command()
+@click.option('--interval', type=int, help='Keep running, reconciling every N minutes')
+@click.pass_context
+def reconcile_stats(ctx, interval):
+    """Correct the dashboard stats rollups against the source tables."""
+    import time
+
+    from florida.models import SessionLocal
+    from florida.services.stats import reconcile_rollups
+
+    while True:
+        db = SessionLocal()
+        try:
+            corrected = reconcile_rollups(db)
+            db.commit()
+        finally:
+            db.close()
+        click.echo(f"Corrected {corrected} stats counters")
+        if not interval:
+            break
+        time.sleep(interval * 60)
+
+
+@cli.command()
+@click.option('--limit', type=int, default=100, help='Maximum hearings to process')
+@click.option('--rebuild', is_flag=True, help='Rebuild hearings that already have passages')
+@click.pass_context
+def build_passages(ctx, limit, rebuild):
+    """Build phrase-search passages for transcribed hearings."""
+    from sqlalchemy import exists
+
+    from florida.models import SessionLocal
+    from florida.models.hearing import FLHearing, FLTranscriptPassage, FLTranscriptSegment
+    from florida.pipeline.stages.transcribe import write_passages
+
+    db = SessionLocal()
+    try:
+        query = db.query(FLHearing.id).filter(
+            exists().where(FLTranscriptSegment.hearing_id == FLHearing.id)
+        )
+        if not rebuild:
+            query = query.filter(~exists().where(FLTranscriptPassage.hearing_id == FLHearing.id))
+        hearing_ids = [row.id for row in query.order_by(FLHearing.id).limit(limit)]
+
+        total = 0
+        for hearing_id in hearing_ids:
+            segments = db.query(
+                FLTranscriptSegment.segment_index,
+                FLTranscriptSegment.start_time,
+                FLTranscriptSegment.end_time,
+                FLTranscriptSegment.text,
+                FLTranscriptSegment.speaker_name,
+                FLTranscriptSegment.speaker_label,
+            ).filter(FLTranscriptSegment.hearing_id == hearing_id).all()
+            total += write_passages(db, hearing_id, [dict(row._mapping) for row in segments])
+            db.commit()
+    finally:
+        db.close()
+    click.echo(f"Wrote {total} passages for {len(hearing_ids)} hearings")
+
+
 def main():
     """Main entry point."""
     cli(obj={})
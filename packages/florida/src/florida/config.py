@@ -51,9 +51,22 @@ class FloridaConfig:
 
     # Rate limiting (requests per second)
     api_rate_limit: float = 2.0
+    # Concurrent requests in flight for concurrent syncs (still paced by api_rate_limit)
+    api_concurrency: int = 4
+    # Thunderstone search result pages fetched ahead of the consumer
+    search_prefetch_pages: int = 4
+
+    # Validators and bodies of scraped URLs for conditional requests ('' disables)
+    http_cache_path: str = "data/florida/http_cache.sqlite3"
+    # Requests kept in the HTTP cache (least recently used are evicted)
+    http_cache_max_entries: int = 10_000
 
     # Processing
     max_concurrent_downloads: int = 3
+    # Scraped dockets/documents buffered per bulk upsert
+    sync_batch_size: int = 500
+    # Unfinished concurrent syncs started within this many hours are resumed
+    sync_resume_hours: int = 24
 
     @classmethod
     def from_env(cls) -> "FloridaConfig":
@@ -94,7 +107,13 @@ class FloridaConfig:
 
             # Rate limiting
             api_rate_limit=float(env_str("FL_API_RATE_LIMIT", "2.0")),
+            api_concurrency=env_int("FL_API_CONCURRENCY", 4),
+            search_prefetch_pages=env_int("FL_SEARCH_PREFETCH_PAGES", 4),
+            http_cache_path=env_str("FL_HTTP_CACHE_PATH", f"{local_path}/http_cache.sqlite3"),
+            http_cache_max_entries=env_int("FL_HTTP_CACHE_MAX_ENTRIES", 10_000),
             max_concurrent_downloads=env_int("FL_MAX_CONCURRENT_DOWNLOADS", 3),
+            sync_batch_size=env_int("FL_SYNC_BATCH_SIZE", 500),
+            sync_resume_hours=env_int("FL_SYNC_RESUME_HOURS", 24),
         )
 
     @property
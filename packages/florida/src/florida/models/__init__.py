@@ -6,6 +6,7 @@ SQLAlchemy models for Florida-specific tables:
 - fl_documents: Documents from Thunderstone search
 - fl_hearings: Hearing transcripts
 - fl_transcript_segments: Speaker-attributed segments
+- fl_transcript_passages: Overlapping segment windows for phrase search
 - fl_entities: Extracted entities from transcripts
 - fl_analyses: LLM analysis results
 - fl_utilities: Canonical utility companies
@@ -13,15 +14,21 @@ SQLAlchemy models for Florida-specific tables:
 - fl_hearing_dockets: Hearing-to-docket links
 - fl_hearing_utilities: Hearing-to-utility links
 - fl_hearing_topics: Hearing-to-topic links
+- fl_pipeline_jobs: Durable queue of pipeline stage runs
+- fl_stats_rollups: Precomputed dashboard counters
+- fl_sync_checkpoints: Progress of resumable ClerkOffice syncs
+- fl_import_frontier: Thunderstone import search terms, leased by workers
+- fl_thunderstone_ids: Thunderstone document ids claimed by the importer
 """
 
 from florida.models.base import Base, SessionLocal, get_db, init_db
 from florida.models.docket import FLDocket
 from florida.models.document import FLDocument
-from florida.models.hearing import FLHearing, FLTranscriptSegment
+from florida.models.hearing import FLHearing, FLTranscriptSegment, FLTranscriptPassage
 from florida.models.entity import FLEntity
 from florida.models.analysis import FLAnalysis
 from florida.models.watchlist import FLWatchlist
+from florida.models.job import FLPipelineJob
 from florida.models.linking import (
     FLUtility,
     FLTopic,
@@ -30,6 +37,9 @@ from florida.models.linking import (
     FLHearingTopic,
     FLEntityCorrection,
 )
+from florida.models.stats import FLStatsRollup
+from florida.models.sync import FLSyncCheckpoint
+from florida.models.import_frontier import FLImportTerm, FLThunderstoneId
 
 __all__ = [
     'Base',
@@ -40,6 +50,7 @@ __all__ = [
     'FLDocument',
     'FLHearing',
     'FLTranscriptSegment',
+    'FLTranscriptPassage',
     'FLEntity',
     'FLAnalysis',
     'FLWatchlist',
@@ -49,4 +60,14 @@ __all__ = [
     'FLHearingUtility',
     'FLHearingTopic',
     'FLEntityCorrection',
+    'FLPipelineJob',
+    'FLStatsRollup',
+    'FLSyncCheckpoint',
+    'FLImportTerm',
+    'FLThunderstoneId',
 ]
+
+# Keep the dashboard stats rollups current on every flush
+from florida.services.stats import rollup_tracker  # noqa: E402
+
+rollup_tracker.listen(SessionLocal)
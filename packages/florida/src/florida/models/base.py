@@ -1,9 +1,13 @@
 """
 Base SQLAlchemy configuration for Florida models.
 """
+import io
+import json
 import os
-from sqlalchemy import create_engine, JSON
-from sqlalchemy.orm import sessionmaker, declarative_base
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import create_engine, func, JSON, Table
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 
 # Florida-specific database URL
 FL_DATABASE_URL = os.getenv(
@@ -49,11 +53,176 @@ def get_db():
         db.close()
 
 
+def _copy_value(value: Any) -> Any:
+    """CSV field for COPY: JSON for lists/dicts, text for other non-primitives."""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    if value is not None and not isinstance(value, (int, float, str)):
+        return str(value)
+    return value
+
+
+def _copy_field(value: Any) -> str:
+    """One CSV field: None unquoted (COPY's NULL), everything else quoted."""
+    value = _copy_value(value)
+    if value is None:
+        return ""
+    text = str(value)
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _copy_buffer(rows: List[Dict[str, Any]], columns: List[str]) -> io.StringIO:
+    """
+    Encode rows as CSV for COPY ... WITH (FORMAT csv).
+
+    CSV COPY reads an unquoted empty field as NULL and a quoted one as an
+    empty string, so None is written bare and every other value is quoted
+    to keep '' distinct from NULL.
+    """
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(",".join(_copy_field(row[column]) for column in columns))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+def bulk_insert(db: Session, table: Table, rows: List[Dict[str, Any]], batch_size: int = 1000) -> int:
+    """
+    Insert many rows in the session's transaction, bypassing the ORM unit of work.
+
+    PostgreSQL (psycopg2) streams the rows through COPY FROM STDIN; SQLite
+    gets executemany INSERTs of batch_size rows. COPY skips SQLAlchemy-side
+    column defaults, and all rows must have the same keys.
+
+    Returns:
+        Number of rows inserted
+    """
+    if not rows:
+        return 0
+
+    connection = db.connection()
+    columns = list(rows[0].keys())
+
+    if connection.dialect.name == "postgresql" and connection.dialect.driver == "psycopg2":
+        buffer = _copy_buffer(rows, columns)
+
+        cursor = connection.connection.dbapi_connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        finally:
+            cursor.close()
+        return len(rows)
+
+    for start in range(0, len(rows), batch_size):
+        connection.execute(table.insert(), rows[start:start + batch_size])
+    return len(rows)
+
+
+def _on_conflict_insert(connection):
+    """The dialect's insert() construct with ON CONFLICT support."""
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"ON CONFLICT is not supported on {dialect}")
+    return insert
+
+
+def bulk_upsert(
+    db: Session,
+    table: Table,
+    rows: List[Dict[str, Any]],
+    index_elements: Sequence[str],
+    coalesce: Sequence[str] = (),
+    overwrite: Sequence[str] = (),
+    batch_size: int = 500,
+) -> int:
+    """
+    INSERT ... ON CONFLICT DO UPDATE many rows in the session's transaction.
+
+    Each batch is one multi-row statement. On a conflict with
+    index_elements (which need a unique index), `coalesce` columns keep
+    the stored value when the new one is NULL, so locally-enriched fields
+    survive a sparser scrape. `overwrite` columns always take the new
+    value. Other columns are only written on insert.
+
+    Rows must have the same keys and unique index_elements values (a
+    statement can't update one row twice). Column defaults aren't applied
+    on update, so pass updated_at-style columns in overwrite.
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+
+    connection = db.connection()
+    insert = _on_conflict_insert(connection)
+    for start in range(0, len(rows), batch_size):
+        statement = insert(table).values(rows[start:start + batch_size])
+        updates = {
+            column: func.coalesce(statement.excluded[column], table.c[column])
+            for column in coalesce
+        }
+        updates.update({column: statement.excluded[column] for column in overwrite})
+        if updates:
+            statement = statement.on_conflict_do_update(index_elements=list(index_elements), set_=updates)
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=list(index_elements))
+        connection.execute(statement)
+    return len(rows)
+
+
+def bulk_insert_missing(
+    db: Session,
+    table: Table,
+    rows: List[Dict[str, Any]],
+    index_elements: Sequence[str],
+    returning: str,
+    batch_size: int = 500,
+) -> List[Any]:
+    """
+    INSERT ... ON CONFLICT DO NOTHING many rows in the session's transaction.
+
+    Concurrent sessions inserting the same key serialize on the unique
+    index, so exactly one of them gets the row back: use it to claim keys
+    across worker processes.
+
+    Returns:
+        The `returning` column of the rows actually inserted
+    """
+    if not rows:
+        return []
+
+    connection = db.connection()
+    insert = _on_conflict_insert(connection)
+    inserted = []
+    for start in range(0, len(rows), batch_size):
+        statement = (
+            insert(table)
+            .values(rows[start:start + batch_size])
+            .on_conflict_do_nothing(index_elements=list(index_elements))
+            .returning(table.c[returning])
+        )
+        inserted.extend(connection.execute(statement).scalars())
+    return inserted
+
+
 def init_db():
     """Create all tables (for development)."""
     from florida.models.docket import FLDocket
     from florida.models.document import FLDocument
-    from florida.models.hearing import FLHearing, FLTranscriptSegment
+    from florida.models.hearing import FLHearing, FLTranscriptSegment, FLTranscriptPassage
     from florida.models.entity import FLEntity
     from florida.models.analysis import FLAnalysis
+    from florida.models.job import FLPipelineJob
+    from florida.models.stats import FLStatsRollup
+    from florida.models.sync import FLSyncCheckpoint
+    from florida.models.import_frontier import FLImportTerm, FLThunderstoneId
     Base.metadata.create_all(bind=engine)
@@ -32,7 +32,7 @@ class FLDocument(Base):
     __tablename__ = 'fl_documents'
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    thunderstone_id: Mapped[Optional[str]] = mapped_column(String(100))
+    thunderstone_id: Mapped[Optional[str]] = mapped_column(String(100), index=True)
 
     # Document metadata
     title: Mapped[str] = mapped_column(Text, nullable=False)
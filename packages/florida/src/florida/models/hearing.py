@@ -1,7 +1,8 @@
 """
-Florida Hearing and Transcript Segment models.
+Florida Hearing, Transcript Segment and Transcript Passage models.
 
-Represents hearing transcripts and their speaker-attributed segments.
+Represents hearing transcripts, their speaker-attributed segments, and
+the overlapping segment windows used for phrase search.
 """
 from datetime import datetime, date
 from typing import Optional, List, TYPE_CHECKING
@@ -9,7 +10,7 @@ from decimal import Decimal
 
 from sqlalchemy import (
     Column, Integer, String, Text, Date, DateTime, Float,
-    Numeric, ForeignKey
+    Numeric, ForeignKey, Index, JSON
 )
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -56,7 +57,9 @@ class FLHearing(Base):
 
     # Full transcript text
     full_text: Mapped[Optional[str]] = mapped_column(Text)
+    # Denormalized from fl_transcript_segments; maintained by the transcribe stage
     word_count: Mapped[Optional[int]] = mapped_column(Integer)
+    segment_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     # Processing metadata
     whisper_model: Mapped[Optional[str]] = mapped_column(String(50))
@@ -64,7 +67,7 @@ class FLHearing(Base):
     processing_cost_usd: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 4))
 
     # Timestamps
-    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow, index=True)
     processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
     # Relationships
@@ -74,6 +77,11 @@ class FLHearing(Base):
         back_populates="hearing",
         cascade="all, delete-orphan"
     )
+    passages: Mapped[List["FLTranscriptPassage"]] = relationship(
+        "FLTranscriptPassage",
+        back_populates="hearing",
+        cascade="all, delete-orphan"
+    )
     entities: Mapped[List["FLEntity"]] = relationship(
         "FLEntity",
         back_populates="hearing",
@@ -180,3 +188,42 @@ class FLTranscriptSegment(Base):
         minutes = int(self.start_time // 60)
         seconds = int(self.start_time % 60)
         return f"{minutes:02d}:{seconds:02d}"
+
+
+class FLTranscriptPassage(Base):
+    """
+    Window of consecutive transcript segments, for phrase search.
+
+    Whisper segments are a few seconds long, so phrases are often split
+    between two of them. Passages overlap (see core.services.passages),
+    so a split phrase lies whole inside at least one. Written by the
+    transcribe stage; `florida-cli build-passages` backfills.
+    """
+    __tablename__ = 'fl_transcript_passages'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    hearing_id: Mapped[int] = mapped_column(Integer, ForeignKey('fl_hearings.id', ondelete='CASCADE'), nullable=False)
+    passage_index: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Segments covered (segment_index, inclusive)
+    first_segment_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_segment_index: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    start_time: Mapped[Optional[float]] = mapped_column(Float)
+    end_time: Mapped[Optional[float]] = mapped_column(Float)
+    speakers: Mapped[Optional[str]] = mapped_column(String(500))
+
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    # [[char offset, start time], ...] of each segment in text
+    segment_offsets: Mapped[Optional[list]] = mapped_column(JSON)
+
+    # text_tsvector is a generated column in PostgreSQL
+
+    hearing: Mapped["FLHearing"] = relationship("FLHearing", back_populates="passages")
+
+    __table_args__ = (
+        Index('ix_fl_passages_hearing_index', 'hearing_id', 'passage_index'),
+    )
+
+    def __repr__(self):
+        return f"<FLTranscriptPassage {self.hearing_id}:{self.passage_index}>"
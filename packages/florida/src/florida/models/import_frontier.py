@@ -0,0 +1,75 @@
+"""
+Florida Thunderstone import frontier models.
+
+The comprehensive Thunderstone import is a frontier of (profile, search
+term) rows leased through core.services.job_queue, so any number of
+worker processes share it and a restarted import skips finished terms.
+"""
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, UniqueConstraint
+
+from florida.models.base import Base, JSONB
+
+
+class FLImportTerm(Base):
+    """
+    One search term to import from one Thunderstone profile.
+
+    Has the job queue's columns (statuses: queued, running, succeeded,
+    failed) plus last_page, the last results page stored, which a retried
+    or re-leased term resumes after.
+    """
+
+    __tablename__ = "fl_import_frontier"
+
+    id = Column(Integer, primary_key=True)
+    profile = Column(String(50), nullable=False)
+    term = Column(String(200), nullable=False)
+    last_page = Column(Integer, nullable=False, default=0)
+
+    # Job queue columns
+    kind = Column(String(50), nullable=False, default="thunderstone_term")
+    payload = Column(JSONB, nullable=False, default=dict)  # {profile, term}
+    run_id = Column(String(64), index=True)
+
+    status = Column(String(20), nullable=False, default="queued")
+    priority = Column(Integer, nullable=False, default=0)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    locked_by = Column(String(100))
+    locked_at = Column(DateTime)
+    heartbeat_at = Column(DateTime)
+
+    finished_at = Column(DateTime)
+    last_error = Column(Text)
+    result = Column(JSONB)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("profile", "term", name="uq_fl_import_frontier_profile_term"),
+        Index("ix_fl_import_frontier_status_run_after", "status", "run_after"),
+    )
+
+    def __repr__(self):
+        return f"<FLImportTerm {self.profile}:{self.term!r} {self.status} page {self.last_page}>"
+
+
+class FLThunderstoneId(Base):
+    """
+    A Thunderstone document id claimed by a writer of fl_documents.
+
+    Importer workers and the document sync stage insert ids with ON
+    CONFLICT DO NOTHING in the transaction that stores the documents, so
+    two processes never both insert a document and nothing has to hold
+    every known id in memory.
+    """
+
+    __tablename__ = "fl_thunderstone_ids"
+
+    thunderstone_id = Column(String(100), primary_key=True)
+
+    def __repr__(self):
+        return f"<FLThunderstoneId {self.thunderstone_id}>"
@@ -0,0 +1,50 @@
+"""
+Florida pipeline job model.
+
+Durable queue of transcribe/analyze runs, enqueued by the admin API and
+processed by `florida-cli worker` through core.services.job_queue.
+"""
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+
+from florida.models.base import Base, JSONB
+
+
+class FLPipelineJob(Base):
+    """
+    A unit of pipeline work (one stage on one hearing).
+
+    Statuses: queued, running, succeeded, failed, cancelled, paused.
+    """
+
+    __tablename__ = "fl_pipeline_jobs"
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(50), nullable=False)  # transcribe, analyze
+    payload = Column(JSONB, nullable=False, default=dict)
+    run_id = Column(String(64), index=True)  # Groups jobs enqueued together
+
+    status = Column(String(20), nullable=False, default="queued")
+    priority = Column(Integer, nullable=False, default=0)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    # Lease
+    locked_by = Column(String(100))
+    locked_at = Column(DateTime)
+    heartbeat_at = Column(DateTime)
+
+    # Outcome
+    finished_at = Column(DateTime)
+    last_error = Column(Text)
+    result = Column(JSONB)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_fl_pipeline_jobs_status_run_after", "status", "run_after"),
+    )
+
+    def __repr__(self):
+        return f"<FLPipelineJob {self.id} {self.kind} {self.status}>"
@@ -0,0 +1,32 @@
+"""
+Florida stats rollup model.
+
+Precomputed dashboard counters, maintained by florida.services.stats.
+"""
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import String, Date, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from florida.models.base import Base
+
+
+class FLStatsRollup(Base):
+    """
+    One additive counter: a metric's change on a day, per dimension.
+
+    Dimension is the status or model name the metric is broken down by,
+    or '' for plain totals. A metric's current value is the sum of its
+    rows over all days.
+    """
+    __tablename__ = 'fl_stats_rollups'
+
+    state_code: Mapped[str] = mapped_column(String(2), primary_key=True, default='FL')
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    metric: Mapped[str] = mapped_column(String(50), primary_key=True)
+    dimension: Mapped[str] = mapped_column(String(100), primary_key=True, default='')
+    value: Mapped[Decimal] = mapped_column(Numeric(18, 4), nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<FLStatsRollup {self.day} {self.metric}[{self.dimension}]={self.value}>"
@@ -0,0 +1,41 @@
+"""
+Florida sync checkpoint model.
+
+Progress of resumable ClerkOffice syncs, written by DocketSyncStage as
+each docket type/industry combination is stored.
+"""
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, DateTime, UniqueConstraint
+
+from florida.models.base import Base, JSONB
+
+
+class FLSyncCheckpoint(Base):
+    """
+    One unit of a sync run (e.g. docket type D, industry E).
+
+    Statuses: pending, done, failed. A run is resumable while any of its
+    checkpoints isn't done; resuming skips the done ones.
+    """
+
+    __tablename__ = "fl_sync_checkpoints"
+
+    id = Column(Integer, primary_key=True)
+    run_id = Column(String(64), nullable=False, index=True)
+    source = Column(String(50), nullable=False)  # clerkoffice_dockets
+    key = Column(String(100), nullable=False)  # e.g. D:E
+    params = Column(JSONB)  # Filters the run was started with
+
+    status = Column(String(20), nullable=False, default="pending")
+    item_count = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    completed_at = Column(DateTime)
+
+    __table_args__ = (
+        UniqueConstraint("run_id", "key", name="uq_fl_sync_checkpoints_run_key"),
+    )
+
+    def __repr__(self):
+        return f"<FLSyncCheckpoint {self.run_id} {self.key} {self.status}>"
@@ -5,20 +5,41 @@ Syncs dockets from the Florida PSC ClerkOffice API to the FL_DOCKETS table.
 This runs periodically to keep the local database in sync with the official records.
 """
 
+import asyncio
 import logging
+import uuid
+from contextlib import aclosing
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from core.pipeline.base import StageResult
 from florida.config import get_config, FloridaConfig
 from florida.scrapers.clerkoffice import FloridaClerkOfficeScraper, FloridaDocketData
+from florida.models.base import bulk_upsert
 from florida.models.docket import FLDocket
+from florida.models.sync import FLSyncCheckpoint
 
 logger = logging.getLogger(__name__)
 
+# ClerkOffice fields refreshed on every sync; a missing value keeps the
+# stored one so locally-enriched data survives
+DOCKET_SYNC_FIELDS = [
+    'title',
+    'utility_name',
+    'status',
+    'case_type',
+    'industry_type',
+    'filed_date',
+    'closed_date',
+    'psc_docket_url',
+]
+
+CHECKPOINT_SOURCE = 'clerkoffice_dockets'
+
 
 @dataclass
 class DocketSyncResult:
@@ -28,6 +49,9 @@ class DocketSyncResult:
     updated_dockets: int = 0
     errors: List[str] = None
     duration_seconds: float = 0.0
+    # Concurrent syncs: checkpointed run and combinations skipped on resume
+    run_id: Optional[str] = None
+    resumed_combinations: int = 0
 
     def __post_init__(self):
         if self.errors is None:
@@ -40,7 +64,8 @@ class DocketSyncStage:
 
     This stage:
     1. Fetches dockets from the ClerkOffice API
-    2. Upserts them into the FL_DOCKETS table
+    2. Upserts them into the FL_DOCKETS table in batches (one existence
+       query and one INSERT ... ON CONFLICT per batch)
     3. Preserves any locally-enriched data (commissioner assignments, etc.)
 
     Can be run in several modes:
@@ -48,6 +73,14 @@ class DocketSyncStage:
     - Year sync: Dockets from a specific year
     - Open only: Only currently open dockets
     - Incremental: Recently opened/closed dockets
+
+    With concurrent=True the docket type/industry combinations are fetched
+    in parallel (paced by the config's api_rate_limit) and each one is
+    checkpointed in fl_sync_checkpoints once stored, so a crashed run
+    picks up where it left off. Runs are only resumed within the config's
+    sync_resume_hours of starting; after that, a combination that keeps
+    failing (or a run cut short by `limit`) no longer holds back a fresh
+    full sync.
     """
 
     name = "docket_sync"
@@ -56,52 +89,201 @@ class DocketSyncStage:
         self,
         db: Session,
         config: Optional[FloridaConfig] = None,
-        scraper: Optional[FloridaClerkOfficeScraper] = None
+        scraper: Optional[FloridaClerkOfficeScraper] = None,
+        batch_size: Optional[int] = None,
     ):
         self.db = db
         self.config = config or get_config()
         self.scraper = scraper or FloridaClerkOfficeScraper(self.config)
+        self.batch_size = batch_size or self.config.sync_batch_size
 
-    def _upsert_docket(self, data: FloridaDocketData) -> bool:
+    def _upsert_dockets(self, batch: List[FloridaDocketData]) -> int:
         """
-        Upsert a docket into the database.
+        Upsert a batch of dockets (unique docket numbers) into the database.
 
-        Returns True if inserted (new), False if updated (existing).
+        Returns the number inserted (new); the rest were updated.
         """
-        existing = self.db.query(FLDocket).filter(
-            FLDocket.docket_number == data.docket_number
-        ).first()
+        numbers = [data.docket_number for data in batch]
+        existing = self.db.query(func.count(FLDocket.id)).filter(
+            FLDocket.docket_number.in_(numbers)
+        ).scalar() or 0
 
-        if existing:
-            # Update existing docket (preserve locally-enriched fields)
-            existing.title = data.title or existing.title
-            existing.utility_name = data.utility_name or existing.utility_name
-            existing.status = data.status or existing.status
-            existing.case_type = data.case_type or existing.case_type
-            existing.industry_type = data.industry_type or existing.industry_type
-            existing.filed_date = data.filed_date or existing.filed_date
-            existing.closed_date = data.closed_date or existing.closed_date
-            existing.psc_docket_url = data.psc_docket_url or existing.psc_docket_url
-            existing.updated_at = datetime.utcnow()
-            return False
-        else:
-            # Insert new docket
-            docket = FLDocket(
-                docket_number=data.docket_number,
-                year=data.year,
-                sequence=data.sequence,
-                sector_code=data.sector_code,
-                title=data.title,
-                utility_name=data.utility_name,
-                status=data.status,
-                case_type=data.case_type,
-                industry_type=data.industry_type,
-                filed_date=data.filed_date,
-                closed_date=data.closed_date,
-                psc_docket_url=data.psc_docket_url,
-            )
-            self.db.add(docket)
+        now = datetime.utcnow()
+        rows = [
+            {
+                'docket_number': data.docket_number,
+                'year': data.year,
+                'sequence': data.sequence,
+                'sector_code': data.sector_code,
+                **{field: getattr(data, field) or None for field in DOCKET_SYNC_FIELDS},
+                'created_at': now,
+                'updated_at': now,
+            }
+            for data in batch
+        ]
+        bulk_upsert(
+            self.db,
+            FLDocket.__table__,
+            rows,
+            index_elements=['docket_number'],
+            coalesce=DOCKET_SYNC_FIELDS,
+            overwrite=['updated_at'],
+        )
+        return len(batch) - existing
+
+    def _flush(
+        self,
+        batch: List[FloridaDocketData],
+        result: DocketSyncResult,
+        on_progress: Optional[callable] = None
+    ) -> bool:
+        """
+        Write and commit a batch, adding its counts to result. Returns False on error.
+
+        A failed batch is retried one docket at a time, so a single bad
+        record doesn't drop the rest of the batch.
+        """
+        if not batch:
             return True
+        try:
+            new = self._upsert_dockets(batch)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            if len(batch) == 1:
+                logger.warning(f"Error upserting docket {batch[0].docket_number}: {e}")
+                result.errors.append(str(e))
+                return False
+            logger.warning(
+                f"Error upserting {len(batch)} dockets starting at {batch[0].docket_number}: {e}; "
+                f"retrying one at a time"
+            )
+            stored = [self._flush([data], result) for data in batch]
+            if on_progress:
+                on_progress(f"Synced {result.total_scraped} dockets...")
+            return all(stored)
+
+        result.new_dockets += new
+        result.updated_dockets += len(batch) - new
+        result.total_scraped += len(batch)
+        if on_progress:
+            on_progress(f"Synced {result.total_scraped} dockets...")
+        return True
+
+    def _checkpoints(
+        self,
+        combinations: List[Tuple[str, str]],
+        params: Dict[str, Any],
+        resume: bool = True,
+    ) -> Dict[str, FLSyncCheckpoint]:
+        """
+        Checkpoints by combination key for a concurrent sync.
+
+        When resuming, reuses the latest unfinished run started with the
+        same params within sync_resume_hours; otherwise starts a new run
+        with all combinations pending. Failed combinations of a resumed
+        run are retried.
+        """
+        run_id = None
+        if resume:
+            # A run's checkpoints are all created when it starts
+            started_after = datetime.utcnow() - timedelta(hours=self.config.sync_resume_hours)
+            unfinished = self.db.query(FLSyncCheckpoint).filter(
+                FLSyncCheckpoint.source == CHECKPOINT_SOURCE,
+                FLSyncCheckpoint.status != 'done',
+                FLSyncCheckpoint.created_at >= started_after,
+            ).order_by(FLSyncCheckpoint.id.desc())
+            run_id = next((cp.run_id for cp in unfinished if cp.params == params), None)
+
+        if run_id is None:
+            run_id = uuid.uuid4().hex
+            self.db.add_all([
+                FLSyncCheckpoint(
+                    run_id=run_id,
+                    source=CHECKPOINT_SOURCE,
+                    key=f"{dtype}:{itype}",
+                    params=params,
+                    status='pending',
+                    item_count=0,
+                )
+                for dtype, itype in combinations
+            ])
+            self.db.commit()
+
+        return {
+            cp.key: cp
+            for cp in self.db.query(FLSyncCheckpoint).filter(FLSyncCheckpoint.run_id == run_id)
+        }
+
+    def _finish_checkpoint(
+        self,
+        checkpoint: FLSyncCheckpoint,
+        status: str,
+        item_count: int = 0,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record a combination's outcome."""
+        checkpoint.status = status
+        checkpoint.item_count = item_count
+        checkpoint.last_error = error
+        checkpoint.completed_at = datetime.utcnow()
+        self.db.commit()
+
+    async def _sync_concurrent(
+        self,
+        result: DocketSyncResult,
+        year: Optional[int],
+        status: Optional[str],
+        industries: Optional[List[str]],
+        limit: int,
+        resume: bool,
+        on_progress: Optional[callable] = None
+    ) -> None:
+        """Fetch combinations concurrently, storing and checkpointing each as it arrives."""
+        combinations = self.scraper.docket_combinations(status, industries)
+        params = {'year': year, 'status': status, 'industries': sorted(industries or [])}
+        checkpoints = self._checkpoints(combinations, params, resume)
+
+        pending = [
+            (dtype, itype) for dtype, itype in combinations
+            if checkpoints[f"{dtype}:{itype}"].status != 'done'
+        ]
+        result.run_id = next(iter(checkpoints.values())).run_id
+        result.resumed_combinations = len(combinations) - len(pending)
+        if result.resumed_combinations and on_progress:
+            on_progress(
+                f"Resuming run {result.run_id}: "
+                f"{result.resumed_combinations}/{len(combinations)} combinations already synced"
+            )
+
+        seen_dockets = set()
+        async with aclosing(self.scraper.fetch_docket_lists(pending, year=year)) as docket_lists:
+            async for docket_list in docket_lists:
+                checkpoint = checkpoints[docket_list.key]
+                if docket_list.error is not None:
+                    result.errors.append(f"{docket_list.key}: {docket_list.error}")
+                    self._finish_checkpoint(checkpoint, 'failed', error=str(docket_list.error))
+                    continue
+
+                dockets = [d for d in docket_list.dockets if d.docket_number not in seen_dockets]
+                seen_dockets.update(d.docket_number for d in dockets)
+                remaining = limit - result.total_scraped
+                truncated = len(dockets) > remaining
+                dockets = dockets[:remaining]
+
+                stored = [
+                    self._flush(dockets[start:start + self.batch_size], result, on_progress)
+                    for start in range(0, len(dockets), self.batch_size)
+                ]
+                if truncated:
+                    # Partly stored: leave the checkpoint pending for the next run
+                    break
+                if all(stored):
+                    self._finish_checkpoint(checkpoint, 'done', item_count=len(dockets))
+                else:
+                    self._finish_checkpoint(checkpoint, 'failed', error=result.errors[-1])
+                if result.total_scraped >= limit:
+                    break
 
     def sync_all(
         self,
@@ -109,7 +291,9 @@ class DocketSyncStage:
         status: Optional[str] = None,
         industries: Optional[List[str]] = None,
         limit: int = 10000,
-        on_progress: Optional[callable] = None
+        on_progress: Optional[callable] = None,
+        concurrent: bool = False,
+        resume: bool = True,
     ) -> DocketSyncResult:
         """
         Sync all dockets matching the criteria.
@@ -120,6 +304,11 @@ class DocketSyncStage:
             industries: List of industry codes ['E', 'G', 'T', 'W', 'X']
             limit: Maximum dockets to sync
             on_progress: Callback for progress updates
+            concurrent: Fetch docket type/industry combinations in parallel,
+                checkpointing each one (must not be called from a running
+                event loop)
+            resume: With concurrent, continue the latest unfinished run
+                with the same filters, if started within sync_resume_hours
 
         Returns:
             DocketSyncResult with stats
@@ -129,43 +318,34 @@ class DocketSyncStage:
 
         result = DocketSyncResult()
         seen_dockets = set()
+        batch: List[FloridaDocketData] = []
 
         try:
             if on_progress:
                 on_progress("Starting Florida docket sync...")
 
-            for docket_data in self.scraper.scrape_florida_dockets(
-                year=year,
-                status=status,
-                industries=industries,
-                limit=limit
-            ):
-                # Skip duplicates
-                if docket_data.docket_number in seen_dockets:
-                    continue
-                seen_dockets.add(docket_data.docket_number)
-
-                try:
-                    is_new = self._upsert_docket(docket_data)
-                    if is_new:
-                        result.new_dockets += 1
-                    else:
-                        result.updated_dockets += 1
-                    result.total_scraped += 1
-
-                    # Commit in batches
-                    if result.total_scraped % 100 == 0:
-                        self.db.commit()
-                        if on_progress:
-                            on_progress(f"Synced {result.total_scraped} dockets...")
-
-                except Exception as e:
-                    logger.warning(f"Error upserting docket {docket_data.docket_number}: {e}")
-                    result.errors.append(str(e))
-                    self.db.rollback()
-
-            # Final commit
-            self.db.commit()
+            if concurrent:
+                asyncio.run(self._sync_concurrent(
+                    result, year, status, industries, limit, resume, on_progress
+                ))
+            else:
+                for docket_data in self.scraper.scrape_florida_dockets(
+                    year=year,
+                    status=status,
+                    industries=industries,
+                    limit=limit
+                ):
+                    # Skip duplicates
+                    if docket_data.docket_number in seen_dockets:
+                        continue
+                    seen_dockets.add(docket_data.docket_number)
+
+                    batch.append(docket_data)
+                    if len(batch) >= self.batch_size:
+                        self._flush(batch, result, on_progress)
+                        batch = []
+
+                self._flush(batch, result, on_progress)
 
         except Exception as e:
             logger.exception(f"Error during docket sync: {e}")
@@ -207,8 +387,6 @@ class DocketSyncStage:
 
     def get_sync_stats(self) -> Dict[str, Any]:
         """Get statistics about synced dockets."""
-        from sqlalchemy import func
-
         total = self.db.query(func.count(FLDocket.id)).scalar() or 0
         open_count = self.db.query(func.count(FLDocket.id)).filter(
             FLDocket.status == 'open'
@@ -7,19 +7,35 @@ This discovers and catalogs PSC documents associated with dockets.
 
 import logging
 from datetime import datetime, date
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, List, Set, Tuple
 from dataclasses import dataclass
 
+from sqlalchemy import func, tuple_
 from sqlalchemy.orm import Session
 
 from core.pipeline.base import StageResult
 from florida.config import get_config, FloridaConfig
 from florida.scrapers.thunderstone import FloridaThunderstoneScraper, ThunderstoneDocument
+from florida.models.base import bulk_insert, bulk_insert_missing, bulk_upsert
 from florida.models.document import FLDocument
 from florida.models.docket import FLDocket
+from florida.models.import_frontier import FLThunderstoneId
 
 logger = logging.getLogger(__name__)
 
+# Thunderstone fields refreshed when a document is seen again; a missing
+# value keeps the stored one
+DOCUMENT_SYNC_FIELDS = [
+    'document_type',
+    'profile',
+    'file_url',
+    'file_type',
+    'file_size_bytes',
+    'filed_date',
+    'filer_name',
+    'docket_number',
+]
+
 
 @dataclass
 class DocumentSyncResult:
@@ -42,7 +58,9 @@ class DocumentSyncStage:
 
     This stage:
     1. Searches for documents associated with known dockets
-    2. Indexes document metadata into FL_DOCUMENTS table
+    2. Indexes document metadata into FL_DOCUMENTS table in batches
+       (existing documents and dockets resolved with one query each, then
+       one INSERT ... ON CONFLICT for updates and one insert for new rows)
     3. Links documents to their parent dockets
 
     Can be run in several modes:
@@ -58,72 +76,192 @@ class DocumentSyncStage:
         self,
         db: Session,
         config: Optional[FloridaConfig] = None,
-        scraper: Optional[FloridaThunderstoneScraper] = None
+        scraper: Optional[FloridaThunderstoneScraper] = None,
+        batch_size: Optional[int] = None,
     ):
         self.db = db
         self.config = config or get_config()
         self.scraper = scraper or FloridaThunderstoneScraper(self.config)
+        self.batch_size = batch_size or self.config.sync_batch_size
+
+    @staticmethod
+    def _match_keys(doc: ThunderstoneDocument) -> Set[Tuple]:
+        """Keys an existing document can be matched on."""
+        keys = set()
+        if doc.thunderstone_id:
+            keys.add(('thunderstone_id', doc.thunderstone_id))
+        if doc.docket_number and doc.title:
+            keys.add(('docket_title', doc.docket_number, doc.title))
+        return keys
 
-    def _upsert_document(self, doc: ThunderstoneDocument) -> bool:
+    def _upsert_documents(self, batch: List[ThunderstoneDocument]) -> int:
         """
-        Upsert a document into the database.
+        Upsert a batch of documents into the database.
 
-        Returns True if inserted (new), False if updated (existing).
+        Documents match existing rows by thunderstone_id, then by
+        title+docket. New documents' ids are claimed in fl_thunderstone_ids
+        like the Thunderstone importer does. An id another writer claimed
+        first updates the row that writer stored. Returns the number
+        inserted (new); the rest were updated.
         """
-        # Check for existing by thunderstone_id or title+docket combination
-        existing = None
-        if doc.thunderstone_id:
-            existing = self.db.query(FLDocument).filter(
-                FLDocument.thunderstone_id == doc.thunderstone_id
-            ).first()
+        thunderstone_ids = {doc.thunderstone_id for doc in batch if doc.thunderstone_id}
+        by_thunderstone_id = {}
+        if thunderstone_ids:
+            by_thunderstone_id = dict(
+                self.db.query(FLDocument.thunderstone_id, FLDocument.id).filter(
+                    FLDocument.thunderstone_id.in_(thunderstone_ids)
+                )
+            )
 
-        if not existing and doc.docket_number and doc.title:
-            existing = self.db.query(FLDocument).filter(
-                FLDocument.docket_number == doc.docket_number,
-                FLDocument.title == doc.title
-            ).first()
+        docket_titles = {(doc.docket_number, doc.title) for doc in batch if doc.docket_number and doc.title}
+        by_docket_title = {}
+        if docket_titles:
+            by_docket_title = {
+                (docket_number, title): document_id
+                for docket_number, title, document_id in self.db.query(
+                    FLDocument.docket_number, FLDocument.title, FLDocument.id
+                ).filter(tuple_(FLDocument.docket_number, FLDocument.title).in_(docket_titles))
+            }
 
         # Validate docket_number exists if provided (skip FK if docket not in DB)
-        validated_docket_number = None
-        if doc.docket_number:
-            docket_exists = self.db.query(FLDocket).filter(
-                FLDocket.docket_number == doc.docket_number
-            ).first()
-            if docket_exists:
-                validated_docket_number = doc.docket_number
-
-        if existing:
-            # Update existing document
-            existing.document_type = doc.document_type or existing.document_type
-            existing.profile = doc.profile or existing.profile
-            existing.file_url = doc.file_url or existing.file_url
-            existing.file_type = doc.file_type or existing.file_type
-            existing.file_size_bytes = doc.file_size_bytes or existing.file_size_bytes
-            existing.filed_date = doc.filed_date or existing.filed_date
-            existing.filer_name = doc.filer_name or existing.filer_name
-            existing.scraped_at = datetime.utcnow()
-            # Only update docket_number if the docket exists
-            if validated_docket_number:
-                existing.docket_number = validated_docket_number
-            return False
-        else:
-            # Insert new document
-            document = FLDocument(
-                thunderstone_id=doc.thunderstone_id,
-                title=doc.title,
-                document_type=doc.document_type,
-                profile=doc.profile,
-                docket_number=validated_docket_number,  # Only set if docket exists
-                file_url=doc.file_url,
-                file_type=doc.file_type,
-                file_size_bytes=doc.file_size_bytes,
-                filed_date=doc.filed_date,
-                filer_name=doc.filer_name,
-                document_number=doc.document_number,
-                scraped_at=datetime.utcnow(),
+        docket_numbers = {doc.docket_number for doc in batch if doc.docket_number}
+        known_dockets = set()
+        if docket_numbers:
+            known_dockets = {
+                docket_number for (docket_number,) in self.db.query(FLDocket.docket_number).filter(
+                    FLDocket.docket_number.in_(docket_numbers)
+                )
+            }
+
+        now = datetime.utcnow()
+        new_rows = []
+        updates: Dict[int, Dict[str, Any]] = {}
+        for doc in batch:
+            row = {
+                'thunderstone_id': doc.thunderstone_id,
+                'title': doc.title,
+                **{field: getattr(doc, field) or None for field in DOCUMENT_SYNC_FIELDS},
+                # Only set if docket exists
+                'docket_number': doc.docket_number if doc.docket_number in known_dockets else None,
+                'document_number': doc.document_number,
+                'created_at': now,
+                'scraped_at': now,
+            }
+
+            existing_id = by_thunderstone_id.get(doc.thunderstone_id)
+            if existing_id is None and doc.docket_number and doc.title:
+                existing_id = by_docket_title.get((doc.docket_number, doc.title))
+
+            if existing_id is None:
+                new_rows.append(row)
+            else:
+                self._add_update(updates, existing_id, row)
+
+        # Sorted, so concurrent writers take the row locks in the same order.
+        # A conflicting claim waits for the other writer's commit.
+        new_ids = sorted({row['thunderstone_id'] for row in new_rows if row['thunderstone_id']})
+        claimed = set(bulk_insert_missing(
+            self.db,
+            FLThunderstoneId.__table__,
+            [{'thunderstone_id': thunderstone_id} for thunderstone_id in new_ids],
+            index_elements=['thunderstone_id'],
+            returning='thunderstone_id',
+        ))
+        taken = set(new_ids) - claimed
+        if taken:
+            stored = dict(
+                self.db.query(FLDocument.thunderstone_id, FLDocument.id).filter(
+                    FLDocument.thunderstone_id.in_(taken)
+                )
             )
-            self.db.add(document)
-            return True
+            unclaimed_rows, new_rows = new_rows, []
+            for row in unclaimed_rows:
+                existing_id = stored.get(row['thunderstone_id'])
+                if existing_id is None:
+                    new_rows.append(row)
+                else:
+                    self._add_update(updates, existing_id, row)
+
+        # Updates conflict on the primary key: fl_documents has no unique
+        # key on thunderstone_id to conflict on
+        bulk_upsert(
+            self.db,
+            FLDocument.__table__,
+            list(updates.values()),
+            index_elements=['id'],
+            coalesce=DOCUMENT_SYNC_FIELDS,
+            overwrite=['scraped_at'],
+        )
+        bulk_insert(self.db, FLDocument.__table__, new_rows)
+        return len(new_rows)
+
+    @staticmethod
+    def _add_update(updates: Dict[int, Dict[str, Any]], existing_id: int, row: Dict[str, Any]) -> None:
+        if existing_id in updates:
+            # Two scraped documents resolved to the same row: later values win
+            updates[existing_id].update({key: value for key, value in row.items() if value is not None})
+        else:
+            updates[existing_id] = {'id': existing_id, **row}
+
+    def _flush(
+        self,
+        batch: List[ThunderstoneDocument],
+        result: DocumentSyncResult,
+        on_progress: Optional[callable] = None,
+    ) -> None:
+        """
+        Write and commit a batch, adding its counts to result.
+
+        A failed batch is retried one document at a time, so a single bad
+        record doesn't drop the rest of the batch.
+        """
+        if not batch:
+            return
+        try:
+            new = self._upsert_documents(batch)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            if len(batch) == 1:
+                logger.warning(f"Error indexing document {batch[0].thunderstone_id}: {e}")
+                result.errors.append(str(e))
+                return
+            logger.warning(f"Error indexing {len(batch)} documents: {e}; retrying one at a time")
+            for doc in batch:
+                self._flush([doc], result)
+            if on_progress:
+                on_progress(f"Indexed {result.total_indexed} documents...")
+            return
+
+        result.new_documents += new
+        result.updated_documents += len(batch) - new
+        result.total_indexed += len(batch)
+        if on_progress:
+            on_progress(f"Indexed {result.total_indexed} documents...")
+
+    def _index(
+        self,
+        docs: Iterable[ThunderstoneDocument],
+        result: DocumentSyncResult,
+        on_progress: Optional[callable] = None,
+    ) -> None:
+        """Index scraped documents in batches of batch_size."""
+        batch: List[ThunderstoneDocument] = []
+        batch_keys: Set[Tuple] = set()
+        for doc in docs:
+            keys = self._match_keys(doc)
+            # A repeat must see the earlier copy in the database to match it
+            if keys & batch_keys:
+                self._flush(batch, result, on_progress)
+                batch, batch_keys = [], set()
+
+            batch.append(doc)
+            batch_keys |= keys
+            if len(batch) >= self.batch_size:
+                self._flush(batch, result, on_progress)
+                batch, batch_keys = [], set()
+
+        self._flush(batch, result, on_progress)
 
     def index_docket_documents(
         self,
@@ -147,24 +285,15 @@ class DocumentSyncStage:
         result = DocumentSyncResult()
 
         try:
-            for doc in self.scraper.search_by_docket(
-                docket_number=docket_number,
-                profile=profile,
-                limit=limit
-            ):
-                try:
-                    is_new = self._upsert_document(doc)
-                    if is_new:
-                        result.new_documents += 1
-                    else:
-                        result.updated_documents += 1
-                    result.total_indexed += 1
-                except Exception as e:
-                    logger.warning(f"Error indexing document: {e}")
-                    result.errors.append(str(e))
-
+            self._index(
+                self.scraper.search_by_docket(
+                    docket_number=docket_number,
+                    profile=profile,
+                    limit=limit
+                ),
+                result,
+            )
             result.dockets_processed = 1
-            self.db.commit()
 
         except Exception as e:
             logger.exception(f"Error indexing docket {docket_number}: {e}")
@@ -201,29 +330,15 @@ class DocumentSyncStage:
             if on_progress:
                 on_progress(f"Searching Thunderstone: '{query}'...")
 
-            for doc in self.scraper.search(
-                query=query,
-                profile=profile,
-                limit=limit
-            ):
-                try:
-                    is_new = self._upsert_document(doc)
-                    if is_new:
-                        result.new_documents += 1
-                    else:
-                        result.updated_documents += 1
-                    result.total_indexed += 1
-
-                    if result.total_indexed % 50 == 0:
-                        self.db.commit()
-                        if on_progress:
-                            on_progress(f"Indexed {result.total_indexed} documents...")
-
-                except Exception as e:
-                    logger.warning(f"Error indexing document: {e}")
-                    result.errors.append(str(e))
-
-            self.db.commit()
+            self._index(
+                self.scraper.search(
+                    query=query,
+                    profile=profile,
+                    limit=limit
+                ),
+                result,
+                on_progress,
+            )
 
         except Exception as e:
             logger.exception(f"Error during search: {e}")
@@ -247,19 +362,7 @@ class DocumentSyncStage:
             if on_progress:
                 on_progress("Fetching recent orders...")
 
-            for doc in self.scraper.get_orders(query='', limit=limit):
-                try:
-                    is_new = self._upsert_document(doc)
-                    if is_new:
-                        result.new_documents += 1
-                    else:
-                        result.updated_documents += 1
-                    result.total_indexed += 1
-                except Exception as e:
-                    logger.warning(f"Error indexing order: {e}")
-                    result.errors.append(str(e))
-
-            self.db.commit()
+            self._index(self.scraper.get_orders(query='', limit=limit), result)
 
         except Exception as e:
             logger.exception(f"Error fetching orders: {e}")
@@ -329,8 +432,6 @@ class DocumentSyncStage:
 
     def get_document_stats(self) -> Dict[str, Any]:
         """Get statistics about indexed documents."""
-        from sqlalchemy import func
-
         total = self.db.query(func.count(FLDocument.id)).scalar() or 0
 
         # By document type
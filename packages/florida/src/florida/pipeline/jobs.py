@@ -0,0 +1,157 @@
+"""
+Florida pipeline jobs - transcribe/analyze runs through the durable job queue.
+
+The admin API enqueues one job per hearing into fl_pipeline_jobs and
+`florida-cli worker` processes lease and run them. A job's payload may
+list follow-up stages ("then"), which are enqueued for the same hearing
+when the job completes, so a full-pipeline run analyzes each hearing as
+soon as it is transcribed.
+"""
+
+import logging
+import os
+import uuid
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from core.services.job_queue import JobQueue
+from florida.models.hearing import FLHearing
+from florida.models.job import FLPipelineJob
+from florida.pipeline.stages import FLTranscribeStage, FLAnalyzeStage
+
+logger = logging.getLogger(__name__)
+
+# A job whose worker stops heartbeating for this long is requeued
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "300"))
+# Failed jobs are retried with backoff up to this many attempts
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+
+STAGES = {
+    "transcribe": FLTranscribeStage,
+    "analyze": FLAnalyzeStage,
+}
+
+job_queue = JobQueue(FLPipelineJob, lease_seconds=JOB_LEASE_SECONDS)
+
+
+class StageFailedError(Exception):
+    """Raised when a stage returns an unsuccessful result, so the job is retried."""
+
+
+def find_hearings_for_stage(db: Session, stage: str, limit: int) -> List[int]:
+    """IDs of hearings waiting for a stage."""
+    if stage == "transcribe":
+        # No segments yet
+        rows = db.execute(text("""
+            SELECT h.id FROM fl_hearings h
+            WHERE NOT EXISTS (
+                SELECT 1 FROM fl_transcript_segments s WHERE s.hearing_id = h.id
+            )
+            AND (h.transcript_status IS NULL OR h.transcript_status NOT IN ('transcribed', 'analyzed', 'error', 'skipped'))
+            LIMIT :limit
+        """), {"limit": limit}).fetchall()
+    elif stage == "analyze":
+        # Have segments but no analysis
+        rows = db.execute(text("""
+            SELECT DISTINCT h.id FROM fl_hearings h
+            JOIN fl_transcript_segments s ON s.hearing_id = h.id
+            LEFT JOIN fl_analyses a ON a.hearing_id = h.id
+            WHERE a.id IS NULL
+            LIMIT :limit
+        """), {"limit": limit}).fetchall()
+    else:
+        raise ValueError(f"Unknown stage: {stage}")
+    return [r[0] for r in rows]
+
+
+def enqueue_stage_jobs(
+    db: Session,
+    stage: str,
+    hearing_ids: List[int],
+    then: Optional[List[str]] = None,
+    max_cost_usd: Optional[float] = None,
+    run_id: Optional[str] = None,
+) -> str:
+    """
+    Enqueue one job per hearing and commit.
+
+    Args:
+        stage: Key of STAGES
+        hearing_ids: Hearings to process
+        then: Stages to enqueue for each hearing after this one
+        max_cost_usd: Jobs of the run are skipped once its succeeded jobs
+            have reported this much cost
+        run_id: Add to an existing run instead of starting a new one
+
+    Returns:
+        run_id grouping the jobs
+    """
+    run_id = run_id or f"{stage}_{uuid.uuid4().hex[:12]}"
+    for hearing_id in hearing_ids:
+        _add_stage_job(db, stage, hearing_id, then, max_cost_usd, run_id)
+    db.commit()
+
+    logger.info(f"Enqueued {len(hearing_ids)} {stage} jobs as run {run_id}")
+    return run_id
+
+
+def _add_stage_job(
+    db: Session,
+    stage: str,
+    hearing_id: int,
+    then: Optional[List[str]],
+    max_cost_usd: Optional[float],
+    run_id: str,
+):
+    """Add one stage job to the session. The caller commits."""
+    job_queue.enqueue(
+        db,
+        stage,
+        {
+            "hearing_id": hearing_id,
+            "run_id": run_id,
+            "then": then or [],
+            "max_cost_usd": max_cost_usd,
+        },
+        run_id=run_id,
+        max_attempts=JOB_MAX_ATTEMPTS,
+    )
+
+
+def run_stage_job(stage: str, payload: Dict[str, Any], db: Session) -> Dict[str, Any]:
+    """Run a stage on the payload's hearing and return the job result."""
+    max_cost_usd = payload.get("max_cost_usd")
+    if max_cost_usd and job_queue.run_cost(db, payload["run_id"]) >= max_cost_usd:
+        return {"skipped": True, "error": f"Run cost ceiling ${max_cost_usd:.2f} reached"}
+
+    hearing = db.query(FLHearing).filter(FLHearing.id == payload["hearing_id"]).first()
+    if not hearing:
+        return {"skipped": True, "error": f"Hearing {payload['hearing_id']} not found"}
+
+    pipeline_stage = STAGES[stage]()
+    is_valid, reason = pipeline_stage.validate(hearing, db)
+    if not is_valid:
+        # A hearing that can't go through this stage doesn't move down the chain
+        return {"skipped": True, "error": reason}
+
+    result = pipeline_stage.execute(hearing, db)
+    if not result.success:
+        raise StageFailedError(result.error)
+
+    # Left uncommitted: the worker's complete() commits the follow-up job
+    # together with this one's success, so a lost lease or retry can't
+    # enqueue it twice
+    then = payload.get("then") or []
+    if then:
+        _add_stage_job(db, then[0], hearing.id, then[1:], max_cost_usd, payload["run_id"])
+
+    return {"skipped": False, "cost_usd": result.cost_usd, "model": result.model}
+
+
+# Handlers for JobWorker, keyed by job kind
+JOB_HANDLERS = {
+    name: (lambda payload, db, name=name: run_stage_job(name, payload, db))
+    for name in STAGES
+}
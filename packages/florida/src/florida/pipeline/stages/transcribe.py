@@ -8,12 +8,20 @@ Supports:
 - Groq Whisper API (fastest, preferred)
 - Azure OpenAI Whisper API
 - OpenAI Whisper API
+
+Large files are split into chunks that are transcribed concurrently.
+Whisper responses are cached per chunk by audio hash, model and prompt.
+Saved segments are also windowed into FLTranscriptPassage rows for
+phrase search.
 """
 
 import os
+import math
+import shutil
 import logging
 import tempfile
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Tuple
@@ -21,7 +29,10 @@ from dataclasses import dataclass
 
 from sqlalchemy.orm import Session
 
-from florida.models.hearing import FLHearing, FLTranscriptSegment
+from core.services.passages import DEFAULT_STRIDE, DEFAULT_WINDOW, build_passages
+from core.services.transcription_cache import TranscriptionCache
+from florida.models.base import bulk_insert
+from florida.models.hearing import FLHearing, FLTranscriptPassage, FLTranscriptSegment
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +42,18 @@ USE_OPENAI_WHISPER = os.getenv("USE_OPENAI_WHISPER", "true").lower() == "true"
 
 # File size limits for chunking
 MAX_FILE_SIZE_BYTES = 24 * 1024 * 1024  # 24MB (Groq limit is 25MB)
-CHUNK_DURATION_SECONDS = 600  # 10 minutes per chunk
+CHUNK_BITRATE_KBPS = 64  # Chunks are mono 16kHz CBR MP3, so length follows from the byte limit
+CHUNK_SIZE_HEADROOM = 0.9  # Stay 10% under the limit for container overhead
+MIN_CHUNK_SECONDS = 60
+WHISPER_MAX_CONCURRENCY = int(os.getenv("WHISPER_MAX_CONCURRENCY", "4"))  # Chunks in flight
+
+# Whisper response cache (empty TRANSCRIPT_CACHE_DIR disables)
+TRANSCRIPT_CACHE_DIR = os.getenv("TRANSCRIPT_CACHE_DIR", "data/transcript_cache")
+TRANSCRIPT_CACHE_MAX_MB = int(os.getenv("TRANSCRIPT_CACHE_MAX_MB", "1024"))
+
+# Passage windows for phrase search: segments per passage, segments between starts
+PASSAGE_WINDOW_SEGMENTS = int(os.getenv("PASSAGE_WINDOW_SEGMENTS", str(DEFAULT_WINDOW)))
+PASSAGE_STRIDE_SEGMENTS = int(os.getenv("PASSAGE_STRIDE_SEGMENTS", str(DEFAULT_STRIDE)))
 
 # Groq configuration (preferred - fastest)
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
@@ -60,6 +82,8 @@ class TranscriptionResult:
     model: str = ""
     cost_usd: float = 0.0
     error: str = ""
+    cache_hits: int = 0
+    cache_misses: int = 0
 
     def __post_init__(self):
         if self.segments is None:
@@ -76,8 +100,20 @@ class FLTranscribeStage:
 
     name = "transcribe"
 
-    def __init__(self, audio_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        audio_dir: Optional[Path] = None,
+        max_concurrency: Optional[int] = None,
+        cache: Optional[TranscriptionCache] = None,
+    ):
         self.audio_dir = audio_dir or AUDIO_DIR
+        self.max_concurrency = max(1, max_concurrency or WHISPER_MAX_CONCURRENCY)
+        if cache is None and TRANSCRIPT_CACHE_DIR:
+            cache = TranscriptionCache(
+                TRANSCRIPT_CACHE_DIR,
+                max_bytes=TRANSCRIPT_CACHE_MAX_MB * 1024 * 1024,
+            )
+        self.cache = cache
         self._openai_client = None
         self._groq_client = None
         # Priority: Groq > Azure > OpenAI
@@ -319,35 +355,12 @@ class FLTranscribeStage:
         duration_minutes = (duration_seconds or 0) / 60
 
         try:
-            with open(audio_path, "rb") as audio_file:
-                response = self.groq_client.audio.transcriptions.create(
-                    model=GROQ_WHISPER_MODEL,
-                    file=audio_file,
-                    response_format="verbose_json",
-                    prompt=initial_prompt if initial_prompt else None,
-                )
+            response, cached = self._transcribe_chunk(audio_path, GROQ_WHISPER_MODEL, initial_prompt)
+
+            full_text = response["text"]
+            segments = response["segments"]
 
-            full_text = response.text
-            segments = []
-
-            if hasattr(response, 'segments') and response.segments:
-                for i, seg in enumerate(response.segments):
-                    if isinstance(seg, dict):
-                        segments.append({
-                            "index": i,
-                            "start": seg.get("start", 0),
-                            "end": seg.get("end", 0),
-                            "text": seg.get("text", "").strip(),
-                        })
-                    else:
-                        segments.append({
-                            "index": i,
-                            "start": getattr(seg, "start", 0),
-                            "end": getattr(seg, "end", 0),
-                            "text": getattr(seg, "text", "").strip(),
-                        })
-
-            cost_usd = duration_minutes * GROQ_WHISPER_COST_PER_MINUTE
+            cost_usd = 0.0 if cached else duration_minutes * GROQ_WHISPER_COST_PER_MINUTE
             logger.info(f"Groq transcription complete: {len(segments)} segments, {duration_minutes:.1f} min")
 
             return TranscriptionResult(
@@ -356,6 +369,8 @@ class FLTranscribeStage:
                 segments=segments,
                 model=GROQ_WHISPER_MODEL,
                 cost_usd=cost_usd,
+                cache_hits=int(cached),
+                cache_misses=int(not cached and self.cache is not None),
             )
 
         except Exception as e:
@@ -373,36 +388,12 @@ class FLTranscribeStage:
         duration_minutes = (duration_seconds or 0) / 60
 
         try:
-            with open(audio_path, "rb") as audio_file:
-                response = self.openai_client.audio.transcriptions.create(
-                    model=model_name,
-                    file=audio_file,
-                    response_format="verbose_json",
-                    timestamp_granularities=["segment"],
-                    prompt=initial_prompt if initial_prompt else None,
-                )
+            response, cached = self._transcribe_chunk(audio_path, model_name, initial_prompt)
 
-            full_text = response.text
-            segments = []
-
-            if hasattr(response, 'segments') and response.segments:
-                for i, seg in enumerate(response.segments):
-                    if isinstance(seg, dict):
-                        segments.append({
-                            "index": i,
-                            "start": seg.get("start", 0),
-                            "end": seg.get("end", 0),
-                            "text": seg.get("text", "").strip(),
-                        })
-                    else:
-                        segments.append({
-                            "index": i,
-                            "start": getattr(seg, "start", 0),
-                            "end": getattr(seg, "end", 0),
-                            "text": getattr(seg, "text", "").strip(),
-                        })
-
-            cost_usd = duration_minutes * WHISPER_COST_PER_MINUTE
+            full_text = response["text"]
+            segments = response["segments"]
+
+            cost_usd = 0.0 if cached else duration_minutes * WHISPER_COST_PER_MINUTE
             logger.info(f"{provider} transcription complete: {len(segments)} segments, ${cost_usd:.4f}")
 
             return TranscriptionResult(
@@ -411,6 +402,8 @@ class FLTranscribeStage:
                 segments=segments,
                 model=model_name,
                 cost_usd=cost_usd,
+                cache_hits=int(cached),
+                cache_misses=int(not cached and self.cache is not None),
             )
 
         except Exception as e:
@@ -441,64 +434,61 @@ class FLTranscribeStage:
         chunks = []
         try:
             chunks = self._split_audio(audio_path, duration_seconds or 0)
-            logger.info(f"Created {len(chunks)} chunks")
+            logger.info(f"Created {len(chunks)} chunks, transcribing up to {self.max_concurrency} at once")
 
+            # Initialize the lazy client before fanning out so workers share it
+            if self._use_groq:
+                _ = self.groq_client
+            else:
+                _ = self.openai_client
+
+            responses: Dict[int, Dict] = {}
+            cache_hits = 0
+            with ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="whisper"
+            ) as pool:
+                futures = {
+                    pool.submit(self._transcribe_chunk, chunk_path, model_name, initial_prompt): i
+                    for i, (chunk_path, _) in enumerate(chunks)
+                }
+                for future in as_completed(futures):
+                    chunk_path, time_offset = chunks[futures[future]]
+                    try:
+                        responses[futures[future]], cached = future.result()
+                        cache_hits += int(cached)
+                        logger.info(
+                            f"Transcribed chunk: {chunk_path.name} (offset={time_offset}s"
+                            f"{', cached' if cached else ''})"
+                        )
+                    except Exception as e:
+                        logger.error(f"Error transcribing chunk {chunk_path.name}: {e}")
+
+            # Reassemble in chunk order, shifting timestamps by each chunk's offset
             all_segments = []
             all_text_parts = []
-            segment_index = 0
-
-            for chunk_path, time_offset in chunks:
-                logger.info(f"Transcribing chunk: {chunk_path.name} (offset={time_offset}s)")
-
-                try:
-                    with open(chunk_path, "rb") as audio_file:
-                        if self._use_groq:
-                            response = self.groq_client.audio.transcriptions.create(
-                                model=model_name,
-                                file=audio_file,
-                                response_format="verbose_json",
-                                prompt=initial_prompt if initial_prompt else None,
-                            )
-                        else:
-                            response = self.openai_client.audio.transcriptions.create(
-                                model=model_name,
-                                file=audio_file,
-                                response_format="verbose_json",
-                                timestamp_granularities=["segment"],
-                                prompt=initial_prompt if initial_prompt else None,
-                            )
-
-                    if response.text:
-                        all_text_parts.append(response.text)
-
-                    if hasattr(response, 'segments') and response.segments:
-                        for seg in response.segments:
-                            if isinstance(seg, dict):
-                                start = seg.get("start", 0)
-                                end = seg.get("end", 0)
-                                text = seg.get("text", "").strip()
-                            else:
-                                start = getattr(seg, "start", 0)
-                                end = getattr(seg, "end", 0)
-                                text = getattr(seg, "text", "").strip()
-
-                            all_segments.append({
-                                "index": segment_index,
-                                "start": start + time_offset,
-                                "end": end + time_offset,
-                                "text": text,
-                            })
-                            segment_index += 1
-
-                except Exception as e:
-                    logger.error(f"Error transcribing chunk {chunk_path.name}: {e}")
+
+            for i, (_, time_offset) in enumerate(chunks):
+                response = responses.get(i)
+                if response is None:
                     continue
 
+                if response["text"]:
+                    all_text_parts.append(response["text"])
+
+                for seg in response["segments"]:
+                    all_segments.append({
+                        **seg,
+                        "index": len(all_segments),
+                        "start": seg["start"] + time_offset,
+                        "end": seg["end"] + time_offset,
+                    })
+
             if not all_segments:
                 return TranscriptionResult(success=False, error="No segments transcribed from chunks")
 
             full_text = " ".join(all_text_parts)
-            cost_usd = duration_minutes * cost_per_minute
+            # Chunks served from cache cost nothing
+            cost_usd = duration_minutes * cost_per_minute * (1 - cache_hits / len(chunks))
 
             logger.info(f"{provider} chunked transcription complete: {len(all_segments)} segments")
 
@@ -508,6 +498,8 @@ class FLTranscribeStage:
                 segments=all_segments,
                 model=model_name,
                 cost_usd=cost_usd,
+                cache_hits=cache_hits if self.cache is not None else 0,
+                cache_misses=len(responses) - cache_hits if self.cache is not None else 0,
             )
 
         except Exception as e:
@@ -516,47 +508,145 @@ class FLTranscribeStage:
         finally:
             self._cleanup_chunks(chunks)
 
+    def _transcribe_chunk(self, chunk_path: Path, model_name: str, initial_prompt: str) -> Tuple[Dict, bool]:
+        """
+        Transcribe one audio file, consulting the cache first.
+
+        Runs in worker threads for chunked audio.
+
+        Returns:
+            Tuple of ({"text", "segments"}, served_from_cache)
+        """
+        key = None
+        if self.cache is not None:
+            key = self.cache.make_key(chunk_path, model_name, initial_prompt)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached, True
+
+        response = self._call_whisper(chunk_path, model_name, initial_prompt)
+        result = {
+            "text": response.text or "",
+            "segments": self._parse_segments(response),
+        }
+
+        if key is not None:
+            self.cache.put(key, result)
+        return result, False
+
+    def _parse_segments(self, response: Any) -> List[Dict]:
+        """Parse segments from Whisper response."""
+        segments = []
+
+        if hasattr(response, 'segments') and response.segments:
+            for i, seg in enumerate(response.segments):
+                if isinstance(seg, dict):
+                    segments.append({
+                        "index": i,
+                        "start": seg.get("start", 0),
+                        "end": seg.get("end", 0),
+                        "text": seg.get("text", "").strip(),
+                    })
+                else:
+                    segments.append({
+                        "index": i,
+                        "start": getattr(seg, "start", 0),
+                        "end": getattr(seg, "end", 0),
+                        "text": getattr(seg, "text", "").strip(),
+                    })
+
+        return segments
+
+    def _call_whisper(self, chunk_path: Path, model_name: str, initial_prompt: str) -> Any:
+        """Send one file to the Whisper API."""
+        with open(chunk_path, "rb") as audio_file:
+            if self._use_groq:
+                return self.groq_client.audio.transcriptions.create(
+                    model=model_name,
+                    file=audio_file,
+                    response_format="verbose_json",
+                    prompt=initial_prompt if initial_prompt else None,
+                )
+            return self.openai_client.audio.transcriptions.create(
+                model=model_name,
+                file=audio_file,
+                response_format="verbose_json",
+                timestamp_granularities=["segment"],
+                prompt=initial_prompt if initial_prompt else None,
+            )
+
+    def _chunk_duration(self, duration: float) -> int:
+        """
+        Pick a chunk length that keeps every chunk under MAX_FILE_SIZE_BYTES.
+
+        Audio is split into the fewest chunks that fit, of even length. It
+        depends only on the duration, not on max_concurrency, so the same
+        audio always splits at the same points and hits the transcription
+        cache whatever the concurrency setting.
+        """
+        bytes_per_second = CHUNK_BITRATE_KBPS * 1000 / 8
+        max_seconds = int(MAX_FILE_SIZE_BYTES * CHUNK_SIZE_HEADROOM / bytes_per_second)
+        if not duration:
+            return max_seconds
+
+        chunks = math.ceil(duration / max_seconds)
+        # +1s so rounding in the reported duration doesn't leave a sliver chunk
+        even_split = math.ceil(duration / chunks) + 1
+        return max(MIN_CHUNK_SECONDS, min(max_seconds, even_split))
+
     def _split_audio(self, audio_path: Path, duration: float) -> List[Tuple[Path, float]]:
-        """Split audio into chunks using ffmpeg."""
-        if duration == 0:
-            duration = self._get_audio_duration(audio_path) or 0
-            if duration == 0:
-                raise ValueError(f"Could not determine duration of {audio_path}")
+        """
+        Split audio into chunks in one ffmpeg pass using the segment muxer.
 
-        chunks = []
-        temp_dir = tempfile.mkdtemp(prefix="fl_whisper_chunks_")
-        num_chunks = int((duration // CHUNK_DURATION_SECONDS) + 1)
-
-        logger.info(f"Splitting {audio_path.name} ({duration}s) into {num_chunks} chunks")
-
-        for i in range(num_chunks):
-            start_time = i * CHUNK_DURATION_SECONDS
-            chunk_path = Path(temp_dir) / f"chunk_{i:03d}.mp3"
-
-            try:
-                result = subprocess.run(
-                    [
-                        "ffmpeg", "-y",
-                        "-i", str(audio_path),
-                        "-ss", str(start_time),
-                        "-t", str(CHUNK_DURATION_SECONDS),
-                        "-c:a", "libmp3lame",
-                        "-q:a", "4",
-                        str(chunk_path)
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=120
-                )
+        Returns (chunk_path, start_offset_seconds) pairs; offsets come from
+        ffmpeg's segment list so they match the actual cut points.
+        """
+        # Prefer the file's own duration so identical audio always splits at
+        # the same points (and hits the transcription cache)
+        duration = self._get_audio_duration(audio_path) or duration
+
+        chunk_seconds = self._chunk_duration(duration)
+        temp_dir = Path(tempfile.mkdtemp(prefix="fl_whisper_chunks_"))
+        segment_list = temp_dir / "segments.csv"
+
+        logger.info(f"Splitting {audio_path.name} ({duration}s) into {chunk_seconds}s chunks")
 
-                if result.returncode == 0 and chunk_path.exists() and chunk_path.stat().st_size > 0:
-                    chunks.append((chunk_path, float(start_time)))
+        try:
+            result = subprocess.run(
+                [
+                    "ffmpeg", "-y",
+                    "-i", str(audio_path),
+                    "-vn",
+                    "-ac", "1",
+                    "-ar", "16000",
+                    "-c:a", "libmp3lame",
+                    "-b:a", f"{CHUNK_BITRATE_KBPS}k",
+                    "-f", "segment",
+                    "-segment_time", str(chunk_seconds),
+                    "-reset_timestamps", "1",
+                    "-segment_list", str(segment_list),
+                    "-segment_list_type", "csv",
+                    str(temp_dir / "chunk_%03d.mp3"),
+                ],
+                capture_output=True,
+                text=True,
+                timeout=max(600, int(duration / 10)),
+            )
+            if result.returncode != 0:
+                logger.error(f"ffmpeg split failed for {audio_path.name}: {result.stderr[-500:]}")
+        except Exception as e:
+            logger.error(f"Error splitting {audio_path.name}: {e}")
 
-            except Exception as e:
-                logger.error(f"Error creating chunk {i}: {e}")
-                continue
+        chunks = []
+        if segment_list.exists():
+            for line in segment_list.read_text().splitlines():
+                name, start, _ = line.rsplit(",", 2)
+                chunk_path = temp_dir / name
+                if chunk_path.exists() and chunk_path.stat().st_size > 0:
+                    chunks.append((chunk_path, float(start)))
 
         if not chunks:
+            shutil.rmtree(temp_dir, ignore_errors=True)
             raise ValueError(f"Failed to create any chunks from {audio_path}")
 
         return chunks
@@ -566,38 +656,38 @@ class FLTranscribeStage:
         if not chunks:
             return
 
-        temp_dir = chunks[0][0].parent
-        for chunk_path, _ in chunks:
-            try:
-                chunk_path.unlink(missing_ok=True)
-            except Exception:
-                pass
-        try:
-            temp_dir.rmdir()
-        except Exception:
-            pass
+        shutil.rmtree(chunks[0][0].parent, ignore_errors=True)
 
     def _save_transcript(self, hearing: FLHearing, result: TranscriptionResult, db: Session):
-        """Save transcript to FLHearing and create FLTranscriptSegment records."""
+        """Save transcript to FLHearing and bulk-insert FLTranscriptSegment rows."""
+        # Build segment rows, counting words in the same pass
+        rows = []
+        text_parts = []
+        word_count = 0
+        for seg_data in result.segments:
+            seg_text = seg_data.get("text", "")
+            text_parts.append(seg_text)
+            word_count += len(seg_text.split())
+            rows.append({
+                "hearing_id": hearing.id,
+                "segment_index": seg_data.get("index", 0),
+                "start_time": seg_data.get("start", 0),
+                "end_time": seg_data.get("end", 0),
+                "text": seg_text,
+                "speaker_label": seg_data.get("speaker"),
+            })
+
         # Update hearing with transcript
-        hearing.full_text = result.text
-        hearing.word_count = len(result.text.split()) if result.text else 0
+        hearing.full_text = result.text or " ".join(text_parts)
+        hearing.word_count = word_count if rows else len(hearing.full_text.split())
+        hearing.segment_count = len(rows)
         hearing.whisper_model = result.model
         hearing.processing_cost_usd = result.cost_usd
         hearing.transcript_status = "transcribed"
         hearing.processed_at = datetime.utcnow()
 
-        # Create segment records
-        for seg_data in result.segments:
-            segment = FLTranscriptSegment(
-                hearing_id=hearing.id,
-                segment_index=seg_data.get("index", 0),
-                start_time=seg_data.get("start", 0),
-                end_time=seg_data.get("end", 0),
-                text=seg_data.get("text", ""),
-                speaker_label=seg_data.get("speaker"),
-            )
-            db.add(segment)
+        bulk_insert(db, FLTranscriptSegment.__table__, rows)
+        write_passages(db, hearing.id, rows)
 
         db.commit()
         logger.info(f"Saved transcript for hearing {hearing.id}: {len(result.segments)} segments")
@@ -624,4 +714,26 @@ class FLTranscribeStage:
         return None
 
 
-__all__ = ['FLTranscribeStage', 'TranscriptionResult']
+def write_passages(db: Session, hearing_id: int, segments: List[Dict[str, Any]]) -> int:
+    """
+    Replace a hearing's passages with windows over the given segment rows.
+
+    Called in the transcribe stage's transaction with the rows it just
+    inserted, and by `florida-cli build-passages` for older hearings.
+    The caller commits.
+
+    Returns:
+        Number of passages written
+    """
+    db.query(FLTranscriptPassage).filter(
+        FLTranscriptPassage.hearing_id == hearing_id
+    ).delete(synchronize_session=False)
+
+    passages = build_passages(segments, window=PASSAGE_WINDOW_SEGMENTS, stride=PASSAGE_STRIDE_SEGMENTS)
+    for passage in passages:
+        passage["hearing_id"] = hearing_id
+    bulk_insert(db, FLTranscriptPassage.__table__, passages)
+    return len(passages)
+
+
+__all__ = ['FLTranscribeStage', 'TranscriptionResult', 'write_passages']
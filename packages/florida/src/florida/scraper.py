@@ -15,6 +15,8 @@ import threading
 
 import httpx
 
+from core.utils.http import CachedResponse, HTTPCache
+from florida.config import get_config
 from florida.models import get_db
 from florida.models.hearing import FLHearing
 
@@ -214,10 +216,14 @@ def _parse_rss_item(item: ET.Element) -> Optional[RSSItem]:
     return result
 
 
-def fetch_and_parse_feed(feed_url: str = FLORIDA_CHANNEL_RSS) -> List[RSSItem]:
-    """Fetch and parse RSS feed."""
-    items = []
+def fetch_feed(feed_url: str = FLORIDA_CHANNEL_RSS, cache: Optional[HTTPCache] = None) -> CachedResponse:
+    """
+    Fetch the RSS feed, conditionally when it is in the cache.
 
+    The result's `changed` is False when the feed is the same as the last
+    one committed to the cache.
+    """
+    cache = cache or HTTPCache()
     headers = {
         "User-Agent": "Mozilla/5.0 (compatible; FloridaPSCScraper/1.0; +https://github.com/canaryscope)",
         "Accept": "application/rss+xml, application/xml, text/xml, */*",
@@ -225,32 +231,41 @@ def fetch_and_parse_feed(feed_url: str = FLORIDA_CHANNEL_RSS) -> List[RSSItem]:
 
     try:
         with httpx.Client(timeout=30.0, headers=headers) as client:
-            response = client.get(feed_url)
-            response.raise_for_status()
-
-        root = ET.fromstring(response.content)
-        channel = root.find('channel')
-        if channel is None:
-            logger.warning("No channel element found in RSS feed")
-            return items
-
-        for item in channel.findall('item'):
-            parsed = _parse_rss_item(item)
-            if parsed:
-                items.append(parsed)
-
-        logger.info(f"Parsed {len(items)} items from RSS feed")
-
+            return cache.fetch(client.get, feed_url)
     except httpx.HTTPError as e:
         logger.error(f"HTTP error fetching RSS feed: {e}")
         raise
+
+
+def parse_feed(content: bytes) -> List[RSSItem]:
+    """Parse RSS feed XML."""
+    items = []
+
+    try:
+        root = ET.fromstring(content)
     except ET.ParseError as e:
         logger.error(f"XML parse error: {e}")
         raise
 
+    channel = root.find('channel')
+    if channel is None:
+        logger.warning("No channel element found in RSS feed")
+        return items
+
+    for item in channel.findall('item'):
+        parsed = _parse_rss_item(item)
+        if parsed:
+            items.append(parsed)
+
+    logger.info(f"Parsed {len(items)} items from RSS feed")
     return items
 
 
+def fetch_and_parse_feed(feed_url: str = FLORIDA_CHANNEL_RSS) -> List[RSSItem]:
+    """Fetch and parse RSS feed."""
+    return parse_feed(fetch_feed(feed_url).content)
+
+
 def run_scraper(dry_run: bool = False) -> ScraperProgress:
     """
     Run the Florida Channel scraper.
@@ -275,8 +290,18 @@ def run_scraper(dry_run: bool = False) -> ScraperProgress:
         _stop_requested = False
 
     try:
-        # Fetch RSS feed
-        items = fetch_and_parse_feed()
+        # Fetch RSS feed; most runs find it unchanged and stop here
+        config = get_config()
+        cache = HTTPCache(config.http_cache_path, config.http_cache_max_entries)
+        feed = fetch_feed(FLORIDA_CHANNEL_RSS, cache)
+        if not feed.changed:
+            logger.info("RSS feed unchanged since last run")
+            with _scraper_lock:
+                _scraper_progress.status = ScraperStatus.COMPLETED
+                _scraper_progress.finished_at = datetime.now(timezone.utc)
+            return _scraper_progress
+
+        items = parse_feed(feed.content)
 
         with _scraper_lock:
             _scraper_progress.items_found = len(items)
@@ -336,6 +361,10 @@ def run_scraper(dry_run: bool = False) -> ScraperProgress:
             if db:
                 db.close()
 
+        # Only a fully processed feed may be skipped next time
+        if not dry_run and not _stop_requested:
+            cache.commit(feed)
+
         with _scraper_lock:
             _scraper_progress.status = ScraperStatus.COMPLETED
             _scraper_progress.finished_at = datetime.now(timezone.utc)
@@ -10,7 +10,9 @@ Scrapers for Florida data sources:
 from florida.scrapers.clerkoffice import (
     FloridaClerkOfficeScraper,
     FloridaClerkOfficeClient,
+    FloridaClerkOfficeAsyncClient,
     FloridaDocketData,
+    DocketListResult,
 )
 from florida.scrapers.thunderstone import (
     FloridaThunderstoneScraper,
@@ -23,7 +25,9 @@ __all__ = [
     # ClerkOffice scraper
     'FloridaClerkOfficeScraper',
     'FloridaClerkOfficeClient',
+    'FloridaClerkOfficeAsyncClient',
     'FloridaDocketData',
+    'DocketListResult',
     # Thunderstone scraper
     'FloridaThunderstoneScraper',
     'FloridaThunderstoneClient',
@@ -12,16 +12,19 @@ Key endpoints:
 - /SearchDocketsByDocketNumber - Autocomplete search
 """
 
+import asyncio
 import logging
 import re
 import time
 from datetime import datetime, date
-from typing import Iterator, Optional, List, Dict, Any
+from typing import AsyncIterator, Iterator, Optional, List, Dict, Any, Iterable, Set, Tuple
 from dataclasses import dataclass, field
 
+import httpx
 import requests
 
 from core.scrapers.base import BaseDocketScraper, DocketRecord
+from core.utils.http import AsyncTokenBucket, HTTPCache
 from florida.config import get_config, FloridaConfig
 from florida import FL_SECTOR_CODES
 
@@ -45,6 +48,18 @@ DOCKET_TYPES = {
     'C': 'closed',     # Closed Last 30 Days
 }
 
+USER_AGENT = 'CanaryScope Research Bot (contact: admin@canaryscope.com)'
+
+
+def _docket_list(data: Any) -> List[Dict[str, Any]]:
+    """Unwrap a PscDocketsByType response: {result: {result: [...]}}."""
+    if isinstance(data, dict):
+        outer_result = data.get('result', {})
+        if isinstance(outer_result, dict):
+            return outer_result.get('result', [])
+        return outer_result if isinstance(outer_result, list) else []
+    return data
+
 
 @dataclass
 class FloridaDocketData:
@@ -113,8 +128,9 @@ class FloridaClerkOfficeClient:
         self.session = requests.Session()
         self.session.headers.update({
             'Accept': 'application/json',
-            'User-Agent': 'CanaryScope Research Bot (contact: admin@canaryscope.com)',
+            'User-Agent': USER_AGENT,
         })
+        self.cache = HTTPCache(self.config.http_cache_path, self.config.http_cache_max_entries)
         self._last_request_time = 0.0
 
     def _rate_limit(self):
@@ -125,15 +141,19 @@ class FloridaClerkOfficeClient:
             time.sleep(wait_time)
         self._last_request_time = time.time()
 
-    def get_open_dockets(self) -> List[Dict[str, Any]]:
-        """Get all open dockets."""
+    def _get_json(self, endpoint: str, params: Optional[Dict[str, Any]] = None, timeout: int = 30) -> Any:
+        """GET an endpoint conditionally (unchanged responses come from the cache)."""
         self._rate_limit()
-        response = self.session.get(
-            f"{self.base_url}/OpenDockets",
-            timeout=60
+        return self.cache.fetch_json(
+            self.session.get,
+            f"{self.base_url}/{endpoint}",
+            params=params,
+            timeout=timeout,
         )
-        response.raise_for_status()
-        data = response.json()
+
+    def get_open_dockets(self) -> List[Dict[str, Any]]:
+        """Get all open dockets."""
+        data = self._get_json("OpenDockets", timeout=60)
         return data.get('result', []) if isinstance(data, dict) else data
 
     def get_dockets_by_type(
@@ -142,54 +162,85 @@ class FloridaClerkOfficeClient:
         industry_type: str = 'E',  # E=Electric, G=Gas, T=Telecom, W=Water, X=Other
     ) -> List[Dict[str, Any]]:
         """Get dockets filtered by type and industry."""
-        self._rate_limit()
         params = {
             'docketType': docket_type,
             'industryType': industry_type,
         }
-        response = self.session.get(
-            f"{self.base_url}/PscDocketsByType",
-            params=params,
-            timeout=60
-        )
-        response.raise_for_status()
-        data = response.json()
-
-        # Handle nested response structure: {result: {result: [...]}}
-        if isinstance(data, dict):
-            outer_result = data.get('result', {})
-            if isinstance(outer_result, dict):
-                return outer_result.get('result', [])
-            return outer_result if isinstance(outer_result, list) else []
-        return data
+        return _docket_list(self._get_json("PscDocketsByType", params, timeout=60))
 
     def get_docket_details(self, docket_no: str) -> Optional[Dict[str, Any]]:
         """Get detailed information for a specific docket."""
-        self._rate_limit()
         params = {'docketNo': docket_no}
-        response = self.session.get(
-            f"{self.base_url}/DocketDetailsByDocketsNo",
-            params=params,
-            timeout=30
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = self._get_json("DocketDetailsByDocketsNo", params)
         return data.get('result') if isinstance(data, dict) else data
 
     def search_dockets(self, query: str) -> List[Dict[str, Any]]:
         """Search dockets by docket number (autocomplete)."""
-        self._rate_limit()
         params = {'docketNumber': query}
-        response = self.session.get(
-            f"{self.base_url}/SearchDocketsByDocketNumber",
-            params=params,
-            timeout=30
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = self._get_json("SearchDocketsByDocketNumber", params)
         return data.get('result', []) if isinstance(data, dict) else data
 
 
+class FloridaClerkOfficeAsyncClient:
+    """
+    Async ClerkOffice client for concurrent docket list fetches.
+
+    All requests share one token bucket, so however many are in flight,
+    they start no faster than config.api_rate_limit per second. At most
+    config.api_concurrency run at once.
+
+        async with FloridaClerkOfficeAsyncClient(config) as client:
+            dockets = await client.get_dockets_by_type('D', 'E')
+    """
+
+    def __init__(self, config: Optional[FloridaConfig] = None):
+        self.config = config or get_config()
+        self.base_url = self.config.clerk_office_base_url
+        self.bucket = AsyncTokenBucket(self.config.api_rate_limit)
+        self.semaphore = asyncio.Semaphore(self.config.api_concurrency)
+        self.cache = HTTPCache(self.config.http_cache_path, self.config.http_cache_max_entries)
+        self.client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "FloridaClerkOfficeAsyncClient":
+        self.client = httpx.AsyncClient(
+            headers={'Accept': 'application/json', 'User-Agent': USER_AGENT},
+            timeout=60,
+            follow_redirects=True,
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.client.aclose()
+
+    async def get_dockets_by_type(
+        self,
+        docket_type: str = 'D',
+        industry_type: str = 'E',
+    ) -> List[Dict[str, Any]]:
+        """Get dockets filtered by type and industry."""
+        async with self.semaphore:
+            await self.bucket.acquire()
+            data = await self.cache.afetch_json(
+                self.client.get,
+                f"{self.base_url}/PscDocketsByType",
+                params={'docketType': docket_type, 'industryType': industry_type},
+            )
+            return _docket_list(data)
+
+
+@dataclass
+class DocketListResult:
+    """One docket type/industry combination from a concurrent fetch."""
+    docket_type: str
+    industry_type: str
+    dockets: List[FloridaDocketData] = field(default_factory=list)
+    error: Optional[Exception] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.docket_type}:{self.industry_type}"
+
+
 class FloridaClerkOfficeScraper(BaseDocketScraper):
     """
     Florida PSC docket scraper using the ClerkOffice REST API.
@@ -368,6 +419,73 @@ class FloridaClerkOfficeScraper(BaseDocketScraper):
         seen_dockets = set()
         total = 0
 
+        # Fetch from each docket type and industry combination
+        for dtype, itype in self.docket_combinations(status, industries):
+            if total >= limit:
+                break
+
+            try:
+                logger.debug(f"Fetching docket type {dtype}, industry {itype}...")
+                dockets = self.client.get_dockets_by_type(
+                    docket_type=dtype,
+                    industry_type=itype
+                )
+
+                for docket_data in self._parse_docket_list(dockets, year, seen_dockets):
+                    if total >= limit:
+                        break
+                    yield docket_data
+                    total += 1
+
+            except Exception as e:
+                logger.error(f"Error fetching docket type {dtype}, industry {itype}: {e}")
+
+        logger.info(f"Scraped {total} dockets from Florida ClerkOffice API")
+
+    async def fetch_docket_lists(
+        self,
+        combinations: Iterable[Tuple[str, str]],
+        year: Optional[int] = None,
+    ) -> AsyncIterator[DocketListResult]:
+        """
+        Fetch docket type/industry combinations concurrently.
+
+        Yields each combination's parsed dockets as its request finishes
+        (a failed request is yielded with its error). Requests are paced by
+        a shared token bucket at config.api_rate_limit. Dockets aren't
+        de-duplicated across combinations.
+
+        Args:
+            combinations: (docket type, industry code) pairs, as from
+                docket_combinations()
+            year: Filter by year (applied client-side)
+        """
+        async with FloridaClerkOfficeAsyncClient(self.config) as client:
+            async def fetch(dtype: str, itype: str) -> DocketListResult:
+                logger.debug(f"Fetching docket type {dtype}, industry {itype}...")
+                try:
+                    dockets = await client.get_dockets_by_type(docket_type=dtype, industry_type=itype)
+                except Exception as e:
+                    logger.error(f"Error fetching docket type {dtype}, industry {itype}: {e}")
+                    return DocketListResult(dtype, itype, error=e)
+                return DocketListResult(dtype, itype, list(self._parse_docket_list(dockets, year)))
+
+            tasks = [asyncio.create_task(fetch(dtype, itype)) for dtype, itype in combinations]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                # The consumer stopped early (e.g. hit its limit)
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def docket_combinations(
+        status: Optional[str] = None,
+        industries: Optional[List[str]] = None,
+    ) -> List[Tuple[str, str]]:
+        """(docket type, industry code) pairs to fetch for a status filter."""
         # Determine which API calls to make based on status
         if status == 'open':
             docket_types = ['D']  # Just open
@@ -378,57 +496,43 @@ class FloridaClerkOfficeScraper(BaseDocketScraper):
 
         # Industry types - API doesn't support 'A' for all, must iterate
         industry_types = industries or ['E', 'G', 'T', 'W', 'X']
+        return [(dtype, itype) for dtype in docket_types for itype in industry_types]
 
-        # Fetch from each docket type and industry combination
-        for dtype in docket_types:
-            for itype in industry_types:
-                if total >= limit:
-                    break
-
-                try:
-                    logger.debug(f"Fetching docket type {dtype}, industry {itype}...")
-                    dockets = self.client.get_dockets_by_type(
-                        docket_type=dtype,
-                        industry_type=itype
-                    )
-
-                    for docket in dockets:
-                        if total >= limit:
-                            break
-
-                        docket_num = docket.get('docketnum') or docket.get('docketId')
-                        if not docket_num:
-                            continue
-
-                        # Skip duplicates
-                        if docket_num in seen_dockets:
+    def _parse_docket_list(
+        self,
+        dockets: List[Dict[str, Any]],
+        year: Optional[int] = None,
+        seen_dockets: Optional[Set[str]] = None,
+    ) -> Iterator[FloridaDocketData]:
+        """Parse a docket list, skipping duplicates (in seen_dockets) and other years."""
+        if seen_dockets is None:
+            seen_dockets = set()
+
+        for docket in dockets:
+            docket_num = docket.get('docketnum') or docket.get('docketId')
+            if not docket_num:
+                continue
+
+            # Skip duplicates
+            if docket_num in seen_dockets:
+                continue
+            seen_dockets.add(docket_num)
+
+            # Year filter
+            if year:
+                filed_date_str = docket.get('docketedDate')
+                if filed_date_str:
+                    try:
+                        docket_year = int(filed_date_str[:4])
+                        if docket_year != year:
                             continue
-                        seen_dockets.add(docket_num)
-
-                        # Year filter
-                        if year:
-                            filed_date_str = docket.get('docketedDate')
-                            if filed_date_str:
-                                try:
-                                    docket_year = int(filed_date_str[:4])
-                                    if docket_year != year:
-                                        continue
-                                except (ValueError, TypeError):
-                                    pass
-
-                        # Parse and yield
-                        docket_data = self._parse_api_result(docket)
-                        if docket_data:
-                            yield docket_data
-                            total += 1
-
-                except Exception as e:
-                    logger.error(f"Error fetching docket type {dtype}, industry {itype}: {e}")
+                    except (ValueError, TypeError):
+                        pass
 
-            if total >= limit:
-                break
-
-        logger.info(f"Scraped {total} dockets from Florida ClerkOffice API")
+            # Parse and yield
+            docket_data = self._parse_api_result(docket)
+            if docket_data:
+                yield docket_data
 
     def get_docket_detail(self, docket_number: str) -> Optional[DocketRecord]:
         """Get detailed information for a specific docket."""
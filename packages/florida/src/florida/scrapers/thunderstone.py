@@ -12,15 +12,20 @@ Key endpoints:
 """
 
 import logging
+import math
 import re
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, date
-from typing import Iterator, Optional, List, Dict, Any
+from typing import Iterator, Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass, field
 from urllib.parse import urljoin, quote
 
 import requests
+from tenacity import Retrying, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from core.utils.http import HTTPCache
 from florida.config import get_config, FloridaConfig
 
 logger = logging.getLogger(__name__)
@@ -38,6 +43,11 @@ THUNDERSTONE_PROFILES = {
     'website': 'Website Content',
 }
 
+# Attempts per search results page, with exponential backoff (seconds)
+# between them; a page that still fails is skipped
+PAGE_ATTEMPTS = 3
+PAGE_RETRY_WAIT = 1.0
+
 # Default sort orders
 LIST_ORDERS = {
     'relevance': 'Relevance',
@@ -109,36 +119,48 @@ class FloridaThunderstoneClient:
             'Accept': 'application/json',
             'User-Agent': 'CanaryScope Research Bot (contact: admin@canaryscope.com)',
         })
+        self.cache = HTTPCache(self.config.http_cache_path, self.config.http_cache_max_entries)
         self._last_request_time = 0.0
+        # Prefetching searches call from several threads
+        self._rate_lock = threading.Lock()
 
     def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        wait_time = (1.0 / self.config.api_rate_limit) - elapsed
-        if wait_time > 0:
-            time.sleep(wait_time)
-        self._last_request_time = time.time()
+        """Enforce rate limiting between requests (shared by all threads)."""
+        with self._rate_lock:
+            elapsed = time.time() - self._last_request_time
+            wait_time = (1.0 / self.config.api_rate_limit) - elapsed
+            if wait_time > 0:
+                time.sleep(wait_time)
+            self._last_request_time = time.time()
+
+    def _get_json(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: int = 30,
+        cached: bool = True,
+    ) -> Any:
+        """GET an endpoint, conditionally if cached (unchanged responses come from the cache)."""
+        self._rate_limit()
+        if not cached:
+            response = self.session.get(f"{self.base_url}/{endpoint}", params=params, timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+        return self.cache.fetch_json(
+            self.session.get,
+            f"{self.base_url}/{endpoint}",
+            params=params,
+            timeout=timeout,
+        )
 
     def get_profiles(self) -> List[Dict[str, Any]]:
         """Get available search profiles."""
-        self._rate_limit()
-        response = self.session.get(
-            f"{self.base_url}/getprofiles",
-            timeout=30
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = self._get_json("getprofiles")
         return data.get('result', []) if isinstance(data, dict) else data
 
     def get_categories(self, profile: str) -> List[Dict[str, Any]]:
         """Get categories for a specific profile."""
-        self._rate_limit()
-        response = self.session.get(
-            f"{self.base_url}/getcategories/{profile}",
-            timeout=30
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = self._get_json(f"getcategories/{profile}")
         return data.get('result', []) if isinstance(data, dict) else data
 
     def search(
@@ -164,8 +186,6 @@ class FloridaThunderstoneClient:
         Returns:
             Dict with results, total_count, and pagination info
         """
-        self._rate_limit()
-
         params = {
             'SelectedProfile': profile,
             'SearchText': search_text,
@@ -177,13 +197,9 @@ class FloridaThunderstoneClient:
         if category:
             params['Category'] = category
 
-        response = self.session.get(
-            f"{self.base_url}/search",
-            params=params,
-            timeout=60
-        )
-        response.raise_for_status()
-        return response.json()
+        # Search pages are rarely requested twice; caching their bodies
+        # would only grow the cache file
+        return self._get_json("search", params, timeout=60, cached=False)
 
 
 class FloridaThunderstoneScraper:
@@ -319,6 +335,56 @@ class FloridaThunderstoneScraper:
             logger.debug(f"Error parsing Thunderstone result: {e}")
             return None
 
+    def _search_page(
+        self,
+        search_text: str,
+        profile: str,
+        page: int,
+        per_page: int,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Fetch one page of search results, retrying request failures.
+
+        Returns:
+            (result items, total result count)
+        """
+        for attempt in Retrying(
+            stop=stop_after_attempt(PAGE_ATTEMPTS),
+            wait=wait_exponential(multiplier=PAGE_RETRY_WAIT, max=10 * PAGE_RETRY_WAIT),
+            retry=retry_if_exception_type(requests.RequestException),
+            reraise=True,
+        ):
+            with attempt:
+                result = self.client.search(
+                    search_text=search_text,
+                    profile=profile,
+                    page=page,
+                    per_page=per_page,
+                )
+
+        # Extract results from response
+        items = []
+        if isinstance(result, dict):
+            items = (
+                result.get('result', {}).get('thunderstoneResults', []) or
+                result.get('result', {}).get('Results', []) or
+                result.get('thunderstoneResults', []) or
+                result.get('Results', []) or
+                result.get('results', []) or
+                []
+            )
+        elif isinstance(result, list):
+            items = result
+
+        total_results = 0
+        if isinstance(result, dict):
+            total_results = (
+                result.get('result', {}).get('TotalResults', 0) or
+                result.get('TotalResults', 0) or
+                result.get('total', 0)
+            )
+        return items, total_results
+
     def get_profiles(self) -> List[ThunderstoneProfile]:
         """Get available search profiles."""
         try:
@@ -349,6 +415,10 @@ class FloridaThunderstoneScraper:
         """
         Search for documents.
 
+        Pages after the first are prefetched concurrently (see
+        config.search_prefetch_pages) but documents are yielded in result
+        order. A page that fails PAGE_ATTEMPTS times is logged and skipped.
+
         Args:
             query: Search query text
             profile: Search profile (library, orders, filingsCurrent, etc.)
@@ -373,32 +443,45 @@ class FloridaThunderstoneScraper:
 
         logger.info(f"Searching Thunderstone: '{search_text}' (profile={profile}, limit={limit})")
 
-        page = 1
+        if limit <= 0:
+            return
+
         per_page = min(50, limit)
         total_yielded = 0
 
-        while total_yielded < limit:
-            try:
-                result = self.client.search(
-                    search_text=search_text,
-                    profile=profile,
-                    page=page,
-                    per_page=per_page,
-                )
+        # The first page tells us how many pages there are
+        try:
+            items, total_results = self._search_page(search_text, profile, 1, per_page)
+        except Exception as e:
+            logger.error(f"Error searching Thunderstone page 1: {e}")
+            return
+        last_page = max(1, math.ceil(total_results / per_page))
+
+        # Later pages are fetched prefetch at a time ahead of the consumer,
+        # paced by the client's shared rate limit
+        prefetch = max(1, self.config.search_prefetch_pages)
+        executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix='thunderstone')
+        futures: Dict[int, Future] = {}
 
-                # Extract results from response
-                items = []
-                if isinstance(result, dict):
-                    items = (
-                        result.get('result', {}).get('thunderstoneResults', []) or
-                        result.get('result', {}).get('Results', []) or
-                        result.get('thunderstoneResults', []) or
-                        result.get('Results', []) or
-                        result.get('results', []) or
-                        []
-                    )
-                elif isinstance(result, list):
-                    items = result
+        def fetch(page: int) -> Future:
+            return executor.submit(self._search_page, search_text, profile, page, per_page)
+
+        try:
+            for page in range(1, last_page + 1):
+                # Don't prefetch past the page that would reach limit
+                # (filtered-out results can still pull in more later)
+                pages_needed = math.ceil((limit - total_yielded) / per_page)
+                horizon = min(page + prefetch, page + pages_needed - 1, last_page)
+                for ahead in range(page + 1, horizon + 1):
+                    if ahead not in futures:
+                        futures[ahead] = fetch(ahead)
+
+                if page > 1:
+                    try:
+                        items, _ = (futures.pop(page, None) or fetch(page)).result()
+                    except Exception as e:
+                        logger.error(f"Error searching Thunderstone page {page}, skipping it: {e}")
+                        continue
 
                 if not items:
                     break
@@ -418,25 +501,54 @@ class FloridaThunderstoneScraper:
                         yield doc
                         total_yielded += 1
 
-                # Check if more pages available
-                total_results = 0
-                if isinstance(result, dict):
-                    total_results = (
-                        result.get('result', {}).get('TotalResults', 0) or
-                        result.get('TotalResults', 0) or
-                        result.get('total', 0)
-                    )
-
-                if page * per_page >= total_results:
+                if total_yielded >= limit:
                     break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        logger.info(f"Returned {total_yielded} documents from Thunderstone")
+
+    def search_pages(
+        self,
+        query: str,
+        profile: str = 'library',
+        start_page: int = 1,
+        limit: int = 100,
+    ) -> Iterator[Tuple[int, List[ThunderstoneDocument]]]:
+        """
+        Search page by page, for imports that checkpoint progress.
+
+        Pages are fetched one at a time (retried like search()); a page
+        that still fails raises, so the caller can resume from it later.
+
+        Args:
+            query: Search query text
+            profile: Search profile
+            start_page: First page to fetch (1-based)
+            limit: Maximum results across all pages
 
-                page += 1
+        Yields:
+            (page number, parsed documents) tuples
+        """
+        if limit <= 0:
+            return
+
+        per_page = min(50, limit)
+        last_page = math.ceil(limit / per_page)
 
-            except Exception as e:
-                logger.error(f"Error searching Thunderstone page {page}: {e}")
+        for page in range(start_page, last_page + 1):
+            items, total_results = self._search_page(query, profile, page, per_page)
+            if not items:
                 break
 
-        logger.info(f"Returned {total_yielded} documents from Thunderstone")
+            documents = [
+                doc for doc in (self._parse_search_result(item, profile) for item in items)
+                if doc
+            ]
+            yield page, documents
+
+            if page * per_page >= total_results:
+                break
 
     def search_by_docket(
         self,
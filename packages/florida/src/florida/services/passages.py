@@ -0,0 +1,344 @@
+"""
+Florida transcript passage search.
+
+Searches fl_transcript_passages (overlapping windows of consecutive
+segments, written by the transcribe stage) instead of single segments,
+so a phrase Whisper split across two segments still matches. Queries use
+websearch_to_tsquery: plain terms, "quoted phrases", OR and -term.
+
+Overlapping passages of a hearing collapse to the best ranked
+(core.services.passages.select_non_overlapping), over a bounded fetch of
+the top-ranked spans that widens until the page fills. The page's
+passages are then loaded with their hearing and segments, and each hit
+carries the segment the match begins in and its start time
+(core.services.passages.match_segment_position). count_passage_matches
+counts in SQL and is approximate.
+
+Hearings transcribed before passages existed have none until
+`florida-cli build-passages` runs; their segments are searched directly
+(text_tsvector) and merged into the results by rank.
+"""
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from core.services.passages import match_segment_position, select_non_overlapping
+
+_TERM_RE = re.compile(r'"([^"]+)"|(\S+)')
+
+
+@dataclass
+class PassageHit:
+    """
+    A passage matching a search, with the segment and timestamp of the match.
+
+    Hits from hearings without passages are single segments: passage_id
+    is None and the passage fields describe the segment.
+    """
+    passage_id: Optional[int]
+    hearing_id: int
+    hearing_title: Optional[str]
+    hearing_date: Optional[date]
+    docket_number: Optional[str]
+    source_url: Optional[str]
+    text: str
+    speakers: Optional[str]
+    start_time: float
+    end_time: float
+    match_time: float
+    rank: float
+    # Segment the match begins in
+    segment_id: Optional[int] = None
+    segment_text: Optional[str] = None
+    speaker_name: Optional[str] = None
+    speaker_role: Optional[str] = None
+
+
+def _filters(
+    speaker: Optional[str],
+    docket: Optional[str],
+    params: Dict[str, Any],
+    speaker_clause: str = "p.speakers ILIKE :speaker",
+) -> str:
+    clauses = []
+    if speaker:
+        clauses.append(f"AND {speaker_clause}")
+        params["speaker"] = f"%{speaker}%"
+    if docket:
+        clauses.append("AND h.docket_number = :docket")
+        params["docket"] = docket
+    return " ".join(clauses)
+
+
+def _distinct_matches(
+    db: Session,
+    q: str,
+    speaker: Optional[str],
+    docket: Optional[str],
+    limit: int,
+) -> List[Any]:
+    """Spans and ranks of the `limit` best non-overlapping matching passages, best first."""
+    params: Dict[str, Any] = {"q": q}
+    filters = _filters(speaker, docket, params)
+    statement = text(f"""
+        SELECT
+            p.id,
+            p.hearing_id,
+            p.first_segment_index,
+            p.last_segment_index,
+            ts_rank(p.text_tsvector, websearch_to_tsquery('english', :q)) as rank
+        FROM fl_transcript_passages p
+        JOIN fl_hearings h ON p.hearing_id = h.id
+        WHERE p.text_tsvector @@ websearch_to_tsquery('english', :q)
+        {filters}
+        ORDER BY rank DESC, p.id
+        LIMIT :fetch
+    """)
+
+    # Each match is usually in two overlapping windows; fetch enough to
+    # fill the page after collapsing them, and more if that fell short
+    params["fetch"] = limit * 3
+    while True:
+        rows = db.execute(statement, params).fetchall()
+        matches = select_non_overlapping(
+            rows,
+            lambda row: (row.hearing_id, row.first_segment_index, row.last_segment_index),
+            limit,
+        )
+        if len(matches) >= limit or len(rows) < params["fetch"]:
+            return matches
+        params["fetch"] *= 4
+
+
+_SEGMENT_SPEAKER = "(s.speaker_name ILIKE :speaker OR s.speaker_label ILIKE :speaker)"
+
+# Segments of hearings that have no passages yet
+_UNPASSAGED_SEGMENTS = """
+    FROM fl_transcript_segments s
+    JOIN fl_hearings h ON s.hearing_id = h.id
+    WHERE s.text_tsvector @@ websearch_to_tsquery('english', :q)
+    AND NOT EXISTS (SELECT 1 FROM fl_transcript_passages p WHERE p.hearing_id = s.hearing_id)
+"""
+
+
+def _segment_hits(
+    db: Session,
+    q: str,
+    speaker: Optional[str],
+    docket: Optional[str],
+    limit: int,
+) -> List[PassageHit]:
+    """The `limit` best matching segments of hearings without passages."""
+    params: Dict[str, Any] = {"q": q, "limit": limit}
+    filters = _filters(speaker, docket, params, _SEGMENT_SPEAKER)
+    rows = db.execute(text(f"""
+        SELECT
+            s.id,
+            s.hearing_id,
+            s.text,
+            s.speaker_name,
+            s.speaker_label,
+            s.speaker_role,
+            s.start_time,
+            s.end_time,
+            h.title as hearing_title,
+            h.hearing_date,
+            h.docket_number,
+            h.source_url,
+            ts_rank(s.text_tsvector, websearch_to_tsquery('english', :q)) as rank
+        {_UNPASSAGED_SEGMENTS}
+        {filters}
+        ORDER BY rank DESC, s.id
+        LIMIT :limit
+    """), params).fetchall()
+
+    return [
+        PassageHit(
+            passage_id=None,
+            hearing_id=row.hearing_id,
+            hearing_title=row.hearing_title,
+            hearing_date=row.hearing_date,
+            docket_number=row.docket_number,
+            source_url=row.source_url,
+            text=row.text or "",
+            speakers=row.speaker_name or row.speaker_label,
+            start_time=row.start_time or 0,
+            end_time=row.end_time or 0,
+            match_time=row.start_time or 0,
+            rank=float(row.rank) if row.rank else 0.0,
+            segment_id=row.id,
+            segment_text=row.text,
+            speaker_name=row.speaker_name,
+            speaker_role=row.speaker_role,
+        )
+        for row in rows
+    ]
+
+
+def query_terms(q: str) -> List[str]:
+    """Quoted phrases and bare words of a query, for locating the match."""
+    return [
+        phrase or word
+        for phrase, word in _TERM_RE.findall(q)
+        if phrase or (word.lower() != "or" and not word.startswith("-"))
+    ]
+
+
+def search_passages(
+    db: Session,
+    q: str,
+    limit: int = 20,
+    offset: int = 0,
+    speaker: Optional[str] = None,
+    docket: Optional[str] = None,
+) -> List[PassageHit]:
+    """
+    Ranked passage hits for a query.
+
+    Args:
+        q: Search query
+        limit: Max hits
+        offset: Hits to skip (after collapsing overlaps)
+        speaker: Filter by speaker name/label (substring)
+        docket: Filter by hearing docket number
+    """
+    matches = _distinct_matches(db, q, speaker, docket, offset + limit)
+    segment_hits = _segment_hits(db, q, speaker, docket, offset + limit)
+    if not matches and not segment_hits:
+        return []
+
+    rows = {}
+    segments: Dict[int, List[Any]] = {}
+    if matches:
+        ids = [match.id for match in matches]
+        rows = {
+            row.id: row
+            for row in db.execute(
+                text("""
+                    SELECT
+                        p.id,
+                        p.hearing_id,
+                        p.text,
+                        p.speakers,
+                        p.start_time,
+                        p.end_time,
+                        p.segment_offsets,
+                        h.title as hearing_title,
+                        h.hearing_date,
+                        h.docket_number,
+                        h.source_url
+                    FROM fl_transcript_passages p
+                    JOIN fl_hearings h ON p.hearing_id = h.id
+                    WHERE p.id IN :ids
+                """).bindparams(bindparam("ids", expanding=True)),
+                {"ids": ids},
+            )
+        }
+        # The passages' segments, in passage text order (build_passages
+        # skips blank segments, so offsets line up with the non-blank ones)
+        for row in db.execute(
+            text("""
+                SELECT
+                    p.id as passage_id,
+                    s.id,
+                    s.text,
+                    s.speaker_name,
+                    s.speaker_role
+                FROM fl_transcript_passages p
+                JOIN fl_transcript_segments s
+                    ON s.hearing_id = p.hearing_id
+                    AND s.segment_index BETWEEN p.first_segment_index AND p.last_segment_index
+                WHERE p.id IN :ids
+                ORDER BY p.id, s.segment_index
+            """).bindparams(bindparam("ids", expanding=True)),
+            {"ids": ids},
+        ):
+            if (row.text or "").strip():
+                segments.setdefault(row.passage_id, []).append(row)
+
+    terms = query_terms(q)
+    hits = []
+    for match in matches:
+        row = rows[match.id]
+        position = match_segment_position(row.text, row.segment_offsets, terms)
+        segment = None
+        match_time = None
+        if position is not None:
+            match_time = row.segment_offsets[position][1]
+            passage_segments = segments.get(row.id, [])
+            if position < len(passage_segments):
+                segment = passage_segments[position]
+        hits.append(PassageHit(
+            passage_id=row.id,
+            hearing_id=row.hearing_id,
+            hearing_title=row.hearing_title,
+            hearing_date=row.hearing_date,
+            docket_number=row.docket_number,
+            source_url=row.source_url,
+            text=row.text or "",
+            speakers=row.speakers,
+            start_time=row.start_time or 0,
+            end_time=row.end_time or 0,
+            match_time=match_time if match_time is not None else (row.start_time or 0),
+            rank=float(match.rank) if match.rank else 0.0,
+            segment_id=segment.id if segment else None,
+            segment_text=segment.text if segment else None,
+            speaker_name=segment.speaker_name if segment else None,
+            speaker_role=segment.speaker_role if segment else None,
+        ))
+
+    hits.extend(segment_hits)
+    hits.sort(key=lambda hit: hit.rank, reverse=True)
+    return hits[offset:offset + limit]
+
+
+def count_passage_matches(
+    db: Session,
+    q: str,
+    speaker: Optional[str] = None,
+    docket: Optional[str] = None,
+) -> int:
+    """
+    Approximate number of distinct matches, for pagination.
+
+    Counts runs of consecutive matching passages (a passage whose
+    predecessor also matches is the same hit seen through the overlap).
+    search_passages collapses overlaps greedily by rank instead, which can
+    keep slightly more or fewer hits for long runs, so the total is an
+    estimate and the last page may come up short or be followed by one
+    more. Matching segments of hearings without passages count one each.
+    """
+    params: Dict[str, Any] = {"q": q}
+    filters = _filters(speaker, docket, params)
+    segment_filters = _filters(speaker, docket, {}, _SEGMENT_SPEAKER)
+    passages = db.execute(text(f"""
+        SELECT COUNT(*)
+        FROM fl_transcript_passages p
+        JOIN fl_hearings h ON p.hearing_id = h.id
+        WHERE p.text_tsvector @@ websearch_to_tsquery('english', :q)
+        {filters}
+        AND NOT EXISTS (
+            SELECT 1 FROM fl_transcript_passages prev
+            WHERE prev.hearing_id = p.hearing_id
+              AND prev.passage_index = p.passage_index - 1
+              AND prev.text_tsvector @@ websearch_to_tsquery('english', :q)
+        )
+    """), params).scalar() or 0
+    segments = db.execute(text(f"""
+        SELECT COUNT(*)
+        {_UNPASSAGED_SEGMENTS}
+        {segment_filters}
+    """), params).scalar() or 0
+    return passages + segments
+
+
+__all__ = [
+    'PassageHit',
+    'query_terms',
+    'search_passages',
+    'count_passage_matches',
+]
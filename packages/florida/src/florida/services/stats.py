@@ -0,0 +1,105 @@
+"""
+Florida dashboard stats rollups.
+
+/admin/stats and /api/stats read the fl_stats_rollups counters maintained
+here instead of aggregating fl_hearings, fl_transcript_segments and
+fl_analyses per request.
+
+- FLHearing and FLAnalysis changes are tracked on flush (every session
+  made by florida.models.SessionLocal). Segment totals come from the
+  denormalized fl_hearings.segment_count, so the transcribe stage's bulk
+  segment insert needs no extra bookkeeping.
+- reconcile_rollups() recomputes every counter from the source tables and
+  corrects drift (raw SQL and Query.update writes, counters that predate
+  the rollup table). Run it periodically: `florida-cli reconcile-stats`.
+"""
+from collections import defaultdict
+from typing import Any, Dict, Iterable
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from core.services.stats_rollup import Contribution, RollupKey, RollupStore, RollupTracker
+from florida.models.analysis import FLAnalysis
+from florida.models.hearing import FLHearing
+from florida.models.stats import FLStatsRollup
+
+STATE_CODE = "FL"
+
+# Metrics (dimension in brackets)
+HEARINGS = "hearings"
+HEARINGS_BY_STATUS = "hearings_by_status"  # [transcript_status]
+DURATION_SECONDS = "duration_seconds"
+SEGMENTS = "segments"
+TRANSCRIPTION_COST = "transcription_cost"  # [whisper_model]
+ANALYSES = "analyses"
+ANALYSIS_COST = "analysis_cost"  # [model]
+
+rollups = RollupStore(FLStatsRollup)
+rollup_tracker = RollupTracker(rollups)
+
+
+def _hearing_contribution(values: Dict[str, Any], hearing: FLHearing) -> Iterable[Contribution]:
+    return [
+        (STATE_CODE, HEARINGS, "", 1),
+        (STATE_CODE, HEARINGS_BY_STATUS, values["transcript_status"], 1),
+        (STATE_CODE, DURATION_SECONDS, "", values["duration_seconds"]),
+        (STATE_CODE, SEGMENTS, "", values["segment_count"]),
+        (STATE_CODE, TRANSCRIPTION_COST, values["whisper_model"], values["processing_cost_usd"]),
+    ]
+
+
+def _analysis_contribution(values: Dict[str, Any], analysis: FLAnalysis) -> Iterable[Contribution]:
+    return [
+        (STATE_CODE, ANALYSES, "", 1),
+        (STATE_CODE, ANALYSIS_COST, values["model"], values["cost_usd"]),
+    ]
+
+
+rollup_tracker.track(
+    FLHearing,
+    ["transcript_status", "duration_seconds", "segment_count", "whisper_model", "processing_cost_usd"],
+    _hearing_contribution,
+    day_attribute="created_at",
+)
+rollup_tracker.track(FLAnalysis, ["model", "cost_usd"], _analysis_contribution, day_attribute="created_at")
+
+
+def expected_rollups(db: Session) -> Dict[RollupKey, Any]:
+    """Every counter recomputed from the source tables, bucketed by creation day."""
+    expected: Dict[RollupKey, Any] = defaultdict(float)
+    hearing_day = func.date(FLHearing.created_at)
+    analysis_day = func.date(FLAnalysis.created_at)
+
+    for day, status, model, count, seconds, segments, cost in db.query(
+        hearing_day,
+        FLHearing.transcript_status,
+        FLHearing.whisper_model,
+        func.count(FLHearing.id),
+        func.sum(FLHearing.duration_seconds),
+        func.sum(FLHearing.segment_count),
+        func.sum(FLHearing.processing_cost_usd),
+    ).group_by(hearing_day, FLHearing.transcript_status, FLHearing.whisper_model):
+        expected[(STATE_CODE, day, HEARINGS, "")] += count
+        expected[(STATE_CODE, day, HEARINGS_BY_STATUS, status or "")] += count
+        expected[(STATE_CODE, day, DURATION_SECONDS, "")] += seconds or 0
+        expected[(STATE_CODE, day, SEGMENTS, "")] += segments or 0
+        expected[(STATE_CODE, day, TRANSCRIPTION_COST, model or "")] += float(cost or 0)
+
+    for day, model, count, cost in db.query(
+        analysis_day, FLAnalysis.model, func.count(FLAnalysis.id), func.sum(FLAnalysis.cost_usd)
+    ).group_by(analysis_day, FLAnalysis.model):
+        expected[(STATE_CODE, day, ANALYSES, "")] += count
+        expected[(STATE_CODE, day, ANALYSIS_COST, model or "")] += float(cost or 0)
+
+    return expected
+
+
+def reconcile_rollups(db: Session) -> int:
+    """
+    Correct the rollups against the source tables (in db's transaction).
+
+    Returns:
+        Number of counters corrected
+    """
+    return rollups.reconcile(db, expected_rollups(db))
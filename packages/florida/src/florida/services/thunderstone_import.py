@@ -3,23 +3,51 @@ Thunderstone bulk import service.
 
 Imports document metadata from Florida PSC Thunderstone API
 and creates/enriches docket records.
+
+Documents are stored in batches. Duplicates are found with one indexed
+query per batch and ids are claimed in fl_thunderstone_ids, so no
+process loads every known id. Importer workers and DocumentSyncStage
+both claim ids before inserting, so concurrent writers never insert the
+same document twice.
+
+The comprehensive import is a frontier of (profile, search term) rows in
+fl_import_frontier, leased through core.services.job_queue: run it with
+several worker processes, stop it at any time, and re-run it to continue
+with the terms (and pages) not yet imported.
 """
 
 import logging
+import multiprocessing
+import os
 import re
 import time
 from datetime import datetime, date
-from typing import Optional, Dict, Set, Tuple
-from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, replace
 
 from sqlalchemy.orm import Session
-from sqlalchemy.dialects.postgresql import insert
 
-from florida.models import SessionLocal, FLDocument, FLDocket
+from core.services.job_queue import FAILED, QUEUED, JobQueue, JobWorker
+from florida.config import FloridaConfig, get_config
+from florida.models import SessionLocal, FLDocument, FLDocket, FLImportTerm, FLThunderstoneId
+from florida.models.base import bulk_insert, bulk_insert_missing
 from florida.scrapers.thunderstone import FloridaThunderstoneScraper, ThunderstoneDocument
 
 logger = logging.getLogger(__name__)
 
+# Frontier job kind and lease settings (see florida.pipeline.jobs)
+TERM_KIND = "thunderstone_term"
+IMPORT_LEASE_SECONDS = int(os.getenv("IMPORT_LEASE_SECONDS", "300"))
+IMPORT_MAX_ATTEMPTS = int(os.getenv("IMPORT_MAX_ATTEMPTS", "3"))
+
+# The API returns at most ~100 results per search
+TERM_RESULT_LIMIT = 100
+
+DEFAULT_IMPORT_PROFILES = ['orders', 'library', 'filings', 'filingsCurrent']
+
+import_queue = JobQueue(FLImportTerm, lease_seconds=IMPORT_LEASE_SECONDS)
+
+
 # Sector code descriptions
 SECTOR_CODES = {
     'EI': ('Electric', 'Electric utility'),
@@ -110,27 +138,9 @@ class ThunderstoneImporter:
     # URL filing pattern: /NNNNN-YYYY/ or /NNNNN-YYYY.pdf (filing numbers, not dockets)
     URL_FILING_PATTERN = re.compile(r'/(\d{5})-(\d{4})[./]')
 
-    def __init__(self):
-        self.scraper = FloridaThunderstoneScraper()
+    def __init__(self, config: Optional[FloridaConfig] = None):
+        self.scraper = FloridaThunderstoneScraper(config)
         self.stats = ImportStats()
-        self._existing_thunderstone_ids: Set[str] = set()
-        self._existing_dockets: Dict[str, int] = {}  # docket_number -> id
-
-    def _load_existing_data(self, session: Session):
-        """Load existing thunderstone IDs and dockets for deduplication."""
-        logger.info("Loading existing data for deduplication...")
-
-        # Load existing thunderstone IDs
-        existing_docs = session.query(FLDocument.thunderstone_id).filter(
-            FLDocument.thunderstone_id.isnot(None)
-        ).all()
-        self._existing_thunderstone_ids = {d[0] for d in existing_docs}
-        logger.info(f"Found {len(self._existing_thunderstone_ids):,} existing documents")
-
-        # Load existing dockets
-        existing_dockets = session.query(FLDocket.docket_number, FLDocket.id).all()
-        self._existing_dockets = {d[0]: d[1] for d in existing_dockets}
-        logger.info(f"Found {len(self._existing_dockets):,} existing dockets")
 
     def _extract_docket_info(self, text: str) -> Optional[Tuple[str, int, int, str]]:
         """
@@ -165,20 +175,14 @@ class ThunderstoneImporter:
                 return name
         return None
 
-    def _get_or_create_docket(
+    def _docket_row(
         self,
-        session: Session,
-        docket_number: str,
-        year: int,
-        sequence: int,
-        sector_code: str,
-        doc: ThunderstoneDocument
-    ) -> Optional[int]:
-        """Get existing docket ID or create new docket."""
-
-        # Check if we already know this docket
-        if docket_number in self._existing_dockets:
-            return self._existing_dockets[docket_number]
+        docket_info: Tuple[str, int, int, str],
+        doc: ThunderstoneDocument,
+        now: datetime,
+    ) -> Dict[str, Any]:
+        """New docket record for a docket number first seen in doc."""
+        docket_number, year, sequence, sector_code = docket_info
 
         # Get sector info
         industry_type, case_type = SECTOR_CODES.get(sector_code, ('Unknown', 'Unknown'))
@@ -203,84 +207,127 @@ class ThunderstoneImporter:
             if len(title) > 200:
                 title = title[:200] + '...'
 
-        # Create new docket
-        try:
-            new_docket = FLDocket(
-                docket_number=docket_number,
-                year=year,
-                sequence=sequence,
-                sector_code=sector_code,
-                title=title,
-                utility_name=utility_name,
-                industry_type=industry_type,
-                case_type=case_type,
-                filed_date=doc.filed_date,
-                psc_docket_url=f"https://www.floridapsc.com/ClerkOffice/DocketFiling?docket={docket_number}",
-                created_at=datetime.utcnow(),
-            )
-            session.add(new_docket)
-            session.flush()  # Get the ID
-
-            self._existing_dockets[docket_number] = new_docket.id
-            self.stats.dockets_created += 1
-
-            logger.debug(f"Created docket: {docket_number} - {utility_name or 'Unknown'}")
-            return new_docket.id
-
-        except Exception as e:
-            logger.warning(f"Failed to create docket {docket_number}: {e}")
-            return None
-
-    def _import_document(self, session: Session, doc: ThunderstoneDocument) -> bool:
-        """Import a single document. Returns True if inserted."""
-
-        # Skip if already exists
-        if doc.thunderstone_id and doc.thunderstone_id in self._existing_thunderstone_ids:
-            self.stats.documents_skipped += 1
-            return False
-
-        # Extract docket info
-        docket_number = None
-        docket_info = (
-            self._extract_docket_info(doc.title or '') or
-            self._extract_docket_info(doc.content_excerpt or '') or
-            self._extract_docket_info(doc.file_url or '')
-        )
+        return {
+            'docket_number': docket_number,
+            'year': year,
+            'sequence': sequence,
+            'sector_code': sector_code,
+            'title': title,
+            'utility_name': utility_name,
+            'industry_type': industry_type,
+            'case_type': case_type,
+            'filed_date': doc.filed_date,
+            'psc_docket_url': f"https://www.floridapsc.com/ClerkOffice/DocketFiling?docket={docket_number}",
+            'created_at': now,
+        }
+
+    def import_batch(self, session: Session, docs: List[ThunderstoneDocument]) -> int:
+        """
+        Store a batch of documents, skipping ones already imported.
 
-        if docket_info:
-            docket_number, year, sequence, sector_code = docket_info
-            self._get_or_create_docket(session, docket_number, year, sequence, sector_code, doc)
-
-        # Create document record
-        try:
-            new_doc = FLDocument(
-                thunderstone_id=doc.thunderstone_id,
-                title=doc.title or 'Untitled',
-                document_type=doc.document_type,
-                profile=doc.profile,
-                docket_number=docket_number,
-                file_url=doc.file_url,
-                file_type=doc.file_type,
-                file_size_bytes=doc.file_size_bytes,
-                filed_date=doc.filed_date,
-                content_text=doc.content_excerpt,
-                filer_name=doc.filer_name,
-                document_number=doc.document_number,
-                created_at=datetime.utcnow(),
-                scraped_at=datetime.utcnow(),
-            )
-            session.add(new_doc)
+        Ids already in fl_documents are skipped; the rest are claimed in
+        fl_thunderstone_ids, and a concurrent worker holding the same id
+        makes the claim wait for its commit (then skip). Missing dockets
+        are created. All in session's transaction; the caller commits.
 
+        Returns:
+            Number of documents inserted
+        """
+        ids = {doc.thunderstone_id for doc in docs if doc.thunderstone_id}
+        known = set()
+        if ids:
+            known = {
+                thunderstone_id for (thunderstone_id,) in session.query(FLDocument.thunderstone_id).filter(
+                    FLDocument.thunderstone_id.in_(ids)
+                )
+            }
+        # Sorted, so concurrent workers take the row locks in the same order
+        claimed = set(bulk_insert_missing(
+            session,
+            FLThunderstoneId.__table__,
+            [{'thunderstone_id': thunderstone_id} for thunderstone_id in sorted(ids - known)],
+            index_elements=['thunderstone_id'],
+            returning='thunderstone_id',
+        ))
+
+        now = datetime.utcnow()
+        dockets: Dict[str, Dict[str, Any]] = {}
+        rows = []
+        for doc in docs:
             if doc.thunderstone_id:
-                self._existing_thunderstone_ids.add(doc.thunderstone_id)
+                if doc.thunderstone_id not in claimed:
+                    self.stats.documents_skipped += 1
+                    continue
+                claimed.discard(doc.thunderstone_id)
+
+            # Extract docket info
+            docket_number = None
+            docket_info = (
+                self._extract_docket_info(doc.title or '') or
+                self._extract_docket_info(doc.content_excerpt or '') or
+                self._extract_docket_info(doc.file_url or '')
+            )
+            if docket_info:
+                docket_number = docket_info[0]
+                if docket_number not in dockets:
+                    dockets[docket_number] = self._docket_row(docket_info, doc, now)
+
+            rows.append({
+                'thunderstone_id': doc.thunderstone_id,
+                'title': doc.title or 'Untitled',
+                'document_type': doc.document_type,
+                'profile': doc.profile,
+                'docket_number': docket_number,
+                'file_url': doc.file_url,
+                'file_type': doc.file_type,
+                'file_size_bytes': doc.file_size_bytes,
+                'filed_date': doc.filed_date,
+                'content_text': doc.content_excerpt,
+                'filer_name': doc.filer_name,
+                'document_number': doc.document_number,
+                'created_at': now,
+                'scraped_at': now,
+            })
+
+        created = bulk_insert_missing(
+            session,
+            FLDocket.__table__,
+            list(dockets.values()),
+            index_elements=['docket_number'],
+            returning='docket_number',
+        )
+        self.stats.dockets_created += len(created)
+        for docket_number in created:
+            logger.debug(f"Created docket: {docket_number}")
 
-            self.stats.documents_inserted += 1
-            return True
+        bulk_insert(session, FLDocument.__table__, rows)
+        self.stats.documents_inserted += len(rows)
+        return len(rows)
 
-        except Exception as e:
-            logger.warning(f"Failed to insert document: {e}")
-            self.stats.errors += 1
-            return False
+    def _import_search(
+        self,
+        session: Session,
+        docs: Iterable[ThunderstoneDocument],
+        commit_every: int,
+        label: str,
+    ) -> int:
+        """Import search results in batches of commit_every, committing each."""
+        count = 0
+        batch: List[ThunderstoneDocument] = []
+        for doc in docs:
+            self.stats.documents_processed += 1
+            count += 1
+            batch.append(doc)
+
+            if len(batch) >= commit_every:
+                self.import_batch(session, batch)
+                session.commit()
+                batch = []
+                logger.info(f"{label}{self.stats}")
+
+        self.import_batch(session, batch)
+        session.commit()
+        return count
 
     def import_profile(
         self,
@@ -301,26 +348,12 @@ class ThunderstoneImporter:
         logger.info(f"Starting import: profile={profile}, search='{search_term}', limit={limit}")
 
         with SessionLocal() as session:
-            self._load_existing_data(session)
-
-            batch_count = 0
-            for doc in self.scraper.search(query=search_term, profile=profile, limit=limit or 999999):
-                self.stats.documents_processed += 1
-                self._import_document(session, doc)
-                batch_count += 1
-
-                # Periodic commit
-                if batch_count >= commit_every:
-                    session.commit()
-                    batch_count = 0
-                    logger.info(f"Progress: {self.stats}")
-
-                # Check limit
-                if limit and self.stats.documents_processed >= limit:
-                    break
-
-            # Final commit
-            session.commit()
+            self._import_search(
+                session,
+                self.scraper.search(query=search_term, profile=profile, limit=limit or 999999),
+                commit_every,
+                "Progress: ",
+            )
 
         logger.info(f"Import complete: {self.stats}")
         return self.stats
@@ -344,39 +377,21 @@ class ThunderstoneImporter:
 
         logger.info(f"Starting multi-profile import: {profiles}")
 
-        with SessionLocal() as session:
-            self._load_existing_data(session)
-
         for profile in profiles:
             logger.info(f"\n{'='*50}\nImporting profile: {profile}\n{'='*50}")
 
             try:
                 with SessionLocal() as session:
-                    # Reload for each profile in case of long runs
-                    self._load_existing_data(session)
-
-                    batch_count = 0
-                    profile_count = 0
-
-                    for doc in self.scraper.search(
-                        query=search_term,
-                        profile=profile,
-                        limit=limit_per_profile or 999999
-                    ):
-                        self.stats.documents_processed += 1
-                        profile_count += 1
-                        self._import_document(session, doc)
-                        batch_count += 1
-
-                        if batch_count >= 100:
-                            session.commit()
-                            batch_count = 0
-                            logger.info(f"[{profile}] {self.stats}")
-
-                        if limit_per_profile and profile_count >= limit_per_profile:
-                            break
-
-                    session.commit()
+                    self._import_search(
+                        session,
+                        self.scraper.search(
+                            query=search_term,
+                            profile=profile,
+                            limit=limit_per_profile or 999999
+                        ),
+                        100,
+                        f"[{profile}] ",
+                    )
 
             except Exception as e:
                 logger.error(f"Error importing profile {profile}: {e}")
@@ -386,52 +401,13 @@ class ThunderstoneImporter:
         return self.stats
 
 
-def run_import(
-    profiles: Optional[list] = None,
-    search_term: str = "Florida",
-    limit: Optional[int] = None,
-):
-    """
-    Run Thunderstone import.
-
-    Args:
-        profiles: List of profiles to import, or None for all
-        search_term: Search term to use
-        limit: Max documents per profile
-    """
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s'
-    )
-
-    importer = ThunderstoneImporter()
-    return importer.import_all_profiles(
-        search_term=search_term,
-        limit_per_profile=limit,
-        profiles=profiles,
-    )
-
-
-def run_comprehensive_import(
-    profiles: Optional[list] = None,
-):
+def build_search_terms() -> List[str]:
     """
-    Run comprehensive import using multiple search strategies.
+    Search terms for the comprehensive import.
 
     The Thunderstone API only returns ~100 results per search,
     so we use multiple search terms to maximize coverage.
     """
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s'
-    )
-
-    importer = ThunderstoneImporter()
-
-    if profiles is None:
-        profiles = ['orders', 'library', 'filings', 'filingsCurrent']
-
-    # Search terms to maximize coverage
     search_terms = []
 
     # Order number range searches: PSC-YYYY-NN for years 1990-2026
@@ -461,46 +437,216 @@ def run_comprehensive_import(
         "EI", "WS", "GU", "TL", "EM", "EC",
         "Commission", "Docket", "hearing", "application", "certificate",
     ])
+    return search_terms
 
-    with SessionLocal() as session:
-        importer._load_existing_data(session)
 
-    logger.info(f"Starting comprehensive import with {len(search_terms)} search terms")
-    logger.info(f"Profiles: {profiles}")
+def seed_frontier(
+    db: Session,
+    profiles: List[str],
+    search_terms: List[str],
+    run_id: Optional[str] = None,
+) -> int:
+    """
+    Queue (profile, term) pairs not already in the frontier and commit.
 
-    for profile in profiles:
-        logger.info(f"\n{'='*60}\nProcessing profile: {profile}\n{'='*60}")
+    Existing rows keep their status, so re-seeding a restarted import
+    doesn't re-scan finished terms.
 
-        for search_term in search_terms:
-            try:
-                with SessionLocal() as session:
-                    batch_count = 0
-                    term_inserted = 0
+    Returns:
+        Number of terms added
+    """
+    now = datetime.utcnow()
+    rows = [
+        {
+            'profile': profile,
+            'term': term,
+            'last_page': 0,
+            'kind': TERM_KIND,
+            'payload': {'profile': profile, 'term': term},
+            'run_id': run_id,
+            'status': QUEUED,
+            'priority': 0,
+            'attempts': 0,
+            'max_attempts': IMPORT_MAX_ATTEMPTS,
+            'run_after': now,
+            'created_at': now,
+        }
+        for profile in profiles
+        for term in search_terms
+    ]
+    added = bulk_insert_missing(
+        db, FLImportTerm.__table__, rows, index_elements=['profile', 'term'], returning='id'
+    )
+    db.commit()
+    return len(added)
 
-                    for doc in importer.scraper.search(
-                        query=search_term,
-                        profile=profile,
-                        limit=100  # API limit
-                    ):
-                        importer.stats.documents_processed += 1
-                        if importer._import_document(session, doc):
-                            term_inserted += 1
-                        batch_count += 1
 
-                        if batch_count >= 100:
-                            session.commit()
-                            batch_count = 0
+def import_term(importer: ThunderstoneImporter, payload: Dict[str, Any], db: Session) -> Dict[str, Any]:
+    """
+    Import one frontier term (job handler).
 
-                    session.commit()
+    Each results page is committed with the term's last_page, so a retried
+    or re-leased term resumes after the last stored page.
+    """
+    term = db.query(FLImportTerm).filter(
+        FLImportTerm.profile == payload['profile'],
+        FLImportTerm.term == payload['term'],
+    ).one()
+
+    found = inserted = 0
+    for page, docs in importer.scraper.search_pages(
+        term.term,
+        profile=term.profile,
+        start_page=term.last_page + 1,
+        limit=TERM_RESULT_LIMIT,
+    ):
+        importer.stats.documents_processed += len(docs)
+        found += len(docs)
+        inserted += importer.import_batch(db, docs)
+        term.last_page = page
+        db.commit()
+
+    if inserted:
+        logger.info(f"[{term.profile}] '{term.term}': +{inserted} docs | Total: {importer.stats}")
+    return {'documents_found': found, 'documents_inserted': inserted, 'last_page': term.last_page}
+
+
+def run_import_worker(
+    worker_id: Optional[str] = None,
+    drain: bool = True,
+    api_rate_limit: Optional[float] = None,
+) -> int:
+    """
+    Lease and import frontier terms in this process.
 
-                    if term_inserted > 0:
-                        logger.info(f"[{profile}] '{search_term}': +{term_inserted} docs | Total: {importer.stats}")
+    Each worker paces only its own requests, so workers running side by
+    side should split the API rate limit between them.
 
-            except Exception as e:
-                logger.error(f"Error with search '{search_term}': {e}")
+    Args:
+        worker_id: Worker name in leases (default host:pid)
+        drain: Exit once no terms are due instead of polling
+        api_rate_limit: Requests per second for this worker (default the
+            configured FL_API_RATE_LIMIT)
+
+    Returns:
+        Number of terms processed
+    """
+    config = get_config()
+    if api_rate_limit:
+        config = replace(config, api_rate_limit=api_rate_limit)
+    importer = ThunderstoneImporter(config)
+    worker = JobWorker(
+        import_queue,
+        SessionLocal,
+        {TERM_KIND: lambda payload, db: import_term(importer, payload, db)},
+        worker_id=worker_id,
+        heartbeat_interval=max(import_queue.lease_seconds / 5, 1),
+    )
+    processed = worker.run(stop_when_idle=drain)
+    logger.info(f"Worker {worker.worker_id} done: {importer.stats}")
+    return processed
+
+
+def _import_worker_process(api_rate_limit: float):
+    """Entry point of a spawned import worker process."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(processName)s - %(levelname)s - %(message)s'
+    )
+    run_import_worker(api_rate_limit=api_rate_limit)
+
+
+def run_import(
+    profiles: Optional[list] = None,
+    search_term: str = "Florida",
+    limit: Optional[int] = None,
+):
+    """
+    Run Thunderstone import.
+
+    Args:
+        profiles: List of profiles to import, or None for all
+        search_term: Search term to use
+        limit: Max documents per profile
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    importer = ThunderstoneImporter()
+    return importer.import_all_profiles(
+        search_term=search_term,
+        limit_per_profile=limit,
+        profiles=profiles,
+    )
+
+
+def run_comprehensive_import(
+    profiles: Optional[list] = None,
+    workers: int = 4,
+    retry_failed: bool = False,
+) -> Dict[str, int]:
+    """
+    Run comprehensive import using multiple search strategies.
+
+    Seeds the frontier with every (profile, search term) pair, then runs
+    `workers` processes that lease terms until none are left. The
+    processes split the configured API rate limit evenly, so together
+    they stay within it. Re-running continues an interrupted import; more
+    workers (e.g. run_import_worker() on other hosts) can join at any
+    time, given their own share of the rate limit.
+
+    Args:
+        profiles: Profiles to search (None for the default set)
+        workers: Worker processes to run here
+        retry_failed: Requeue terms that used up their attempts
+
+    Returns:
+        Frontier term counts by status
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
 
-    logger.info(f"\n{'='*60}\nFinal stats: {importer.stats}\n{'='*60}")
-    return importer.stats
+    if profiles is None:
+        profiles = DEFAULT_IMPORT_PROFILES
+    search_terms = build_search_terms()
+
+    with SessionLocal() as session:
+        added = seed_frontier(session, profiles, search_terms)
+        if retry_failed:
+            import_queue.set_status(session, FAILED, QUEUED)
+        counts = import_queue.counts(session)
+
+    logger.info(f"Starting comprehensive import with {len(search_terms)} search terms")
+    logger.info(f"Profiles: {profiles}")
+    logger.info(f"Frontier: +{added} new terms, {counts}")
+
+    if workers <= 1:
+        run_import_worker()
+    else:
+        # Fresh interpreters, so no database connections are inherited
+        context = multiprocessing.get_context('spawn')
+        rate_share = get_config().api_rate_limit / workers
+        processes = [
+            context.Process(
+                target=_import_worker_process,
+                args=(rate_share,),
+                name=f"import-worker-{i}",
+            )
+            for i in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+    with SessionLocal() as session:
+        counts = import_queue.counts(session)
+    logger.info(f"\n{'='*60}\nFrontier: {counts}\n{'='*60}")
+    return counts
 
 
 if __name__ == '__main__':
@@ -510,11 +656,23 @@ if __name__ == '__main__':
     parser.add_argument('--profiles', nargs='+', help='Profiles to import')
     parser.add_argument('--search', default='Florida', help='Search term')
     parser.add_argument('--limit', type=int, help='Max docs per profile')
+    parser.add_argument('--comprehensive', action='store_true',
+                        help='Import every frontier search term (resumable)')
+    parser.add_argument('--workers', type=int, default=4, help='Worker processes for --comprehensive')
+    parser.add_argument('--retry-failed', action='store_true',
+                        help='With --comprehensive, requeue terms that used up their attempts')
 
     args = parser.parse_args()
 
-    run_import(
-        profiles=args.profiles,
-        search_term=args.search,
-        limit=args.limit,
-    )
+    if args.comprehensive:
+        run_comprehensive_import(
+            profiles=args.profiles,
+            workers=args.workers,
+            retry_failed=args.retry_failed,
+        )
+    else:
+        run_import(
+            profiles=args.profiles,
+            search_term=args.search,
+            limit=args.limit,
+        )
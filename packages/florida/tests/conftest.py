@@ -0,0 +1,35 @@
+"""
+Pytest configuration and fixtures for the Florida package.
+"""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Models pick SQLite-compatible column types at import time
+os.environ["FL_DATABASE_URL"] = "sqlite://"
+
+import florida.models  # noqa: E402,F401 - registers every table
+from florida.models.base import Base  # noqa: E402
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """File-backed SQLite database with every Florida table."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path}/florida.db",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(session_factory):
+    """Session on a fresh Florida database."""
+    session = session_factory()
+    yield session
+    session.close()
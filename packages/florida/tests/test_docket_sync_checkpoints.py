@@ -0,0 +1,86 @@
+"""
+Test resuming checkpointed concurrent docket syncs.
+"""
+
+from datetime import datetime, timedelta
+
+from florida.models.sync import FLSyncCheckpoint
+from florida.pipeline.docket_sync import DocketSyncStage
+from florida.scrapers.clerkoffice import DocketListResult, FloridaDocketData
+
+
+class FakeClerkOffice:
+    """Concurrent ClerkOffice fetches from a {key: dockets or exception} map."""
+
+    def __init__(self, lists):
+        self.lists = lists
+        self.fetched = []
+
+    def docket_combinations(self, status=None, industries=None):
+        return [tuple(key.split(":")) for key in self.lists]
+
+    async def fetch_docket_lists(self, combinations, year=None):
+        for dtype, itype in combinations:
+            key = f"{dtype}:{itype}"
+            self.fetched.append(key)
+            value = self.lists[key]
+            if isinstance(value, Exception):
+                yield DocketListResult(dtype, itype, error=value)
+            else:
+                yield DocketListResult(dtype, itype, dockets=value)
+
+
+def _docket(number):
+    return FloridaDocketData(docket_number=number, year=int(number[:4]), sequence=int(number[4:8]))
+
+
+def _sync(db, scraper, **kwargs):
+    return DocketSyncStage(db, scraper=scraper).sync_all(concurrent=True, **kwargs)
+
+
+def test_resume_skips_done_and_retries_failed(db):
+    scraper = FakeClerkOffice({
+        "D:E": [_docket("20250001-EI")],
+        "D:G": ConnectionError("timed out"),
+    })
+    first = _sync(db, scraper)
+    assert first.errors == ["D:G: timed out"]
+
+    scraper.lists["D:G"] = [_docket("20250002-GU")]
+    scraper.fetched = []
+    second = _sync(db, scraper)
+
+    assert second.run_id == first.run_id
+    assert second.resumed_combinations == 1
+    assert scraper.fetched == ["D:G"]
+    assert second.new_dockets == 1
+
+    # Finished: the next sync starts over
+    scraper.fetched = []
+    third = _sync(db, scraper)
+    assert third.run_id != first.run_id
+    assert scraper.fetched == ["D:E", "D:G"]
+
+
+def test_resume_continues_a_run_cut_short_by_limit(db):
+    scraper = FakeClerkOffice({"D:E": [_docket("20250001-EI"), _docket("20250002-EI")]})
+    first = _sync(db, scraper, limit=1)
+    assert first.total_scraped == 1
+
+    second = _sync(db, scraper)
+    assert second.run_id == first.run_id
+    assert (second.new_dockets, second.updated_dockets) == (1, 1)
+
+
+def test_stale_or_fresh_runs_are_not_resumed(db):
+    scraper = FakeClerkOffice({"D:E": ConnectionError("timed out")})
+    first = _sync(db, scraper)
+
+    fresh = _sync(db, scraper, resume=False)
+    assert fresh.run_id != first.run_id
+
+    # Started before the resume window: a combination that keeps failing
+    # doesn't keep its run open
+    db.query(FLSyncCheckpoint).update({FLSyncCheckpoint.created_at: datetime.utcnow() - timedelta(hours=25)})
+    db.commit()
+    assert _sync(db, scraper).run_id not in (first.run_id, fresh.run_id)
@@ -0,0 +1,83 @@
+"""
+Tests for the keyset-paginated entity review queue.
+"""
+
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from florida.api.routes.review import get_review_queue
+from florida.models import (
+    FLDocket,
+    FLHearing,
+    FLHearingDocket,
+    FLHearingTopic,
+    FLHearingUtility,
+    FLTopic,
+    FLUtility,
+)
+
+
+@pytest.fixture
+def pending_links(db):
+    """Pending links of all three types with interleaved confidence scores."""
+    hearing = FLHearing(title="Rate case hearing", hearing_date=date(2025, 3, 4), source_type="video")
+    docket = FLDocket(docket_number="20250001-EI", year=2025, sequence=1, sector_code="EI",
+                      title="FPL rate case")
+    utility = FLUtility(name="Florida Power & Light", normalized_name="florida power & light")
+    topic = FLTopic(name="Rate case", slug="rate-case", category="rates")
+    db.add_all([hearing, docket, utility, topic])
+    db.flush()
+
+    scores = {
+        FLHearingDocket: [None, 40.0, 70.0],
+        FLHearingUtility: [40.0, 55.0],
+        FLHearingTopic: [None, 40.0, 90.0],
+    }
+    for link, link_scores in scores.items():
+        for score in link_scores:
+            fields = {FLHearingDocket: {"docket_id": docket.id},
+                      FLHearingUtility: {"utility_id": utility.id},
+                      FLHearingTopic: {"topic_id": topic.id}}[link]
+            db.add(link(hearing_id=hearing.id, confidence_score=score, needs_review=True, **fields))
+    # Reviewed links never show up
+    db.add(FLHearingDocket(hearing_id=hearing.id, docket_id=docket.id, confidence_score=10.0,
+                           needs_review=False))
+    db.commit()
+
+
+def _page(db, entity_type=None, limit=50, cursor=None):
+    return get_review_queue(entity_type=entity_type, limit=limit, cursor=cursor, db=db)
+
+
+def test_queue_pages_across_link_types(db, pending_links):
+    seen = []
+    cursor = None
+    while True:
+        page = _page(db, limit=3, cursor=cursor)
+        assert len(page["items"]) <= 3
+        seen += [(item["type"], item["confidence_score"]) for item in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    # Lowest confidence first (unscored before scored), then docket < utility < topic
+    assert seen == [
+        ("docket", None), ("topic", None),
+        ("docket", 40.0), ("utility", 40.0), ("topic", 40.0),
+        ("utility", 55.0), ("docket", 70.0), ("topic", 90.0),
+    ]
+
+    topics = _page(db, entity_type="topic", limit=2)
+    assert [item["confidence_score"] for item in topics["items"]] == [None, 40.0]
+    rest = _page(db, entity_type="topic", limit=2, cursor=topics["next_cursor"])
+    assert [item["confidence_score"] for item in rest["items"]] == [90.0]
+    assert rest["next_cursor"] is None
+
+
+@pytest.mark.parametrize("cursor", ["garbage", "40.0:hearing:3", "x:docket:3", "40.0:docket:"])
+def test_queue_rejects_bad_cursor(db, pending_links, cursor):
+    with pytest.raises(HTTPException) as exc:
+        _page(db, limit=3, cursor=cursor)
+    assert exc.value.status_code == 400
@@ -5,13 +5,19 @@ These tests verify the scraper functionality using mock responses
 to avoid hitting the actual API during testing.
 """
 
+import asyncio
+import threading
+
+import httpx
 import pytest
+import requests
 from datetime import date
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 from florida.scrapers import (
     FloridaClerkOfficeScraper,
     FloridaClerkOfficeClient,
+    FloridaClerkOfficeAsyncClient,
     FloridaDocketData,
     FloridaThunderstoneScraper,
     FloridaThunderstoneClient,
@@ -19,6 +25,7 @@ from florida.scrapers import (
     ThunderstoneProfile,
 )
 from florida.config import FloridaConfig
+from core.utils.http import HTTPCache
 
 
 # Sample API responses for mocking
@@ -154,6 +161,26 @@ class TestFloridaClerkOfficeScraper:
         assert dockets[0].closed_date is None
         assert dockets[1].closed_date == date(2025, 6, 1)
 
+    def test_fetch_docket_lists(self, scraper):
+        """Test concurrent fetch yields each combination, including failures."""
+        async def get_dockets_by_type(docket_type='D', industry_type='E'):
+            if industry_type == 'G':
+                raise ConnectionError("timed out")
+            return MOCK_DOCKET_RESPONSE['result']
+
+        async def fetch():
+            combinations = scraper.docket_combinations(status='open', industries=['E', 'G'])
+            return [result async for result in scraper.fetch_docket_lists(combinations, year=2025)]
+
+        with patch.object(FloridaClerkOfficeAsyncClient, 'get_dockets_by_type',
+                          AsyncMock(side_effect=get_dockets_by_type)):
+            results = {result.key: result for result in asyncio.run(fetch())}
+
+        assert set(results) == {'D:E', 'D:G'}
+        assert [d.docket_number for d in results['D:E'].dockets] == ['20250001-EI', '20250002-GU']
+        assert isinstance(results['D:G'].error, ConnectionError)
+        assert results['D:G'].dockets == []
+
     @patch.object(FloridaClerkOfficeClient, 'get_open_dockets')
     def test_connection_test_success(self, mock_get, scraper):
         """Test successful connection test."""
@@ -209,6 +236,44 @@ class TestFloridaThunderstoneScraper:
         assert docs[0].docket_number == '20250001-EI'
         assert docs[0].file_type == 'PDF'
 
+    @patch('florida.scrapers.thunderstone.PAGE_RETRY_WAIT', 0)
+    @patch.object(FloridaThunderstoneClient, 'search')
+    def test_search_prefetches_pages_in_order(self, mock_search, scraper):
+        """Test prefetched pages are yielded in order, retrying or skipping failures."""
+        failures = {2: 1, 3: 99}  # page 2 fails once, page 3 always
+
+        def search_page(search_text, profile, page, per_page):
+            if failures.get(page, 0) > 0:
+                failures[page] -= 1
+                raise requests.ConnectionError("reset")
+            return {'result': {
+                'Results': [{'Id': f'{page}-{i}', 'Title': f'Doc {page}-{i}'} for i in range(per_page)],
+                'TotalResults': 5 * per_page,
+            }}
+
+        mock_search.side_effect = search_page
+
+        docs = list(scraper.search('rate case', limit=200))
+
+        pages = [int(doc.thunderstone_id.split('-')[0]) for doc in docs]
+        assert pages == [1] * 50 + [2] * 50 + [4] * 50 + [5] * 50
+        assert [doc.thunderstone_id for doc in docs[:2]] == ['1-0', '1-1']
+        assert mock_search.call_count == 5 + 1 + 2
+
+    @patch.object(FloridaThunderstoneClient, 'search')
+    def test_search_pages_resumes_from_start_page(self, mock_search, scraper):
+        """Test page-by-page search starts at start_page and stops at the last page."""
+        mock_search.side_effect = lambda search_text, profile, page, per_page: {'result': {
+            'Results': [{'Id': f'{page}-{i}', 'Title': f'Doc {page}-{i}'} for i in range(per_page)],
+            'TotalResults': 120,
+        }}
+
+        pages = list(scraper.search_pages('PSC-2024-01', profile='orders', start_page=2, limit=150))
+
+        assert [(page, len(docs)) for page, docs in pages] == [(2, 50), (3, 50)]
+        assert pages[0][1][0].thunderstone_id == '2-0'
+        assert [c.kwargs['page'] for c in mock_search.call_args_list] == [2, 3]
+
     @patch.object(FloridaThunderstoneClient, 'search')
     def test_search_by_docket(self, mock_search, scraper):
         """Test searching by docket number."""
@@ -234,6 +299,99 @@ class TestFloridaThunderstoneScraper:
         assert scraper.test_connection() is False
 
 
+class TestHTTPCache:
+    """Test conditional requests through the shared HTTP cache."""
+
+    def test_conditional_fetch(self, tmp_path):
+        """Test a committed feed is revalidated, served on 304 and reported unchanged."""
+        feed = {'body': b'<rss>1</rss>', 'etag': '"v1"'}
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            if request.headers.get('If-None-Match') == feed['etag']:
+                return httpx.Response(304, headers={'ETag': feed['etag']})
+            return httpx.Response(200, content=feed['body'], headers={'ETag': feed['etag']})
+
+        cache = HTTPCache(str(tmp_path / 'http_cache.sqlite3'))
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            first = cache.fetch(client.get, 'https://feeds.test/rss', params={'b': 2, 'a': 1})
+            assert first.changed and first.content == b'<rss>1</rss>'
+            # Nothing is remembered until the feed is committed
+            assert cache.fetch(client.get, 'https://feeds.test/rss', params={'a': 1, 'b': 2}).changed
+            cache.commit(first)
+
+            second = cache.fetch(client.get, 'https://feeds.test/rss', params={'a': 1, 'b': 2})
+            assert second.not_modified and not second.changed
+            assert second.content == b'<rss>1</rss>'
+            assert requests_seen[-1].headers['If-None-Match'] == '"v1"'
+
+            feed.update(body=b'<rss>2</rss>', etag='"v2"')
+            third = cache.fetch(client.get, 'https://feeds.test/rss', params={'a': 1, 'b': 2})
+            assert third.changed and third.content == b'<rss>2</rss>'
+
+            # No validators: the digest alone detects an unchanged body
+            def plain_handler(request):
+                assert 'If-None-Match' not in request.headers
+                return httpx.Response(200, content=b'same')
+
+            plain = httpx.Client(transport=httpx.MockTransport(plain_handler))
+            cache.commit(cache.fetch(plain.get, 'https://feeds.test/plain'))
+            assert not cache.fetch(plain.get, 'https://feeds.test/plain').changed
+
+        # Disabled cache: plain requests, always changed
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            off = HTTPCache()
+            off.commit(off.fetch(client.get, 'https://feeds.test/rss'))
+            assert off.fetch(client.get, 'https://feeds.test/rss').changed
+
+
+    def test_evicts_least_recently_committed(self, tmp_path, monkeypatch):
+        """Test the cache keeps at most max_entries requests."""
+        def handler(request):
+            return httpx.Response(200, content=request.url.path.encode(), headers={'ETag': '"v1"'})
+
+        monkeypatch.setattr(HTTPCache, 'prune_interval', 1)
+        cache = HTTPCache(str(tmp_path / 'http_cache.sqlite3'), max_entries=2)
+        clock = iter(range(100))
+        monkeypatch.setattr('core.utils.http.time.time', lambda: next(clock))
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            for page in ['a', 'b', 'a', 'c']:
+                cache.commit(cache.fetch(client.get, f'https://feeds.test/{page}'))
+
+            # 'b' was the least recently committed of the three
+            assert not cache.fetch(client.get, 'https://feeds.test/a').changed
+            assert not cache.fetch(client.get, 'https://feeds.test/c').changed
+            assert cache.fetch(client.get, 'https://feeds.test/b').changed
+
+    def test_async_fetch_keeps_sqlite_off_the_loop(self, tmp_path, monkeypatch):
+        """Test afetch_json reads and commits the cache in worker threads."""
+        async def handler(request):
+            if request.headers.get('If-None-Match') == '"v1"':
+                return httpx.Response(304, headers={'ETag': '"v1"'})
+            return httpx.Response(200, json={'dockets': [1]}, headers={'ETag': '"v1"'})
+
+        loop_threads = []
+        cache = HTTPCache(str(tmp_path / 'http_cache.sqlite3'))
+        entry, commit = cache._entry, cache.commit
+
+        def track(method):
+            def wrapper(*args):
+                loop_threads.append(threading.current_thread() is threading.main_thread())
+                return method(*args)
+            return wrapper
+
+        monkeypatch.setattr(cache, '_entry', track(entry))
+        monkeypatch.setattr(cache, 'commit', track(commit))
+
+        async def fetch_twice():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return [await cache.afetch_json(client.get, 'https://feeds.test/dockets') for _ in range(2)]
+
+        assert asyncio.run(fetch_twice()) == [{'dockets': [1]}] * 2
+        assert loop_threads == [False] * 4
+
+
 class TestFloridaDocketData:
     """Test FloridaDocketData dataclass."""
 
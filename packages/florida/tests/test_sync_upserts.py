@@ -0,0 +1,166 @@
+"""
+Test the batched docket and document sync upserts on SQLite.
+"""
+
+from datetime import date, datetime
+
+from florida.models.base import _copy_buffer, bulk_upsert
+from florida.models.docket import FLDocket
+from florida.models.document import FLDocument
+from florida.pipeline.docket_sync import DocketSyncStage
+from florida.pipeline.document_sync import DocumentSyncStage
+from florida.scrapers.clerkoffice import FloridaDocketData
+from florida.scrapers.thunderstone import ThunderstoneDocument
+
+
+class FakeClerkOffice:
+    def __init__(self, dockets):
+        self.dockets = dockets
+
+    def scrape_florida_dockets(self, year=None, status=None, industries=None, limit=None):
+        yield from self.dockets
+
+
+class FakeThunderstone:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def search(self, query, profile='library', limit=100):
+        return iter(self.documents)
+
+
+def _docket(number, **fields):
+    return FloridaDocketData(
+        docket_number=number,
+        year=int(number[:4]),
+        sequence=int(number[4:8]),
+        sector_code=number[-2:],
+        **fields,
+    )
+
+
+def test_bulk_upsert_coalesces_and_overwrites(db):
+    db.add(FLDocket(
+        docket_number="20250001-EI", year=2025, sequence=1,
+        title="Rate case", utility_name="FPL", updated_at=datetime(2025, 1, 1),
+    ))
+    db.commit()
+
+    written = bulk_upsert(db, FLDocket.__table__, [
+        {"docket_number": "20250001-EI", "year": 2025, "sequence": 1, "sector_code": "EI",
+         "title": None, "utility_name": "Florida Power & Light", "updated_at": datetime(2025, 6, 1)},
+        {"docket_number": "20250002-GU", "year": 2025, "sequence": 2, "sector_code": "GU",
+         "title": "Fuel clause", "utility_name": None, "updated_at": datetime(2025, 6, 1)},
+    ], index_elements=["docket_number"], coalesce=["title", "utility_name"], overwrite=["updated_at"])
+    db.commit()
+
+    assert written == 2
+    existing = db.query(FLDocket).filter_by(docket_number="20250001-EI").one()
+    assert existing.title == "Rate case"
+    assert existing.utility_name == "Florida Power & Light"
+    assert existing.updated_at == datetime(2025, 6, 1)
+    # Insert-only columns aren't touched by the update
+    assert existing.sector_code is None
+    assert db.query(FLDocket).filter_by(docket_number="20250002-GU").one().title == "Fuel clause"
+
+
+def test_docket_sync_counts_and_keeps_enriched_fields(db):
+    db.add(FLDocket(
+        docket_number="20250001-EI", year=2025, sequence=1,
+        utility_name="FPL", status="open", commissioner_assignments=["La Rosa"],
+    ))
+    db.commit()
+
+    stage = DocketSyncStage(db, scraper=FakeClerkOffice([
+        _docket("20250001-EI", status="closed", closed_date=date(2025, 5, 1)),
+        _docket("20250002-GU", title="Fuel clause"),
+        _docket("20250002-GU", title="Fuel clause"),
+        _docket("20250003-WU", title="Water rates"),
+    ]), batch_size=2)
+    result = stage.sync_all()
+
+    assert result.errors == []
+    assert (result.total_scraped, result.new_dockets, result.updated_dockets) == (3, 2, 1)
+
+    existing = db.query(FLDocket).filter_by(docket_number="20250001-EI").one()
+    assert existing.status == "closed"
+    assert existing.closed_date == date(2025, 5, 1)
+    assert existing.utility_name == "FPL"
+    assert existing.commissioner_assignments == ["La Rosa"]
+    assert db.query(FLDocket).count() == 3
+
+
+def test_docket_sync_retries_a_failed_batch_row_by_row(db):
+    broken = _docket("20250001-EI")
+    broken.year = None  # NOT NULL
+
+    stage = DocketSyncStage(db, scraper=FakeClerkOffice([
+        broken,
+        _docket("20250002-GU"),
+        _docket("20250003-WU"),
+    ]), batch_size=2)
+    result = stage.sync_all()
+
+    assert len(result.errors) == 1
+    assert (result.total_scraped, result.new_dockets) == (2, 2)
+    assert sorted(number for (number,) in db.query(FLDocket.docket_number)) == ["20250002-GU", "20250003-WU"]
+
+
+def test_document_sync_retries_a_failed_batch_row_by_row(db):
+    stage = DocumentSyncStage(db, scraper=FakeThunderstone([
+        ThunderstoneDocument(thunderstone_id="ts-1", title="Testimony"),
+        ThunderstoneDocument(thunderstone_id="ts-2", title=None),  # NOT NULL
+        ThunderstoneDocument(thunderstone_id="ts-3", title="Comments"),
+    ]), batch_size=10)
+    result = stage.search_and_index("rates")
+
+    assert len(result.errors) == 1
+    assert (result.total_indexed, result.new_documents) == (2, 2)
+    assert sorted(ts_id for (ts_id,) in db.query(FLDocument.thunderstone_id)) == ["ts-1", "ts-3"]
+
+
+def test_document_sync_matches_repeats_within_a_batch(db):
+    db.add(FLDocket(docket_number="20250001-EI", year=2025, sequence=1))
+    db.add(FLDocument(title="Order approving settlement", docket_number="20250001-EI", filer_name="PSC"))
+    db.commit()
+
+    stage = DocumentSyncStage(db, scraper=FakeThunderstone([
+        ThunderstoneDocument(thunderstone_id="ts-1", title="Testimony of J. Smith", docket_number="20250001-EI"),
+        # Matches the stored document by docket and title
+        ThunderstoneDocument(
+            thunderstone_id="ts-2", title="Order approving settlement",
+            docket_number="20250001-EI", document_type="order",
+        ),
+        # Unknown docket: stored without the foreign key
+        ThunderstoneDocument(thunderstone_id="ts-3", title="Comments", docket_number="20259999-XX"),
+        # Repeat of ts-1 in the same batch, now with a file
+        ThunderstoneDocument(
+            thunderstone_id="ts-1", title="Testimony of J. Smith",
+            docket_number="20250001-EI", file_url="https://example.com/ts-1.pdf",
+        ),
+    ]), batch_size=10)
+    result = stage.search_and_index("settlement")
+
+    assert result.errors == []
+    assert (result.total_indexed, result.new_documents, result.updated_documents) == (4, 2, 2)
+    assert db.query(FLDocument).count() == 3
+
+    testimony = db.query(FLDocument).filter_by(thunderstone_id="ts-1").one()
+    assert testimony.file_url == "https://example.com/ts-1.pdf"
+    order = db.query(FLDocument).filter_by(title="Order approving settlement").one()
+    assert (order.document_type, order.filer_name) == ("order", "PSC")
+    assert db.query(FLDocument).filter_by(thunderstone_id="ts-3").one().docket_number is None
+
+
+def test_copy_buffer_writes_none_as_null():
+    """Missing dates, sizes and dockets go to COPY as NULL, not as ''."""
+    rows = [
+        {"title": "Comments", "docket_number": None, "filed_date": None, "file_size_bytes": None},
+        {"title": "", "docket_number": "20250001-EI", "filed_date": date(2025, 1, 2), "file_size_bytes": 2048},
+    ]
+    buffer = _copy_buffer(rows, ["title", "docket_number", "filed_date", "file_size_bytes"])
+
+    assert buffer.read() == (
+        '"Comments",,,\n'
+        '"","20250001-EI","2025-01-02","2048"\n'
+    )
@@ -0,0 +1,217 @@
+"""
+Test the Thunderstone importer and its claims on document ids (SQLite).
+"""
+
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from core.services.job_queue import QUEUED, SUCCEEDED
+from florida.config import FloridaConfig
+from florida.models import FLDocket, FLDocument, FLImportTerm, FLThunderstoneId
+from florida.pipeline import document_sync
+from florida.pipeline.document_sync import DocumentSyncStage
+from florida.scrapers.thunderstone import FloridaThunderstoneClient, ThunderstoneDocument
+from florida.services import thunderstone_import
+from florida.services.thunderstone_import import (
+    ThunderstoneImporter,
+    import_queue,
+    run_comprehensive_import,
+    run_import_worker,
+    seed_frontier,
+)
+
+
+class FakeThunderstone:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def search(self, query, profile='library', limit=100):
+        return iter(self.documents)
+
+
+class FakeSearchPages:
+    """search_pages over {term: [page of documents, ...]}, failing where told."""
+
+    def __init__(self, pages, fail_after=None):
+        self.pages = pages
+        self.fail_after = fail_after or {}
+        self.calls = []
+
+    def search_pages(self, term, profile='library', start_page=1, limit=None):
+        self.calls.append((term, start_page))
+        for page, docs in enumerate(self.pages[term][start_page - 1:], start=start_page):
+            yield page, docs
+            if self.fail_after.get(term) == page:
+                del self.fail_after[term]
+                raise ConnectionError("connection reset")
+
+
+class PacedSearchPages:
+    """One empty page per term, paced like a worker's Thunderstone client."""
+
+    def __init__(self, config, starts):
+        self.client = SimpleNamespace(config=config, _last_request_time=0.0, _rate_lock=threading.Lock())
+        self.starts = starts
+
+    def search_pages(self, term, profile='library', start_page=1, limit=None):
+        FloridaThunderstoneClient._rate_limit(self.client)
+        self.starts.append(time.time())
+        yield start_page, []
+
+
+class ThreadContext:
+    """multiprocessing context stand-in that runs workers as threads."""
+
+    def Process(self, target, args=(), name=None):
+        return threading.Thread(target=target, args=args, name=name)
+
+
+def _doc(thunderstone_id, title="Order"):
+    return ThunderstoneDocument(thunderstone_id=thunderstone_id, title=title, profile="orders")
+
+
+@pytest.fixture
+def workers(session_factory, monkeypatch):
+    """Run import workers against the test database with a fake scraper."""
+    scraper = FakeSearchPages({})
+    monkeypatch.setattr(thunderstone_import, "SessionLocal", session_factory)
+    monkeypatch.setattr(thunderstone_import, "FloridaThunderstoneScraper", lambda config=None: scraper)
+    return scraper
+
+
+def test_seed_frontier_adds_only_new_terms(db):
+    assert seed_frontier(db, ["orders", "library"], ["PSC-2024-01", "FPL"]) == 4
+    assert seed_frontier(db, ["orders", "library"], ["PSC-2024-01", "FPL"]) == 0
+    assert seed_frontier(db, ["orders"], ["FPL", "TECO"]) == 1
+    assert db.query(FLImportTerm).count() == 5
+
+
+def test_import_batch_skips_known_and_claimed_ids(db):
+    db.add(FLDocument(thunderstone_id="ts-1", title="Already stored"))
+    db.add(FLThunderstoneId(thunderstone_id="ts-2"))
+    db.commit()
+
+    importer = ThunderstoneImporter()
+    inserted = importer.import_batch(db, [
+        _doc("ts-1"),
+        _doc("ts-2"),
+        _doc("ts-3", "Order in Docket No. 20240001-EI, Florida Power & Light rate case"),
+        _doc("ts-3"),
+        _doc(None, "Untracked notice"),
+    ])
+    db.commit()
+
+    assert inserted == 2
+    assert importer.stats.documents_skipped == 3
+    assert {doc.thunderstone_id for doc in db.query(FLDocument)} == {"ts-1", "ts-3", None}
+    docket = db.query(FLDocket).one()
+    assert (docket.docket_number, docket.utility_name) == ("20240001-EI", "Florida Power & Light Company")
+    assert importer.stats.dockets_created == 1
+
+
+def test_released_term_resumes_after_last_page(db, workers):
+    workers.pages = {"FPL": [[_doc("ts-1")], [_doc("ts-2")], [_doc("ts-3")]]}
+    workers.fail_after = {"FPL": 2}
+    seed_frontier(db, ["orders"], ["FPL"])
+
+    run_import_worker(worker_id="w1")
+    term = db.query(FLImportTerm).one()
+    db.refresh(term)
+    assert (term.status, term.last_page) == (QUEUED, 2)
+
+    # Retry without waiting out the backoff
+    term.run_after = datetime.utcnow()
+    db.commit()
+    run_import_worker(worker_id="w1")
+
+    db.refresh(term)
+    assert term.status == SUCCEEDED
+    assert workers.calls == [("FPL", 1), ("FPL", 3)]
+    assert db.query(FLDocument).count() == 3
+
+
+def test_rerun_skips_finished_terms(db, workers):
+    workers.pages = {"FPL": [[_doc("ts-1")]], "TECO": [[_doc("ts-2")], [_doc("ts-1")]]}
+    seed_frontier(db, ["orders"], ["FPL", "TECO"])
+
+    assert run_import_worker(worker_id="w1") == 2
+    assert seed_frontier(db, ["orders"], ["FPL", "TECO"]) == 0
+    assert run_import_worker(worker_id="w1") == 0
+
+    assert sorted(workers.calls) == [("FPL", 1), ("TECO", 1)]
+    assert import_queue.counts(db) == {SUCCEEDED: 2}
+    assert db.query(FLDocument).count() == 2
+
+
+def test_importer_and_document_sync_share_claims(db):
+    importer = ThunderstoneImporter()
+    importer.import_batch(db, [ThunderstoneDocument(thunderstone_id="ts-1", title="Order on rates")])
+    db.commit()
+
+    # Document sync updates the imported ts-1 and claims its new ts-2, so
+    # the importer won't insert ts-2 again
+    result = DocumentSyncStage(db, scraper=FakeThunderstone([
+        ThunderstoneDocument(thunderstone_id="ts-1", title="Order on rates", file_url="https://example.com/1.pdf"),
+        ThunderstoneDocument(thunderstone_id="ts-2", title="Staff recommendation"),
+    ]), batch_size=10).search_and_index("rates")
+    assert (result.new_documents, result.updated_documents) == (1, 1)
+    assert {claim.thunderstone_id for claim in db.query(FLThunderstoneId)} == {"ts-1", "ts-2"}
+
+    # A claim without a stored document (e.g. deleted since) doesn't block the insert
+    db.add(FLThunderstoneId(thunderstone_id="ts-3"))
+    db.commit()
+    stage = DocumentSyncStage(db, scraper=FakeThunderstone([]), batch_size=10)
+    assert stage._upsert_documents([ThunderstoneDocument(thunderstone_id="ts-3", title="Comments")]) == 1
+    db.commit()
+
+    assert importer.import_batch(db, [ThunderstoneDocument(thunderstone_id="ts-2", title="Staff recommendation")]) == 0
+    assert db.query(FLDocument).filter_by(thunderstone_id="ts-1").one().file_url == "https://example.com/1.pdf"
+
+
+def test_document_sync_yields_to_a_concurrent_claim(db, monkeypatch):
+    claim = document_sync.bulk_insert_missing
+
+    def racing_claim(session, table, rows, **kwargs):
+        # An importer claims and stores ts-9 after the sync looked it up
+        session.add(FLThunderstoneId(thunderstone_id="ts-9"))
+        session.add(FLDocument(thunderstone_id="ts-9", title="Imported order"))
+        session.flush()
+        return claim(session, table, rows, **kwargs)
+
+    monkeypatch.setattr(document_sync, "bulk_insert_missing", racing_claim)
+    stage = DocumentSyncStage(db, scraper=FakeThunderstone([]), batch_size=10)
+    new = stage._upsert_documents([
+        ThunderstoneDocument(thunderstone_id="ts-9", title="Imported order", file_url="https://example.com/9.pdf"),
+    ])
+    db.commit()
+
+    assert new == 0
+    stored = db.query(FLDocument).filter_by(thunderstone_id="ts-9").one()
+    assert stored.file_url == "https://example.com/9.pdf"
+
+
+def test_comprehensive_import_workers_share_the_rate_limit(db, session_factory, monkeypatch):
+    starts = []
+    monkeypatch.setattr(thunderstone_import, "SessionLocal", session_factory)
+    monkeypatch.setattr(thunderstone_import, "get_config", lambda: FloridaConfig(api_rate_limit=20.0))
+    monkeypatch.setattr(
+        thunderstone_import, "FloridaThunderstoneScraper",
+        lambda config=None: PacedSearchPages(config, starts),
+    )
+    monkeypatch.setattr(thunderstone_import.multiprocessing, "get_context", lambda method: ThreadContext())
+    monkeypatch.setattr(thunderstone_import, "build_search_terms", lambda: [f"term {i}" for i in range(30)])
+
+    counts = run_comprehensive_import(profiles=["orders"], workers=4)
+
+    assert counts == {SUCCEEDED: 30}
+    starts.sort()
+    # No one-second window holds more than api_rate_limit request starts
+    busiest = max(
+        sum(1 for other in starts if start <= other < start + 0.99)
+        for start in starts
+    )
+    assert busiest <= 20
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Load-test the read-heavy API routes on the sync and async database paths.
+
+Seeds hearings (unless --database-url points at existing data), then for
+each path starts the app in a subprocess with ASYNC_DB_ROUTES set and
+drives it with --concurrency clients for --duration seconds:
+
+- sync: routes run in the threadpool on the sync engine
+- async: routes run on the event loop via the async engine (run_sync)
+
+Requests go through httpx's in-process ASGI transport, so the numbers
+measure the app and database, not the network. The default SQLite seed
+only checks both paths work; ASYNC_DB_ROUTES stays off until a run
+against PostgreSQL (with the production cache backend) shows a gain.
+
+Usage:
+    python scripts/benchmark_async_routes.py --concurrency 100
+    python scripts/benchmark_async_routes.py --database-url postgresql://localhost/psc_bench
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+ENDPOINTS = [
+    "/api/hearings?limit=50",
+    "/api/search?q=rate%20case&limit=20",
+    "/api/stats",
+    "/api/search/facets",
+]
+
+
+def seed(count: int):
+    """Hearings with searchable full text."""
+    from src.core.database import SessionLocal, init_db
+    from src.core.models.hearing import Hearing
+
+    init_db()
+    db = SessionLocal()
+    try:
+        if db.query(Hearing.id).first():
+            return
+        for i in range(count):
+            db.add(Hearing(
+                state_code="FL",
+                title=f"Hearing {i}",
+                hearing_type="Agenda Conference" if i % 3 else "Rate Case",
+                full_text=f"Hearing {i} on the rate case and storm cost recovery " * 20,
+            ))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def drive(concurrency: int, duration: float) -> dict:
+    """Run clients against the app until duration elapses."""
+    import httpx
+    from src.api.main import create_app
+
+    # Disable the response cache so every request reaches the database
+    from src.api.cache import response_cache
+    response_cache.enabled = False
+
+    app = create_app()
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def worker(n: int):
+            nonlocal errors
+            i = n
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await client.get(ENDPOINTS[i % len(ENDPOINTS)])
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    errors += 1
+                i += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*[worker(n) for n in range(concurrency)])
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test sync vs async database routes")
+    parser.add_argument("--database-url", help="Database to test (default: temp SQLite file)")
+    parser.add_argument("--hearings", type=int, default=2000, help="Hearings to seed")
+    parser.add_argument("--concurrency", type=int, default=100, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per run")
+    parser.add_argument("--child", choices=["sync", "async"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = asyncio.run(drive(args.concurrency, args.duration))
+        print(json.dumps(result))
+        return
+
+    if not args.database_url:
+        temp_dir = tempfile.mkdtemp(prefix="async_bench_")
+        args.database_url = f"sqlite:///{temp_dir}/bench.db"
+    os.environ["DATABASE_URL"] = args.database_url
+    seed(args.hearings)
+
+    print(f"{args.concurrency} clients, {args.duration:.0f}s per path, {args.database_url.split('://')[0]}")
+    print(f"{'path':<6} {'requests':>9} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'errors':>7}")
+    for path in ("sync", "async"):
+        env = dict(os.environ, ASYNC_DB_ROUTES="true" if path == "async" else "false", LOG_LEVEL="WARNING")
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", path,
+             "--concurrency", str(args.concurrency), "--duration", str(args.duration)],
+            env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{path:<6} {result['requests']:>9} {result['rps']:>8.1f} "
+            f"{result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} {result['errors']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
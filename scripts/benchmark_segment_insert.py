@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark persisting transcript segments.
+
+Creates a hearing and times saving N synthetic segments with:
+- legacy: one ORM TranscriptSegment per segment via db.add, flushed on commit
+- bulk: src.core.database.bulk_insert (COPY on PostgreSQL, batched INSERT otherwise)
+
+Usage:
+    python scripts/benchmark_segment_insert.py --segments 10000
+    python scripts/benchmark_segment_insert.py --database-url postgresql://localhost/psc_bench
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def make_segments(count: int):
+    """Whisper-shaped segments of ~20 words each."""
+    return [
+        {
+            "index": i,
+            "start": i * 6.0,
+            "end": i * 6.0 + 5.5,
+            "text": f"Segment {i} the commission will now hear testimony on the rate case from the witness for staff",
+        }
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark transcript segment inserts")
+    parser.add_argument("--database-url", help="Database to benchmark (default: temp SQLite file)")
+    parser.add_argument("--segments", type=int, default=10000, help="Segments per run")
+    args = parser.parse_args()
+
+    temp_dir = None
+    if not args.database_url:
+        temp_dir = tempfile.mkdtemp(prefix="segment_bench_")
+        args.database_url = f"sqlite:///{temp_dir}/bench.db"
+    os.environ["DATABASE_URL"] = args.database_url
+
+    from src.core.database import SessionLocal, bulk_insert, engine
+    from src.core.models import Base
+    from src.core.models.hearing import Hearing
+    from src.core.models.transcript import TranscriptSegment
+
+    Base.metadata.create_all(bind=engine)
+    segments = make_segments(args.segments)
+
+    db = SessionLocal()
+    try:
+        hearing = Hearing(state_code="FL", title="Segment insert benchmark")
+        db.add(hearing)
+        db.commit()
+
+        start = time.perf_counter()
+        for seg in segments:
+            db.add(TranscriptSegment(
+                hearing_id=hearing.id,
+                segment_index=seg["index"],
+                start_time=seg["start"],
+                end_time=seg["end"],
+                text=seg["text"],
+            ))
+        db.commit()
+        legacy_time = time.perf_counter() - start
+        print(f"legacy: {len(segments)} segments in {legacy_time:.2f}s")
+
+        db.query(TranscriptSegment).filter(TranscriptSegment.hearing_id == hearing.id).delete()
+        db.commit()
+
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "hearing_id": hearing.id,
+                "segment_index": seg["index"],
+                "start_time": seg["start"],
+                "end_time": seg["end"],
+                "text": seg["text"],
+                "speaker_label": None,
+            }
+            for seg in segments
+        ]
+        start = time.perf_counter()
+        bulk_insert(db, TranscriptSegment.__table__, rows)
+        db.commit()
+        bulk_time = time.perf_counter() - start
+        print(f"bulk:   {len(segments)} segments in {bulk_time:.2f}s")
+        print(f"speedup: {legacy_time / bulk_time:.1f}x")
+
+    finally:
+        db.close()
+        if temp_dir:
+            Base.metadata.drop_all(bind=engine)
+            engine.dispose()
+            for path in Path(temp_dir).iterdir():
+                path.unlink()
+            os.rmdir(temp_dir)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
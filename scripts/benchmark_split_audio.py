@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark audio splitting for chunked Whisper transcription.
+
+Generates a synthetic multi-hour WAV and times:
+- legacy: one ffmpeg run per 10-minute chunk, seeking on the output side
+  (every run decodes the source from the start, O(N^2) overall)
+- segment: TranscribeStage._split_audio, one ffmpeg pass with the segment muxer
+
+Usage:
+    python scripts/benchmark_split_audio.py --hours 3
+    python scripts/benchmark_split_audio.py --hours 6 --skip-legacy
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.pipeline.transcribe import TranscribeStage
+
+LEGACY_CHUNK_SECONDS = 600
+
+
+def make_wav(path: Path, seconds: int):
+    """Write a mono 16kHz WAV of pink noise (compresses like speech, unlike a sine)."""
+    subprocess.run(
+        [
+            "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+            "-f", "lavfi",
+            "-i", f"anoisesrc=color=pink:sample_rate=16000:duration={seconds}",
+            "-ac", "1",
+            str(path),
+        ],
+        check=True,
+    )
+
+
+def split_legacy(audio_path: Path, duration: int, out_dir: Path) -> int:
+    """Previous splitter: re-decode from the start for every chunk."""
+    count = 0
+    for i in range(duration // LEGACY_CHUNK_SECONDS + 1):
+        chunk_path = out_dir / f"chunk_{i:03d}.mp3"
+        subprocess.run(
+            [
+                "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+                "-i", str(audio_path),
+                "-ss", str(i * LEGACY_CHUNK_SECONDS),
+                "-t", str(LEGACY_CHUNK_SECONDS),
+                "-c:a", "libmp3lame",
+                "-q:a", "4",
+                str(chunk_path),
+            ],
+            capture_output=True,
+        )
+        if chunk_path.exists() and chunk_path.stat().st_size > 0:
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark audio splitting")
+    parser.add_argument("--hours", type=float, default=3.0, help="Synthetic audio length")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time the segment splitter")
+    args = parser.parse_args()
+
+    if not shutil.which("ffmpeg"):
+        print("ffmpeg not found on PATH")
+        return 1
+
+    duration = int(args.hours * 3600)
+    work_dir = Path(tempfile.mkdtemp(prefix="split_bench_"))
+
+    try:
+        wav = work_dir / "synthetic.wav"
+        print(f"Generating {args.hours}h synthetic WAV...")
+        make_wav(wav, duration)
+        print(f"  {wav.stat().st_size / 1024 / 1024:.0f} MB")
+
+        if not args.skip_legacy:
+            legacy_dir = work_dir / "legacy"
+            legacy_dir.mkdir()
+            start = time.perf_counter()
+            count = split_legacy(wav, duration, legacy_dir)
+            legacy_time = time.perf_counter() - start
+            print(f"legacy:  {count} chunks in {legacy_time:.1f}s")
+
+        stage = TranscribeStage(audio_dir=work_dir)
+        start = time.perf_counter()
+        chunks = stage._split_audio(wav, duration)
+        segment_time = time.perf_counter() - start
+        largest = max(path.stat().st_size for path, _ in chunks)
+        print(
+            f"segment: {len(chunks)} chunks in {segment_time:.1f}s "
+            f"(largest {largest / 1024 / 1024:.1f} MB)"
+        )
+        stage._cleanup_chunks(chunks)
+
+        if not args.skip_legacy:
+            print(f"speedup: {legacy_time / segment_time:.1f}x")
+
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
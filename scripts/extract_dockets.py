@@ -24,10 +24,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dotenv import load_dotenv
 load_dotenv()
 
-from openai import OpenAI
 from sqlalchemy import text
 from app.database import SessionLocal
 from app.services.notifications import notify_watchlist_users
+from core.services.llm import Message, get_llm_service
 
 logging.basicConfig(
     level=logging.INFO,
@@ -35,7 +35,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-client = OpenAI()
+# Shared rate-limited client (LLM_REQUESTS_PER_MINUTE / LLM_TOKENS_PER_MINUTE)
+llm = get_llm_service("gpt-4o-mini")
 
 EXTRACTION_PROMPT = """Analyze this transcript from a Public Service Commission hearing and extract all official proceeding identifiers.
 
@@ -73,30 +74,27 @@ TRANSCRIPT:
 """
 
 
-def extract_dockets_from_text(transcript_text: str, state_code: str) -> dict:
+async def extract_dockets_from_text(transcript_text: str, state_code: str) -> dict:
     """Extract docket identifiers from transcript text using GPT-4."""
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            max_tokens=2000,
-            response_format={"type": "json_object"},
-            messages=[
-                {
-                    "role": "user",
-                    "content": EXTRACTION_PROMPT.format(
-                        state=state_code,
-                        transcript=transcript_text[:20000]  # Limit context
-                    )
-                }
-            ]
-        )
+    response = await llm.acomplete(
+        [
+            Message(
+                "user",
+                EXTRACTION_PROMPT.format(
+                    state=state_code,
+                    transcript=transcript_text[:20000]  # Limit context
+                ),
+            )
+        ],
+        max_tokens=2000,
+        json_mode=True,
+    )
 
-        result = json.loads(response.choices[0].message.content)
-        return result
+    if not response.success:
+        logger.error(f"Extraction failed: {response.error}")
+        return {"identifiers": [], "error": response.error}
 
-    except Exception as e:
-        logger.error(f"Extraction failed: {e}")
-        return {"identifiers": [], "error": str(e)}
+    return response.parsed_json
 
 
 def get_or_create_docket(db, state_id: int, state_code: str, identifier: dict) -> int:
@@ -225,7 +223,7 @@ async def process_hearing(db, hearing_id: int, notify: bool = True) -> dict:
     logger.info(f"Processing hearing {hearing_id}: {hearing.title[:50]}...")
 
     # Extract dockets
-    result = extract_dockets_from_text(transcript_text, hearing.state_code)
+    result = await extract_dockets_from_text(transcript_text, hearing.state_code)
 
     if result.get("error"):
         return result
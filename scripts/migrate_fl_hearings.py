@@ -228,6 +228,18 @@ def migrate_hearings(
                     })
                     stats['segments_migrated'] += 1
 
+                if not dry_run:
+                    # Keep the denormalized counts the dashboard lists read
+                    fl_db.execute(text("""
+                        UPDATE fl_hearings
+                        SET segment_count = :segment_count, word_count = :word_count
+                        WHERE id = :hearing_id
+                    """), {
+                        "hearing_id": new_id,
+                        "segment_count": len(segments),
+                        "word_count": sum(len((seg.text or "").split()) for seg in segments),
+                    })
+
             except Exception as e:
                 logger.error(f"  Error migrating segments for hearing {old_id}: {e}")
                 stats['errors'].append(f"Segments for hearing {old_id}: {e}")
@@ -32,6 +32,7 @@ load_dotenv()
 
 from app.database import SessionLocal
 from app.models.database import Source, Hearing, State
+from core.utils.http import HTTPCache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -112,6 +113,12 @@ class ScraperOrchestrator:
         self._stop_requested = threading.Event()
         self._lock = threading.Lock()
         self._thread: Optional[threading.Thread] = None
+        # Feeds and meeting lists unchanged since their last successful
+        # scrape are skipped (empty path disables)
+        self.http_cache = HTTPCache(
+            os.getenv("SCRAPER_HTTP_CACHE_PATH", "data/http_cache.sqlite3"),
+            max_entries=int(os.getenv("SCRAPER_HTTP_CACHE_MAX_ENTRIES", "10000")),
+        )
 
     @property
     def is_running(self) -> bool:
@@ -318,7 +325,7 @@ class ScraperOrchestrator:
 
         try:
             state_code, agency_code = parse_adminmonitor_url(source.url)
-            scraper = AdminMonitorScraper(state_code, agency_code)
+            scraper = AdminMonitorScraper(state_code, agency_code, cache=self.http_cache)
 
             logger.info(f"Scraping AdminMonitor: {source.name}")
             meetings = scraper.scrape_all_meetings(include_future=False, fetch_details=True)
@@ -357,6 +364,8 @@ class ScraperOrchestrator:
                 results["new_hearings"] += 1
 
             self._update_source_status(db, source, results, meetings, dry_run, date_attr="meeting_date")
+            if not dry_run and not self._stop_requested.is_set():
+                scraper.commit_cache()
 
         except Exception as e:
             results["errors"].append(str(e))
@@ -452,7 +461,7 @@ class ScraperOrchestrator:
         }
 
         try:
-            scraper = create_scraper(source.url)
+            scraper = create_scraper(source.url, cache=self.http_cache)
 
             logger.info(f"Scraping RSS: {source.name}")
             items = scraper.fetch_items()
@@ -493,6 +502,8 @@ class ScraperOrchestrator:
                 results["new_hearings"] += 1
 
             self._update_source_status(db, source, results, items, dry_run, date_attr="pub_date")
+            if not dry_run and not self._stop_requested.is_set():
+                scraper.commit_cache()
 
         except Exception as e:
             results["errors"].append(str(e))
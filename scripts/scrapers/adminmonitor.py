@@ -20,6 +20,8 @@ from urllib.parse import urljoin
 import requests
 from bs4 import BeautifulSoup
 
+from core.utils.http import CachedResponse, HTTPCache
+
 logger = logging.getLogger(__name__)
 
 # Browser-like headers to avoid 403 blocks
@@ -51,7 +53,7 @@ class AdminMonitorScraper:
 
     BASE_URL = "https://www.adminmonitor.com"
 
-    def __init__(self, state_code: str, agency_code: str, timeout: int = 30):
+    def __init__(self, state_code: str, agency_code: str, timeout: int = 30, cache: Optional[HTTPCache] = None):
         """
         Initialize scraper for a specific state/agency.
 
@@ -59,14 +61,29 @@ class AdminMonitorScraper:
             state_code: Two-letter state code (e.g., 'ca', 'tx')
             agency_code: Agency identifier (e.g., 'cpuc', 'puct')
             timeout: Request timeout in seconds
+            cache: HTTP cache for conditional requests; an unchanged
+                meeting list yields no meetings until commit_cache()
+                records a new one
         """
         self.state_code = state_code.lower()
         self.agency_code = agency_code.lower()
         self.timeout = timeout
         self.session = requests.Session()
         self.session.headers.update(DEFAULT_HEADERS)
+        self.cache = cache or HTTPCache()
+        self.listings: list[CachedResponse] = []
         self.base_agency_url = f"{self.BASE_URL}/{self.state_code}/{self.agency_code}/"
 
+    @property
+    def unchanged(self) -> bool:
+        """Whether every meeting list fetched was as it was at the last commit_cache()."""
+        return bool(self.listings) and not any(listing.changed for listing in self.listings)
+
+    def commit_cache(self):
+        """Record the fetched meeting lists as processed, so identical lists are skipped next time."""
+        for listing in self.listings:
+            self.cache.commit(listing)
+
     def _parse_date_from_url(self, url: str) -> Optional[date]:
         """Extract date from AdminMonitor URL path (e.g., /20251218/)."""
         match = re.search(r'/(\d{8})/?', url)
@@ -102,20 +119,24 @@ class AdminMonitorScraper:
             direction: "Past Meetings" or "Future Meetings"
 
         Returns:
-            List of AdminMonitorMeeting objects
+            List of AdminMonitorMeeting objects (empty when the list is unchanged)
         """
         meetings = []
 
         try:
             # POST request to get meeting list
-            response = self.session.post(
+            listing = self.cache.fetch(
+                self.session.post,
                 self.base_agency_url,
                 data={"dir": direction},
                 timeout=self.timeout
             )
-            response.raise_for_status()
+            self.listings.append(listing)
+            if not listing.changed:
+                logger.info(f"{direction} unchanged since last scrape: {self.base_agency_url}")
+                return meetings
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(listing.content, 'html.parser')
 
             # Find all meeting links in the listing
             # Pattern: <a href="/ca/cpuc/voting_meeting/20251218/">Voting Meeting</a>
@@ -169,10 +190,11 @@ class AdminMonitorScraper:
             Updated meeting object with video_url and other details
         """
         try:
-            response = self.session.get(meeting.source_url, timeout=self.timeout)
-            response.raise_for_status()
+            # Detail pages are parsed whatever their state, so keep them straight away
+            page = self.cache.fetch(self.session.get, meeting.source_url, timeout=self.timeout)
+            self.cache.commit(page)
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(page.content, 'html.parser')
 
             # Find video source - AdminMonitor uses HLS streams
             # Pattern: <source src="https://...cloudfront.net/.../master.m3u8" type="application/x-mpegURL" />
@@ -267,10 +289,10 @@ def parse_adminmonitor_url(url: str) -> tuple[str, str]:
     return match.group(1), match.group(2)
 
 
-def create_scraper_from_url(url: str) -> AdminMonitorScraper:
+def create_scraper_from_url(url: str, cache: Optional[HTTPCache] = None) -> AdminMonitorScraper:
     """Create a scraper instance from an AdminMonitor URL."""
     state_code, agency_code = parse_adminmonitor_url(url)
-    return AdminMonitorScraper(state_code, agency_code)
+    return AdminMonitorScraper(state_code, agency_code, cache=cache)
 
 
 if __name__ == "__main__":
@@ -20,6 +20,8 @@ import xml.etree.ElementTree as ET
 
 import requests
 
+from core.utils.http import CachedResponse, HTTPCache
+
 logger = logging.getLogger(__name__)
 
 # Standard headers
@@ -59,20 +61,34 @@ class RSSItem:
 class RSSFeedScraper:
     """Scraper for RSS/Atom feeds."""
 
-    def __init__(self, feed_url: str, timeout: int = 30):
+    def __init__(self, feed_url: str, timeout: int = 30, cache: Optional[HTTPCache] = None):
         """
         Initialize RSS scraper.
 
         Args:
             feed_url: URL of the RSS/Atom feed
             timeout: Request timeout in seconds
+            cache: HTTP cache for conditional requests; an unchanged feed
+                yields no items until commit_cache() records a new one
         """
         self.feed_url = feed_url
         self.timeout = timeout
         self.session = requests.Session()
         self.session.headers.update(DEFAULT_HEADERS)
+        self.cache = cache or HTTPCache()
+        self.feed: Optional[CachedResponse] = None
         self._feed_type = None
 
+    @property
+    def unchanged(self) -> bool:
+        """Whether the last fetch found the feed as it was at the last commit_cache()."""
+        return self.feed is not None and not self.feed.changed
+
+    def commit_cache(self):
+        """Record the fetched feed as processed, so an identical feed is skipped next time."""
+        if self.feed is not None:
+            self.cache.commit(self.feed)
+
     def _generate_external_id(self, item_data: dict) -> str:
         """Generate unique external ID for an RSS item."""
         # Use guid if available
@@ -310,17 +326,19 @@ class RSSFeedScraper:
         Fetch and parse all items from the RSS feed.
 
         Returns:
-            List of RSSItem objects
+            List of RSSItem objects (empty when the feed is unchanged)
         """
         items = []
 
         try:
             logger.info(f"Fetching RSS feed: {self.feed_url}")
-            response = self.session.get(self.feed_url, timeout=self.timeout)
-            response.raise_for_status()
+            self.feed = self.cache.fetch(self.session.get, self.feed_url, timeout=self.timeout)
+            if self.unchanged:
+                logger.info(f"Feed unchanged since last scrape: {self.feed_url}")
+                return items
 
             # Parse XML
-            root = ET.fromstring(response.content)
+            root = ET.fromstring(self.feed.content)
 
             # Detect feed type and parse accordingly
             if root.tag == 'rss' or root.find('channel') is not None:
@@ -427,12 +445,13 @@ class FloridaChannelScraper(RSSFeedScraper):
         return result
 
 
-def create_scraper(feed_url: str) -> RSSFeedScraper:
+def create_scraper(feed_url: str, cache: Optional[HTTPCache] = None) -> RSSFeedScraper:
     """
     Create appropriate scraper based on feed URL.
 
     Args:
         feed_url: URL of the RSS feed
+        cache: HTTP cache for conditional requests
 
     Returns:
         Appropriate scraper instance
@@ -440,11 +459,11 @@ def create_scraper(feed_url: str) -> RSSFeedScraper:
     url_lower = feed_url.lower()
 
     if 'granicus.com' in url_lower:
-        return GranicusScraper(feed_url)
+        return GranicusScraper(feed_url, cache=cache)
     elif 'thefloridachannel.org' in url_lower:
-        return FloridaChannelScraper(feed_url)
+        return FloridaChannelScraper(feed_url, cache=cache)
     else:
-        return RSSFeedScraper(feed_url)
+        return RSSFeedScraper(feed_url, cache=cache)
 
 
 def infer_hearing_type(title: str, categories: list = None) -> str:
@@ -0,0 +1,429 @@
+"""
+Response cache for hot read endpoints.
+
+Facets, suggestions and the dashboard's lookup lists are the same for
+every visitor until the pipeline or a scraper commits new data, so routes
+can cache their result:
+
+    @router.get("/hearing-types")
+    @response_cache.cached("stats.hearing_types", tags=[HEARINGS])
+    def get_hearing_types(db: Session = Depends(get_db)):
+        ...
+
+Entries are keyed by route name and arguments (the db session excluded)
+and expire after a TTL. Each tag has a generation counter that is part of
+the key; invalidating a tag bumps it, so every entry derived from that
+data misses on the next request and ages out of the store. Writers
+trigger invalidation through src.core.services.invalidation.
+
+Backends:
+- MemoryBackend: per-process LRU with TTL (default).
+- SharedBackend: JSON values in a Redis-compatible store, shared by all
+  API processes; invalidations from worker processes reach it too.
+  LocalRedisClient is an in-process stand-in for tests and development.
+
+Per-endpoint hit/miss counters are kept for /admin/cache.
+"""
+
+import asyncio
+import functools
+import inspect
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+
+from src.core.config import Settings, get_settings
+from src.core.services import invalidation
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+# ============================================================================
+# BACKENDS
+# ============================================================================
+
+class CacheBackend(ABC):
+    """Key/value store with per-entry TTL and counters."""
+
+    name = ""
+
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """Value for key, or _MISSING."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store value for ttl seconds."""
+
+    @abstractmethod
+    def counters(self, keys: Sequence[str]) -> List[int]:
+        """Current value of each counter (0 if never incremented)."""
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Increment a counter; counters don't expire."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop all entries and counters."""
+
+    def size(self) -> Optional[int]:
+        """Number of stored entries, if known."""
+        return None
+
+
+class MemoryBackend(CacheBackend):
+    """
+    Process-local LRU store with TTL.
+
+    Holds at most max_entries values; the least recently used is evicted
+    first. Values are stored as-is, not copied.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def counters(self, keys: Sequence[str]) -> List[int]:
+        with self._lock:
+            return [self._counters.get(key, 0) for key in keys]
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+    def size(self) -> Optional[int]:
+        return len(self._entries)
+
+
+class LocalRedisClient:
+    """
+    In-process stand-in for the subset of redis.Redis that SharedBackend uses.
+
+    Values are kept as the serialized strings a real server would hold.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[Optional[float], Any]] = {}
+        self._lock = threading.Lock()
+
+    def _live(self, key: str) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._live(key)
+
+    def mget(self, keys: Sequence[str]) -> List[Optional[str]]:
+        with self._lock:
+            return [self._live(key) for key in keys]
+
+    def set(self, key: str, value: str, ex: Optional[float] = None) -> bool:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ex if ex else None, value)
+        return True
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = int(self._live(key) or 0) + 1
+            self._data[key] = (None, str(value))
+            return value
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(1 for key in keys if self._data.pop(key, None) is not None)
+
+    def scan_iter(self, match: str):
+        prefix = match.rstrip("*")
+        with self._lock:
+            keys = [key for key in self._data if key.startswith(prefix)]
+        return iter(keys)
+
+
+class SharedBackend(CacheBackend):
+    """
+    Cache in a Redis-compatible store, shared across processes.
+
+    Values are stored as JSON, so cached results must be JSON-encodable
+    (ResponseCache encodes them first). Store errors are logged and
+    treated as misses: the endpoint still answers from the database.
+    """
+
+    name = "shared"
+
+    def __init__(self, client, prefix: str = "psc:cache:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "psc:cache:") -> "SharedBackend":
+        import redis
+        return cls(redis.Redis.from_url(url, decode_responses=True), prefix=prefix)
+
+    def get(self, key: str) -> Any:
+        try:
+            raw = self.client.get(self.prefix + key)
+        except Exception as e:
+            logger.warning(f"Shared cache read failed: {e}")
+            return _MISSING
+        return _MISSING if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        try:
+            self.client.set(self.prefix + key, json.dumps(value), ex=max(int(ttl), 1))
+        except Exception as e:
+            logger.warning(f"Shared cache write failed: {e}")
+
+    def counters(self, keys: Sequence[str]) -> List[int]:
+        if not keys:
+            return []
+        try:
+            values = self.client.mget([self.prefix + key for key in keys])
+        except Exception as e:
+            logger.warning(f"Shared cache read failed: {e}")
+            # Unknown generations: a key no entry was stored under
+            return [-1] * len(keys)
+        return [int(value or 0) for value in values]
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(self.prefix + key))
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=f"{self.prefix}*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+def get_cache_backend(settings: Settings) -> CacheBackend:
+    """Backend from settings: "memory", "redis" (api_cache_url) or "local"."""
+    name = settings.api_cache_backend
+    if name == "memory":
+        return MemoryBackend(max_entries=settings.api_cache_max_entries)
+    if name == "redis":
+        if not settings.api_cache_url:
+            raise ValueError("API_CACHE_URL is required for the redis cache backend")
+        return SharedBackend.from_url(settings.api_cache_url)
+    if name == "local":
+        return SharedBackend(LocalRedisClient())
+    raise ValueError(f"Unknown cache backend: {name}")
+
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+@dataclass
+class EndpointMetrics:
+    """Hit/miss counters for one cached endpoint (this process)."""
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+
+class ResponseCache:
+    """
+    Route-level result cache with tag invalidation and hit-ratio metrics.
+
+    Usage:
+        response_cache = ResponseCache(MemoryBackend(), default_ttl=300)
+
+        @router.get("/facets")
+        @response_cache.cached("search.facets", tags=["hearings", "analyses"])
+        def get_search_facets(state_code: str = None, db: Session = Depends(get_db)):
+            ...
+
+        response_cache.invalidate("analyses")
+        response_cache.metrics()  # {"search.facets": {"hits": ..., "hit_ratio": ...}}
+    """
+
+    def __init__(self, backend: CacheBackend, default_ttl: float = 300, enabled: bool = True):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.enabled = enabled
+        self._metrics: Dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "ResponseCache":
+        return cls(
+            get_cache_backend(settings),
+            default_ttl=settings.api_cache_ttl_seconds,
+            enabled=settings.api_cache_ttl_seconds > 0,
+        )
+
+    # --- decorator ---
+
+    def cached(
+        self,
+        name: str,
+        tags: Iterable[str] = (),
+        ttl: Optional[float] = None,
+    ) -> Callable:
+        """
+        Cache a route's result.
+
+        Args:
+            name: Endpoint name in keys and metrics (e.g. "search.facets")
+            tags: Invalidation topics the result is derived from
+            ttl: Seconds to keep a result (default_ttl if None)
+
+        Place it below the router decorator; the wrapped function keeps its
+        signature, so FastAPI still sees the parameters and dependencies.
+        Results are stored JSON-encoded (as the response would be).
+        """
+        tags = tuple(sorted(tags))
+        with self._lock:
+            self._metrics.setdefault(name, EndpointMetrics())
+
+        def decorator(func: Callable) -> Callable:
+            signature = inspect.signature(func)
+
+            def lookup(args, kwargs) -> Tuple[Optional[str], Any]:
+                if not self.enabled:
+                    return None, _MISSING
+                key = self._key(name, tags, signature, args, kwargs)
+                value = self.backend.get(key)
+                self._record(name, value is not _MISSING)
+                return key, value
+
+            def store(key: Optional[str], result: Any) -> Any:
+                if key is None:
+                    return result
+                encoded = jsonable_encoder(result)
+                self.backend.set(key, encoded, self.default_ttl if ttl is None else ttl)
+                return encoded
+
+            if asyncio.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    key, value = lookup(args, kwargs)
+                    if value is not _MISSING:
+                        return value
+                    return store(key, await func(*args, **kwargs))
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key, value = lookup(args, kwargs)
+                if value is not _MISSING:
+                    return value
+                return store(key, func(*args, **kwargs))
+            return wrapper
+
+        return decorator
+
+    def _key(self, name: str, tags: Tuple[str, ...], signature, args, kwargs) -> str:
+        bound = signature.bind_partial(*args, **kwargs)
+        params = {
+            param: value for param, value in sorted(bound.arguments.items())
+            if not isinstance(value, Session)
+        }
+        generations = self.backend.counters([f"gen:{tag}" for tag in tags])
+        generation = ".".join(str(g) for g in generations)
+        return f"{name}:{generation}:{json.dumps(jsonable_encoder(params), sort_keys=True)}"
+
+    def _record(self, name: str, hit: bool) -> None:
+        with self._lock:
+            metrics = self._metrics.setdefault(name, EndpointMetrics())
+            if hit:
+                metrics.hits += 1
+            else:
+                metrics.misses += 1
+
+    # --- invalidation ---
+
+    def invalidate(self, *tags: str) -> None:
+        """Expire every result derived from the given tags."""
+        for tag in tags:
+            self.backend.incr(f"gen:{tag}")
+        logger.debug(f"Invalidated cached responses for {', '.join(tags)}")
+
+    def clear(self) -> None:
+        """Drop all entries and reset the metrics."""
+        self.backend.clear()
+        with self._lock:
+            for name in self._metrics:
+                self._metrics[name] = EndpointMetrics()
+
+    # --- metrics ---
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint hits, misses and hit ratio since start (or clear)."""
+        with self._lock:
+            return {
+                name: {
+                    "hits": m.hits,
+                    "misses": m.misses,
+                    "hit_ratio": round(m.hit_ratio, 4),
+                }
+                for name, m in sorted(self._metrics.items())
+            }
+
+
+response_cache = ResponseCache.from_settings(get_settings())
+invalidation.on_change(response_cache.invalidate)
+
+
+__all__ = [
+    'CacheBackend',
+    'MemoryBackend',
+    'SharedBackend',
+    'LocalRedisClient',
+    'get_cache_backend',
+    'EndpointMetrics',
+    'ResponseCache',
+    'response_cache',
+]
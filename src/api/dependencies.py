@@ -7,13 +7,16 @@ Provides dependency injection for:
 - Configuration
 """
 
-from typing import Generator
+import functools
+import inspect
+from typing import AsyncGenerator, Callable, Generator
 
 from fastapi import Depends, HTTPException, Header, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.core.config import get_settings, Settings
-from src.core.database import SessionLocal
+from src.core.database import AsyncSessionLocal, SessionLocal
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -32,6 +35,53 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Async database session dependency (async engine; see async_db_route)."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def async_db_route(func: Callable) -> Callable:
+    """
+    Serve a route written against a sync Session from the async engine.
+
+    FastAPI sees an async endpoint whose `db` comes from get_async_db. The
+    route body runs inside AsyncSession.run_sync, so its queries go through
+    the async driver on the event loop. A request waiting on the database
+    holds no threadpool thread or sync pool connection. The body must not
+    do other blocking I/O (HTTP calls, file reads), which includes
+    response_cache with the redis backend.
+
+    Only with settings.async_db_routes on (off by default, pending
+    PostgreSQL benchmarks); otherwise the route is returned unchanged and
+    runs in the threadpool. Either way the original function is available
+    as `.sync`, to call with a Session from scripts and tests.
+
+    Usage (directly below the router decorator, above response_cache):
+        @router.get("")
+        @async_db_route
+        def list_items(limit: int = 50, db: Session = Depends(get_db)):
+            return db.query(Item).limit(limit).all()
+    """
+    func.sync = func
+    if not get_settings().async_db_routes:
+        return func
+
+    signature = inspect.signature(func)
+    parameters = [
+        param.replace(annotation=AsyncSession, default=Depends(get_async_db)) if name == "db" else param
+        for name, param in signature.parameters.items()
+    ]
+
+    @functools.wraps(func)
+    async def endpoint(*args, **kwargs):
+        db: AsyncSession = kwargs.pop("db")
+        return await db.run_sync(lambda session: func(*args, db=session, **kwargs))
+
+    endpoint.__signature__ = signature.replace(parameters=parameters)
+    return endpoint
+
+
 def get_settings_dep() -> Settings:
     """Settings dependency."""
     return get_settings()
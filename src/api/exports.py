@@ -0,0 +1,103 @@
+"""
+Streaming export responses.
+
+Export endpoints return a whole transcript, docket or search result set
+in one request. Rows are read through a server-side cursor (yield_per)
+and encoded chunk by chunk by core.services.export, so memory stays
+flat however large the export is:
+
+    @router.get("/{hearing_id}/export")
+    def export_hearing(hearing_id: UUID, fmt: str = export_format_query(), db=Depends(get_db)):
+        query = segment_export_query(db).filter(TranscriptSegment.hearing_id == hearing_id)
+        return stream_export(db, query, fmt, f"hearing-{hearing_id}")
+"""
+
+from typing import Sequence
+
+from fastapi import HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from src.core.models.hearing import Hearing
+from src.core.models.transcript import TranscriptSegment
+from core.services.export import (
+    CUE_FORMATS,
+    EXPORT_FORMATS,
+    SEGMENT_FIELDS,
+    export_chunks,
+    export_filename,
+)
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = 1000
+
+# Columns for exports spanning several hearings
+MULTI_HEARING_FIELDS = ["hearing_title", "hearing_date"] + SEGMENT_FIELDS
+
+
+def export_format_query():
+    """The `format` query parameter shared by export endpoints."""
+    return Query(
+        "ndjson",
+        alias="format",
+        pattern=f"^({'|'.join(EXPORT_FORMATS)})$",
+        description="ndjson, csv, vtt (WebVTT) or srt",
+    )
+
+
+def require_single_hearing(fmt: str) -> None:
+    """Subtitle timestamps restart with each recording, so they need one hearing."""
+    if fmt in CUE_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{fmt} export is only available for a single hearing",
+        )
+
+
+def segment_export_query(db: Session, with_hearing: bool = False):
+    """Segment columns for export (joined to the hearing for multi-hearing exports)."""
+    columns = [
+        TranscriptSegment.hearing_id,
+        TranscriptSegment.segment_index,
+        TranscriptSegment.start_time,
+        TranscriptSegment.end_time,
+        func.coalesce(TranscriptSegment.speaker_name, TranscriptSegment.speaker_label).label("speaker"),
+        TranscriptSegment.speaker_role,
+        TranscriptSegment.text,
+    ]
+    if not with_hearing:
+        return db.query(*columns)
+    return db.query(
+        Hearing.title.label("hearing_title"),
+        Hearing.hearing_date,
+        *columns,
+    ).join(Hearing, Hearing.id == TranscriptSegment.hearing_id)
+
+
+def stream_export(
+    db: Session,
+    query,
+    fmt: str,
+    filename: str,
+    fields: Sequence[str] = SEGMENT_FIELDS,
+) -> StreamingResponse:
+    """
+    Stream an ordered column query as an export download.
+
+    The query runs when the response body is sent. The session is closed
+    once the stream ends, so the cursor's connection is released even if
+    the request's own cleanup already ran.
+    """
+    def rows():
+        try:
+            for row in query.yield_per(EXPORT_BATCH_SIZE):
+                yield row._asdict()
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        export_chunks(rows(), fmt, fields),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{export_filename(filename, fmt)}"'},
+    )
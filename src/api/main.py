@@ -16,7 +16,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from src.core.config import get_settings
-from src.core.database import init_db
+from src.core.database import async_engine, init_db
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -40,6 +40,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down API")
+    await async_engine.dispose()
 
 
 def create_app() -> FastAPI:
@@ -67,7 +68,7 @@ def create_app() -> FastAPI:
 
     # Register routes
     from src.api.routes import dockets, documents, hearings, search, health, states, stats
-    from src.api.routes.admin import pipeline, scrapers
+    from src.api.routes.admin import cache, pipeline, scrapers
 
     # Public routes
     app.include_router(health.router, tags=["health"])
@@ -83,6 +84,8 @@ def create_app() -> FastAPI:
     app.include_router(pipeline.router, prefix="/admin/pipeline", tags=["admin"])
     app.include_router(scrapers.router, prefix="/api/admin/scrapers", tags=["admin"])
     app.include_router(scrapers.router, prefix="/admin/scrapers", tags=["admin"])
+    app.include_router(cache.router, prefix="/api/admin/cache", tags=["admin"])
+    app.include_router(cache.router, prefix="/admin/cache", tags=["admin"])
     app.include_router(stats.router, prefix="/admin/stats", tags=["admin"])
     app.include_router(states.router, prefix="/admin/states", tags=["admin"])
 
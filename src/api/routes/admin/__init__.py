@@ -4,6 +4,6 @@ Admin API routes.
 Requires authentication via X-API-Key header.
 """
 
-from src.api.routes.admin import pipeline, scrapers
+from src.api.routes.admin import cache, pipeline, scrapers
 
-__all__ = ["pipeline", "scrapers"]
+__all__ = ["cache", "pipeline", "scrapers"]
@@ -0,0 +1,48 @@
+"""
+Response cache admin routes.
+
+Hit ratios of the cached read endpoints, and manual invalidation.
+"""
+
+from typing import List
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel
+
+from src.api.cache import response_cache
+from src.api.dependencies import require_admin
+
+router = APIRouter()
+
+
+class InvalidateRequest(BaseModel):
+    """Topics to invalidate (see src.core.services.invalidation)."""
+    tags: List[str]
+
+
+@router.get("")
+def get_cache_stats(
+    _admin: bool = Depends(require_admin),
+):
+    """
+    Get per-endpoint cache hits, misses and hit ratio (this process).
+    """
+    return {
+        "backend": response_cache.backend.name,
+        "enabled": response_cache.enabled,
+        "ttl_seconds": response_cache.default_ttl,
+        "entries": response_cache.backend.size(),
+        "endpoints": response_cache.metrics(),
+    }
+
+
+@router.post("/invalidate")
+def invalidate_cache(
+    request: InvalidateRequest,
+    _admin: bool = Depends(require_admin),
+):
+    """
+    Expire cached responses derived from the given topics.
+    """
+    response_cache.invalidate(*request.tags)
+    return {"invalidated": request.tags}
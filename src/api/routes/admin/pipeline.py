@@ -6,10 +6,10 @@ Provides endpoints to run transcription and analysis stages.
 
 import logging
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from src.api.dependencies import get_db, require_admin
@@ -21,89 +21,38 @@ from src.api.schemas.pipeline import (
 )
 from src.core.models.hearing import Hearing
 from src.core.pipeline.orchestrator import PipelineOrchestrator
-from src.core.pipeline.transcribe import TranscribeStage
-from src.core.pipeline.analyze import AnalyzeStage
+from src.core.pipeline.jobs import STAGES, enqueue_stage_jobs, get_job_queue
+from core.services.job_queue import (
+    CANCELLED,
+    FAILED,
+    QUEUED,
+    RUNNING,
+    SUCCEEDED,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# Store for tracking pipeline runs (in production, use Redis or database)
-_pipeline_runs = {}
-
-
 def _get_stage(stage_name: str):
     """Get stage instance by name."""
-    stages = {
-        "transcribe": TranscribeStage,
-        "analyze": AnalyzeStage,
-    }
-
-    stage_class = stages.get(stage_name)
+    stage_class = STAGES.get(stage_name)
     if not stage_class:
         raise HTTPException(
             status_code=400,
-            detail=f"Unknown stage: {stage_name}. Valid stages: {list(stages.keys())}"
+            detail=f"Unknown stage: {stage_name}. Valid stages: {list(STAGES.keys())}"
         )
 
     return stage_class()
 
 
-async def _run_pipeline_async(
-    run_id: str,
-    stage_name: str,
-    hearing_ids: List[UUID],
-    state_code: str,
-    db_session_factory,
-):
-    """Background task to run pipeline."""
-    from src.core.database import SessionLocal
-
-    _pipeline_runs[run_id]["status"] = "running"
-    _pipeline_runs[run_id]["started_at"] = datetime.utcnow()
-
-    db = SessionLocal()
-    try:
-        stage = _get_stage(stage_name)
-        orchestrator = PipelineOrchestrator(db)
-
-        batch_result = orchestrator.run_stage_batch(
-            stage=stage,
-            hearing_ids=hearing_ids,
-            state_code=state_code,
-        )
-
-        # Update run status
-        _pipeline_runs[run_id].update({
-            "status": "completed",
-            "total": batch_result.total,
-            "successful": batch_result.successful,
-            "failed": batch_result.failed,
-            "skipped": batch_result.skipped,
-            "total_cost_usd": batch_result.total_cost_usd,
-            "errors": batch_result.errors,
-            "completed_at": datetime.utcnow(),
-        })
-
-    except Exception as e:
-        logger.exception(f"Pipeline run {run_id} failed")
-        _pipeline_runs[run_id].update({
-            "status": "failed",
-            "errors": [{"error": str(e)}],
-            "completed_at": datetime.utcnow(),
-        })
-    finally:
-        db.close()
-
-
 @router.post("/run", response_model=PipelineStatusResponse)
-async def run_pipeline(
+def run_pipeline(
     request: PipelineRunRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _admin: bool = Depends(require_admin),
 ):
     """
-    Run a pipeline stage on hearings.
+    Queue a pipeline stage on hearings.
 
     Stages:
     - transcribe: Whisper transcription
@@ -111,8 +60,11 @@ async def run_pipeline(
 
     If hearing_ids is not provided, automatically selects hearings
     based on status_filter and limit.
+
+    One job per hearing is added to the pipeline_jobs queue and processed
+    by `psc worker` processes; poll /status/{run_id} for progress.
     """
-    stage = _get_stage(request.stage)
+    _get_stage(request.stage)
 
     # Get hearing IDs to process
     if request.hearing_ids:
@@ -137,25 +89,15 @@ async def run_pipeline(
             skipped=0,
         )
 
-    # Create run tracking entry
-    run_id = f"{request.stage}_{datetime.utcnow().timestamp()}"
-    _pipeline_runs[run_id] = {
-        "status": "queued",
-        "stage": request.stage,
-        "total": len(hearing_ids),
-    }
-
-    # Queue background task
-    background_tasks.add_task(
-        _run_pipeline_async,
-        run_id=run_id,
-        stage_name=request.stage,
-        hearing_ids=hearing_ids,
-        state_code=request.state_code,
-        db_session_factory=None,
+    run_id = enqueue_stage_jobs(
+        db,
+        request.stage,
+        hearing_ids,
+        max_cost_usd=request.max_cost_usd,
     )
 
     return PipelineStatusResponse(
+        run_id=run_id,
         status="queued",
         stage=request.stage,
         total=len(hearing_ids),
@@ -200,6 +142,8 @@ def run_pipeline_sync(
         stage=stage,
         hearing_ids=hearing_ids,
         state_code=request.state_code,
+        concurrency=request.concurrency,
+        max_cost_usd=request.max_cost_usd,
     )
 
     return PipelineStatusResponse(
@@ -289,30 +233,67 @@ def get_pending_hearings(
 @router.get("/status/{run_id}", response_model=PipelineStatusResponse)
 def get_pipeline_status(
     run_id: str,
+    db: Session = Depends(get_db),
     _admin: bool = Depends(require_admin),
 ):
     """
-    Get status of a pipeline run.
+    Get status of a pipeline run from its queued jobs.
     """
-    if run_id not in _pipeline_runs:
+    jobs = get_job_queue().run_jobs(db, run_id)
+    if not jobs:
         raise HTTPException(status_code=404, detail="Pipeline run not found")
 
-    run_data = _pipeline_runs[run_id]
+    counts = {}
+    for job in jobs:
+        counts[job.status] = counts.get(job.status, 0) + 1
+
+    results = [job.result or {} for job in jobs if job.status == SUCCEEDED]
+    skipped = sum(1 for r in results if r.get("skipped"))
+
+    if counts.get(RUNNING):
+        status = "running"
+    elif counts.get(QUEUED):
+        status = "queued"
+    elif counts.get(CANCELLED) and not counts.get(SUCCEEDED):
+        status = "cancelled"
+    else:
+        status = "completed"
+
+    started = [job.locked_at for job in jobs if job.locked_at]
+    finished = [job.finished_at for job in jobs if job.finished_at]
 
     return PipelineStatusResponse(
-        status=run_data.get("status", "unknown"),
-        stage=run_data.get("stage", ""),
-        total=run_data.get("total", 0),
-        successful=run_data.get("successful", 0),
-        failed=run_data.get("failed", 0),
-        skipped=run_data.get("skipped", 0),
-        total_cost_usd=run_data.get("total_cost_usd", 0.0),
-        errors=run_data.get("errors"),
-        started_at=run_data.get("started_at"),
-        completed_at=run_data.get("completed_at"),
+        run_id=run_id,
+        status=status,
+        stage=jobs[0].kind,
+        total=len(jobs),
+        successful=len(results) - skipped,
+        failed=counts.get(FAILED, 0),
+        skipped=skipped,
+        total_cost_usd=sum(float(r.get("cost_usd") or 0) for r in results),
+        errors=[
+            {"id": job.payload.get("hearing_id", ""), "error": job.last_error or ""}
+            for job in jobs
+            if job.status == FAILED
+        ] or None,
+        started_at=min(started) if started else None,
+        completed_at=max(finished) if status in ("completed", "cancelled") and finished else None,
     )
 
 
+@router.post("/cancel/{run_id}", response_model=PipelineStatusResponse)
+def cancel_pipeline_run(
+    run_id: str,
+    db: Session = Depends(get_db),
+    _admin: bool = Depends(require_admin),
+):
+    """
+    Cancel a run's queued jobs. Jobs already running finish.
+    """
+    get_job_queue().set_status(db, QUEUED, CANCELLED, run_id=run_id)
+    return get_pipeline_status(run_id, db)
+
+
 @router.get("/stats")
 def get_pipeline_stats(
     state_code: Optional[str] = None,
@@ -10,10 +10,18 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 
 from src.api.dependencies import get_db
+from src.api.exports import (
+    MULTI_HEARING_FIELDS,
+    export_format_query,
+    require_single_hearing,
+    segment_export_query,
+    stream_export,
+)
 from src.api.schemas.docket import DocketResponse, DocketListResponse, DocketDetail
 from src.core.models.docket import Docket
 from src.core.models.document import Document
 from src.core.models.hearing import Hearing
+from src.core.models.transcript import TranscriptSegment
 
 router = APIRouter()
 
@@ -222,3 +230,31 @@ def get_docket_hearings(
         limit=limit,
         offset=offset,
     )
+
+
+@router.get("/{docket_id}/export")
+def export_docket_transcripts(
+    docket_id: UUID,
+    fmt: str = export_format_query(),
+    db: Session = Depends(get_db),
+):
+    """
+    Download the transcripts of every hearing in a docket, streamed.
+
+    Hearings oldest first, segments in order; ndjson or csv only.
+    """
+    require_single_hearing(fmt)
+    docket = db.query(Docket.docket_number).filter(Docket.id == docket_id).first()
+    if not docket:
+        raise HTTPException(status_code=404, detail="Docket not found")
+
+    query = segment_export_query(db, with_hearing=True).filter(
+        Hearing.docket_id == docket_id
+    ).order_by(
+        Hearing.hearing_date.asc().nullslast(),
+        Hearing.id,
+        TranscriptSegment.segment_index,
+    )
+    return stream_export(
+        db, query, fmt, f"docket-{docket.docket_number or docket_id}", MULTI_HEARING_FIELDS
+    )
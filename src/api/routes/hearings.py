@@ -2,13 +2,14 @@
 Hearing API routes.
 """
 
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 
-from src.api.dependencies import get_db
+from src.api.dependencies import async_db_route, get_db
+from src.api.exports import export_format_query, segment_export_query, stream_export
 from src.api.schemas.hearing import (
     HearingResponse,
     HearingListResponse,
@@ -19,11 +20,29 @@ from src.api.schemas.hearing import (
 from src.core.models.hearing import Hearing
 from src.core.models.transcript import TranscriptSegment
 from src.core.models.analysis import Analysis
+from core.utils.pagination import InvalidCursor, SortKey, keyset_order, paginate
 
 router = APIRouter()
 
 
+def _want_total(include_total: Optional[bool], after: Optional[str]) -> bool:
+    # Count on the first page by default; scrolling pages skip the count
+    return include_total if include_total is not None else after is None
+
+
+def _page(query, keys: List[SortKey], limit: int, offset: int, after: Optional[str], kind: str):
+    """Rows and next_cursor: a keyset page, or an OFFSET page when offset is given."""
+    if offset and not after:
+        return query.order_by(*keyset_order(keys)).offset(offset).limit(limit).all(), None
+    try:
+        page = paginate(query, keys, limit=limit, after=after, kind=kind)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return page.items, page.next_cursor
+
+
 @router.get("", response_model=HearingListResponse)
+@async_db_route
 def list_hearings(
     state_code: Optional[str] = Query(None, description="Filter by state"),
     status: Optional[str] = Query(None, description="Filter by transcript_status"),
@@ -35,12 +54,15 @@ def list_hearings(
     has_analysis: Optional[bool] = Query(None, description="Filter by whether analysis exists"),
     limit: int = Query(50, le=200),
     offset: int = Query(0, ge=0),
+    after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: Optional[bool] = Query(None, description="Count all matches (default: first page only)"),
     db: Session = Depends(get_db),
 ):
     """
-    List hearings with optional filters.
+    List hearings with optional filters, newest first.
 
     Supports filtering by state, status, docket, type, and analysis fields.
+    Pass next_cursor back as after for the following page.
     """
     query = db.query(Hearing).options(
         joinedload(Hearing.analysis)
@@ -74,13 +96,13 @@ def list_hearings(
         if sector:
             query = query.filter(Analysis.sector == sector)
 
-    # Get total count
-    total = query.count()
+    total = query.count() if _want_total(include_total, after) else None
 
-    # Get paginated results
-    hearings = query.order_by(
-        Hearing.hearing_date.desc().nullslast()
-    ).offset(offset).limit(limit).all()
+    keys = [
+        SortKey(Hearing.hearing_date, descending=True, nullable=True),
+        SortKey(Hearing.id, descending=True),
+    ]
+    hearings, next_cursor = _page(query, keys, limit, offset, after, "hearings")
 
     # Build response
     items = []
@@ -110,10 +132,12 @@ def list_hearings(
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/{hearing_id}", response_model=HearingDetail)
+@async_db_route
 def get_hearing(
     hearing_id: UUID,
     include_transcript: bool = Query(True, description="Include full transcript text"),
@@ -215,18 +239,22 @@ def get_hearing(
 
 
 @router.get("/{hearing_id}/segments")
+@async_db_route
 def get_hearing_segments(
     hearing_id: UUID,
     speaker: Optional[str] = Query(None, description="Filter by speaker name"),
     search: Optional[str] = Query(None, description="Search in segment text"),
     limit: int = Query(100, le=500),
     offset: int = Query(0, ge=0),
+    after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: Optional[bool] = Query(None, description="Count all matches (default: first page only)"),
     db: Session = Depends(get_db),
 ):
     """
-    Get transcript segments for a hearing.
+    Get transcript segments for a hearing, in order.
 
-    Supports filtering by speaker and text search.
+    Supports filtering by speaker and text search. Pass next_cursor back
+    as after to scroll: each page costs the same however deep it is.
     """
     # Verify hearing exists
     hearing = db.query(Hearing).filter(Hearing.id == hearing_id).first()
@@ -245,11 +273,10 @@ def get_hearing_segments(
     if search:
         query = query.filter(TranscriptSegment.text.ilike(f"%{search}%"))
 
-    total = query.count()
+    total = query.count() if _want_total(include_total, after) else None
 
-    segments = query.order_by(
-        TranscriptSegment.segment_index
-    ).offset(offset).limit(limit).all()
+    keys = [SortKey(TranscriptSegment.segment_index), SortKey(TranscriptSegment.id)]
+    segments, next_cursor = _page(query, keys, limit, offset, after, "segments")
 
     return {
         "items": [
@@ -269,10 +296,34 @@ def get_hearing_segments(
         "total": total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": next_cursor,
     }
 
 
+@router.get("/{hearing_id}/export")
+def export_hearing_transcript(
+    hearing_id: UUID,
+    fmt: str = export_format_query(),
+    db: Session = Depends(get_db),
+):
+    """
+    Download a hearing's whole transcript in one streamed response.
+
+    Formats: ndjson and csv (one row per segment), vtt and srt (subtitle
+    cues with speaker names).
+    """
+    hearing = db.query(Hearing.id).filter(Hearing.id == hearing_id).first()
+    if not hearing:
+        raise HTTPException(status_code=404, detail="Hearing not found")
+
+    query = segment_export_query(db).filter(
+        TranscriptSegment.hearing_id == hearing_id
+    ).order_by(TranscriptSegment.segment_index)
+    return stream_export(db, query, fmt, f"hearing-{hearing_id}")
+
+
 @router.get("/{hearing_id}/analysis", response_model=AnalysisResponse)
+@async_db_route
 def get_hearing_analysis(
     hearing_id: UUID,
     db: Session = Depends(get_db),
@@ -312,6 +363,7 @@ def get_hearing_analysis(
 
 
 @router.get("/statuses")
+@async_db_route
 def get_hearing_statuses(
     state_code: Optional[str] = Query(None),
     db: Session = Depends(get_db),
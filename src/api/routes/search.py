@@ -5,17 +5,31 @@ Search API routes.
 from typing import Optional
 from datetime import date
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from src.api.dependencies import get_db
+from src.api.cache import response_cache
+from src.api.dependencies import async_db_route, get_db
+from src.api.exports import (
+    MULTI_HEARING_FIELDS,
+    export_format_query,
+    require_single_hearing,
+    segment_export_query,
+    stream_export,
+)
+from src.core.config import get_settings
 from src.api.schemas.search import SearchResponse, SearchResult, SearchFacets
-from src.core.services.search import SearchService
+from src.core.services.invalidation import ANALYSES, DOCKETS, HEARINGS, TRANSCRIPTS
+from src.core.models.hearing import Hearing
+from src.core.models.transcript import TranscriptSegment
+from src.core.services.search import SearchService, parse_query
+from core.utils.pagination import InvalidCursor
 
 router = APIRouter()
 
 
 @router.get("", response_model=SearchResponse)
+@async_db_route
 def search_transcripts(
     q: str = Query(..., min_length=1, description="Search query"),
     state_code: Optional[str] = Query(None, description="Filter by state"),
@@ -27,28 +41,37 @@ def search_transcripts(
     sector: Optional[str] = Query(None, description="Filter by sector"),
     limit: int = Query(20, le=100),
     offset: int = Query(0, ge=0),
+    after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: Optional[bool] = Query(None, description="Count all matches (default: first page only)"),
     db: Session = Depends(get_db),
 ):
     """
     Search hearing transcripts.
 
     Full-text search across transcript content with optional filters.
-    Returns matching hearings with text snippets.
+    Returns matching hearings with text snippets. Pass next_cursor back
+    as after for the following page; offset still works but deep offsets
+    get slower.
     """
     search_service = SearchService(db)
 
-    result = search_service.search_transcripts(
-        query=q,
-        state_code=state_code,
-        docket_number=docket_number,
-        date_from=str(date_from) if date_from else None,
-        date_to=str(date_to) if date_to else None,
-        hearing_type=hearing_type,
-        utility=utility,
-        sector=sector,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        result = search_service.search_transcripts(
+            query=q,
+            state_code=state_code,
+            docket_number=docket_number,
+            date_from=str(date_from) if date_from else None,
+            date_to=str(date_to) if date_to else None,
+            hearing_type=hearing_type,
+            utility=utility,
+            sector=sector,
+            limit=limit,
+            offset=offset,
+            after=after,
+            include_total=include_total if include_total is not None else after is None,
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
     return SearchResponse(
         results=[
@@ -66,10 +89,13 @@ def search_transcripts(
         total=result.total,
         query=result.query,
         filters=result.filters,
+        next_cursor=result.next_cursor,
     )
 
 
 @router.get("/facets", response_model=SearchFacets)
+@async_db_route
+@response_cache.cached("search.facets", tags=[HEARINGS, TRANSCRIPTS, ANALYSES])
 def get_search_facets(
     state_code: Optional[str] = Query(None, description="Filter facets by state"),
     db: Session = Depends(get_db),
@@ -95,6 +121,7 @@ def get_search_facets(
 
 
 @router.get("/segments")
+@async_db_route
 def search_segments(
     q: str = Query(..., min_length=1, description="Search query"),
     hearing_id: Optional[str] = Query(None, description="Filter to specific hearing"),
@@ -123,7 +150,132 @@ def search_segments(
     }
 
 
+@router.get("/export")
+def export_search_results(
+    q: str = Query(..., min_length=1, description="Search query"),
+    state_code: Optional[str] = Query(None, description="Filter by state"),
+    docket_number: Optional[str] = Query(None, description="Filter by docket"),
+    date_from: Optional[date] = Query(None, description="Filter from date"),
+    date_to: Optional[date] = Query(None, description="Filter to date"),
+    speaker: Optional[str] = Query(None, description="Filter by speaker"),
+    fmt: str = export_format_query(),
+    db: Session = Depends(get_db),
+):
+    """
+    Download every transcript segment matching a search, streamed.
+
+    Same query syntax and full-text matching as search (terms, "phrases",
+    OR, -term). Unlike the paginated endpoints there is no limit: segments
+    come newest hearing first, in transcript order. ndjson or csv only.
+    """
+    require_single_hearing(fmt)
+    parsed = parse_query(q)
+    if not parsed.groups:
+        raise HTTPException(status_code=400, detail="Query has no search terms")
+
+    query = segment_export_query(db, with_hearing=True).filter(
+        parsed.to_match(TranscriptSegment.text, db.get_bind().dialect.name)
+    )
+    if state_code:
+        query = query.filter(Hearing.state_code == state_code.upper())
+    if docket_number:
+        query = query.filter(Hearing.docket_number == docket_number)
+    if date_from:
+        query = query.filter(Hearing.hearing_date >= date_from)
+    if date_to:
+        query = query.filter(Hearing.hearing_date <= date_to)
+    if speaker:
+        query = query.filter(
+            (TranscriptSegment.speaker_name.ilike(f"%{speaker}%")) |
+            (TranscriptSegment.speaker_label.ilike(f"%{speaker}%"))
+        )
+
+    query = query.order_by(
+        Hearing.hearing_date.desc().nullslast(),
+        Hearing.id,
+        TranscriptSegment.segment_index,
+    )
+    return stream_export(db, query, fmt, f"search-{q[:40]}", MULTI_HEARING_FIELDS)
+
+
+@router.get("/passages")
+@async_db_route
+def search_passages(
+    q: str = Query(..., min_length=1, description="Search query"),
+    state_code: Optional[str] = Query(None, description="Filter by state"),
+    hearing_id: Optional[str] = Query(None, description="Filter to specific hearing"),
+    speaker: Optional[str] = Query(None, description="Filter by speaker"),
+    limit: int = Query(20, le=100),
+    db: Session = Depends(get_db),
+):
+    """
+    Search transcript passages (windows of consecutive segments).
+
+    Finds phrases that span segment boundaries, and returns each hit
+    with the surrounding text and the timestamp where the match starts.
+    """
+    search_service = SearchService(db)
+
+    passages = search_service.search_passages(
+        query=q,
+        state_code=state_code,
+        hearing_id=hearing_id,
+        speaker=speaker,
+        limit=limit,
+    )
+
+    return {
+        "results": passages,
+        "total": len(passages),
+        "query": q,
+    }
+
+
+@router.get("/semantic")
+def semantic_search(
+    q: str = Query(..., min_length=1, description="Search query"),
+    state_code: Optional[str] = Query(None, description="Filter by state"),
+    hearing_id: Optional[str] = Query(None, description="Filter to specific hearing"),
+    limit: int = Query(20, le=100),
+    db: Session = Depends(get_db),
+):
+    """
+    Hybrid search within transcript segments.
+
+    Fuses full-text and embedding similarity rankings (reciprocal-rank
+    fusion), so passages about the query's topic are found even when
+    they use different words. Falls back to the full-text ranking when
+    no embedding provider is configured.
+    """
+    from src.core.pipeline.embed import get_default_provider, get_embedding_cache
+    from src.core.services.embeddings import embed_texts
+
+    settings = get_settings()
+    query_vector = None
+    if settings.embedding_provider != "openai" or settings.openai_api_key:
+        embedded = embed_texts(get_default_provider(), [q], cache=get_embedding_cache())
+        query_vector = embedded.vectors[0]
+
+    search_service = SearchService(db)
+    results = search_service.semantic_search(
+        query=q,
+        query_vector=query_vector,
+        state_code=state_code,
+        hearing_id=hearing_id,
+        limit=limit,
+    )
+
+    return {
+        "results": results,
+        "total": len(results),
+        "query": q,
+        "semantic": query_vector is not None,
+    }
+
+
 @router.get("/suggest")
+@async_db_route
+@response_cache.cached("search.suggest", tags=[DOCKETS, ANALYSES])
 def search_suggestions(
     q: str = Query(..., min_length=2, description="Partial query for suggestions"),
     state_code: Optional[str] = Query(None),
@@ -9,8 +9,10 @@ from pydantic import BaseModel
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from src.api.cache import response_cache
 from src.api.dependencies import get_db
 from src.core.models.hearing import Hearing
+from src.core.services.invalidation import HEARINGS
 from src.states.registry import StateRegistry
 
 router = APIRouter()
@@ -26,6 +28,7 @@ class StateResponse(BaseModel):
 
 
 @router.get("", response_model=List[StateResponse])
+@response_cache.cached("states.list", tags=[HEARINGS])
 def list_states(db: Session = Depends(get_db)):
     """
     List all available states with hearing counts.
@@ -10,11 +10,21 @@ from pydantic import BaseModel
 from sqlalchemy import func, and_
 from sqlalchemy.orm import Session
 
-from src.api.dependencies import get_db
+from src.api.cache import response_cache
+from src.api.dependencies import async_db_route, get_db
 from src.core.models.hearing import Hearing
 from src.core.models.docket import Docket
-from src.core.models.transcript import TranscriptSegment
 from src.core.models.analysis import Analysis
+from src.core.services import invalidation
+from src.core.services.stats import (
+    ANALYSIS_COST,
+    DURATION_SECONDS,
+    HEARINGS,
+    HEARINGS_BY_STATUS,
+    SEGMENTS,
+    TRANSCRIPTION_COST,
+    rollups,
+)
 from src.states.registry import StateRegistry
 
 router = APIRouter()
@@ -48,51 +58,36 @@ class HearingTypeCount(BaseModel):
 
 
 @router.get("", response_model=StatsResponse)
+@async_db_route
 def get_stats(db: Session = Depends(get_db)):
     """
     Get dashboard statistics.
+
+    Totals come from the stats rollups (see src.core.services.stats), so
+    this is a handful of small reads whatever the corpus size.
     """
     now = datetime.utcnow()
     last_24h = now - timedelta(hours=24)
     last_7d = now - timedelta(days=7)
 
-    # Total counts
-    total_hearings = db.query(func.count(Hearing.id)).scalar() or 0
-    total_segments = db.query(func.count(TranscriptSegment.id)).scalar() or 0
-
-    # Total hours from duration
-    total_seconds = db.query(func.sum(Hearing.duration_seconds)).scalar() or 0
-    total_hours = total_seconds / 3600
-
-    # Hearings by status
-    status_counts = dict(
-        db.query(
-            Hearing.transcript_status,
-            func.count(Hearing.id)
-        ).group_by(Hearing.transcript_status).all()
-    )
-    hearings_by_status = {k or "unknown": v for k, v in status_counts.items()}
-
-    # Hearings by state
-    state_counts = dict(
-        db.query(
-            Hearing.state_code,
-            func.count(Hearing.id)
-        ).group_by(Hearing.state_code).all()
-    )
-    hearings_by_state = {k or "unknown": v for k, v in state_counts.items()}
+    totals = rollups.totals(db)
+    total_hearings = int(sum(totals[HEARINGS].values()))
+    total_segments = int(sum(totals[SEGMENTS].values()))
+    total_hours = sum(totals[DURATION_SECONDS].values()) / 3600
 
-    # Costs from hearings
-    transcription_cost = db.query(
-        func.sum(Hearing.processing_cost_usd)
-    ).scalar() or 0.0
+    hearings_by_status = {
+        (status or "unknown"): int(count)
+        for status, count in totals[HEARINGS_BY_STATUS].items() if count
+    }
+    hearings_by_state = {
+        state: int(count)
+        for state, count in rollups.by_state(db, HEARINGS).items() if count
+    }
 
-    # Costs from analyses
-    analysis_cost = db.query(
-        func.sum(Analysis.cost_usd)
-    ).scalar() or 0.0
+    transcription_cost = sum(totals[TRANSCRIPTION_COST].values())
+    analysis_cost = sum(totals[ANALYSIS_COST].values())
 
-    # Recent hearings
+    # Recent hearings (index range scans over created_at)
     hearings_last_24h = db.query(func.count(Hearing.id)).filter(
         Hearing.created_at >= last_24h
     ).scalar() or 0
@@ -108,15 +103,17 @@ def get_stats(db: Session = Depends(get_db)):
         total_hours=round(total_hours, 1),
         hearings_by_status=hearings_by_status,
         hearings_by_state=hearings_by_state,
-        total_transcription_cost=float(transcription_cost),
-        total_analysis_cost=float(analysis_cost),
-        total_cost=float(transcription_cost) + float(analysis_cost),
+        total_transcription_cost=round(transcription_cost, 4),
+        total_analysis_cost=round(analysis_cost, 4),
+        total_cost=round(transcription_cost + analysis_cost, 4),
         hearings_last_24h=hearings_last_24h,
         hearings_last_7d=hearings_last_7d,
     )
 
 
 @router.get("/utilities", response_model=List[UtilityCount])
+@async_db_route
+@response_cache.cached("stats.utilities", tags=[invalidation.ANALYSES])
 def get_utilities(db: Session = Depends(get_db)):
     """
     Get list of utilities with hearing counts.
@@ -140,6 +137,8 @@ def get_utilities(db: Session = Depends(get_db)):
 
 
 @router.get("/hearing-types", response_model=List[HearingTypeCount])
+@async_db_route
+@response_cache.cached("stats.hearing_types", tags=[invalidation.HEARINGS])
 def get_hearing_types(db: Session = Depends(get_db)):
     """
     Get list of hearing types with counts.
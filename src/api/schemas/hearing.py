@@ -123,6 +123,7 @@ class HearingDetail(BaseModel):
 class HearingListResponse(BaseModel):
     """Paginated hearing list response."""
     items: List[HearingResponse]
-    total: int
+    total: Optional[int] = None  # Omitted on cursor pages unless requested
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
@@ -6,7 +6,7 @@ from typing import Optional, List, Dict, Any
 from uuid import UUID
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class PipelineRunRequest(BaseModel):
@@ -16,6 +16,8 @@ class PipelineRunRequest(BaseModel):
     hearing_ids: Optional[List[UUID]] = None  # Specific hearings, or None for auto-select
     status_filter: Optional[str] = None  # Filter by transcript_status
     limit: int = 10  # Max hearings to process
+    concurrency: int = Field(1, ge=1, le=32)  # Hearings processed at once (run-sync)
+    max_cost_usd: Optional[float] = Field(None, gt=0)  # Stop starting hearings past this spend
 
 
 class StageResultResponse(BaseModel):
@@ -31,7 +33,8 @@ class StageResultResponse(BaseModel):
 
 class PipelineStatusResponse(BaseModel):
     """Pipeline execution status."""
-    status: str  # "queued", "running", "completed", "failed"
+    run_id: Optional[str] = None  # Set for queued runs; poll /status/{run_id}
+    status: str  # "queued", "running", "completed", "failed", "cancelled"
     stage: str
     total: int = 0
     successful: int = 0
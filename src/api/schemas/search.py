@@ -44,7 +44,8 @@ class SearchFacets(BaseModel):
 class SearchResponse(BaseModel):
     """Search response with results and metadata."""
     results: List[SearchResult]
-    total: int
+    total: Optional[int] = None  # Omitted on cursor pages unless requested
     query: str
     filters: Dict[str, Any]
     facets: Optional[SearchFacets] = None
+    next_cursor: Optional[str] = None
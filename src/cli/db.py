@@ -18,7 +18,7 @@ def db():
 def init_db(drop: bool):
     """Initialize the database schema."""
     # Import all models so they're registered
-    from src.core.models import docket, document, hearing, transcript, analysis, entity
+    from src.core.models import docket, document, hearing, transcript, analysis, entity, job, stats
     from src.states.florida.models import docket as fl_docket, document as fl_document, hearing as fl_hearing
 
     if drop:
@@ -91,6 +91,22 @@ def db_stats():
                 click.echo(f"    {status}: {count}")
 
 
+@db.command("reconcile-stats")
+@click.option("--interval", type=int, help="Keep running, reconciling every N minutes")
+def reconcile_stats(interval: int):
+    """Correct the dashboard stats rollups against the source tables."""
+    import time
+    from src.core.services.stats import reconcile_rollups
+
+    while True:
+        with get_db_session() as session:
+            corrected = reconcile_rollups(session)
+        click.echo(f"Corrected {corrected} stats counters")
+        if not interval:
+            break
+        time.sleep(interval * 60)
+
+
 @db.command("migrate")
 @click.option("--revision", "-r", default="head", help="Revision to migrate to")
 def migrate(revision: str):
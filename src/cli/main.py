@@ -2,21 +2,26 @@
 
 import click
 
+from src.core.config import get_settings
 from src.cli.scraper import scraper
 from src.cli.pipeline import pipeline
 from src.cli.db import db
+from src.cli.worker import worker
 
 
 @click.group()
 @click.version_option(version="0.1.0")
 def cli():
     """PSC Hearing Intelligence CLI."""
-    pass
+    if get_settings().api_cache_backend == "redis":
+        # Pipeline and scraper commits here invalidate the API's shared cache
+        import src.api.cache  # noqa: F401
 
 
 cli.add_command(scraper)
 cli.add_command(pipeline)
 cli.add_command(db)
+cli.add_command(worker)
 
 
 if __name__ == "__main__":
@@ -5,7 +5,6 @@ from uuid import UUID
 
 import click
 
-from src.core.config import get_settings
 from src.core.database import get_db_session
 from src.core.models.hearing import Hearing
 
@@ -60,10 +59,8 @@ def transcribe(hearing_id: Optional[str], state: Optional[str], limit: int, dry_
     from sqlalchemy import select
     from src.core.pipeline.orchestrator import PipelineOrchestrator
 
-    settings = get_settings()
-
     with get_db_session() as session:
-        orchestrator = PipelineOrchestrator(session, settings)
+        orchestrator = PipelineOrchestrator(session)
 
         if hearing_id:
             click.echo(f"Transcribing hearing: {hearing_id}")
@@ -121,10 +118,8 @@ def analyze(hearing_id: Optional[str], state: Optional[str], limit: int, dry_run
     from sqlalchemy import select
     from src.core.pipeline.orchestrator import PipelineOrchestrator
 
-    settings = get_settings()
-
     with get_db_session() as session:
-        orchestrator = PipelineOrchestrator(session, settings)
+        orchestrator = PipelineOrchestrator(session)
 
         if hearing_id:
             click.echo(f"Analyzing hearing: {hearing_id}")
@@ -172,6 +167,37 @@ def analyze(hearing_id: Optional[str], state: Optional[str], limit: int, dry_run
             click.echo(f"\nCompleted: {success}/{len(results)} successful")
 
 
+@pipeline.command("analyze-batch")
+@click.option("--state", "-s", help="Filter by state code")
+@click.option("--limit", "-l", default=500, help="Maximum hearings to submit")
+@click.option("--ingest-only", is_flag=True, help="Only collect finished batches")
+def analyze_batch(state: Optional[str], limit: int, ingest_only: bool):
+    """
+    Backfill analyses through the offline Batch API.
+
+    Collects results of finished batches, then submits transcribed
+    hearings that are not analyzed or already in a batch. Run it
+    periodically (e.g. nightly) until everything is analyzed.
+    """
+    from src.core.pipeline.analyze_batch import ingest_analysis_batches, submit_analysis_batch
+
+    with get_db_session() as session:
+        counts = ingest_analysis_batches(session)
+        click.echo(
+            f"Ingested: {counts['saved']} saved, {counts['skipped']} skipped, "
+            f"{counts['failed']} failed; {counts['running']} batches still running"
+        )
+
+        if ingest_only:
+            return
+
+        batch_id = submit_analysis_batch(session, state_code=state, limit=limit)
+        if batch_id:
+            click.echo(f"Submitted batch {batch_id}")
+        else:
+            click.echo("No hearings to submit.")
+
+
 @pipeline.command("process")
 @click.option("--state", "-s", help="Filter by state code")
 @click.option("--limit", "-l", default=10, help="Maximum hearings to process")
@@ -181,10 +207,8 @@ def process_all(state: Optional[str], limit: int, dry_run: bool):
     from sqlalchemy import select
     from src.core.pipeline.orchestrator import PipelineOrchestrator
 
-    settings = get_settings()
-
     with get_db_session() as session:
-        orchestrator = PipelineOrchestrator(session, settings)
+        orchestrator = PipelineOrchestrator(session)
 
         click.echo(f"Finding pending hearings (limit: {limit})...")
 
@@ -232,6 +256,81 @@ def process_all(state: Optional[str], limit: int, dry_run: bool):
         click.echo("\nPipeline complete")
 
 
+@pipeline.command("embed")
+@click.option("--state", "-s", help="Filter by state code")
+@click.option("--limit", "-l", default=100, help="Maximum hearings to process")
+def embed(state: Optional[str], limit: int):
+    """Embed transcript segments of transcribed hearings for semantic search."""
+    from src.core.models.transcript import TranscriptSegment
+    from src.core.pipeline.embed import EmbedStage
+    from src.core.pipeline.orchestrator import PipelineOrchestrator
+
+    with get_db_session() as session:
+        query = session.query(TranscriptSegment.hearing_id).filter(
+            TranscriptSegment.embedding.is_(None)
+        )
+        if state:
+            query = query.join(Hearing, Hearing.id == TranscriptSegment.hearing_id).filter(
+                Hearing.state_code == state.upper()
+            )
+        hearing_ids = [row.hearing_id for row in query.distinct().limit(limit).all()]
+
+        if not hearing_ids:
+            click.echo("No segments to embed.")
+            return
+
+        click.echo(f"Embedding segments of {len(hearing_ids)} hearings...")
+        stage = EmbedStage()
+        result = PipelineOrchestrator(session).run_stage_batch(stage, hearing_ids=hearing_ids, limit=limit)
+        click.echo(
+            f"Completed: {result.successful} embedded, {result.skipped} skipped, "
+            f"{result.failed} failed (${result.total_cost_usd:.4f}); cache {stage.cache.stats}"
+        )
+
+
+@pipeline.command("passages")
+@click.option("--state", "-s", help="Filter by state code")
+@click.option("--limit", "-l", default=100, help="Maximum hearings to process")
+@click.option("--rebuild", is_flag=True, help="Rebuild hearings that already have passages")
+def passages(state: Optional[str], limit: int, rebuild: bool):
+    """Build phrase-search passages for transcribed hearings."""
+    from sqlalchemy import exists
+
+    from src.core.models.transcript import TranscriptPassage, TranscriptSegment
+    from src.core.pipeline.transcribe import write_passages
+    from src.core.services.invalidation import TRANSCRIPTS, notify_changed
+
+    with get_db_session() as session:
+        query = session.query(Hearing.id).filter(
+            exists().where(TranscriptSegment.hearing_id == Hearing.id)
+        )
+        if not rebuild:
+            query = query.filter(~exists().where(TranscriptPassage.hearing_id == Hearing.id))
+        if state:
+            query = query.filter(Hearing.state_code == state.upper())
+        hearing_ids = [row.id for row in query.limit(limit).all()]
+
+        if not hearing_ids:
+            click.echo("No hearings need passages.")
+            return
+
+        total = 0
+        for hearing_id in hearing_ids:
+            segments = session.query(
+                TranscriptSegment.segment_index,
+                TranscriptSegment.start_time,
+                TranscriptSegment.end_time,
+                TranscriptSegment.text,
+                TranscriptSegment.speaker_name,
+                TranscriptSegment.speaker_label,
+            ).filter(TranscriptSegment.hearing_id == hearing_id).all()
+            total += write_passages(session, hearing_id, [dict(row._mapping) for row in segments])
+            session.commit()
+
+        notify_changed(TRANSCRIPTS)
+        click.echo(f"Wrote {total} passages for {len(hearing_ids)} hearings")
+
+
 @pipeline.command("retry-errors")
 @click.option("--state", "-s", help="Filter by state code")
 @click.option("--limit", "-l", default=10, help="Maximum hearings to retry")
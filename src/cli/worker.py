@@ -0,0 +1,66 @@
+"""Pipeline worker CLI command."""
+
+import logging
+import signal
+from typing import Optional
+
+import click
+
+from src.core.config import get_settings
+
+
+@click.command()
+@click.option("--concurrency", "-c", default=1, help="Jobs processed at once in this process")
+@click.option("--poll-interval", default=2.0, help="Seconds to wait when the queue is empty")
+@click.option("--max-jobs", type=int, help="Exit after this many jobs (per worker thread)")
+@click.option("--drain", is_flag=True, help="Exit once no jobs are due instead of polling")
+@click.option("--worker-id", help="Worker name in leases (default host:pid)")
+def worker(
+    concurrency: int,
+    poll_interval: float,
+    max_jobs: Optional[int],
+    drain: bool,
+    worker_id: Optional[str],
+):
+    """
+    Process queued pipeline jobs.
+
+    Run any number of workers, on any number of hosts, against the same
+    database; jobs are leased so each runs once. SIGTERM/SIGINT finish
+    the current job and exit.
+    """
+    from src.core.database import SessionLocal
+    from src.core.pipeline.jobs import JOB_HANDLERS, get_job_queue
+    from core.services.job_queue import JobWorker, default_worker_id, run_workers
+
+    settings = get_settings()
+    logging.basicConfig(
+        level=settings.log_level,
+        format="%(asctime)s %(threadName)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    queue = get_job_queue()
+    base_id = worker_id or default_worker_id()
+    workers = [
+        JobWorker(
+            queue,
+            SessionLocal,
+            JOB_HANDLERS,
+            worker_id=base_id if concurrency == 1 else f"{base_id}:{i}",
+            poll_interval=poll_interval,
+            heartbeat_interval=max(queue.lease_seconds / 5, 1),
+        )
+        for i in range(concurrency)
+    ]
+
+    def shutdown(signum, frame):
+        click.echo("Stopping after current jobs...")
+        for w in workers:
+            w.stop()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    click.echo(f"Worker {base_id} processing jobs with concurrency {concurrency}")
+    processed = run_workers(workers, max_jobs=max_jobs, stop_when_idle=drain)
+    click.echo(f"Processed {processed} jobs")
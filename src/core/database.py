@@ -2,13 +2,20 @@
 Database connection and session management.
 
 Provides SQLAlchemy engine, session factory, and dependency injection for FastAPI.
+
+Two engines share the database: the sync engine (scripts, pipeline, write
+routes) and an async engine (asyncpg / aiosqlite) for the read-heavy API
+routes, so those don't hold a threadpool thread while waiting on queries.
 """
 
+import io
+import json
 import logging
-from typing import Generator
+from typing import AsyncGenerator, Generator, List, Dict, Any
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import Table, create_engine, event, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool, StaticPool
 
@@ -35,8 +42,8 @@ else:
     engine = create_engine(
         settings.database_url,
         poolclass=QueuePool,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
         pool_pre_ping=True,  # Verify connections before use
         echo=settings.log_level == "DEBUG",
     )
@@ -49,6 +56,52 @@ SessionLocal = sessionmaker(
 )
 
 
+def to_async_url(url: str) -> str:
+    """Async-driver form of a sync database URL (asyncpg / aiosqlite)."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend == "postgresql":
+        query = dict(parsed.query)
+        # asyncpg takes ssl=, not libpq's sslmode=
+        if "sslmode" in query:
+            query["ssl"] = query.pop("sslmode")
+        parsed = parsed.set(drivername="postgresql+asyncpg", query=query)
+    elif backend == "sqlite":
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+    return parsed.render_as_string(hide_password=False)
+
+
+async_database_url = settings.async_database_url or to_async_url(settings.database_url)
+
+# Async engine for the read-heavy API routes (see get_async_db)
+if is_sqlite:
+    async_engine = create_async_engine(
+        async_database_url,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        echo=settings.log_level == "DEBUG",
+    )
+else:
+    async_engine = create_async_engine(
+        async_database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+        echo=settings.log_level == "DEBUG",
+    )
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# Keep the dashboard stats rollups current on every flush
+from src.core.services.stats import rollup_tracker  # noqa: E402
+
+rollup_tracker.listen(SessionLocal)
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     FastAPI dependency that provides a database session.
@@ -65,6 +118,19 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency that provides an async database session.
+
+    Usage:
+        @app.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_async_db)):
+            return (await db.execute(select(Item))).scalars().all()
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 @contextmanager
 def get_db_session() -> Generator[Session, None, None]:
     """
@@ -85,6 +151,80 @@ def get_db_session() -> Generator[Session, None, None]:
         db.close()
 
 
+def _copy_value(value: Any) -> Any:
+    """CSV field for COPY: JSON for lists/dicts, text for other non-primitives."""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    if value is not None and not isinstance(value, (int, float, str)):
+        return str(value)
+    return value
+
+
+def _copy_field(value: Any) -> str:
+    """One CSV field: None unquoted (COPY's NULL), everything else quoted."""
+    value = _copy_value(value)
+    if value is None:
+        return ""
+    text = str(value)
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _copy_buffer(rows: List[Dict[str, Any]], columns: List[str]) -> io.StringIO:
+    """
+    Encode rows as CSV for COPY ... WITH (FORMAT csv).
+
+    CSV COPY reads an unquoted empty field as NULL and a quoted one as an
+    empty string, so None is written bare and every other value is quoted
+    to keep '' distinct from NULL.
+    """
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(",".join(_copy_field(row[column]) for column in columns))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+def bulk_insert(db: Session, table: Table, rows: List[Dict[str, Any]], batch_size: int = 1000) -> int:
+    """
+    Insert many rows in the session's transaction, bypassing the ORM unit of work.
+
+    PostgreSQL (psycopg2) streams the rows through COPY FROM STDIN; other
+    databases get executemany INSERTs of batch_size rows, which SQLAlchemy
+    sends as multi-row VALUES statements.
+
+    COPY skips SQLAlchemy-side column defaults, so rows must carry values
+    for any Python-side defaults (e.g. uuid4 primary keys). All rows must
+    have the same keys.
+
+    Returns:
+        Number of rows inserted
+    """
+    if not rows:
+        return 0
+
+    connection = db.connection()
+    columns = list(rows[0].keys())
+    dbapi_connection = connection.connection.dbapi_connection
+
+    if connection.dialect.name == "postgresql" and connection.dialect.driver == "psycopg2":
+        buffer = _copy_buffer(rows, columns)
+
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        finally:
+            cursor.close()
+        return len(rows)
+
+    for start in range(0, len(rows), batch_size):
+        connection.execute(table.insert(), rows[start:start + batch_size])
+    return len(rows)
+
+
 def init_db():
     """
     Initialize database tables.
@@ -94,12 +234,20 @@ def init_db():
     from src.core.models.base import Base
 
     # Import all models so they're registered with Base
-    from src.core.models import docket, document, hearing, transcript, analysis, entity
+    from src.core.models import docket, document, hearing, transcript, analysis, entity, job, stats
 
     logger.info("Creating database tables...")
     Base.metadata.create_all(bind=engine)
     logger.info("Database tables created successfully")
 
+    # create_all only fires DDL events for new tables; make sure databases
+    # created before the full-text index existed get one too.
+    with engine.begin() as conn:
+        hearings_indexed = hearing.install_fulltext_index(conn)
+        passages_indexed = transcript.install_passage_index(conn)
+        if hearings_indexed and passages_indexed:
+            logger.info("Full-text search index ready")
+
 
 # Optional: Log slow queries in development
 if settings.log_level == "DEBUG":
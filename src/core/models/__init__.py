@@ -8,9 +8,11 @@ from src.core.models.base import Base, TimestampMixin, StateModelMixin
 from src.core.models.docket import Docket
 from src.core.models.document import Document
 from src.core.models.hearing import Hearing
-from src.core.models.transcript import TranscriptSegment
+from src.core.models.transcript import TranscriptPassage, TranscriptSegment
 from src.core.models.analysis import Analysis
 from src.core.models.entity import Entity
+from src.core.models.job import PipelineJob
+from src.core.models.stats import StatsRollup
 
 __all__ = [
     # Base
@@ -22,6 +24,9 @@ __all__ = [
     "Document",
     "Hearing",
     "TranscriptSegment",
+    "TranscriptPassage",
     "Analysis",
     "Entity",
+    "PipelineJob",
+    "StatsRollup",
 ]
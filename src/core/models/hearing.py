@@ -14,14 +14,14 @@ import uuid
 from datetime import date, time, datetime
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import Column, String, Text, Date, Time, Integer, Numeric, ForeignKey, Index, DateTime
+from sqlalchemy import Column, String, Text, Date, Time, Integer, Numeric, ForeignKey, Index, DateTime, event, text
 from sqlalchemy.orm import relationship, Mapped
 
 from src.core.models.base import Base, TimestampMixin, StateModelMixin, GUID
 
 if TYPE_CHECKING:
     from src.core.models.docket import Docket
-    from src.core.models.transcript import TranscriptSegment
+    from src.core.models.transcript import TranscriptPassage, TranscriptSegment
     from src.core.models.analysis import Analysis
 
 
@@ -115,6 +115,12 @@ class Hearing(Base, StateModelMixin, TimestampMixin):
         cascade="all, delete-orphan",
         order_by="TranscriptSegment.segment_index",
     )
+    passages: Mapped[list["TranscriptPassage"]] = relationship(
+        "TranscriptPassage",
+        back_populates="hearing",
+        cascade="all, delete-orphan",
+        order_by="TranscriptPassage.passage_index",
+    )
     analysis: Mapped[Optional["Analysis"]] = relationship(
         "Analysis",
         back_populates="hearing",
@@ -127,6 +133,7 @@ class Hearing(Base, StateModelMixin, TimestampMixin):
         Index("ix_hearings_state_date", "state_code", "hearing_date"),
         Index("ix_hearings_state_status", "state_code", "transcript_status"),
         Index("ix_hearings_external", "source_system", "external_id"),
+        Index("ix_hearings_created_at", "created_at"),
     )
 
     def __repr__(self) -> str:
@@ -138,3 +145,110 @@ class Hearing(Base, StateModelMixin, TimestampMixin):
         if self.duration_seconds:
             return self.duration_seconds // 60
         return None
+
+
+# =============================================================================
+# FULL-TEXT INDEX
+# =============================================================================
+#
+# Transcripts are indexed outside the mapped columns so the model stays
+# portable: PostgreSQL gets a stored tsvector column with a GIN index,
+# SQLite gets an FTS5 shadow table kept in sync by triggers.
+# SearchService queries these directly (see src/core/services/search.py).
+
+HEARING_FTS_TABLE = "hearings_fts"
+
+_FULLTEXT_DDL = {
+    "postgresql": [
+        """
+        ALTER TABLE hearings ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(full_text, '')), 'B')
+        ) STORED
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_hearings_search_vector ON hearings USING gin (search_vector)",
+    ],
+    "sqlite": [
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {HEARING_FTS_TABLE} USING fts5(
+            title, full_text,
+            content='hearings', content_rowid='rowid',
+            tokenize='porter unicode61'
+        )
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS hearings_fts_ai AFTER INSERT ON hearings BEGIN
+            INSERT INTO {HEARING_FTS_TABLE}(rowid, title, full_text)
+            VALUES (new.rowid, new.title, new.full_text);
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS hearings_fts_ad AFTER DELETE ON hearings BEGIN
+            INSERT INTO {HEARING_FTS_TABLE}({HEARING_FTS_TABLE}, rowid, title, full_text)
+            VALUES ('delete', old.rowid, old.title, old.full_text);
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS hearings_fts_au AFTER UPDATE OF title, full_text ON hearings BEGIN
+            INSERT INTO {HEARING_FTS_TABLE}({HEARING_FTS_TABLE}, rowid, title, full_text)
+            VALUES ('delete', old.rowid, old.title, old.full_text);
+            INSERT INTO {HEARING_FTS_TABLE}(rowid, title, full_text)
+            VALUES (new.rowid, new.title, new.full_text);
+        END
+        """,
+    ],
+}
+
+
+def has_fulltext_index(connection) -> bool:
+    """Check whether the dialect-specific full-text index exists."""
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        return connection.execute(text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = 'hearings' AND column_name = 'search_vector'"
+        )).first() is not None
+    if dialect == "sqlite":
+        return connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = :name"),
+            {"name": HEARING_FTS_TABLE},
+        ).first() is not None
+    return False
+
+
+def install_fulltext_index(connection) -> bool:
+    """
+    Create the full-text index for this connection's dialect.
+
+    Idempotent. An SQLite shadow table created over existing rows is
+    rebuilt from the hearings table so older dev databases get indexed.
+
+    Returns:
+        True if the dialect supports a full-text index
+    """
+    statements = _FULLTEXT_DDL.get(connection.dialect.name)
+    if not statements:
+        return False
+    if has_fulltext_index(connection):
+        return True
+
+    for statement in statements:
+        connection.execute(text(statement))
+
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(
+            f"INSERT INTO {HEARING_FTS_TABLE}({HEARING_FTS_TABLE}) VALUES ('rebuild')"
+        ))
+    return True
+
+
+@event.listens_for(Hearing.__table__, "after_create")
+def _create_fulltext_index(target, connection, **kw):
+    install_fulltext_index(connection)
+
+
+@event.listens_for(Hearing.__table__, "before_drop")
+def _drop_fulltext_index(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DROP TABLE IF EXISTS {HEARING_FTS_TABLE}"))
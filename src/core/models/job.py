@@ -0,0 +1,69 @@
+"""
+Pipeline job model - durable queue of stage runs.
+
+Jobs are enqueued by the admin API and processed by `psc worker`
+processes through core.services.job_queue.JobQueue.
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Column, String, Text, Integer, DateTime, Index, JSON
+
+from src.core.models.base import Base, TimestampMixin, GUID
+
+
+# Job status values
+JOB_STATUS = [
+    "queued",       # Waiting for a worker (run_after may be in the future)
+    "running",      # Leased by a worker
+    "succeeded",    # Handler completed
+    "failed",       # Out of attempts
+    "cancelled",    # Cancelled before it ran
+    "paused",       # Held back until resumed
+]
+
+
+class PipelineJob(Base, TimestampMixin):
+    """
+    A unit of pipeline work (one stage on one hearing).
+
+    Workers lease jobs with SELECT ... FOR UPDATE SKIP LOCKED, heartbeat
+    while running and retry failures with backoff.
+    """
+
+    __tablename__ = "pipeline_jobs"
+
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+
+    kind = Column(String(50), nullable=False, comment="Handler name (transcribe, analyze)")
+    payload = Column(JSON, nullable=False, default=dict, comment="Handler arguments")
+    run_id = Column(String(64), index=True, comment="Groups jobs enqueued together")
+
+    status = Column(String(20), nullable=False, default="queued", comment="Job status")
+    priority = Column(Integer, nullable=False, default=0, comment="Higher runs first")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        comment="Not leased before this time (retry backoff)",
+    )
+
+    # Lease
+    locked_by = Column(String(100), comment="Worker holding the lease")
+    locked_at = Column(DateTime)
+    heartbeat_at = Column(DateTime)
+
+    # Outcome
+    finished_at = Column(DateTime)
+    last_error = Column(Text)
+    result = Column(JSON)
+
+    __table_args__ = (
+        Index("ix_pipeline_jobs_status_run_after", "status", "run_after"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<PipelineJob {self.kind} {self.status} attempt {self.attempts}>"
@@ -0,0 +1,31 @@
+"""
+Stats rollup model - precomputed dashboard counters.
+
+Maintained by src.core.services.stats; see
+core.services.stats_rollup for how counters are kept current.
+"""
+
+from sqlalchemy import Column, String, Date, Numeric
+
+from src.core.models.base import Base
+
+
+class StatsRollup(Base):
+    """
+    One additive counter: a metric's change on a day, per state and dimension.
+
+    Dimension is the status, model name, etc. the metric is broken down
+    by, or '' for plain totals. A metric's current value is the sum of its
+    rows over all days.
+    """
+
+    __tablename__ = "stats_rollups"
+
+    state_code = Column(String(2), primary_key=True, comment="Two-letter state code")
+    day = Column(Date, primary_key=True, comment="UTC day the change was recorded")
+    metric = Column(String(50), primary_key=True, comment="Counter name (hearings, analysis_cost, ...)")
+    dimension = Column(String(100), primary_key=True, default="", comment="Breakdown key or ''")
+    value = Column(Numeric(18, 4), nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<StatsRollup({self.state_code}:{self.day} {self.metric}[{self.dimension}]={self.value})>"
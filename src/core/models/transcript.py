@@ -10,12 +10,15 @@ Used for:
 - Time-synced transcript display
 - Speaker-attributed search
 - Semantic search with embeddings
+
+TranscriptPassage rows are overlapping windows of consecutive segments,
+indexed for full-text search so phrases split across segments match.
 """
 
 import uuid
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import Column, String, Text, Float, Integer, ForeignKey, Index
+from sqlalchemy import JSON, Column, String, Text, Float, Integer, ForeignKey, Index, event, text
 from sqlalchemy.orm import relationship, Mapped
 
 from src.core.models.base import Base, TimestampMixin, GUID
@@ -119,9 +122,161 @@ class TranscriptSegment(Base, TimestampMixin):
         return f"{minutes}:{seconds:02d}"
 
 
-# Add embedding column if pgvector is available
+# Embedding column: a pgvector vector when pgvector is available, otherwise
+# a JSON list searched by brute force (SQLite, tests)
 if HAS_PGVECTOR:
     TranscriptSegment.embedding = Column(
         Vector(1536),
         comment="OpenAI text-embedding-3-small vector",
     )
+else:
+    TranscriptSegment.embedding = Column(
+        JSON(none_as_null=True),
+        comment="Embedding vector (JSON list; brute-force search)",
+    )
+
+
+class TranscriptPassage(Base, TimestampMixin):
+    """
+    Window of consecutive transcript segments, for phrase search.
+
+    Derived from the segments when a hearing is transcribed (see
+    core.services.passages); rebuild with `psc pipeline passages`.
+    """
+
+    __tablename__ = "transcript_passages"
+
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+
+    hearing_id = Column(
+        GUID(),
+        ForeignKey("hearings.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    passage_index = Column(Integer, nullable=False, comment="Order of passage within hearing")
+
+    # Segments covered (segment_index, inclusive)
+    first_segment_index = Column(Integer, nullable=False)
+    last_segment_index = Column(Integer, nullable=False)
+
+    start_time = Column(Float, comment="Start of the first segment, in seconds")
+    end_time = Column(Float, comment="End of the last segment, in seconds")
+    speakers = Column(String(500), comment="Speakers in order of first appearance, comma-separated")
+
+    text = Column(Text, nullable=False, comment="Segment texts joined in order")
+    segment_offsets = Column(
+        JSON,
+        comment="[[char offset, start time], ...] of each segment in text",
+    )
+
+    hearing: Mapped["Hearing"] = relationship(
+        "Hearing",
+        back_populates="passages",
+    )
+
+    __table_args__ = (
+        Index("ix_passages_hearing_index", "hearing_id", "passage_index"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<TranscriptPassage({self.hearing_id}:{self.passage_index})>"
+
+
+# =============================================================================
+# PASSAGE FULL-TEXT INDEX
+# =============================================================================
+#
+# Same layout as the hearings index (src/core/models/hearing.py): a stored
+# tsvector column with a GIN index on PostgreSQL, an FTS5 shadow table kept
+# in sync by triggers on SQLite.
+
+PASSAGE_FTS_TABLE = "transcript_passages_fts"
+
+_PASSAGE_FULLTEXT_DDL = {
+    "postgresql": [
+        """
+        ALTER TABLE transcript_passages ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('english', coalesce(text, ''))) STORED
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_passages_search_vector ON transcript_passages USING gin (search_vector)",
+    ],
+    "sqlite": [
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {PASSAGE_FTS_TABLE} USING fts5(
+            text,
+            content='transcript_passages', content_rowid='rowid',
+            tokenize='porter unicode61'
+        )
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS transcript_passages_fts_ai AFTER INSERT ON transcript_passages BEGIN
+            INSERT INTO {PASSAGE_FTS_TABLE}(rowid, text) VALUES (new.rowid, new.text);
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS transcript_passages_fts_ad AFTER DELETE ON transcript_passages BEGIN
+            INSERT INTO {PASSAGE_FTS_TABLE}({PASSAGE_FTS_TABLE}, rowid, text)
+            VALUES ('delete', old.rowid, old.text);
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS transcript_passages_fts_au AFTER UPDATE OF text ON transcript_passages BEGIN
+            INSERT INTO {PASSAGE_FTS_TABLE}({PASSAGE_FTS_TABLE}, rowid, text)
+            VALUES ('delete', old.rowid, old.text);
+            INSERT INTO {PASSAGE_FTS_TABLE}(rowid, text) VALUES (new.rowid, new.text);
+        END
+        """,
+    ],
+}
+
+
+def has_passage_index(connection) -> bool:
+    """Check whether the dialect-specific passage full-text index exists."""
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        return connection.execute(text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = 'transcript_passages' AND column_name = 'search_vector'"
+        )).first() is not None
+    if dialect == "sqlite":
+        return connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = :name"),
+            {"name": PASSAGE_FTS_TABLE},
+        ).first() is not None
+    return False
+
+
+def install_passage_index(connection) -> bool:
+    """
+    Create the passage full-text index for this connection's dialect.
+
+    Idempotent; see install_fulltext_index in src.core.models.hearing.
+
+    Returns:
+        True if the dialect supports a full-text index
+    """
+    statements = _PASSAGE_FULLTEXT_DDL.get(connection.dialect.name)
+    if not statements:
+        return False
+    if has_passage_index(connection):
+        return True
+
+    for statement in statements:
+        connection.execute(text(statement))
+
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(
+            f"INSERT INTO {PASSAGE_FTS_TABLE}({PASSAGE_FTS_TABLE}) VALUES ('rebuild')"
+        ))
+    return True
+
+
+@event.listens_for(TranscriptPassage.__table__, "after_create")
+def _create_passage_index(target, connection, **kw):
+    install_passage_index(connection)
+
+
+@event.listens_for(TranscriptPassage.__table__, "before_drop")
+def _drop_passage_index(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DROP TABLE IF EXISTS {PASSAGE_FTS_TABLE}"))
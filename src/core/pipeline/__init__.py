@@ -7,12 +7,14 @@ Provides:
 - PipelineOrchestrator: Runs stages on hearings
 - TranscribeStage: Whisper transcription (shared)
 - AnalyzeStage: LLM analysis (shared)
+- EmbedStage: Segment embeddings for semantic search (shared)
 """
 
 from src.core.pipeline.base import PipelineStage, StageResult
 from src.core.pipeline.orchestrator import PipelineOrchestrator
 from src.core.pipeline.transcribe import TranscribeStage
 from src.core.pipeline.analyze import AnalyzeStage
+from src.core.pipeline.embed import EmbedStage
 
 __all__ = [
     "PipelineStage",
@@ -20,4 +22,5 @@ __all__ = [
     "PipelineOrchestrator",
     "TranscribeStage",
     "AnalyzeStage",
+    "EmbedStage",
 ]
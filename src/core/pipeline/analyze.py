@@ -9,13 +9,18 @@ Extracts structured intelligence:
 - Commissioner sentiment
 - Outcome predictions
 - Action items
+
+Transcripts too long for one prompt are analyzed map-reduce style: split
+into parts along segment/speaker boundaries, each part extracted
+concurrently, then the findings merged by a final reduce prompt.
 """
 
 import json
 import logging
-import time
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Tuple, Optional, Dict, Any
+from typing import Tuple, Optional, Dict, Any, List
 
 from sqlalchemy.orm import Session
 
@@ -24,13 +29,19 @@ from src.core.models.hearing import Hearing
 from src.core.models.transcript import TranscriptSegment
 from src.core.models.analysis import Analysis
 from src.core.pipeline.base import PipelineStage, StageResult
+from src.core.services.invalidation import ANALYSES, HEARINGS, notify_changed
+from core.services.llm import Message, OpenAILLMService, get_llm_service
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# Pricing for GPT-4o-mini
-GPT4O_MINI_INPUT_COST_PER_1M = 0.15
-GPT4O_MINI_OUTPUT_COST_PER_1M = 0.60
+
+# Transcripts up to this size are analyzed in a single prompt
+MAX_SINGLE_PASS_TOKENS = 100_000
+
+# A line that starts a new speaker turn ("COMMISSIONER SMITH: ...", "SPEAKER_01: ...")
+SPEAKER_TURN = re.compile(r"^\s*[A-Z][\w .,'()-]{0,60}:\s")
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[A-Z\"'(])")
 
 # State-specific system prompt context
 STATE_CONTEXT = {
@@ -83,7 +94,9 @@ TRANSCRIPT:
 {transcript_text}
 ---
 
-Produce a JSON analysis with this structure:
+"""
+
+OUTPUT_FORMAT = """Produce a JSON analysis with this structure:
 
 {{
   "summary": "2-3 paragraph executive summary",
@@ -159,6 +172,61 @@ STANDARD TOPIC NAMES (use these when applicable):
 
 Return ONLY valid JSON."""
 
+USER_PROMPT_TEMPLATE += OUTPUT_FORMAT
+
+
+CHUNK_PROMPT_TEMPLATE = """This is part {part} of {total_parts} of a {state_name} hearing transcript that is too long to analyze at once. Extract the intelligence in this part; the parts will be merged afterwards.
+
+HEARING METADATA:
+- Title: {title}
+- Docket: {docket_number}
+- Date: {hearing_date}
+- Type: {hearing_type}
+
+TRANSCRIPT PART {part}/{total_parts}:
+---
+{transcript_text}
+---
+
+Produce a JSON object with this structure (use empty lists when nothing applies):
+
+{{
+  "summary": "One paragraph on what happened in this part",
+  "utility_name": "Primary utility involved, if evident",
+  "participants": [{{"name": "Name", "role": "Role", "affiliation": "Organization"}}],
+  "topics": [{{"name": "Topic name", "relevance": "high, medium, or low", "sentiment": "positive, negative, neutral, or mixed", "context": "One sentence"}}],
+  "utilities": [{{"name": "Full company name", "aliases": ["Alternate names"], "role": "applicant, intervenor, or subject", "context": "Brief description"}}],
+  "issues": [{{"issue": "Key issue", "description": "Brief description"}}],
+  "commitments": [{{"commitment": "What was committed", "by_whom": "Who made it", "context": "Context"}}],
+  "vulnerabilities": ["Weakness or vulnerability exposed"],
+  "commissioner_concerns": [{{"commissioner": "Name", "concern": "What they're worried about"}}],
+  "public_comments": "Summary of public input in this part, if any",
+  "quotes": [{{"speaker": "Name", "quote": "Notable quote", "significance": "Why it matters"}}]
+}}
+
+Return ONLY valid JSON."""
+
+
+REDUCE_PROMPT_TEMPLATE = """Produce a comprehensive intelligence briefing for this {state_name} hearing. The transcript was too long to analyze at once, so it was split into {total_parts} consecutive parts and the findings of each part are given below in order.
+
+HEARING METADATA:
+- Title: {title}
+- Docket: {docket_number}
+- Date: {hearing_date}
+- Type: {hearing_type}
+- Duration: ~{duration_minutes} minutes
+
+FINDINGS BY PART:
+---
+{part_findings}
+---
+
+Merge the findings into one briefing covering the whole hearing: deduplicate participants, utilities and topics that appear in several parts (same person or company under slightly different names), combine overlapping issues and commitments, keep the most significant quotes, and base the summary, commissioner mood, likely outcome and risk factors on the hearing as a whole.
+
+"""
+
+REDUCE_PROMPT_TEMPLATE += OUTPUT_FORMAT
+
 
 STATE_NAMES = {
     "FL": "Florida PSC",
@@ -180,17 +248,21 @@ class AnalyzeStage(PipelineStage[Hearing]):
     name = "analyze"
 
     def __init__(self):
-        self._openai_client = None
+        self._llm = None
         self._tiktoken_encoder = None
 
     @property
-    def openai_client(self):
-        """Lazy load OpenAI client."""
-        if self._openai_client is None:
-            from openai import OpenAI
-            self._openai_client = OpenAI(api_key=settings.openai_api_key)
+    def llm(self) -> OpenAILLMService:
+        """Shared rate-limited LLM client for the analysis model."""
+        if self._llm is None:
+            self._llm = get_llm_service(
+                settings.analysis_model,
+                api_key=settings.openai_api_key,
+                requests_per_minute=settings.llm_requests_per_minute,
+                tokens_per_minute=settings.llm_tokens_per_minute,
+            )
             logger.info(f"Using OpenAI API with model {settings.analysis_model}")
-        return self._openai_client
+        return self._llm
 
     @property
     def tiktoken_encoder(self):
@@ -294,83 +366,148 @@ class AnalyzeStage(PipelineStage[Hearing]):
         return "\n".join(text_parts)
 
     def _analyze_transcript(self, hearing: Hearing, transcript_text: str) -> Tuple[Dict, float]:
-        """Run GPT-4o-mini analysis on transcript."""
+        """Run GPT-4o-mini analysis on transcript, map-reducing long ones."""
         logger.info(f"Analyzing hearing {hearing.id} with {settings.analysis_model}")
 
-        # Truncate if too long
-        max_input_tokens = 100_000
-        input_tokens = len(self.tiktoken_encoder.encode(transcript_text))
-
-        if input_tokens > max_input_tokens:
-            logger.info(f"Truncating transcript from {input_tokens} to ~{max_input_tokens} tokens")
-            transcript_text = self._truncate_transcript(transcript_text, max_input_tokens)
-
-        # Build prompts
-        state_context = STATE_CONTEXT.get(hearing.state_code, "")
-        state_name = STATE_NAMES.get(hearing.state_code, "Public Utility Commission")
-
-        system_prompt = SYSTEM_PROMPT_TEMPLATE.format(state_context=state_context)
-        user_prompt = USER_PROMPT_TEMPLATE.format(
-            state_name=state_name,
-            title=hearing.title or "Unknown",
-            docket_number=hearing.docket_number or "Unknown",
-            hearing_date=hearing.hearing_date.isoformat() if hearing.hearing_date else "Unknown",
-            hearing_type=hearing.hearing_type or "Hearing",
-            duration_minutes=hearing.duration_minutes or 0,
-            transcript_text=transcript_text
-        )
+        units = self._transcript_units(transcript_text)
+        input_tokens = sum(tokens for _, tokens in units)
+
+        metadata = self._prompt_metadata(hearing)
+        system_prompt = self._system_prompt(hearing)
 
-        # Retry with exponential backoff for rate limits
-        max_retries = 5
-        base_delay = 60
-
-        for attempt in range(max_retries):
-            try:
-                response = self.openai_client.chat.completions.create(
-                    model=settings.analysis_model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    temperature=0.2,
-                    response_format={"type": "json_object"},
-                    max_tokens=4000
-                )
-                break
-            except Exception as e:
-                error_str = str(e)
-                if "429" in error_str or "rate limit" in error_str.lower():
-                    if attempt < max_retries - 1:
-                        delay = base_delay * (2 ** attempt)
-                        logger.warning(f"Rate limited on attempt {attempt + 1}, waiting {delay}s...")
-                        time.sleep(delay)
-                        continue
-                raise
-
-        # Parse response
-        content = response.choices[0].message.content
-        analysis_data = json.loads(content)
-
-        # Calculate cost
-        completion_tokens = response.usage.completion_tokens
-        total_prompt_tokens = response.usage.prompt_tokens
-        cost_usd = (
-            (total_prompt_tokens * GPT4O_MINI_INPUT_COST_PER_1M / 1_000_000) +
-            (completion_tokens * GPT4O_MINI_OUTPUT_COST_PER_1M / 1_000_000)
+        if input_tokens <= MAX_SINGLE_PASS_TOKENS:
+            user_prompt = USER_PROMPT_TEMPLATE.format(transcript_text=transcript_text, **metadata)
+            return self._complete_json(system_prompt, user_prompt, max_tokens=4000)
+
+        chunks = self._chunk_units(units, settings.analysis_chunk_tokens)
+        logger.info(
+            f"Transcript has {input_tokens} tokens; analyzing in {len(chunks)} parts "
+            f"({settings.analysis_max_concurrency} at a time)"
         )
 
-        logger.info(f"Analysis complete: {total_prompt_tokens} input, {completion_tokens} output, ${cost_usd:.4f}")
+        def analyze_part(part: int) -> Tuple[Dict, float]:
+            user_prompt = CHUNK_PROMPT_TEMPLATE.format(
+                part=part + 1,
+                total_parts=len(chunks),
+                transcript_text=chunks[part],
+                **metadata,
+            )
+            return self._complete_json(system_prompt, user_prompt, max_tokens=2000)
+
+        with ThreadPoolExecutor(max_workers=max(1, settings.analysis_max_concurrency)) as executor:
+            part_results = list(executor.map(analyze_part, range(len(chunks))))
+
+        findings = [{"part": i + 1, **data} for i, (data, _) in enumerate(part_results)]
+        reduce_prompt = REDUCE_PROMPT_TEMPLATE.format(
+            total_parts=len(chunks),
+            part_findings=json.dumps(findings, indent=1),
+            **metadata,
+        )
+        analysis_data, reduce_cost = self._complete_json(system_prompt, reduce_prompt, max_tokens=4000)
 
+        cost_usd = reduce_cost + sum(cost for _, cost in part_results)
+        logger.info(f"Map-reduce analysis complete: {len(chunks)} parts, ${cost_usd:.4f}")
         return analysis_data, cost_usd
 
-    def _truncate_transcript(self, text: str, max_tokens: int) -> str:
-        """Truncate transcript keeping beginning and end."""
-        lines = text.split('\n')
-        target_lines = int(len(lines) * 0.7)
-        keep_start = target_lines // 2
-        keep_end = target_lines // 2
-        truncated = lines[:keep_start] + ["\n[... TRANSCRIPT TRUNCATED FOR LENGTH ...]\n"] + lines[-keep_end:]
-        return '\n'.join(truncated)
+    def _prompt_metadata(self, hearing: Hearing) -> Dict[str, Any]:
+        """Hearing fields used by the prompt templates."""
+        return {
+            "state_name": STATE_NAMES.get(hearing.state_code, "Public Utility Commission"),
+            "title": hearing.title or "Unknown",
+            "docket_number": hearing.docket_number or "Unknown",
+            "hearing_date": hearing.hearing_date.isoformat() if hearing.hearing_date else "Unknown",
+            "hearing_type": hearing.hearing_type or "Hearing",
+            "duration_minutes": hearing.duration_minutes or 0,
+        }
+
+    def _system_prompt(self, hearing: Hearing) -> str:
+        return SYSTEM_PROMPT_TEMPLATE.format(
+            state_context=STATE_CONTEXT.get(hearing.state_code, "")
+        )
+
+    def _complete_json(self, system_prompt: str, user_prompt: str, max_tokens: int) -> Tuple[Dict, float]:
+        """Run one JSON-mode completion through the shared LLM service. Returns (data, cost)."""
+        response = self.llm.complete(
+            [Message("system", system_prompt), Message("user", user_prompt)],
+            temperature=0.2,
+            max_tokens=max_tokens,
+            json_mode=True,
+        )
+        if not response.success:
+            raise RuntimeError(response.error)
+
+        logger.info(
+            f"Completion: {response.input_tokens} input, {response.output_tokens} output, "
+            f"${response.cost_usd:.4f}"
+        )
+        return response.parsed_json, response.cost_usd
+
+    def _transcript_units(self, text: str) -> List[Tuple[str, int]]:
+        """
+        Split a transcript into (line, token_count) units.
+
+        Lines are segments (optionally "Speaker: text"); a line over the
+        chunk budget, such as a Whisper full_text without breaks, is cut
+        into budget-sized pieces at sentence ends. Every token takes at
+        least one byte, so only a line with more bytes than the budget can
+        exceed it: such lines are tokenized sentence by sentence, never
+        whole, and each piece of text is tokenized once. The counts are
+        reused for the single-pass check and chunking.
+        """
+        max_tokens = settings.analysis_chunk_tokens
+        units = []
+        for line in text.split("\n"):
+            if not line.strip():
+                continue
+            if len(line.encode("utf-8")) <= max_tokens:
+                units.append((line, len(self.tiktoken_encoder.encode(line))))
+                continue
+
+            pieces: List[Tuple[List[str], int]] = []
+            piece: List[str] = []
+            piece_tokens = 0
+            for sentence in SENTENCE_END.split(line):
+                sentence_tokens = len(self.tiktoken_encoder.encode(sentence))
+                if piece and piece_tokens + sentence_tokens > max_tokens:
+                    pieces.append((piece, piece_tokens))
+                    piece, piece_tokens = [], 0
+                piece.append(sentence)
+                piece_tokens += sentence_tokens
+            if piece:
+                pieces.append((piece, piece_tokens))
+
+            if len(pieces) == 1:
+                # Long in bytes but within budget: keep the line as it was
+                units.append((line, pieces[0][1]))
+            else:
+                units.extend((" ".join(p), tokens) for p, tokens in pieces)
+        return units
+
+    def _chunk_units(self, units: List[Tuple[str, int]], max_tokens: int) -> List[str]:
+        """
+        Pack units into chunks of at most max_tokens.
+
+        Once a chunk is 80% full it is closed at the next speaker turn so
+        exchanges are not split mid-answer. A single unit larger than the
+        budget becomes its own chunk.
+        """
+        chunks = []
+        current: List[str] = []
+        current_tokens = 0
+
+        for line, tokens in units:
+            if current and (
+                current_tokens + tokens > max_tokens
+                or (current_tokens >= max_tokens * 0.8 and SPEAKER_TURN.match(line))
+            ):
+                chunks.append("\n".join(current))
+                current, current_tokens = [], 0
+            current.append(line)
+            current_tokens += tokens
+
+        if current:
+            chunks.append("\n".join(current))
+        return chunks
 
     def _save_analysis(
         self,
@@ -414,6 +551,7 @@ class AnalyzeStage(PipelineStage[Hearing]):
         hearing.processing_cost_usd = (hearing.processing_cost_usd or 0) + cost
 
         db.commit()
+        notify_changed(ANALYSES, HEARINGS)
         logger.info(f"Saved analysis {analysis.id} for hearing {hearing.id}")
 
         return analysis
@@ -0,0 +1,194 @@
+"""
+Batch-API mode for the analyze stage.
+
+For backfills: build one request per transcribed hearing from the
+AnalyzeStage prompts, submit them as an offline batch (about half the
+per-token price, no per-request latency), and on a later run poll the
+batch and save the results as Analysis rows.
+
+Ingest is idempotent: a hearing that already has an Analysis (from an
+earlier ingest or an online run) is skipped, and hearings in batches not
+yet ingested are not submitted again.
+
+Transcripts too long for a single prompt need the map-reduce path and are
+left to the online analyze stage.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+from src.core.models.analysis import Analysis
+from src.core.models.hearing import Hearing
+from src.core.pipeline.analyze import MAX_SINGLE_PASS_TOKENS, USER_PROMPT_TEMPLATE, AnalyzeStage
+from core.services.llm import Message
+from core.services.llm_batch import (
+    INGESTED,
+    BatchProvider,
+    BatchRequest,
+    BatchStore,
+    get_batch_provider,
+    parse_batch_result,
+    write_batch_file,
+)
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+BATCH_KIND = "analyze"
+
+
+def get_batch_store() -> BatchStore:
+    return BatchStore(Path(settings.analysis_batch_dir))
+
+
+def get_provider(store: BatchStore) -> BatchProvider:
+    return get_batch_provider(
+        settings.analysis_batch_provider,
+        store.root,
+        api_key=settings.openai_api_key,
+    )
+
+
+def build_batch_request(stage: AnalyzeStage, hearing: Hearing, db: Session) -> Optional[BatchRequest]:
+    """Single-pass analysis request for a hearing, or None if it can't be batched."""
+    if db.query(Analysis.id).filter(Analysis.hearing_id == hearing.id).first():
+        return None
+
+    transcript_text = stage._get_transcript_text(hearing, db)
+    if not transcript_text or len(transcript_text.strip()) < 100:
+        return None
+
+    input_tokens = sum(tokens for _, tokens in stage._transcript_units(transcript_text))
+    if input_tokens > MAX_SINGLE_PASS_TOKENS:
+        logger.info(f"Skipping hearing {hearing.id}: {input_tokens} tokens needs map-reduce analysis")
+        return None
+
+    user_prompt = USER_PROMPT_TEMPLATE.format(
+        transcript_text=transcript_text, **stage._prompt_metadata(hearing)
+    )
+    return BatchRequest(
+        custom_id=str(hearing.id),
+        messages=[Message("system", stage._system_prompt(hearing)), Message("user", user_prompt)],
+        max_tokens=4000,
+        temperature=0.2,
+        json_mode=True,
+    )
+
+
+def submit_analysis_batch(
+    db: Session,
+    state_code: Optional[str] = None,
+    limit: int = 500,
+    provider: Optional[BatchProvider] = None,
+    store: Optional[BatchStore] = None,
+    stage: Optional[AnalyzeStage] = None,
+) -> Optional[str]:
+    """
+    Submit transcribed, unanalyzed hearings as one batch.
+
+    Hearings that can't be batched (too short, or too long for one pass)
+    stay transcribed, so candidates are read a page at a time until limit
+    requests are built rather than letting those fill the window.
+
+    Returns:
+        Provider batch id, or None if there was nothing to submit
+    """
+    store = store or get_batch_store()
+    provider = provider or get_provider(store)
+    stage = stage or AnalyzeStage()
+
+    in_flight = [UUID(cid) for cid in store.pending_ids(BATCH_KIND)]
+    query = db.query(Hearing).filter(Hearing.transcript_status == "transcribed")
+    if state_code:
+        query = query.filter(Hearing.state_code == state_code.upper())
+    if in_flight:
+        query = query.filter(Hearing.id.notin_(in_flight))
+    query = query.order_by(Hearing.hearing_date.desc(), Hearing.id)
+
+    requests: List[BatchRequest] = []
+    offset = 0
+    while len(requests) < limit:
+        hearings = query.offset(offset).limit(limit).all()
+        for hearing in hearings:
+            request = build_batch_request(stage, hearing, db)
+            if request:
+                requests.append(request)
+                if len(requests) == limit:
+                    break
+        if len(hearings) < limit:
+            break
+        offset += limit
+
+    if not requests:
+        logger.info("No hearings to submit for batch analysis")
+        return None
+
+    request_file = store.request_path(BATCH_KIND)
+    write_batch_file(request_file, requests, settings.analysis_model)
+    batch_id = provider.submit(request_file, metadata={"kind": BATCH_KIND})
+    store.record(
+        batch_id,
+        kind=BATCH_KIND,
+        provider=provider.name,
+        model=settings.analysis_model,
+        custom_ids=[r.custom_id for r in requests],
+        request_file=request_file,
+    )
+
+    logger.info(f"Submitted {len(requests)} hearings for batch analysis as {batch_id}")
+    return batch_id
+
+
+def ingest_analysis_batches(
+    db: Session,
+    provider: Optional[BatchProvider] = None,
+    store: Optional[BatchStore] = None,
+    stage: Optional[AnalyzeStage] = None,
+) -> Dict[str, int]:
+    """
+    Poll open analysis batches and save the results of finished ones.
+
+    Returns:
+        Counts: running (batches not finished yet), saved, skipped
+        (already analyzed or hearing gone), failed (request errors or
+        invalid JSON)
+    """
+    store = store or get_batch_store()
+    provider = provider or get_provider(store)
+    stage = stage or AnalyzeStage()
+    counts = {"running": 0, "saved": 0, "skipped": 0, "failed": 0}
+
+    for manifest in store.open_manifests(BATCH_KIND):
+        job = provider.retrieve(manifest["batch_id"])
+        if not job.finished:
+            counts["running"] += 1
+            store.mark(manifest, job.status, request_counts=job.request_counts)
+            continue
+
+        errors: List[Dict[str, str]] = []
+        for line in provider.results(job.id):
+            custom_id, response = parse_batch_result(line, json_mode=True)
+            if not response.success:
+                counts["failed"] += 1
+                errors.append({"id": custom_id, "error": response.error or ""})
+                continue
+
+            hearing = db.get(Hearing, UUID(custom_id))
+            already = db.query(Analysis.id).filter(Analysis.hearing_id == UUID(custom_id)).first()
+            if hearing is None or already:
+                counts["skipped"] += 1
+                continue
+
+            stage._save_analysis(hearing, response.parsed_json, response.cost_usd, db)
+            counts["saved"] += 1
+
+        # Hearings whose request failed are picked up by the next submit
+        store.mark(manifest, INGESTED, batch_status=job.status, batch_error=job.error, errors=errors)
+        logger.info(f"Ingested batch {job.id} ({job.status}): {counts}")
+
+    return counts
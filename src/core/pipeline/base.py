@@ -43,7 +43,8 @@ class BatchResult:
     """
     Result from processing a batch of items.
 
-    Aggregates individual StageResults.
+    Aggregates individual StageResults. stopped_reason is set when the
+    batch ended early (cancelled or cost ceiling reached).
     """
     total: int = 0
     successful: int = 0
@@ -52,6 +53,7 @@ class BatchResult:
     total_cost_usd: float = 0.0
     errors: list = field(default_factory=list)
     results: list = field(default_factory=list)
+    stopped_reason: str = ""
 
     def add_result(self, item_id: Any, result: StageResult):
         """Add a stage result to the batch."""
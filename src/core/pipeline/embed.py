@@ -0,0 +1,149 @@
+"""
+Embed stage - vectors for transcript segments.
+
+Fills TranscriptSegment.embedding for a transcribed hearing so
+/api/search/semantic can rank segments by meaning as well as by words.
+Segments are embedded in batched requests; repeated texts (within the
+hearing and, through the shared cache, across hearings) are embedded
+once. Only segments without an embedding are sent, so a re-run after a
+partial failure finishes the rest. Blank segments are never embedded
+(the API rejects empty inputs) and stay without a vector.
+"""
+
+import logging
+from typing import Optional, Tuple
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+from src.core.models.hearing import Hearing
+from src.core.models.transcript import TranscriptSegment
+from src.core.pipeline.base import PipelineStage, StageResult
+from src.core.services.embeddings import (
+    EmbeddingCache,
+    EmbeddingProvider,
+    embed_texts,
+    get_embedding_provider,
+)
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_shared_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Process-wide cache shared by the embed stage and semantic search."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = EmbeddingCache(max_entries=settings.embedding_cache_entries)
+    return _shared_cache
+
+
+def get_default_provider() -> EmbeddingProvider:
+    return get_embedding_provider(
+        settings.embedding_provider,
+        settings.embedding_model,
+        api_key=settings.openai_api_key,
+    )
+
+
+class EmbedStage(PipelineStage[Hearing]):
+    """
+    Embed a hearing's transcript segments.
+
+    Uses the configured provider (OpenAI text-embedding-3-small by
+    default) with the process-wide embedding cache.
+    """
+
+    name = "embed"
+
+    def __init__(
+        self,
+        provider: Optional[EmbeddingProvider] = None,
+        cache: Optional[EmbeddingCache] = None,
+        batch_size: Optional[int] = None,
+    ):
+        self._provider = provider
+        self.cache = cache or get_embedding_cache()
+        self.batch_size = batch_size or settings.embedding_batch_size
+
+    @property
+    def provider(self) -> EmbeddingProvider:
+        if self._provider is None:
+            self._provider = get_default_provider()
+        return self._provider
+
+    def validate(self, hearing: Hearing, db: Session) -> Tuple[bool, str]:
+        """Check the hearing has segments still to embed."""
+        if self._provider is None and settings.embedding_provider == "openai" and not settings.openai_api_key:
+            return False, "No OpenAI API key configured"
+
+        pending = db.query(TranscriptSegment.id).filter(
+            TranscriptSegment.hearing_id == hearing.id,
+            TranscriptSegment.embedding.is_(None),
+            func.trim(TranscriptSegment.text) != "",
+        ).first()
+        if pending is None:
+            has_segments = db.query(TranscriptSegment.id).filter(
+                TranscriptSegment.hearing_id == hearing.id
+            ).first()
+            return False, "Already embedded" if has_segments else "No transcript segments"
+
+        return True, ""
+
+    def execute(self, hearing: Hearing, db: Session) -> StageResult:
+        """Embed segments without a vector and store the vectors."""
+        segments = [
+            seg for seg in db.query(TranscriptSegment.id, TranscriptSegment.text).filter(
+                TranscriptSegment.hearing_id == hearing.id,
+                TranscriptSegment.embedding.is_(None),
+            ).order_by(TranscriptSegment.segment_index)
+            if seg.text and seg.text.strip()
+        ]
+
+        result = embed_texts(
+            self.provider,
+            [seg.text for seg in segments],
+            cache=self.cache,
+            batch_size=self.batch_size,
+        )
+
+        updates = [
+            {"id": seg.id, "embedding": vector}
+            for seg, vector in zip(segments, result.vectors, strict=True)
+            if vector is not None
+        ]
+        if updates:
+            # ORM bulk UPDATE by primary key: one executemany, no object loads
+            db.execute(update(TranscriptSegment), updates)
+        db.commit()
+
+        data = {
+            "segments": len(segments),
+            "embedded": len(updates),
+            "cached": result.cached,
+            "requests": result.requests,
+            "input_tokens": result.input_tokens,
+        }
+        logger.info(
+            f"Embedded {len(updates)}/{len(segments)} segments for hearing {hearing.id} "
+            f"({result.cached} cached or duplicate, {result.requests} requests)"
+        )
+
+        if len(updates) < len(segments):
+            return StageResult(
+                success=False,
+                data=data,
+                error=f"{len(segments) - len(updates)} segments not embedded: {result.errors[0]}",
+                cost_usd=result.cost_usd,
+                model=self.provider.model,
+            )
+
+        return StageResult(
+            success=True,
+            data=data,
+            cost_usd=result.cost_usd,
+            model=self.provider.model,
+        )
@@ -0,0 +1,103 @@
+"""
+Pipeline jobs - stage runs executed through the durable job queue.
+
+The admin API enqueues one job per hearing; `psc worker` processes
+lease and run them. Each job runs a single stage on a single hearing
+via PipelineOrchestrator.run_stage.
+"""
+
+import logging
+import uuid
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+from src.core.models.job import PipelineJob
+from src.core.pipeline.analyze import AnalyzeStage
+from src.core.pipeline.embed import EmbedStage
+from src.core.pipeline.orchestrator import PipelineOrchestrator
+from src.core.pipeline.transcribe import TranscribeStage
+from core.services.job_queue import JobQueue
+
+logger = logging.getLogger(__name__)
+
+STAGES = {
+    "transcribe": TranscribeStage,
+    "analyze": AnalyzeStage,
+    "embed": EmbedStage,
+}
+
+
+class StageFailedError(Exception):
+    """Raised when a stage returns an unsuccessful result, so the job is retried."""
+
+
+def get_job_queue() -> JobQueue:
+    """Job queue over the pipeline_jobs table."""
+    settings = get_settings()
+    return JobQueue(PipelineJob, lease_seconds=settings.job_lease_seconds)
+
+
+def enqueue_stage_jobs(
+    db: Session,
+    stage_name: str,
+    hearing_ids: List[UUID],
+    max_cost_usd: Optional[float] = None,
+) -> str:
+    """
+    Enqueue one job per hearing and commit.
+
+    Args:
+        stage_name: Key of STAGES
+        hearing_ids: Hearings to process
+        max_cost_usd: Jobs of this run are skipped once its succeeded
+            jobs have reported this much cost
+
+    Returns:
+        run_id grouping the jobs
+    """
+    settings = get_settings()
+    queue = get_job_queue()
+    run_id = f"{stage_name}_{uuid.uuid4().hex[:12]}"
+
+    for hearing_id in hearing_ids:
+        queue.enqueue(
+            db,
+            stage_name,
+            {"hearing_id": str(hearing_id), "run_id": run_id, "max_cost_usd": max_cost_usd},
+            run_id=run_id,
+            max_attempts=settings.job_max_attempts,
+        )
+    db.commit()
+
+    logger.info(f"Enqueued {len(hearing_ids)} {stage_name} jobs as run {run_id}")
+    return run_id
+
+
+def run_stage_job(stage_name: str, payload: Dict[str, Any], db: Session) -> Dict[str, Any]:
+    """Run a stage on the payload's hearing and return the job result."""
+    max_cost_usd = payload.get("max_cost_usd")
+    if max_cost_usd and get_job_queue().run_cost(db, payload["run_id"]) >= max_cost_usd:
+        return {"skipped": True, "error": f"Run cost ceiling ${max_cost_usd:.2f} reached"}
+
+    orchestrator = PipelineOrchestrator(db)
+    result = orchestrator.run_stage(STAGES[stage_name](), UUID(payload["hearing_id"]))
+
+    if not result.success:
+        raise StageFailedError(result.error)
+
+    return {
+        "skipped": result.skipped,
+        "error": result.error,
+        "cost_usd": result.cost_usd,
+        "model": result.model,
+    }
+
+
+# Handlers for JobWorker, keyed by job kind
+JOB_HANDLERS = {
+    name: (lambda payload, db, name=name: run_stage_job(name, payload, db))
+    for name in STAGES
+}
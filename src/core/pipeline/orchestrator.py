@@ -3,16 +3,19 @@ Pipeline orchestrator - coordinates running stages on hearings.
 
 Provides:
 - Run single stage on single hearing
-- Run single stage on batch of hearings
+- Run single stage on batch of hearings (optionally across a worker pool)
 - Run full pipeline (multiple stages) on hearing
 """
 
 import logging
-from typing import List, Optional, Type
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, List, Optional, Type
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from src.core.database import SessionLocal
 from src.core.models.hearing import Hearing
 from src.core.pipeline.base import PipelineStage, StageResult, BatchResult
 
@@ -35,6 +38,14 @@ class PipelineOrchestrator:
             hearing_ids=[id1, id2, id3]
         )
 
+        # Run stage on batch with 8 workers, stopping once $5 is spent
+        batch_result = orchestrator.run_stage_batch(
+            TranscribeStage(),
+            status_filter="pending",
+            concurrency=8,
+            max_cost_usd=5.0,
+        )
+
         # Run full pipeline
         results = orchestrator.run_pipeline(
             hearing_id,
@@ -42,8 +53,28 @@ class PipelineOrchestrator:
         )
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, *, session_factory: Callable[[], Session] = SessionLocal):
         self.db = db
+        # Worker threads can't share self.db; each opens its own session
+        self.session_factory = session_factory
+        self._cancel_event = threading.Event()
+        self._worker_local = threading.local()
+        self._worker_sessions: List[Session] = []
+        self._worker_sessions_lock = threading.Lock()
+
+    def cancel(self):
+        """
+        Ask a running batch to stop.
+
+        Cooperative: hearings already being processed finish, but no new
+        ones are started. Safe to call from another thread. The next batch
+        starts uncancelled.
+        """
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
 
     def run_stage(
         self,
@@ -99,21 +130,32 @@ class PipelineOrchestrator:
         state_code: Optional[str] = None,
         status_filter: Optional[str] = None,
         limit: int = 100,
+        concurrency: int = 1,
+        max_cost_usd: Optional[float] = None,
     ) -> BatchResult:
         """
         Run a stage on a batch of hearings.
 
+        With concurrency > 1 hearings are processed on a thread pool, each
+        worker using its own session from session_factory. The stage
+        instance is shared between workers.
+
         Args:
             stage: The pipeline stage to run
             hearing_ids: Specific hearing IDs to process (optional)
             state_code: Filter by state code
             status_filter: Filter by transcript_status
             limit: Maximum hearings to process
+            concurrency: Number of hearings processed at once
+            max_cost_usd: Stop starting new hearings once the batch has
+                spent this much (in-flight hearings may overshoot it)
 
         Returns:
             BatchResult with aggregated results
         """
         batch_result = BatchResult()
+        # A cancel() only applies to the batch it interrupted
+        self._cancel_event.clear()
 
         if hearing_ids:
             # Process specific hearings
@@ -131,18 +173,34 @@ class PipelineOrchestrator:
 
             hearings = query.limit(limit).all()
 
-        logger.info(f"Running {stage.name} on {len(hearings)} hearings")
-
-        for hearing in hearings:
-            try:
-                result = stage.process(hearing, self.db)
-                batch_result.add_result(hearing.id, result)
-            except Exception as e:
-                logger.exception(f"{stage.name} error for hearing {hearing.id}")
-                batch_result.add_result(
-                    hearing.id,
-                    StageResult(success=False, error=str(e))
-                )
+        logger.info(
+            f"Running {stage.name} on {len(hearings)} hearings "
+            f"(concurrency {max(concurrency, 1)})"
+        )
+
+        if concurrency > 1 and len(hearings) > 1:
+            self._run_batch_concurrent(
+                stage, [h.id for h in hearings], batch_result, concurrency, max_cost_usd
+            )
+        else:
+            for hearing in hearings:
+                if self._should_stop(batch_result, max_cost_usd):
+                    break
+                try:
+                    result = stage.process(hearing, self.db)
+                    batch_result.add_result(hearing.id, result)
+                except Exception as e:
+                    logger.exception(f"{stage.name} error for hearing {hearing.id}")
+                    batch_result.add_result(
+                        hearing.id,
+                        StageResult(success=False, error=str(e))
+                    )
+
+        if batch_result.stopped_reason:
+            logger.warning(
+                f"{stage.name} batch stopped after {batch_result.total}/{len(hearings)} "
+                f"hearings: {batch_result.stopped_reason}"
+            )
 
         logger.info(
             f"{stage.name} batch complete: "
@@ -154,6 +212,95 @@ class PipelineOrchestrator:
 
         return batch_result
 
+    def _run_batch_concurrent(
+        self,
+        stage: PipelineStage,
+        hearing_ids: List[UUID],
+        batch_result: BatchResult,
+        concurrency: int,
+        max_cost_usd: Optional[float],
+    ):
+        """
+        Process hearings on a thread pool, adding results as they finish.
+
+        Hearings are submitted one at a time as workers free up, so the
+        cost ceiling and cancellation are checked before each new hearing
+        rather than only once up front.
+        """
+        pending = iter(hearing_ids)
+        in_flight = {}
+
+        def submit_next() -> bool:
+            if self._should_stop(batch_result, max_cost_usd):
+                return False
+            hearing_id = next(pending, None)
+            if hearing_id is None:
+                return False
+            future = executor.submit(self._process_in_worker, stage, hearing_id)
+            in_flight[future] = hearing_id
+            return True
+
+        executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix=f"{stage.name}-worker"
+        )
+        try:
+            while len(in_flight) < concurrency and submit_next():
+                pass
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch_result.add_result(in_flight.pop(future), future.result())
+                while len(in_flight) < concurrency and submit_next():
+                    pass
+        finally:
+            executor.shutdown(wait=True)
+            self._close_worker_sessions()
+
+    def _process_in_worker(self, stage: PipelineStage, hearing_id: UUID) -> StageResult:
+        """Load a hearing in this worker's session and run the stage on it."""
+        db = self._worker_session()
+        try:
+            hearing = db.get(Hearing, hearing_id)
+            if not hearing:
+                return StageResult(success=False, error=f"Hearing {hearing_id} not found")
+            return stage.process(hearing, db)
+        except Exception as e:
+            logger.exception(f"{stage.name} error for hearing {hearing_id}")
+            db.rollback()
+            return StageResult(success=False, error=str(e))
+
+    def _worker_session(self) -> Session:
+        """Session owned by the current worker thread, created on first use."""
+        db = getattr(self._worker_local, "db", None)
+        if db is None:
+            db = self.session_factory()
+            self._worker_local.db = db
+            with self._worker_sessions_lock:
+                self._worker_sessions.append(db)
+        return db
+
+    def _close_worker_sessions(self):
+        with self._worker_sessions_lock:
+            sessions, self._worker_sessions = self._worker_sessions, []
+        for db in sessions:
+            db.close()
+        # Worker threads are gone; drop their thread-local sessions
+        self._worker_local = threading.local()
+
+    def _should_stop(self, batch_result: BatchResult, max_cost_usd: Optional[float]) -> bool:
+        """Check cancellation and the cost ceiling, recording why a batch stopped."""
+        if self._cancel_event.is_set():
+            batch_result.stopped_reason = "cancelled"
+            return True
+        if max_cost_usd is not None and batch_result.total_cost_usd >= max_cost_usd:
+            batch_result.stopped_reason = (
+                f"cost ceiling ${max_cost_usd:.2f} reached "
+                f"(${batch_result.total_cost_usd:.4f} spent)"
+            )
+            return True
+        return False
+
     def run_pipeline(
         self,
         hearing_id: UUID,
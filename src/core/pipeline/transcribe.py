@@ -7,15 +7,21 @@ Supports multiple Whisper providers (in priority order):
 3. OpenAI
 
 Handles:
-- Large file chunking (files > 24MB)
+- Large file chunking (files > 24MB), with chunks transcribed concurrently
+- Content-addressed caching of Whisper responses per chunk
 - Speaker context prompts per state
 - Segment creation with timestamps
+- Passage windows over the segments, for phrase search
 """
 
 import os
+import math
+import uuid
+import shutil
 import logging
 import tempfile
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Tuple, List, Dict, Any
@@ -23,16 +29,26 @@ from typing import Optional, Tuple, List, Dict, Any
 from sqlalchemy.orm import Session
 
 from src.core.config import get_settings
+from src.core.database import bulk_insert
 from src.core.models.hearing import Hearing
-from src.core.models.transcript import TranscriptSegment
+from src.core.models.transcript import TranscriptPassage, TranscriptSegment
 from src.core.pipeline.base import PipelineStage, StageResult
+from src.core.services.invalidation import HEARINGS, TRANSCRIPTS, notify_changed
+from core.services.passages import build_passages
+from src.core.services.stats import SEGMENTS, rollups
+from core.services.transcription_cache import TranscriptionCache
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 # File size limits
 MAX_FILE_SIZE_BYTES = 24 * 1024 * 1024  # 24MB (Groq limit is 25MB)
-CHUNK_DURATION_SECONDS = 600  # 10 minutes per chunk
+
+# Chunks are re-encoded to mono 16kHz CBR MP3 (Whisper resamples to 16kHz anyway),
+# so chunk length can be derived from the byte limit
+CHUNK_BITRATE_KBPS = 64
+CHUNK_SIZE_HEADROOM = 0.9  # Stay 10% under the limit for container overhead
+MIN_CHUNK_SECONDS = 60
 
 # Pricing per minute
 WHISPER_COST_PER_MINUTE = 0.006  # OpenAI/Azure
@@ -66,13 +82,27 @@ class TranscribeStage(PipelineStage[Hearing]):
     Transcribe hearing audio using Whisper.
 
     Automatically selects the best available provider (Groq > Azure > OpenAI).
-    Handles large files by chunking with ffmpeg.
+    Handles large files by splitting them with ffmpeg in a single pass;
+    up to max_concurrency chunks are transcribed at once. Responses are
+    cached by chunk content, so re-runs only pay for unseen audio.
     """
 
     name = "transcribe"
 
-    def __init__(self, audio_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        audio_dir: Optional[Path] = None,
+        max_concurrency: Optional[int] = None,
+        cache: Optional[TranscriptionCache] = None,
+    ):
         self.audio_dir = Path(audio_dir or settings.audio_dir)
+        self.max_concurrency = max(1, max_concurrency or settings.whisper_max_concurrency)
+        if cache is None and settings.transcript_cache_dir:
+            cache = TranscriptionCache(
+                settings.transcript_cache_dir,
+                max_bytes=settings.transcript_cache_max_mb * 1024 * 1024,
+            )
+        self.cache = cache
         self._groq_client = None
         self._openai_client = None
         self.provider = settings.whisper_provider
@@ -134,23 +164,34 @@ class TranscribeStage(PipelineStage[Hearing]):
             initial_prompt = self._build_prompt(hearing)
 
             # Transcribe
+            cache_stats = {"cache_hits": 0, "cache_misses": 0}
             if self._needs_chunking(audio_path):
-                text, segments, cost = self._transcribe_chunked(audio_path, hearing, initial_prompt)
+                text, segments, cost = self._transcribe_chunked(
+                    audio_path, hearing, initial_prompt, cache_stats
+                )
             elif self.provider == "groq":
-                text, segments, cost = self._transcribe_groq(audio_path, hearing, initial_prompt)
+                text, segments, cost = self._transcribe_groq(
+                    audio_path, hearing, initial_prompt, cache_stats
+                )
             else:
-                text, segments, cost = self._transcribe_openai(audio_path, hearing, initial_prompt)
+                text, segments, cost = self._transcribe_openai(
+                    audio_path, hearing, initial_prompt, cache_stats
+                )
 
             # Save to database
             self._save_transcript(hearing, text, segments, cost, db)
 
+            data = {
+                "segments": len(segments),
+                "words": hearing.word_count,
+                "duration_minutes": hearing.duration_minutes,
+            }
+            if self.cache is not None:
+                data.update(cache_stats)
+
             return StageResult(
                 success=True,
-                data={
-                    "segments": len(segments),
-                    "words": hearing.word_count,
-                    "duration_minutes": hearing.duration_minutes,
-                },
+                data=data,
                 cost_usd=cost,
                 model=self._get_model_name(),
             )
@@ -211,7 +252,8 @@ class TranscribeStage(PipelineStage[Hearing]):
         self,
         audio_path: Path,
         hearing: Hearing,
-        initial_prompt: str
+        initial_prompt: str,
+        cache_stats: Optional[Dict[str, int]] = None,
     ) -> Tuple[str, List[Dict], float]:
         """Transcribe using Groq Whisper API."""
         logger.info(f"Transcribing with Groq Whisper: {audio_path.name}")
@@ -219,17 +261,12 @@ class TranscribeStage(PipelineStage[Hearing]):
         duration_seconds = hearing.duration_seconds or self._get_audio_duration(audio_path)
         duration_minutes = (duration_seconds or 0) / 60
 
-        with open(audio_path, "rb") as audio_file:
-            response = self.groq_client.audio.transcriptions.create(
-                model=settings.groq_whisper_model,
-                file=audio_file,
-                response_format="verbose_json",
-                prompt=initial_prompt if initial_prompt else None,
-            )
+        result, cached = self._transcribe_chunk(audio_path, initial_prompt)
+        self._count_cache(cache_stats, cached)
 
-        full_text = response.text
-        segments = self._parse_segments(response)
-        cost_usd = duration_minutes * GROQ_WHISPER_COST_PER_MINUTE
+        full_text = result["text"]
+        segments = result["segments"]
+        cost_usd = 0.0 if cached else duration_minutes * GROQ_WHISPER_COST_PER_MINUTE
 
         logger.info(f"Groq transcription complete: {len(segments)} segments, {duration_minutes:.1f} min")
         return full_text, segments, cost_usd
@@ -238,29 +275,23 @@ class TranscribeStage(PipelineStage[Hearing]):
         self,
         audio_path: Path,
         hearing: Hearing,
-        initial_prompt: str
+        initial_prompt: str,
+        cache_stats: Optional[Dict[str, int]] = None,
     ) -> Tuple[str, List[Dict], float]:
         """Transcribe using OpenAI/Azure Whisper API."""
         provider = "Azure OpenAI" if self.provider == "azure" else "OpenAI"
-        model_name = self._get_model_name()
 
         logger.info(f"Transcribing with {provider} Whisper: {audio_path.name}")
 
         duration_seconds = hearing.duration_seconds or self._get_audio_duration(audio_path)
         duration_minutes = (duration_seconds or 0) / 60
 
-        with open(audio_path, "rb") as audio_file:
-            response = self.openai_client.audio.transcriptions.create(
-                model=model_name,
-                file=audio_file,
-                response_format="verbose_json",
-                timestamp_granularities=["segment"],
-                prompt=initial_prompt if initial_prompt else None,
-            )
+        result, cached = self._transcribe_chunk(audio_path, initial_prompt)
+        self._count_cache(cache_stats, cached)
 
-        full_text = response.text
-        segments = self._parse_segments(response)
-        cost_usd = duration_minutes * WHISPER_COST_PER_MINUTE
+        full_text = result["text"]
+        segments = result["segments"]
+        cost_usd = 0.0 if cached else duration_minutes * WHISPER_COST_PER_MINUTE
 
         logger.info(f"{provider} transcription complete: {len(segments)} segments, ${cost_usd:.4f}")
         return full_text, segments, cost_usd
@@ -269,7 +300,8 @@ class TranscribeStage(PipelineStage[Hearing]):
         self,
         audio_path: Path,
         hearing: Hearing,
-        initial_prompt: str
+        initial_prompt: str,
+        cache_stats: Optional[Dict[str, int]] = None,
     ) -> Tuple[str, List[Dict], float]:
         """Transcribe large audio by splitting into chunks."""
         file_size_mb = audio_path.stat().st_size / (1024 * 1024)
@@ -281,59 +313,66 @@ class TranscribeStage(PipelineStage[Hearing]):
         chunks = []
         try:
             chunks = self._split_audio(audio_path, duration_seconds)
-            logger.info(f"Created {len(chunks)} chunks")
+            logger.info(f"Created {len(chunks)} chunks, transcribing up to {self.max_concurrency} at once")
 
+            # Initialize the lazy client before fanning out so workers share it
+            if self.provider == "groq":
+                _ = self.groq_client
+            else:
+                _ = self.openai_client
+
+            responses: Dict[int, Dict] = {}
+            with ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="whisper"
+            ) as pool:
+                futures = {
+                    pool.submit(self._transcribe_chunk, chunk_path, initial_prompt): i
+                    for i, (chunk_path, _) in enumerate(chunks)
+                }
+                for future in as_completed(futures):
+                    chunk_path, time_offset = chunks[futures[future]]
+                    try:
+                        responses[futures[future]], cached = future.result()
+                        self._count_cache(cache_stats, cached)
+                        logger.info(
+                            f"Transcribed chunk: {chunk_path.name} (offset={time_offset}s"
+                            f"{', cached' if cached else ''})"
+                        )
+                    except Exception as e:
+                        logger.error(f"Error transcribing chunk {chunk_path.name}: {e}")
+
+            # Reassemble in chunk order, shifting timestamps by each chunk's offset
             all_segments = []
             all_text_parts = []
-            segment_index = 0
-
-            for chunk_path, time_offset in chunks:
-                logger.info(f"Transcribing chunk: {chunk_path.name} (offset={time_offset}s)")
-
-                try:
-                    with open(chunk_path, "rb") as audio_file:
-                        if self.provider == "groq":
-                            response = self.groq_client.audio.transcriptions.create(
-                                model=settings.groq_whisper_model,
-                                file=audio_file,
-                                response_format="verbose_json",
-                                prompt=initial_prompt if initial_prompt else None,
-                            )
-                        else:
-                            response = self.openai_client.audio.transcriptions.create(
-                                model=self._get_model_name(),
-                                file=audio_file,
-                                response_format="verbose_json",
-                                timestamp_granularities=["segment"],
-                                prompt=initial_prompt if initial_prompt else None,
-                            )
-
-                    if response.text:
-                        all_text_parts.append(response.text)
-
-                    # Adjust segment timestamps with offset
-                    chunk_segments = self._parse_segments(response)
-                    for seg in chunk_segments:
-                        seg["index"] = segment_index
-                        seg["start"] += time_offset
-                        seg["end"] += time_offset
-                        all_segments.append(seg)
-                        segment_index += 1
-
-                except Exception as e:
-                    logger.error(f"Error transcribing chunk {chunk_path.name}: {e}")
+
+            for i, (_, time_offset) in enumerate(chunks):
+                response = responses.get(i)
+                if response is None:
                     continue
 
+                if response["text"]:
+                    all_text_parts.append(response["text"])
+
+                for seg in response["segments"]:
+                    all_segments.append({
+                        **seg,
+                        "index": len(all_segments),
+                        "start": seg["start"] + time_offset,
+                        "end": seg["end"] + time_offset,
+                    })
+
             if not all_segments:
                 raise ValueError("No segments transcribed from chunks")
 
             full_text = " ".join(all_text_parts)
 
-            # Calculate cost based on provider
+            # Calculate cost based on provider, excluding chunks served from cache
             if self.provider == "groq":
                 cost_usd = duration_minutes * GROQ_WHISPER_COST_PER_MINUTE
             else:
                 cost_usd = duration_minutes * WHISPER_COST_PER_MINUTE
+            if self.cache is not None and cache_stats is not None:
+                cost_usd *= 1 - cache_stats["cache_hits"] / len(chunks)
 
             logger.info(f"Chunked transcription complete: {len(all_segments)} segments")
             return full_text, all_segments, cost_usd
@@ -341,6 +380,55 @@ class TranscribeStage(PipelineStage[Hearing]):
         finally:
             self._cleanup_chunks(chunks)
 
+    def _transcribe_chunk(self, chunk_path: Path, initial_prompt: str) -> Tuple[Dict, bool]:
+        """
+        Transcribe one audio file, consulting the cache first.
+
+        Runs in worker threads for chunked audio.
+
+        Returns:
+            Tuple of ({"text", "segments"}, served_from_cache)
+        """
+        key = None
+        if self.cache is not None:
+            key = self.cache.make_key(chunk_path, self._get_model_name(), initial_prompt)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached, True
+
+        response = self._call_whisper(chunk_path, initial_prompt)
+        result = {
+            "text": response.text or "",
+            "segments": self._parse_segments(response),
+        }
+
+        if key is not None:
+            self.cache.put(key, result)
+        return result, False
+
+    def _count_cache(self, cache_stats: Optional[Dict[str, int]], cached: bool):
+        """Record a cache hit or miss for the current hearing."""
+        if cache_stats is not None and self.cache is not None:
+            cache_stats["cache_hits" if cached else "cache_misses"] += 1
+
+    def _call_whisper(self, chunk_path: Path, initial_prompt: str) -> Any:
+        """Send one file to the Whisper API."""
+        with open(chunk_path, "rb") as audio_file:
+            if self.provider == "groq":
+                return self.groq_client.audio.transcriptions.create(
+                    model=settings.groq_whisper_model,
+                    file=audio_file,
+                    response_format="verbose_json",
+                    prompt=initial_prompt if initial_prompt else None,
+                )
+            return self.openai_client.audio.transcriptions.create(
+                model=self._get_model_name(),
+                file=audio_file,
+                response_format="verbose_json",
+                timestamp_granularities=["segment"],
+                prompt=initial_prompt if initial_prompt else None,
+            )
+
     def _parse_segments(self, response: Any) -> List[Dict]:
         """Parse segments from Whisper response."""
         segments = []
@@ -364,47 +452,78 @@ class TranscribeStage(PipelineStage[Hearing]):
 
         return segments
 
+    def _chunk_duration(self, duration: float) -> int:
+        """
+        Pick a chunk length that keeps every chunk under MAX_FILE_SIZE_BYTES.
+
+        Audio is split into the fewest chunks that fit, of even length. It
+        depends only on the duration, not on max_concurrency, so the same
+        audio always splits at the same points and hits the transcription
+        cache whatever the concurrency setting.
+        """
+        bytes_per_second = CHUNK_BITRATE_KBPS * 1000 / 8
+        max_seconds = int(MAX_FILE_SIZE_BYTES * CHUNK_SIZE_HEADROOM / bytes_per_second)
+        if not duration:
+            return max_seconds
+
+        chunks = math.ceil(duration / max_seconds)
+        # +1s so rounding in the reported duration doesn't leave a sliver chunk
+        even_split = math.ceil(duration / chunks) + 1
+        return max(MIN_CHUNK_SECONDS, min(max_seconds, even_split))
+
     def _split_audio(self, audio_path: Path, duration: float) -> List[Tuple[Path, float]]:
-        """Split audio into chunks using ffmpeg."""
-        if duration == 0:
-            duration = self._get_audio_duration(audio_path) or 0
-            if duration == 0:
-                raise ValueError(f"Could not determine duration of {audio_path}")
+        """
+        Split audio into chunks in one ffmpeg pass using the segment muxer.
 
-        chunks = []
-        temp_dir = tempfile.mkdtemp(prefix="whisper_chunks_")
-        num_chunks = int((duration // CHUNK_DURATION_SECONDS) + 1)
-
-        logger.info(f"Splitting {audio_path.name} ({duration}s) into {num_chunks} chunks")
-
-        for i in range(num_chunks):
-            start_time = i * CHUNK_DURATION_SECONDS
-            chunk_path = Path(temp_dir) / f"chunk_{i:03d}.mp3"
-
-            try:
-                result = subprocess.run(
-                    [
-                        "ffmpeg", "-y",
-                        "-i", str(audio_path),
-                        "-ss", str(start_time),
-                        "-t", str(CHUNK_DURATION_SECONDS),
-                        "-c:a", "libmp3lame",
-                        "-q:a", "4",
-                        str(chunk_path)
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=120
-                )
+        Returns (chunk_path, start_offset_seconds) pairs; offsets come from
+        ffmpeg's segment list so they match the actual cut points.
+        """
+        # Prefer the file's own duration so identical audio always splits at
+        # the same points (and hits the transcription cache)
+        duration = self._get_audio_duration(audio_path) or duration
 
-                if result.returncode == 0 and chunk_path.exists() and chunk_path.stat().st_size > 0:
-                    chunks.append((chunk_path, float(start_time)))
+        chunk_seconds = self._chunk_duration(duration)
+        temp_dir = Path(tempfile.mkdtemp(prefix="whisper_chunks_"))
+        segment_list = temp_dir / "segments.csv"
 
-            except Exception as e:
-                logger.error(f"Error creating chunk {i}: {e}")
-                continue
+        logger.info(f"Splitting {audio_path.name} ({duration}s) into {chunk_seconds}s chunks")
+
+        try:
+            result = subprocess.run(
+                [
+                    "ffmpeg", "-y",
+                    "-i", str(audio_path),
+                    "-vn",
+                    "-ac", "1",
+                    "-ar", "16000",
+                    "-c:a", "libmp3lame",
+                    "-b:a", f"{CHUNK_BITRATE_KBPS}k",
+                    "-f", "segment",
+                    "-segment_time", str(chunk_seconds),
+                    "-reset_timestamps", "1",
+                    "-segment_list", str(segment_list),
+                    "-segment_list_type", "csv",
+                    str(temp_dir / "chunk_%03d.mp3"),
+                ],
+                capture_output=True,
+                text=True,
+                timeout=max(600, int(duration / 10)),
+            )
+            if result.returncode != 0:
+                logger.error(f"ffmpeg split failed for {audio_path.name}: {result.stderr[-500:]}")
+        except Exception as e:
+            logger.error(f"Error splitting {audio_path.name}: {e}")
+
+        chunks = []
+        if segment_list.exists():
+            for line in segment_list.read_text().splitlines():
+                name, start, _ = line.rsplit(",", 2)
+                chunk_path = temp_dir / name
+                if chunk_path.exists() and chunk_path.stat().st_size > 0:
+                    chunks.append((chunk_path, float(start)))
 
         if not chunks:
+            shutil.rmtree(temp_dir, ignore_errors=True)
             raise ValueError(f"Failed to create any chunks from {audio_path}")
 
         return chunks
@@ -414,16 +533,7 @@ class TranscribeStage(PipelineStage[Hearing]):
         if not chunks:
             return
 
-        temp_dir = chunks[0][0].parent
-        for chunk_path, _ in chunks:
-            try:
-                chunk_path.unlink(missing_ok=True)
-            except Exception:
-                pass
-        try:
-            temp_dir.rmdir()
-        except Exception:
-            pass
+        shutil.rmtree(chunks[0][0].parent, ignore_errors=True)
 
     def _get_audio_duration(self, audio_path: Path) -> Optional[int]:
         """Get audio duration in seconds using ffprobe."""
@@ -454,26 +564,65 @@ class TranscribeStage(PipelineStage[Hearing]):
         cost: float,
         db: Session
     ):
-        """Save transcript to database."""
+        """Save transcript to database, bulk-inserting segments."""
+        # Build segment rows, counting words in the same pass
+        rows = []
+        text_parts = []
+        word_count = 0
+        for seg_data in segments:
+            seg_text = seg_data.get("text", "")
+            text_parts.append(seg_text)
+            word_count += len(seg_text.split())
+            rows.append({
+                "id": uuid.uuid4(),
+                "hearing_id": hearing.id,
+                "segment_index": seg_data.get("index", 0),
+                "start_time": seg_data.get("start", 0),
+                "end_time": seg_data.get("end", 0),
+                "text": seg_text,
+                "speaker_label": seg_data.get("speaker"),
+            })
+
         # Update hearing
-        hearing.full_text = text
-        hearing.word_count = len(text.split()) if text else 0
+        hearing.full_text = text or " ".join(text_parts)
+        hearing.word_count = word_count if rows else len(hearing.full_text.split())
         hearing.whisper_model = self._get_model_name()
         hearing.processing_cost_usd = (hearing.processing_cost_usd or 0) + cost
         hearing.transcript_status = "transcribed"
         hearing.processed_at = datetime.utcnow()
 
-        # Create segment records
-        for seg_data in segments:
-            segment = TranscriptSegment(
-                hearing_id=hearing.id,
-                segment_index=seg_data.get("index", 0),
-                start_time=seg_data.get("start", 0),
-                end_time=seg_data.get("end", 0),
-                text=seg_data.get("text", ""),
-                speaker_label=seg_data.get("speaker"),
-            )
-            db.add(segment)
+        bulk_insert(db, TranscriptSegment.__table__, rows)
+        write_passages(db, hearing.id, rows)
+        # Bulk inserts bypass the flush hook that maintains the stats rollups
+        rollups.add(db, hearing.state_code, SEGMENTS, len(rows), day=hearing.created_at)
 
         db.commit()
+        notify_changed(TRANSCRIPTS, HEARINGS)
         logger.info(f"Saved transcript for hearing {hearing.id}: {len(segments)} segments")
+
+
+def write_passages(db: Session, hearing_id, segments: List[Dict[str, Any]]) -> int:
+    """
+    Replace a hearing's passages with windows over the given segment rows.
+
+    Called in the transcribe stage's transaction with the rows it just
+    inserted, and by `psc pipeline passages` for hearings transcribed
+    before passages existed. The caller commits.
+
+    Returns:
+        Number of passages written
+    """
+    db.query(TranscriptPassage).filter(
+        TranscriptPassage.hearing_id == hearing_id
+    ).delete(synchronize_session=False)
+
+    passages = build_passages(
+        segments,
+        window=settings.passage_window_segments,
+        stride=settings.passage_stride_segments,
+    )
+    for passage in passages:
+        passage["id"] = uuid.uuid4()
+        passage["hearing_id"] = hearing_id
+    bulk_insert(db, TranscriptPassage.__table__, passages)
+    return len(passages)
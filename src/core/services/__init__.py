@@ -4,12 +4,48 @@ Services module - shared business logic.
 Provides:
 - StorageService: File storage (local/Azure Blob)
 - SearchService: Full-text and semantic search
+- TranscriptionCache: Content-addressed cache of Whisper responses
+- JobQueue / JobWorker: Durable database-backed job queue
+- OpenAILLMService: Rate-limited LLM client shared by analysis callers
+- BatchStore / *BatchProvider: Offline Batch API submission for backfills
+- RollupStore / RollupTracker: Precomputed stats counters
+- build_passages: Windowed transcript passages for phrase search
+- export_chunks: Streaming NDJSON/CSV/WebVTT/SRT exports
 """
 
 from src.core.services.storage import StorageService
 from src.core.services.search import SearchService
+from core.services.transcription_cache import TranscriptionCache
+from core.services.job_queue import JobQueue, JobWorker
+from core.services.llm import LLMResponse, Message, OpenAILLMService, get_llm_service
+from core.services.llm_batch import (
+    BatchRequest,
+    BatchStore,
+    LocalBatchProvider,
+    OpenAIBatchProvider,
+)
+from core.services.stats_rollup import RollupStore, RollupTracker
+from core.services.passages import build_passages, match_start_time
+from core.services.export import EXPORT_FORMATS, export_chunks
 
 __all__ = [
     "StorageService",
     "SearchService",
+    "TranscriptionCache",
+    "JobQueue",
+    "JobWorker",
+    "LLMResponse",
+    "Message",
+    "OpenAILLMService",
+    "get_llm_service",
+    "BatchRequest",
+    "BatchStore",
+    "LocalBatchProvider",
+    "OpenAIBatchProvider",
+    "RollupStore",
+    "RollupTracker",
+    "build_passages",
+    "match_start_time",
+    "EXPORT_FORMATS",
+    "export_chunks",
 ]
@@ -0,0 +1,336 @@
+"""
+Text embeddings for semantic search.
+
+- EmbeddingProvider: turns a list of texts into vectors.
+  OpenAIEmbeddingProvider calls the embeddings API (text-embedding-3-small
+  by default); LocalEmbeddingProvider hashes words into a vector of the
+  same size, for tests and offline runs (similar wording, similar vector).
+- EmbeddingCache: LRU of vectors keyed by model and text hash. Hearings
+  repeat a lot of short turns ("Thank you, Mr. Chairman."), so the embed
+  stage and repeated search queries skip texts already embedded.
+- embed_texts(): dedups a list of texts, serves what it can from the
+  cache and embeds the rest in requests of at most batch_size inputs.
+- cosine_top_k(): brute-force nearest neighbours, with NumPy when it is
+  installed. Used where pgvector is not available (SQLite, tests).
+
+All providers return unit-length vectors, so cosine similarity is a dot
+product.
+"""
+
+import hashlib
+import logging
+import math
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIMENSIONS = 1536  # TranscriptSegment.embedding
+
+# USD per 1M input tokens
+EMBEDDING_PRICING: Dict[str, float] = {
+    "text-embedding-3-small": 0.02,
+    "text-embedding-3-large": 0.13,
+    "local": 0.0,
+}
+
+Vector = List[float]
+
+
+@dataclass
+class EmbeddingResult:
+    """Vectors for a list of texts, in input order."""
+    vectors: List[Vector]
+    input_tokens: int = 0
+    cost_usd: float = 0.0
+    cached: int = 0  # Texts answered from the cache or by a duplicate
+    requests: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+def _normalize(vector: Sequence[float]) -> Vector:
+    norm = math.sqrt(sum(v * v for v in vector))
+    if norm == 0:
+        return list(vector)
+    return [v / norm for v in vector]
+
+
+class EmbeddingProvider(ABC):
+    """Embeds batches of texts."""
+
+    model = ""
+    dimensions = EMBEDDING_DIMENSIONS
+
+    @abstractmethod
+    def embed(self, texts: List[str]) -> Tuple[List[Vector], int]:
+        """Unit vectors for texts (same order) and the input tokens billed."""
+
+    def get_cost_estimate(self, input_tokens: int) -> float:
+        return input_tokens * EMBEDDING_PRICING.get(self.model, 0.0) / 1_000_000
+
+
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+    """OpenAI embeddings API; the SDK retries 429s and 5xx with backoff."""
+
+    def __init__(
+        self,
+        model: str = "text-embedding-3-small",
+        api_key: Optional[str] = None,
+        dimensions: int = EMBEDDING_DIMENSIONS,
+        max_retries: int = 6,
+    ):
+        self.model = model
+        self.api_key = api_key
+        self.dimensions = dimensions
+        self.max_retries = max_retries
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            from openai import OpenAI
+            self._client = OpenAI(api_key=self.api_key, max_retries=self.max_retries)
+        return self._client
+
+    def embed(self, texts: List[str]) -> Tuple[List[Vector], int]:
+        response = self.client.embeddings.create(
+            model=self.model,
+            input=texts,
+            dimensions=self.dimensions,
+        )
+        data = sorted(response.data, key=lambda d: d.index)
+        tokens = response.usage.prompt_tokens if response.usage else 0
+        return [list(d.embedding) for d in data], tokens
+
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+class LocalEmbeddingProvider(EmbeddingProvider):
+    """
+    Offline stand-in: hashed bag of words and word pairs.
+
+    No network and no dependencies. Texts sharing vocabulary get similar
+    vectors, which is enough to exercise ranking and fusion in tests; it
+    is not a semantic model.
+    """
+
+    model = "local"
+
+    def __init__(self, dimensions: int = EMBEDDING_DIMENSIONS):
+        self.dimensions = dimensions
+
+    def embed(self, texts: List[str]) -> Tuple[List[Vector], int]:
+        vectors = []
+        tokens = 0
+        for text in texts:
+            words = _WORD_RE.findall(text.lower())
+            tokens += len(words)
+            vector = [0.0] * self.dimensions
+            for feature in words + [f"{a} {b}" for a, b in zip(words, words[1:], strict=False)]:
+                digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+                bucket = int.from_bytes(digest[:4], "little") % self.dimensions
+                vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+            vectors.append(_normalize(vector))
+        return vectors, tokens
+
+
+def get_embedding_provider(name: str, model: str, api_key: Optional[str] = None) -> EmbeddingProvider:
+    """Provider by name: "openai" or "local"."""
+    if name == "openai":
+        return OpenAIEmbeddingProvider(model=model, api_key=api_key)
+    if name == "local":
+        return LocalEmbeddingProvider()
+    raise ValueError(f"Unknown embedding provider: {name}")
+
+
+class EmbeddingCache:
+    """
+    Thread-safe LRU of vectors keyed by model and text.
+
+    Usage:
+        cache = EmbeddingCache(max_entries=50_000)
+        key = cache.make_key("text-embedding-3-small", "Thank you.")
+        vector = cache.get(key)
+    """
+
+    def __init__(self, max_entries: int = 50_000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Vector]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        # Whitespace and case differences don't change the embedding enough to matter
+        normalized = " ".join(text.split()).lower()
+        return hashlib.sha256(f"{model}\0{normalized}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Vector]:
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return vector
+
+    def put(self, key: str, vector: Vector) -> None:
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters since this cache was created."""
+        return {"cache_hits": self.hits, "cache_misses": self.misses}
+
+
+def embed_texts(
+    provider: EmbeddingProvider,
+    texts: Sequence[str],
+    cache: Optional[EmbeddingCache] = None,
+    batch_size: int = 256,
+    max_batch_chars: int = 200_000,
+) -> EmbeddingResult:
+    """
+    Embed texts, deduplicated and cached.
+
+    Identical texts (after whitespace/case normalization) are embedded
+    once. Uncached texts are sent in requests of at most batch_size
+    inputs and max_batch_chars characters (the API caps inputs per
+    request and tokens per input list). A failed request, or one that
+    returns a different number of vectors than it was sent, leaves its
+    texts' vectors as None and records the error.
+
+    Returns:
+        EmbeddingResult with one vector (or None) per input text
+    """
+    keys = [EmbeddingCache.make_key(provider.model, text) for text in texts]
+    vectors: Dict[str, Optional[Vector]] = {}
+    pending: "OrderedDict[str, str]" = OrderedDict()
+    result = EmbeddingResult(vectors=[])
+
+    for key, text in zip(keys, texts, strict=True):
+        if key in vectors or key in pending:
+            result.cached += 1
+            continue
+        vector = cache.get(key) if cache else None
+        if vector is not None:
+            vectors[key] = vector
+            result.cached += 1
+        else:
+            pending[key] = text
+
+    for batch in _batches(list(pending.items()), batch_size, max_batch_chars):
+        result.requests += 1
+        try:
+            embedded, tokens = provider.embed([text for _, text in batch])
+        except Exception as e:
+            logger.warning(f"Embedding request of {len(batch)} texts failed: {e}")
+            result.errors.append(str(e))
+            continue
+        result.input_tokens += tokens
+        if len(embedded) != len(batch):
+            error = f"Embedding request of {len(batch)} texts returned {len(embedded)} vectors"
+            logger.warning(error)
+            result.errors.append(error)
+            continue
+        for (key, _), vector in zip(batch, embedded, strict=True):
+            vectors[key] = vector
+            if cache:
+                cache.put(key, vector)
+
+    result.cost_usd = provider.get_cost_estimate(result.input_tokens)
+    result.vectors = [vectors.get(key) for key in keys]
+    return result
+
+
+def _batches(items: List[Tuple[str, str]], batch_size: int, max_chars: int) -> Iterable[List[Tuple[str, str]]]:
+    batch: List[Tuple[str, str]] = []
+    chars = 0
+    for item in items:
+        if batch and (len(batch) >= batch_size or chars + len(item[1]) > max_chars):
+            yield batch
+            batch, chars = [], 0
+        batch.append(item)
+        chars += len(item[1])
+    if batch:
+        yield batch
+
+
+def cosine_top_k(
+    query: Vector,
+    candidates: Sequence[Tuple[Any, Sequence[float]]],
+    k: int,
+) -> List[Tuple[Any, float]]:
+    """
+    Brute-force nearest neighbours of a unit query vector.
+
+    Args:
+        candidates: (id, unit vector) pairs
+        k: Number of neighbours
+
+    Returns:
+        [(id, cosine similarity)], most similar first
+    """
+    if not candidates or k <= 0:
+        return []
+
+    if HAS_NUMPY:
+        matrix = np.asarray([vector for _, vector in candidates], dtype=np.float32)
+        scores = matrix @ np.asarray(query, dtype=np.float32)
+        k = min(k, len(candidates))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(candidates[i][0], float(scores[i])) for i in top]
+
+    scored = [
+        (item_id, sum(q * v for q, v in zip(query, vector, strict=True)))
+        for item_id, vector in candidates
+    ]
+    scored.sort(key=lambda s: s[1], reverse=True)
+    return scored[:k]
+
+
+def reciprocal_rank_fusion(rankings: Iterable[Sequence[Any]], k: int = 60) -> Dict[Any, float]:
+    """
+    Fuse ranked lists: score(id) = sum over lists of 1 / (k + rank).
+
+    Rank is 1-based. k dampens the weight of the very top ranks so an item
+    ranked well by both lists beats one ranked first by only one.
+    """
+    scores: Dict[Any, float] = {}
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + rank)
+    return scores
+
+
+__all__ = [
+    'EMBEDDING_DIMENSIONS',
+    'EMBEDDING_PRICING',
+    'EmbeddingResult',
+    'EmbeddingProvider',
+    'OpenAIEmbeddingProvider',
+    'LocalEmbeddingProvider',
+    'get_embedding_provider',
+    'EmbeddingCache',
+    'embed_texts',
+    'cosine_top_k',
+    'reciprocal_rank_fusion',
+]
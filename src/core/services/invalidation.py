@@ -0,0 +1,75 @@
+"""
+Data-change notifications for read caches.
+
+Writers call notify_changed() after committing, naming what changed;
+caches register a handler with on_change() and drop the results derived
+from it. Pipeline stages and scrapers notify, so nothing in src.core
+depends on the API's cache.
+
+Topics:
+    hearings       Hearing rows (new hearings, status, metadata)
+    transcripts    Transcript segments and hearing full text
+    analyses       Analysis rows
+    dockets        Docket rows
+    documents      Document rows
+
+Handlers run in the writer's process. A process-local cache in another
+process (e.g. the API while `psc worker` transcribes) only sees the
+change once its entries expire, unless the cache uses a shared backend
+and the writer's process has registered it (see src.api.cache).
+"""
+
+import logging
+from typing import Callable, List
+
+logger = logging.getLogger(__name__)
+
+HEARINGS = "hearings"
+TRANSCRIPTS = "transcripts"
+ANALYSES = "analyses"
+DOCKETS = "dockets"
+DOCUMENTS = "documents"
+
+# (*topics) -> None
+ChangeHandler = Callable[..., None]
+
+_handlers: List[ChangeHandler] = []
+
+
+def on_change(handler: ChangeHandler) -> ChangeHandler:
+    """Register a handler called with the topics of every change."""
+    if handler not in _handlers:
+        _handlers.append(handler)
+    return handler
+
+
+def remove_handler(handler: ChangeHandler) -> None:
+    if handler in _handlers:
+        _handlers.remove(handler)
+
+
+def notify_changed(*topics: str) -> None:
+    """
+    Tell registered caches that committed data changed.
+
+    Call after the commit, so a concurrent reader can't repopulate a cache
+    from the old rows. Handler errors are logged, never raised: a cache
+    failure must not fail the write that already succeeded.
+    """
+    for handler in list(_handlers):
+        try:
+            handler(*topics)
+        except Exception as e:
+            logger.warning(f"Cache invalidation for {', '.join(topics)} failed: {e}")
+
+
+__all__ = [
+    'HEARINGS',
+    'TRANSCRIPTS',
+    'ANALYSES',
+    'DOCKETS',
+    'DOCUMENTS',
+    'on_change',
+    'remove_handler',
+    'notify_changed',
+]
@@ -2,21 +2,42 @@
 Search service - full-text and semantic search.
 
 Provides:
-- Full-text search across transcripts
-- Semantic search using embeddings (if pgvector available)
+- Full-text search across transcripts (tsvector/GIN on PostgreSQL, FTS5 on SQLite)
+- Passage search: phrases that span segment boundaries, with the
+  timestamp of the segment where the match starts
+- Hybrid segment search: full-text and embedding (cosine) rankings fused
+  with reciprocal-rank fusion; pgvector's ivfflat index on PostgreSQL,
+  brute force elsewhere
 - Faceted search with filters
+
+Query syntax:
+    rate case            both terms (implicit AND)
+    "rate case"          exact phrase
+    storm OR hurricane   either term
+    -fuel / NOT fuel     exclude a term
 """
 
+import json
 import logging
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+import re
+from typing import List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass, field
 
-from sqlalchemy import func, or_, and_
+from sqlalchemy import func, or_, and_, not_, literal_column, table, text
 from sqlalchemy.orm import Session
 
-from src.core.models.hearing import Hearing
-from src.core.models.transcript import TranscriptSegment
+from src.core.models.hearing import Hearing, HEARING_FTS_TABLE, has_fulltext_index
+from src.core.models.transcript import (
+    HAS_PGVECTOR,
+    PASSAGE_FTS_TABLE,
+    TranscriptPassage,
+    TranscriptSegment,
+    has_passage_index,
+)
 from src.core.models.analysis import Analysis
+from src.core.services.embeddings import cosine_top_k, reciprocal_rank_fusion
+from core.services.passages import match_start_time, select_non_overlapping
+from core.utils.pagination import SortKey, keyset_order, paginate
 
 logger = logging.getLogger(__name__)
 
@@ -37,9 +58,138 @@ class SearchResult:
 class SearchResponse:
     """Search response with results and metadata."""
     results: List[SearchResult]
-    total: int
+    total: Optional[int]  # None when not requested
     query: str
     filters: Dict[str, Any]
+    next_cursor: Optional[str] = None
+
+
+@dataclass
+class QueryTerm:
+    """Single term or quoted phrase in a search query."""
+    text: str
+    phrase: bool = False
+    negated: bool = False
+
+
+# 'english'::regconfig rendered inline, so to_tsvector() matches the
+# expression the text search indexes are built on whatever the
+# SQLAlchemy version (2.1 adds its own ::REGCONFIG cast to bind params)
+TEXT_SEARCH_CONFIG = literal_column("'english'::regconfig")
+
+
+@dataclass
+class ParsedQuery:
+    """
+    Search query normalized to OR-ed groups of AND-ed terms.
+
+    Groups without a positive term are dropped, since neither FTS5 nor
+    a ranked search can answer "everything except X".
+    """
+    groups: List[List[QueryTerm]] = field(default_factory=list)
+
+    @property
+    def positive_terms(self) -> List[str]:
+        """Non-negated terms/phrases, in query order."""
+        return [t.text for group in self.groups for t in group if not t.negated]
+
+    def to_fts5(self) -> str:
+        """Render as an SQLite FTS5 MATCH expression."""
+        def quote(term: QueryTerm) -> str:
+            return '"' + term.text.replace('"', '""') + '"'
+
+        rendered = []
+        for group in self.groups:
+            expr = " AND ".join(quote(t) for t in group if not t.negated)
+            negated = [quote(t) for t in group if t.negated]
+            if negated:
+                expr = f"({expr}) NOT " + " NOT ".join(negated)
+            rendered.append(f"({expr})")
+        return " OR ".join(rendered)
+
+    def to_websearch(self) -> str:
+        """Render for PostgreSQL websearch_to_tsquery()."""
+        return " or ".join(
+            " ".join(("-" if t.negated else "") + f'"{t.text}"' for t in group)
+            for group in self.groups
+        )
+
+    def to_ilike(self, column):
+        """Render as ILIKE conditions (fallback for other dialects)."""
+        return or_(*[
+            and_(*[
+                not_(column.ilike(f"%{t.text}%")) if t.negated else column.ilike(f"%{t.text}%")
+                for t in group
+            ])
+            for group in self.groups
+        ])
+
+    def to_match(self, column, dialect: str):
+        """
+        Full-text match on PostgreSQL, ILIKE elsewhere.
+
+        to_tsvector('english', column) is the expression the text search
+        indexes are built on (e.g. ix_segments_text_search).
+        """
+        if dialect == "postgresql":
+            tsquery = func.websearch_to_tsquery("english", self.to_websearch())
+            return func.to_tsvector(TEXT_SEARCH_CONFIG, column).op("@@")(tsquery)
+        return self.to_ilike(column)
+
+
+_QUERY_TOKEN = re.compile(r'(-?)"([^"]*)"?|(\S+)')
+
+
+def parse_query(query: str) -> ParsedQuery:
+    """
+    Parse user search syntax: terms, "quoted phrases", OR, AND, NOT / -term.
+
+    Operators must be upper-case so ordinary words like "or" still match.
+    """
+    groups: List[List[QueryTerm]] = [[]]
+    negate_next = False
+
+    for match in _QUERY_TOKEN.finditer(query or ""):
+        minus, phrase, word = match.groups()
+        if word is not None:
+            if word == "OR":
+                groups.append([])
+                negate_next = False
+                continue
+            if word == "AND":
+                continue
+            if word == "NOT":
+                negate_next = True
+                continue
+            negated = word.startswith("-") and len(word) > 1
+            term_text = word[1:] if negated else word
+            term_text = term_text.strip("()\"")
+            is_phrase = False
+        else:
+            negated = bool(minus)
+            term_text = " ".join(phrase.split())
+            is_phrase = True
+
+        if term_text:
+            groups[-1].append(QueryTerm(
+                text=term_text,
+                phrase=is_phrase,
+                negated=negated or negate_next,
+            ))
+        negate_next = False
+
+    return ParsedQuery(groups=[
+        group for group in groups if any(not t.negated for t in group)
+    ])
+
+
+# (engine URL, index) -> whether the full-text index exists (checked once per process)
+_fulltext_available: Dict[Tuple[str, str], bool] = {}
+
+_FULLTEXT_INDEX_CHECKS = {
+    "hearings": has_fulltext_index,
+    "passages": has_passage_index,
+}
 
 
 class SearchService:
@@ -66,12 +216,14 @@ class SearchService:
         sector: Optional[str] = None,
         limit: int = 20,
         offset: int = 0,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> SearchResponse:
         """
-        Search transcripts with full-text matching.
+        Search transcripts with ranked full-text matching.
 
         Args:
-            query: Search query string
+            query: Search query (terms, "phrases", OR, NOT / -term)
             state_code: Filter by state (FL, TX, etc.)
             docket_number: Filter by docket number
             date_from: Filter by date range start
@@ -80,10 +232,16 @@ class SearchService:
             utility: Filter by utility name
             sector: Filter by sector
             limit: Max results to return
-            offset: Pagination offset
+            offset: Pagination offset (ignored when after is given)
+            after: next_cursor of the previous page (keyset pagination)
+            include_total: Count all matches (a second query); total is
+                None when False
 
         Returns:
             SearchResponse with matching results
+
+        Raises:
+            InvalidCursor: after was not issued by this search
         """
         # Build base query
         base_query = self.db.query(
@@ -121,27 +279,51 @@ class SearchService:
             if sector:
                 base_query = base_query.filter(Analysis.sector == sector)
 
-        # Full-text search using ILIKE (basic implementation)
-        # For production, use PostgreSQL full-text search or Elasticsearch
-        if query:
-            search_terms = query.split()
-            conditions = []
-            for term in search_terms:
-                conditions.append(Hearing.full_text.ilike(f"%{term}%"))
-            base_query = base_query.filter(and_(*conditions))
-
-        # Get total count
-        total = base_query.count()
+        # Full-text match, ranked where the database supports it
+        parsed = parse_query(query)
+        score = None
+        backend = self._fulltext_backend() if parsed.groups else None
+
+        if backend == "postgresql":
+            tsquery = func.websearch_to_tsquery("english", parsed.to_websearch())
+            vector = literal_column("hearings.search_vector")
+            base_query = base_query.filter(vector.op("@@")(tsquery))
+            score = func.ts_rank_cd(vector, tsquery, 32)
+        elif backend == "sqlite":
+            base_query = base_query.join(
+                table(HEARING_FTS_TABLE),
+                literal_column(f"{HEARING_FTS_TABLE}.rowid") == literal_column("hearings.rowid"),
+            ).filter(
+                text(f"{HEARING_FTS_TABLE} MATCH :fts_query").bindparams(fts_query=parsed.to_fts5())
+            )
+            # bm25() is lower-is-better; title matches weigh 10x body matches
+            score = -literal_column(f"bm25({HEARING_FTS_TABLE}, 10.0, 1.0)")
+        elif parsed.groups:
+            base_query = base_query.filter(parsed.to_ilike(Hearing.full_text))
+
+        total = base_query.count() if include_total else None
+
+        # Best matches first; hearing date and id break ties so the order is
+        # total and pages can continue from a cursor
+        keys = [
+            SortKey(Hearing.hearing_date, descending=True, nullable=True),
+            SortKey(Hearing.id, descending=True),
+        ]
+        if score is not None:
+            base_query = base_query.add_columns(score.label("score"))
+            keys.insert(0, SortKey(score, descending=True, name="score"))
 
-        # Get paginated results
-        hearings = base_query.order_by(
-            Hearing.hearing_date.desc()
-        ).offset(offset).limit(limit).all()
+        next_cursor = None
+        if offset and not after:
+            hearings = base_query.order_by(*keyset_order(keys)).offset(offset).limit(limit).all()
+        else:
+            page = paginate(base_query, keys, limit=limit, after=after, kind="search")
+            hearings, next_cursor = page.items, page.next_cursor
 
         # Build results with snippets
         results = []
         for h in hearings:
-            snippet = self._extract_snippet(h.full_text, query)
+            snippet = self._extract_snippet(h.full_text, parsed.positive_terms)
             results.append(SearchResult(
                 hearing_id=str(h.id),
                 title=h.title or "Untitled Hearing",
@@ -149,13 +331,14 @@ class SearchService:
                 state_code=h.state_code,
                 docket_number=h.docket_number,
                 snippet=snippet,
-                score=1.0,  # Basic implementation - no relevance scoring
+                score=round(float(h.score), 6) if score is not None else 1.0,
             ))
 
         return SearchResponse(
             results=results,
             total=total,
             query=query,
+            next_cursor=next_cursor,
             filters={
                 "state_code": state_code,
                 "docket_number": docket_number,
@@ -226,6 +409,270 @@ class SearchService:
             for seg in segments
         ]
 
+    def search_passages(
+        self,
+        query: str,
+        state_code: Optional[str] = None,
+        hearing_id: Optional[str] = None,
+        speaker: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search transcript passages (windows of consecutive segments).
+
+        Unlike search_segments, a phrase split across segments matches.
+        One ranked query returns the passages with hearing metadata;
+        overlapping passages of the same hearing collapse to the best
+        ranked one, and each hit's timestamp is the start of the segment
+        the match begins in.
+
+        Args:
+            query: Search query (same syntax as search_transcripts)
+            state_code: Filter by state
+            hearing_id: Filter to one hearing
+            speaker: Filter by speaker name or label
+            limit: Max results
+
+        Returns:
+            Passages with hearing metadata, match timestamp and score
+        """
+        parsed = parse_query(query)
+        if not parsed.groups:
+            return []
+
+        base_query = self.db.query(
+            TranscriptPassage,
+            Hearing.title,
+            Hearing.state_code,
+            Hearing.hearing_date,
+        ).join(Hearing, Hearing.id == TranscriptPassage.hearing_id)
+
+        if hearing_id:
+            base_query = base_query.filter(TranscriptPassage.hearing_id == hearing_id)
+        if state_code:
+            base_query = base_query.filter(Hearing.state_code == state_code.upper())
+        if speaker:
+            base_query = base_query.filter(TranscriptPassage.speakers.ilike(f"%{speaker}%"))
+
+        backend = self._fulltext_backend("passages")
+        score = None
+        if backend == "postgresql":
+            tsquery = func.websearch_to_tsquery("english", parsed.to_websearch())
+            vector = literal_column("transcript_passages.search_vector")
+            base_query = base_query.filter(vector.op("@@")(tsquery))
+            score = func.ts_rank_cd(vector, tsquery, 32)
+        elif backend == "sqlite":
+            base_query = base_query.join(
+                table(PASSAGE_FTS_TABLE),
+                literal_column(f"{PASSAGE_FTS_TABLE}.rowid") == literal_column("transcript_passages.rowid"),
+            ).filter(
+                text(f"{PASSAGE_FTS_TABLE} MATCH :fts_query").bindparams(fts_query=parsed.to_fts5())
+            )
+            score = -literal_column(f"bm25({PASSAGE_FTS_TABLE})")
+        else:
+            base_query = base_query.filter(parsed.to_ilike(TranscriptPassage.text))
+
+        if score is not None:
+            base_query = base_query.add_columns(score.label("score")).order_by(
+                literal_column("score").desc()
+            )
+        else:
+            base_query = base_query.order_by(Hearing.hearing_date.desc(), TranscriptPassage.passage_index)
+
+        # Each match is usually in two overlapping windows; fetch enough to
+        # fill the page after collapsing them, and more if that fell short
+        fetch = limit * 3
+        while True:
+            candidates = base_query.limit(fetch).all()
+            rows = select_non_overlapping(
+                candidates,
+                lambda row: (
+                    row.TranscriptPassage.hearing_id,
+                    row.TranscriptPassage.first_segment_index,
+                    row.TranscriptPassage.last_segment_index,
+                ),
+                limit,
+            )
+            if len(rows) >= limit or len(candidates) < fetch:
+                break
+            fetch *= 4
+
+        terms = parsed.positive_terms
+        results = []
+        for row in rows:
+            passage = row.TranscriptPassage
+            match_time = match_start_time(passage.text, passage.segment_offsets, terms)
+            if match_time is None:
+                match_time = passage.start_time
+            results.append({
+                "id": str(passage.id),
+                "hearing_id": str(passage.hearing_id),
+                "hearing_title": row.title or "Untitled Hearing",
+                "state_code": row.state_code,
+                "hearing_date": row.hearing_date.isoformat() if row.hearing_date else "",
+                "first_segment_index": passage.first_segment_index,
+                "last_segment_index": passage.last_segment_index,
+                "start_time": passage.start_time,
+                "end_time": passage.end_time,
+                "match_time": match_time,
+                "timestamp": _format_timestamp(match_time),
+                "speakers": passage.speakers,
+                "text": passage.text,
+                "snippet": self._extract_snippet(passage.text, terms),
+                "score": round(float(row.score), 6) if score is not None else 1.0,
+            })
+        return results
+
+    def semantic_search(
+        self,
+        query: str,
+        query_vector: Optional[List[float]] = None,
+        state_code: Optional[str] = None,
+        hearing_id: Optional[str] = None,
+        limit: int = 20,
+        candidates: int = 100,
+        rrf_k: int = 60,
+    ) -> List[Dict[str, Any]]:
+        """
+        Hybrid search over transcript segments.
+
+        The top `candidates` segments by full-text rank and by cosine
+        similarity to query_vector are fused with reciprocal-rank fusion,
+        so segments both rankings agree on come first, and segments that
+        match in meaning but not in wording still surface. Without a
+        query_vector (no embedding provider) this is a full-text ranking.
+
+        Args:
+            query: Search query (same syntax as search_transcripts)
+            query_vector: Embedding of the query, same model as the segments
+            state_code: Filter by state
+            hearing_id: Filter to one hearing
+            limit: Max results
+            candidates: Depth of each ranking before fusion
+            rrf_k: Fusion constant (higher flattens rank differences)
+
+        Returns:
+            Segments with hearing metadata, fused score and each ranking's rank
+        """
+        parsed = parse_query(query)
+        lexical = self._lexical_segment_ranking(parsed, state_code, hearing_id, candidates)
+        semantic = (
+            self._vector_segment_ranking(query_vector, state_code, hearing_id, candidates)
+            if query_vector is not None else []
+        )
+
+        fused = reciprocal_rank_fusion([lexical, semantic], k=rrf_k)
+        ranked = sorted(fused.items(), key=lambda item: item[1], reverse=True)[:limit]
+        if not ranked:
+            return []
+
+        lexical_rank = {seg_id: rank for rank, seg_id in enumerate(lexical, start=1)}
+        semantic_rank = {seg_id: rank for rank, seg_id in enumerate(semantic, start=1)}
+
+        rows = {
+            row.TranscriptSegment.id: row
+            for row in self.db.query(
+                TranscriptSegment, Hearing.title, Hearing.state_code, Hearing.hearing_date
+            ).join(Hearing, Hearing.id == TranscriptSegment.hearing_id).filter(
+                TranscriptSegment.id.in_([seg_id for seg_id, _ in ranked])
+            )
+        }
+
+        results = []
+        for seg_id, score in ranked:
+            row = rows.get(seg_id)
+            if row is None:
+                continue
+            seg = row.TranscriptSegment
+            results.append({
+                "id": str(seg.id),
+                "hearing_id": str(seg.hearing_id),
+                "hearing_title": row.title or "Untitled Hearing",
+                "state_code": row.state_code,
+                "hearing_date": row.hearing_date.isoformat() if row.hearing_date else "",
+                "segment_index": seg.segment_index,
+                "start_time": seg.start_time,
+                "end_time": seg.end_time,
+                "text": seg.text,
+                "speaker_name": seg.speaker_name,
+                "speaker_label": seg.speaker_label,
+                "timestamp": seg.timestamp_display,
+                "score": round(score, 6),
+                "lexical_rank": lexical_rank.get(seg_id),
+                "semantic_rank": semantic_rank.get(seg_id),
+            })
+        return results
+
+    def _filtered_segments(self, query, state_code: Optional[str], hearing_id: Optional[str]):
+        if hearing_id:
+            query = query.filter(TranscriptSegment.hearing_id == hearing_id)
+        if state_code:
+            query = query.join(Hearing, Hearing.id == TranscriptSegment.hearing_id).filter(
+                Hearing.state_code == state_code.upper()
+            )
+        return query
+
+    def _lexical_segment_ranking(
+        self,
+        parsed: ParsedQuery,
+        state_code: Optional[str],
+        hearing_id: Optional[str],
+        limit: int,
+    ) -> List[Any]:
+        """Segment ids by full-text rank, best first."""
+        if not parsed.groups:
+            return []
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            # Matches ix_segments_text_search (to_tsvector('english', text))
+            vector = func.to_tsvector(TEXT_SEARCH_CONFIG, TranscriptSegment.text)
+            tsquery = func.websearch_to_tsquery("english", parsed.to_websearch())
+            query = self.db.query(TranscriptSegment.id).filter(vector.op("@@")(tsquery))
+            query = self._filtered_segments(query, state_code, hearing_id)
+            rows = query.order_by(func.ts_rank_cd(vector, tsquery).desc()).limit(limit).all()
+            return [row.id for row in rows]
+
+        # Elsewhere: ILIKE match, ranked by how often the terms occur
+        query = self.db.query(TranscriptSegment.id, TranscriptSegment.text).filter(
+            parsed.to_ilike(TranscriptSegment.text)
+        )
+        query = self._filtered_segments(query, state_code, hearing_id)
+        terms = [term.lower() for term in parsed.positive_terms]
+        scored = [
+            (row.id, sum((row.text or "").lower().count(term) for term in terms))
+            for row in query.limit(limit * 10).all()
+        ]
+        scored.sort(key=lambda s: s[1], reverse=True)
+        return [seg_id for seg_id, _ in scored[:limit]]
+
+    def _vector_segment_ranking(
+        self,
+        query_vector: List[float],
+        state_code: Optional[str],
+        hearing_id: Optional[str],
+        limit: int,
+    ) -> List[Any]:
+        """Segment ids by cosine similarity to query_vector, best first."""
+        if HAS_PGVECTOR and self.db.get_bind().dialect.name == "postgresql":
+            distance = TranscriptSegment.embedding.cosine_distance(query_vector)
+            query = self.db.query(TranscriptSegment.id).filter(
+                TranscriptSegment.embedding.isnot(None)
+            )
+            query = self._filtered_segments(query, state_code, hearing_id)
+            # ORDER BY distance LIMIT n is what the ivfflat index serves
+            return [row.id for row in query.order_by(distance).limit(limit).all()]
+
+        # Brute force over the stored vectors (JSON lists without pgvector)
+        query = self.db.query(TranscriptSegment.id, TranscriptSegment.embedding).filter(
+            TranscriptSegment.embedding.isnot(None)
+        )
+        query = self._filtered_segments(query, state_code, hearing_id)
+        candidates = [
+            (row.id, json.loads(row.embedding) if isinstance(row.embedding, str) else row.embedding)
+            for row in query.all()
+        ]
+        return [seg_id for seg_id, _ in cosine_top_k(query_vector, candidates, limit)]
+
     def get_facets(
         self,
         state_code: Optional[str] = None,
@@ -302,17 +749,40 @@ class SearchService:
 
         return facets
 
-    def _extract_snippet(self, text: str, query: str, context_chars: int = 200) -> str:
-        """Extract a snippet around the first match."""
-        if not text or not query:
+    def _fulltext_backend(self, index: str = "hearings") -> str:
+        """
+        Pick the full-text implementation for the session's database.
+
+        Args:
+            index: "hearings" or "passages"
+
+        Returns "postgresql" (tsvector), "sqlite" (FTS5) or "ilike" when
+        no index is installed.
+        """
+        bind = self.db.get_bind()
+        key = (str(bind.engine.url), index)
+        if key not in _fulltext_available:
+            _fulltext_available[key] = _FULLTEXT_INDEX_CHECKS[index](self.db.connection())
+            if not _fulltext_available[key]:
+                logger.warning(f"No full-text index on {index}; falling back to ILIKE search")
+
+        if _fulltext_available[key] and bind.dialect.name in ("postgresql", "sqlite"):
+            return bind.dialect.name
+        return "ilike"
+
+    def _extract_snippet(self, text: str, terms: List[str], context_chars: int = 200) -> str:
+        """Extract a snippet around the first matching term or phrase."""
+        if not text or not terms:
             return text[:context_chars] + "..." if text else ""
 
         text_lower = text.lower()
-        query_lower = query.lower()
-
-        # Find first term match
-        first_term = query.split()[0].lower() if query.split() else ""
-        pos = text_lower.find(first_term)
+        pos = -1
+        first_term = ""
+        for term in terms:
+            pos = text_lower.find(term.lower())
+            if pos != -1:
+                first_term = term
+                break
 
         if pos == -1:
             return text[:context_chars] + "..."
@@ -330,3 +800,14 @@ class SearchService:
             snippet = snippet + "..."
 
         return snippet
+
+
+def _format_timestamp(seconds: Optional[float]) -> str:
+    """HH:MM:SS (or MM:SS) like TranscriptSegment.timestamp_display."""
+    if seconds is None:
+        return ""
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours > 0:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
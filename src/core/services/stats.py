@@ -0,0 +1,117 @@
+"""
+Dashboard stats rollups for the core tables.
+
+/api/stats reads the stats_rollups counters maintained here instead of
+aggregating hearings, transcript segments and analyses per request.
+
+- Hearing and Analysis changes are tracked on flush (every session made
+  by src.core.database.SessionLocal).
+- Transcript segments are bulk-inserted, so the transcribe stage records
+  its SEGMENTS increment itself.
+- reconcile_rollups() recomputes every counter from the source tables and
+  corrects drift (raw SQL writes, cascaded deletes, counters that predate
+  the rollup table). Run it periodically: `psc db reconcile-stats`.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session, object_session
+
+from src.core.models.analysis import Analysis
+from src.core.models.hearing import Hearing
+from src.core.models.stats import StatsRollup
+from src.core.models.transcript import TranscriptSegment
+from core.services.stats_rollup import Contribution, RollupKey, RollupStore, RollupTracker
+
+# Metrics (dimension in brackets)
+HEARINGS = "hearings"
+HEARINGS_BY_STATUS = "hearings_by_status"  # [transcript_status]
+DURATION_SECONDS = "duration_seconds"
+TRANSCRIPTION_COST = "transcription_cost"  # [whisper_model]
+SEGMENTS = "segments"
+ANALYSES = "analyses"
+ANALYSIS_COST = "analysis_cost"  # [model]
+
+rollups = RollupStore(StatsRollup)
+rollup_tracker = RollupTracker(rollups)
+
+
+def _hearing_contribution(values: Dict[str, Any], hearing: Hearing) -> Iterable[Contribution]:
+    state = values["state_code"]
+    return [
+        (state, HEARINGS, "", 1),
+        (state, HEARINGS_BY_STATUS, values["transcript_status"], 1),
+        (state, DURATION_SECONDS, "", values["duration_seconds"]),
+        (state, TRANSCRIPTION_COST, values["whisper_model"], values["processing_cost_usd"]),
+    ]
+
+
+def _analysis_contribution(values: Dict[str, Any], analysis: Analysis) -> Iterable[Contribution]:
+    # Through the session rather than analysis.hearing, which isn't loaded
+    # for an analysis created with just a hearing_id
+    state = object_session(analysis).get(Hearing, values["hearing_id"]).state_code
+    return [
+        (state, ANALYSES, "", 1),
+        (state, ANALYSIS_COST, values["model"], values["cost_usd"]),
+    ]
+
+
+rollup_tracker.track(
+    Hearing,
+    ["state_code", "transcript_status", "duration_seconds", "whisper_model", "processing_cost_usd"],
+    _hearing_contribution,
+    day_attribute="created_at",
+)
+rollup_tracker.track(
+    Analysis, ["hearing_id", "model", "cost_usd"], _analysis_contribution, day_attribute="created_at"
+)
+
+
+def expected_rollups(db: Session) -> Dict[RollupKey, Any]:
+    """Every counter recomputed from the source tables, bucketed by creation day."""
+    expected: Dict[RollupKey, Any] = defaultdict(float)
+    hearing_day = func.date(Hearing.created_at)
+    analysis_day = func.date(Analysis.created_at)
+
+    for state, day, status, model, count, seconds, cost in db.query(
+        Hearing.state_code,
+        hearing_day,
+        Hearing.transcript_status,
+        Hearing.whisper_model,
+        func.count(Hearing.id),
+        func.sum(Hearing.duration_seconds),
+        func.sum(Hearing.processing_cost_usd),
+    ).group_by(Hearing.state_code, hearing_day, Hearing.transcript_status, Hearing.whisper_model):
+        expected[(state, day, HEARINGS, "")] += count
+        expected[(state, day, HEARINGS_BY_STATUS, status or "")] += count
+        expected[(state, day, DURATION_SECONDS, "")] += seconds or 0
+        expected[(state, day, TRANSCRIPTION_COST, model or "")] += float(cost or 0)
+
+    for state, day, count in db.query(
+        Hearing.state_code, hearing_day, func.count(TranscriptSegment.id)
+    ).join(TranscriptSegment, TranscriptSegment.hearing_id == Hearing.id).group_by(
+        Hearing.state_code, hearing_day
+    ):
+        expected[(state, day, SEGMENTS, "")] += count
+
+    for state, day, model, count, cost in db.query(
+        Hearing.state_code, analysis_day, Analysis.model, func.count(Analysis.id), func.sum(Analysis.cost_usd)
+    ).join(Hearing, Hearing.id == Analysis.hearing_id).group_by(
+        Hearing.state_code, analysis_day, Analysis.model
+    ):
+        expected[(state, day, ANALYSES, "")] += count
+        expected[(state, day, ANALYSIS_COST, model or "")] += float(cost or 0)
+
+    return expected
+
+
+def reconcile_rollups(db: Session) -> int:
+    """
+    Correct the rollups against the source tables (in db's transaction).
+
+    Returns:
+        Number of counters corrected
+    """
+    return rollups.reconcile(db, expected_rollups(db))
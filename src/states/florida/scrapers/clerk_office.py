@@ -16,6 +16,7 @@ from sqlalchemy.orm import Session
 
 from src.core.scrapers.base import Scraper, ScraperResult
 from src.core.models.docket import Docket
+from src.core.services.invalidation import DOCKETS, notify_changed
 from src.states.florida.models.docket import FLDocketDetails
 
 logger = logging.getLogger(__name__)
@@ -98,6 +99,7 @@ class ClerkOfficeScraper(Scraper):
                     errors.append(error_msg)
 
             self.db.commit()
+            notify_changed(DOCKETS)
 
             logger.info(
                 f"FL ClerkOffice scrape complete: "
@@ -22,6 +22,7 @@ from sqlalchemy.orm import Session
 from src.core.scrapers.base import Scraper, ScraperResult
 from src.core.models.docket import Docket
 from src.core.models.hearing import Hearing
+from src.core.services.invalidation import HEARINGS, notify_changed
 from src.states.florida.models.hearing import FLHearingDetails
 
 logger = logging.getLogger(__name__)
@@ -102,6 +103,7 @@ class RSSHearingScraper(Scraper):
                     errors.append(error_msg)
 
             self.db.commit()
+            notify_changed(HEARINGS)
 
             return ScraperResult(
                 success=True,
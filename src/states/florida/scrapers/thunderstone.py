@@ -21,6 +21,7 @@ from sqlalchemy.orm import Session
 from src.core.scrapers.base import Scraper, ScraperResult
 from src.core.models.docket import Docket
 from src.core.models.document import Document
+from src.core.services.invalidation import DOCUMENTS, notify_changed
 from src.states.florida.models.document import FLDocumentDetails
 
 logger = logging.getLogger(__name__)
@@ -128,6 +129,7 @@ class ThunderstoneScraper(Scraper):
                     errors.append(error_msg)
 
             self.db.commit()
+            notify_changed(DOCUMENTS)
 
             return ScraperResult(
                 success=True,
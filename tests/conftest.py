@@ -16,6 +16,7 @@ os.environ["AUDIO_DIR"] = "./test_audio"
 
 from src.core.models.base import Base
 from src.core.database import get_db
+from src.api.cache import response_cache
 from src.api.main import create_app
 
 # Import all models to register them with Base.metadata
@@ -78,6 +79,8 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    # Cached responses would outlive each test's rolled-back data
+    response_cache.clear()
 
     with TestClient(app) as test_client:
         yield test_client
@@ -0,0 +1,112 @@
+"""
+Test Batch-API analysis with the local stand-in provider.
+"""
+
+import json
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.models.analysis import Analysis
+from src.core.models.hearing import Hearing
+from src.core.pipeline.analyze import AnalyzeStage
+from src.core.pipeline.analyze_batch import ingest_analysis_batches, submit_analysis_batch
+from core.services.llm_batch import BatchStore, LocalBatchProvider, batch_cost
+
+
+def _responder(body):
+    """Answer like the analysis model, echoing the hearing title."""
+    prompt = body["messages"][-1]["content"]
+    title = prompt.split("- Title: ")[1].split("\n")[0]
+    assert body["response_format"] == {"type": "json_object"}
+    return json.dumps({"summary": f"Summary of {title}", "commissioner_mood": "neutral"})
+
+
+@pytest.fixture
+def batch(tmp_path):
+    stage = AnalyzeStage()
+    stage._tiktoken_encoder = SimpleNamespace(encode=str.split)
+    return {
+        "store": BatchStore(tmp_path / "batches"),
+        "provider": LocalBatchProvider(tmp_path / "provider", responder=_responder),
+        "stage": stage,
+    }
+
+
+def _hearings(db, count):
+    hearings = [
+        Hearing(
+            state_code="FL",
+            title=f"Hearing {i}",
+            transcript_status="transcribed",
+            full_text="COMMISSIONER: " + "testimony " * 50,
+        )
+        for i in range(count)
+    ]
+    db.add_all(hearings)
+    db.commit()
+    return hearings
+
+
+def test_submit_then_ingest_saves_analyses(db_session, batch):
+    hearings = _hearings(db_session, 3)
+
+    batch_id = submit_analysis_batch(db_session, state_code="FL", **batch)
+
+    assert batch_id
+    manifest = batch["store"].open_manifests("analyze")[0]
+    assert sorted(manifest["custom_ids"]) == sorted(str(h.id) for h in hearings)
+
+    # In-flight hearings are not submitted twice
+    assert submit_analysis_batch(db_session, state_code="FL", **batch) is None
+
+    counts = ingest_analysis_batches(db_session, **batch)
+
+    assert counts["saved"] == 3
+    for hearing in hearings:
+        analysis = db_session.query(Analysis).filter(Analysis.hearing_id == hearing.id).one()
+        assert analysis.summary == f"Summary of {hearing.title}"
+        assert hearing.transcript_status == "analyzed"
+    assert batch["store"].open_manifests("analyze") == []
+
+
+def test_submit_reads_past_hearings_that_cannot_be_batched(db_session, batch):
+    short = [
+        Hearing(
+            state_code="FL",
+            title=f"Short {i}",
+            transcript_status="transcribed",
+            hearing_date=date(2025, 1, 1 + i),
+            full_text="too short",
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(short)
+    older = _hearings(db_session, 3)
+
+    submit_analysis_batch(db_session, state_code="FL", limit=2, **batch)
+
+    manifest = batch["store"].open_manifests("analyze")[0]
+    assert len(manifest["custom_ids"]) == 2
+    assert set(manifest["custom_ids"]) <= {str(h.id) for h in older}
+
+
+def test_ingest_is_idempotent(db_session, batch):
+    _hearings(db_session, 2)
+    submit_analysis_batch(db_session, state_code="FL", **batch)
+    ingest_analysis_batches(db_session, **batch)
+
+    # Re-open the manifest as if the ingest had crashed before marking it
+    manifest = batch["store"].manifests("analyze")[0]
+    batch["store"].mark(manifest, "completed")
+
+    counts = ingest_analysis_batches(db_session, **batch)
+
+    assert counts["saved"] == 0
+    assert counts["skipped"] == 2
+    assert db_session.query(Analysis).count() == 2
+
+
+def test_batch_cost_is_half_price():
+    assert batch_cost("gpt-4o-mini-2024-07-18", 1_000_000, 0) == pytest.approx(0.075)
@@ -0,0 +1,127 @@
+"""
+Test map-reduce analysis of long transcripts.
+"""
+
+import json
+import threading
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.models.hearing import Hearing
+from src.core.pipeline import analyze
+from src.core.pipeline.analyze import AnalyzeStage, settings
+from core.services.llm import LLMResponse
+
+
+class FakeLLM:
+    """LLM service stub that records prompts and answers by prompt kind."""
+
+    def __init__(self):
+        self.prompts = []
+        self.lock = threading.Lock()
+
+    def complete(self, messages, temperature=0.2, max_tokens=None, json_mode=False):
+        prompt = messages[-1].content
+        with self.lock:
+            self.prompts.append(prompt)
+        if prompt.startswith("This is part"):
+            part = int(prompt.split()[3])
+            data = {"summary": f"part {part}", "participants": [{"name": f"Speaker {part}"}]}
+        else:
+            data = {"summary": "merged", "one_sentence_summary": "merged"}
+        return LLMResponse(
+            success=True,
+            content=json.dumps(data),
+            parsed_json=data,
+            input_tokens=1000,
+            output_tokens=100,
+            cost_usd=0.01,
+        )
+
+
+@pytest.fixture
+def stage(monkeypatch):
+    """AnalyzeStage with a word-count tokenizer and a stubbed LLM service."""
+    monkeypatch.setattr(analyze, "MAX_SINGLE_PASS_TOKENS", 200)
+    monkeypatch.setattr(settings, "analysis_chunk_tokens", 100)
+    monkeypatch.setattr(settings, "analysis_max_concurrency", 3)
+
+    stage = AnalyzeStage()
+    stage._tiktoken_encoder = SimpleNamespace(encode=str.split)
+    stage.completions = FakeLLM()
+    stage._llm = stage.completions
+    return stage
+
+
+def _hearing():
+    return Hearing(
+        state_code="FL",
+        title="Rate case",
+        docket_number="20250011-EI",
+        hearing_date=date(2025, 1, 15),
+    )
+
+
+def _transcript(turns: int) -> str:
+    """Alternating speaker turns of 30 words each."""
+    speakers = ["COMMISSIONER FAY", "MR. MOYLE"]
+    return "\n".join(
+        f"{speakers[i % 2]}: " + " ".join(f"w{i}_{j}" for j in range(28))
+        for i in range(turns)
+    )
+
+
+def test_short_transcript_single_pass(stage):
+    data, cost = stage._analyze_transcript(_hearing(), _transcript(4))
+
+    assert data["summary"] == "merged"
+    assert len(stage.completions.prompts) == 1
+    assert "TRANSCRIPT:" in stage.completions.prompts[0]
+
+
+def test_long_transcript_is_map_reduced_without_dropping_text(stage):
+    transcript = _transcript(20)
+
+    data, cost = stage._analyze_transcript(_hearing(), transcript)
+
+    chunk_prompts = [p for p in stage.completions.prompts if p.startswith("This is part")]
+    reduce_prompts = [p for p in stage.completions.prompts if "FINDINGS BY PART" in p]
+    assert len(chunk_prompts) > 1
+    assert len(reduce_prompts) == 1
+
+    # Every line lands in exactly one part, and parts start at a speaker turn
+    for line in transcript.split("\n"):
+        assert sum(line in p for p in chunk_prompts) == 1
+    for prompt in chunk_prompts:
+        assert prompt.split("---\n")[1].startswith(("COMMISSIONER FAY:", "MR. MOYLE:"))
+
+    # Reduce sees every part's findings; cost covers every call
+    for i in range(1, len(chunk_prompts) + 1):
+        assert f"Speaker {i}" in reduce_prompts[0]
+    assert data["summary"] == "merged"
+    assert cost == pytest.approx(0.01 * len(stage.completions.prompts))
+
+
+def test_unbroken_text_is_split_on_sentences(stage):
+    text = " ".join(f"Sentence number {i} is here." for i in range(100))
+
+    chunks = stage._chunk_units(stage._transcript_units(text), settings.analysis_chunk_tokens)
+
+    assert len(chunks) > 1
+    assert all(len(c.split()) <= settings.analysis_chunk_tokens for c in chunks)
+    assert all(c.endswith("here.") for c in chunks)
+
+
+def test_long_line_is_tokenized_once(stage):
+    text = " ".join(f"Sentence number {i} is here." for i in range(100))
+    encoded = []
+    stage._tiktoken_encoder = SimpleNamespace(encode=lambda s: encoded.append(s) or s.split())
+
+    units = stage._transcript_units(text)
+
+    # Sentence by sentence only; the whole line is never encoded
+    assert text not in encoded
+    assert len(encoded) == 100
+    assert sum(tokens for _, tokens in units) == len(text.split())
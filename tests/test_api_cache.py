@@ -0,0 +1,83 @@
+"""
+Test the response cache for hot read endpoints.
+"""
+
+import time
+
+import pytest
+
+from src.api.cache import LocalRedisClient, MemoryBackend, ResponseCache, SharedBackend
+from src.api.routes.stats import get_hearing_types
+from src.core.models.hearing import Hearing
+from src.core.services.invalidation import HEARINGS, notify_changed
+
+
+def test_memory_backend_evicts_lru_and_expires():
+    backend = MemoryBackend(max_entries=2)
+    cache = ResponseCache(backend, default_ttl=60)
+    calls = []
+
+    @cache.cached("square")
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    square(1)
+    square(2)
+    square(1)  # 1 is now most recently used
+    square(3)  # evicts 2
+    square(2)
+    assert calls == [1, 2, 3, 2]
+
+    @cache.cached("short", ttl=0.01)
+    def short():
+        calls.append("short")
+        return "value"
+
+    short()
+    time.sleep(0.02)
+    short()
+    assert calls.count("short") == 2
+
+
+@pytest.mark.parametrize("backend", [MemoryBackend(), SharedBackend(LocalRedisClient())])
+def test_invalidation_and_metrics(backend):
+    cache = ResponseCache(backend, default_ttl=60)
+    version = {"value": 1}
+
+    @cache.cached("version", tags=["hearings"])
+    def get_version(state_code=None):
+        return {"state": state_code, "version": version["value"]}
+
+    assert get_version(state_code="FL") == {"state": "FL", "version": 1}
+    version["value"] = 2
+    assert get_version(state_code="FL")["version"] == 1
+    # Arguments are part of the key
+    assert get_version(state_code="TX")["version"] == 2
+
+    cache.invalidate("analyses")
+    assert get_version(state_code="FL")["version"] == 1
+    cache.invalidate("hearings")
+    assert get_version(state_code="FL")["version"] == 2
+
+    assert cache.metrics()["version"] == {"hits": 2, "misses": 3, "hit_ratio": 0.4}
+
+
+def test_route_is_cached_until_hearings_change(client, db_session, admin_headers):
+    db_session.add(Hearing(state_code="FL", title="Workshop", hearing_type="Workshop"))
+    db_session.commit()
+
+    assert get_hearing_types.sync(db=db_session) == [{"hearing_type": "Workshop", "count": 1}]
+
+    db_session.add(Hearing(state_code="FL", title="Agenda", hearing_type="Agenda Conference"))
+    db_session.commit()
+    assert len(get_hearing_types.sync(db=db_session)) == 1
+
+    notify_changed(HEARINGS)
+    assert len(get_hearing_types.sync(db=db_session)) == 2
+
+    response = client.get("/admin/cache", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["endpoints"]["stats.hearing_types"] == {
+        "hits": 1, "misses": 2, "hit_ratio": 0.3333,
+    }
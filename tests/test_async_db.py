@@ -0,0 +1,58 @@
+"""
+Test the async database path.
+"""
+
+import asyncio
+import inspect
+
+from fastapi import Depends
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from src.api.dependencies import async_db_route, get_async_db, get_db
+from src.core.config import get_settings
+from src.core.database import to_async_url
+
+
+def test_to_async_url():
+    assert to_async_url("postgresql://psc:pw@db:5432/psc?sslmode=require") == (
+        "postgresql+asyncpg://psc:pw@db:5432/psc?ssl=require"
+    )
+    assert to_async_url("postgresql+psycopg2://psc@db/psc") == "postgresql+asyncpg://psc@db/psc"
+    assert to_async_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+
+
+def test_async_db_route_is_off_by_default():
+    def answer(db: Session = Depends(get_db)):
+        return 42
+
+    assert async_db_route(answer) is answer
+    assert answer.sync is answer
+
+
+def test_async_db_route_runs_sync_body(tmp_path, monkeypatch):
+    monkeypatch.setattr(get_settings(), "async_db_routes", True)
+
+    @async_db_route
+    def answer(offset: int = 0, db: Session = Depends(get_db)):
+        assert isinstance(db, Session)
+        return db.execute(text("SELECT 41 + :offset"), {"offset": offset}).scalar()
+
+    # FastAPI sees an async endpoint whose db comes from the async engine
+    assert inspect.iscoroutinefunction(answer)
+    assert inspect.signature(answer).parameters["db"].default.dependency is get_async_db
+
+    async def call():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/async.db")
+        try:
+            async with AsyncSession(engine) as db:
+                return await answer(offset=1, db=db)
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(call()) == 42
+
+    # The sync body is still callable with a plain Session
+    with Session(create_engine(f"sqlite:///{tmp_path}/sync.db")) as db:
+        assert answer.sync(db=db) == 41
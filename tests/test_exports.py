@@ -0,0 +1,104 @@
+"""
+Test streaming transcript exports.
+"""
+
+import asyncio
+import json
+import uuid
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.routes.dockets import export_docket_transcripts
+from src.api.routes.hearings import export_hearing_transcript
+from src.api.routes.search import export_search_results
+from src.core.models.docket import Docket
+from src.core.models.hearing import Hearing
+from src.core.models.transcript import TranscriptSegment
+from core.services.export import cue_timestamp, export_chunks, export_filename
+
+
+def _body(response) -> str:
+    async def collect():
+        return b"".join([chunk async for chunk in response.body_iterator])
+    return asyncio.run(collect()).decode()
+
+
+def test_export_formats():
+    rows = [
+        {"start_time": 0.0, "end_time": 2.5, "speaker": "Chair", "text": "Call to\norder.", "segment_index": 0},
+        {"start_time": 3661.25, "end_time": 3662.0, "speaker": None, "text": "Next item", "segment_index": 1},
+    ]
+
+    assert cue_timestamp(3661.25) == "01:01:01.250"
+    assert cue_timestamp(3661.25, ",") == "01:01:01,250"
+
+    vtt = b"".join(export_chunks(rows, "vtt")).decode()
+    assert vtt.startswith("WEBVTT\n\n00:00:00.000 --> 00:00:02.500\n<v Chair>Call to order.\n\n")
+    srt = b"".join(export_chunks(rows, "srt")).decode()
+    assert srt.endswith("2\n01:01:01,250 --> 01:01:02,000\nNext item\n\n")
+
+    csv_text = b"".join(export_chunks(rows, "csv", ["segment_index", "text"])).decode()
+    assert csv_text.splitlines()[0] == "segment_index,text"
+    assert b"".join(export_chunks([], "csv", ["segment_index"])) == b"segment_index\r\n"
+
+    # Rows are batched into chunks, not one write per row
+    many = [{"segment_index": i, "text": "x" * 100} for i in range(500)]
+    chunks = list(export_chunks(many, "ndjson", chunk_size=8 * 1024))
+    assert 1 < len(chunks) < 20
+    assert [json.loads(line)["segment_index"] for line in b"".join(chunks).splitlines()] == list(range(500))
+
+
+def test_export_endpoints(db_session):
+    docket = Docket(state_code="FL", docket_number="20240001-EI")
+    db_session.add(docket)
+    db_session.flush()
+    hearings = [
+        Hearing(state_code="FL", title=f"Hearing {i}", docket_id=docket.id,
+                docket_number=docket.docket_number, hearing_date=date(2024, 1, i + 1))
+        for i in range(2)
+    ]
+    db_session.add_all(hearings)
+    db_session.flush()
+    for hearing in hearings:
+        for i in range(3):
+            db_session.add(TranscriptSegment(
+                id=uuid.uuid4(), hearing_id=hearing.id, segment_index=i,
+                start_time=i * 2.0, end_time=i * 2.0 + 2, speaker_label="SPEAKER_01",
+                text=f"{hearing.title} rate case part {i}",
+            ))
+    db_session.commit()
+    # Each export closes the session when its stream ends
+    docket_id, hearing_id = docket.id, hearings[0].id
+
+    vtt = _body(export_hearing_transcript(hearing_id=hearing_id, fmt="vtt", db=db_session))
+    assert vtt.count(" --> ") == 3 and "<v SPEAKER_01>Hearing 0 rate case part 2" in vtt
+
+    response = export_docket_transcripts(docket_id=docket_id, fmt="csv", db=db_session)
+    assert response.headers["content-disposition"] == 'attachment; filename="docket-20240001-EI.csv"'
+    lines = _body(response).splitlines()
+    assert lines[0].startswith("hearing_title,hearing_date,hearing_id,segment_index")
+    assert [line.split(",")[0] for line in lines[1:]] == ["Hearing 0"] * 3 + ["Hearing 1"] * 3
+
+    with pytest.raises(HTTPException) as exc:
+        export_docket_transcripts(docket_id=docket_id, fmt="srt", db=db_session)
+    assert exc.value.status_code == 400
+
+    ndjson = _body(export_search_results(
+        q='"part 1" OR "part 2"', state_code=None, docket_number=None, date_from=None,
+        date_to=None, speaker=None, fmt="ndjson", db=db_session,
+    ))
+    hits = [json.loads(line) for line in ndjson.splitlines()]
+    # Newest hearing first, then transcript order
+    assert [(h["hearing_title"], h["segment_index"]) for h in hits] == [
+        ("Hearing 1", 1), ("Hearing 1", 2), ("Hearing 0", 1), ("Hearing 0", 2),
+    ]
+
+
+def test_export_filename_is_header_safe():
+    assert export_filename('search-"tarifa" café', "csv") == "search-_tarifa__caf_.csv"
+    assert export_filename("ΔΔ", "ndjson") == "__.ndjson"
+    assert export_filename("", "srt") == "export.srt"
+    # Non-ASCII digits too: header values must encode as latin-1
+    assert export_filename("docket-2025²", "csv") == "docket-2025_.csv"
@@ -0,0 +1,158 @@
+"""
+Test the durable pipeline job queue.
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.api.dependencies import get_db as api_get_db
+from src.core.models.base import Base
+from src.core.models.hearing import Hearing
+from src.core.models.job import PipelineJob
+from core.services.job_queue import JobQueue, JobWorker
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """File-backed SQLite shared by worker threads."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path}/jobs.db",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def test_each_job_runs_once_across_workers(session_factory):
+    queue = JobQueue(PipelineJob)
+    db = session_factory()
+    for i in range(40):
+        queue.enqueue(db, "echo", {"n": i}, run_id="run1")
+    db.commit()
+
+    seen = []
+    lock = threading.Lock()
+
+    def echo(payload, job_db):
+        with lock:
+            seen.append(payload["n"])
+        return {"n": payload["n"]}
+
+    workers = [
+        JobWorker(queue, session_factory, {"echo": echo}, worker_id=f"w{i}", poll_interval=0.01)
+        for i in range(4)
+    ]
+    threads = [threading.Thread(target=w.run, kwargs={"stop_when_idle": True}) for w in workers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(seen) == list(range(40))
+    assert queue.counts(db, run_id="run1") == {"succeeded": 40}
+    db.close()
+
+
+def test_failed_job_retries_with_backoff_then_fails(session_factory):
+    queue = JobQueue(PipelineJob, backoff_base_seconds=60)
+    db = session_factory()
+    job = queue.enqueue(db, "boom", {}, max_attempts=2)
+    db.commit()
+
+    def boom(payload, job_db):
+        raise RuntimeError("provider unavailable")
+
+    worker = JobWorker(queue, session_factory, {"boom": boom}, worker_id="w1")
+    assert worker.run(stop_when_idle=True) == 1
+
+    db.refresh(job)
+    assert job.status == "queued"
+    assert job.attempts == 1
+    assert job.last_error == "provider unavailable"
+    assert job.run_after >= datetime.utcnow() + timedelta(seconds=55)
+
+    # Not due yet
+    assert queue.lease(db, "w1") is None
+
+    job.run_after = datetime.utcnow()
+    db.commit()
+    assert worker.run(stop_when_idle=True) == 1
+
+    db.refresh(job)
+    assert job.status == "failed"
+    assert job.attempts == 2
+    db.close()
+
+
+def test_expired_lease_is_requeued(session_factory):
+    queue = JobQueue(PipelineJob, lease_seconds=60)
+    db = session_factory()
+    queue.enqueue(db, "echo", {})
+    db.commit()
+
+    job = queue.lease(db, "dead-worker")
+    assert job.status == "running"
+    job.heartbeat_at = datetime.utcnow() - timedelta(seconds=120)
+    db.commit()
+
+    assert queue.requeue_expired(db) == 1
+    job = queue.lease(db, "w2")
+    assert job.locked_by == "w2"
+    assert job.attempts == 2
+    # The dead worker can no longer settle the job
+    assert not queue.complete(db, job.id, "dead-worker")
+    db.close()
+
+
+def test_follow_up_jobs_commit_with_completion(session_factory):
+    queue = JobQueue(PipelineJob)
+    db = session_factory()
+    queue.enqueue(db, "transcribe", {}, run_id="run1")
+    db.commit()
+
+    def chain(job_db):
+        queue.enqueue(job_db, "analyze", {}, run_id="run1")
+
+    job = queue.lease(db, "w1")
+    chain(db)
+    assert queue.complete(db, job.id, "w1")
+    assert queue.counts(db, run_id="run1") == {"succeeded": 1, "queued": 1}
+
+    # A worker that lost its lease settles nothing, follow-ups included
+    job = queue.lease(db, "w1")
+    job.locked_by = "w2"
+    db.commit()
+    chain(db)
+    assert not queue.complete(db, job.id, "w1")
+    assert queue.counts(db, run_id="run1") == {"succeeded": 1, "running": 1}
+    db.close()
+
+
+def test_run_endpoint_enqueues_jobs(client, db_session, admin_headers):
+    hearings = [Hearing(state_code="FL", title=f"Hearing {i}") for i in range(3)]
+    db_session.add_all(hearings)
+    db_session.flush()
+    client.app.dependency_overrides[api_get_db] = lambda: db_session
+
+    response = client.post(
+        "/api/admin/pipeline/run",
+        json={"stage": "analyze", "hearing_ids": [str(h.id) for h in hearings]},
+        headers=admin_headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "queued"
+    assert data["total"] == 3
+
+    status = client.get(f"/api/admin/pipeline/status/{data['run_id']}", headers=admin_headers)
+    assert status.status_code == 200
+    assert status.json()["status"] == "queued"
+    assert status.json()["total"] == 3
+
+    cancelled = client.post(f"/api/admin/pipeline/cancel/{data['run_id']}", headers=admin_headers)
+    assert cancelled.json()["status"] == "cancelled"
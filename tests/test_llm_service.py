@@ -0,0 +1,127 @@
+"""
+Test the rate-limited LLM service.
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from core.services.llm import (
+    Message,
+    OpenAILLMService,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class FakeChatClient:
+    """AsyncOpenAI stand-in; raises the queued errors first, then answers."""
+
+    def __init__(self, errors=()):
+        self.errors = list(errors)
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        self.calls.append((time.monotonic(), kwargs))
+        if self.errors:
+            raise self.errors.pop(0)
+        return SimpleNamespace(
+            model=kwargs["model"],
+            choices=[SimpleNamespace(message=SimpleNamespace(content='{"ok": true}'))],
+            usage=SimpleNamespace(prompt_tokens=1000, completion_tokens=200),
+        )
+
+    async def close(self):
+        pass
+
+
+def _rate_limit_error(headers):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, headers=headers, request=request)
+    return openai.RateLimitError("Rate limit reached", response=response, body=None)
+
+
+@pytest.fixture
+def service():
+    service = OpenAILLMService(model="gpt-4o-mini", api_key="test", backoff_base_seconds=0.01)
+    service._encoder = False  # length-based token estimate; no tiktoken download
+    yield service
+    service.close()
+
+
+def test_token_bucket_waits_for_refill():
+    bucket = TokenBucket(per_minute=600)  # 10 units/second
+
+    assert bucket.wait_time(600) == 0
+    bucket.take(600)
+    assert bucket.wait_time(5) == pytest.approx(0.5, abs=0.05)
+
+    # Larger than the whole budget: wait for a full bucket, not forever
+    assert bucket.wait_time(10_000) == pytest.approx(60, abs=0.1)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after({"retry-after-ms": "1500"}) == 1.5
+    assert parse_retry_after({"retry-after": "20"}) == 20
+    assert parse_retry_after({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+    assert parse_retry_after({}) is None
+
+
+def test_complete_parses_json_and_cost(service):
+    service._client = FakeChatClient()
+
+    response = service.complete([Message("user", "hello")], max_tokens=500, json_mode=True)
+
+    assert response.success
+    assert response.parsed_json == {"ok": True}
+    assert response.cost_usd == pytest.approx((1000 * 0.15 + 200 * 0.60) / 1_000_000)
+    assert service._client.calls[0][1]["response_format"] == {"type": "json_object"}
+
+
+def test_rate_limit_honors_retry_after(service):
+    service._client = FakeChatClient(errors=[_rate_limit_error({"retry-after-ms": "200"})])
+
+    response = service.complete([Message("user", "hello")])
+
+    assert response.success
+    (first, _), (second, _) = service._client.calls
+    assert second - first >= 0.2
+
+
+def test_async_callers_share_one_client(service):
+    client = FakeChatClient()
+    service._client = client
+
+    async def run():
+        return await asyncio.gather(*(
+            service.acomplete([Message("user", f"q{i}")]) for i in range(5)
+        ))
+
+    responses = asyncio.run(run())
+
+    assert all(r.success for r in responses)
+    assert len(client.calls) == 5
+
+
+def test_prompt_is_tokenized_off_the_service_loop(service, monkeypatch):
+    service._client = FakeChatClient()
+    threads = []
+    count_tokens = service.count_tokens
+
+    def recording_count_tokens(text):
+        threads.append(threading.current_thread().name)
+        return count_tokens(text)
+
+    monkeypatch.setattr(service, "count_tokens", recording_count_tokens)
+
+    service.complete([Message("user", "hello")])
+    asyncio.run(service.acomplete([Message("user", "hello")]))
+
+    assert len(threads) == 2
+    assert not any(name.startswith("llm-") for name in threads)
@@ -0,0 +1,104 @@
+"""
+Test keyset (cursor) pagination.
+"""
+
+import uuid
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.routes.hearings import get_hearing_segments, list_hearings
+from src.core.database import bulk_insert
+from src.core.models.hearing import Hearing
+from src.core.models.transcript import TranscriptSegment
+from src.core.services.search import SearchService
+from core.utils.pagination import InvalidCursor, decode_cursor, encode_cursor
+
+
+def _list(db, **kwargs):
+    params = dict(
+        state_code=None, status=None, docket_number=None, hearing_type=None, utility=None,
+        sector=None, has_transcript=None, has_analysis=None, limit=2, offset=0,
+        after=None, include_total=None,
+    )
+    params.update(kwargs)
+    return list_hearings.sync(db=db, **params)
+
+
+def test_cursor_round_trip():
+    hearing_id = uuid.uuid4()
+    token = encode_cursor("hearings", [date(2024, 5, 1), hearing_id, 0.25, None])
+
+    assert decode_cursor(token, "hearings") == [date(2024, 5, 1), hearing_id, 0.25, None]
+    with pytest.raises(InvalidCursor):
+        decode_cursor(token, "segments")
+    with pytest.raises(InvalidCursor):
+        decode_cursor("not-a-cursor", "hearings")
+
+
+def test_list_hearings_pages_with_cursor(db_session):
+    dates = [date(2024, 1, 5), date(2024, 3, 1), None, date(2024, 3, 1), date(2023, 12, 1)]
+    for i, hearing_date in enumerate(dates):
+        db_session.add(Hearing(state_code="FL", title=f"Hearing {i}", hearing_date=hearing_date))
+    db_session.commit()
+
+    first = _list(db_session)
+    assert first.total == 5 and first.next_cursor
+
+    seen = list(first.items)
+    cursor = first.next_cursor
+    while cursor:
+        page = _list(db_session, after=cursor)
+        assert page.total is None
+        seen.extend(page.items)
+        cursor = page.next_cursor
+
+    assert len({h.id for h in seen}) == 5
+    # Newest first, undated last
+    assert [h.hearing_date for h in seen] == sorted(dates[:2] + dates[3:], reverse=True) + [None]
+
+    # Same order as OFFSET pages
+    assert [h.id for h in _list(db_session, offset=2).items] == [h.id for h in seen[2:4]]
+
+    with pytest.raises(HTTPException) as exc:
+        _list(db_session, after="bogus")
+    assert exc.value.status_code == 400
+
+
+def test_segment_scroll_and_search_cursor(db_session):
+    hearing = Hearing(state_code="FL", title="Long hearing", full_text="storm " * 5)
+    db_session.add(hearing)
+    db_session.commit()
+    bulk_insert(db_session, TranscriptSegment.__table__, [
+        {"id": uuid.uuid4(), "hearing_id": hearing.id, "segment_index": i, "text": f"Segment {i}"}
+        for i in range(7)
+    ])
+    db_session.commit()
+
+    indexes = []
+    cursor = None
+    while True:
+        page = get_hearing_segments.sync(
+            hearing_id=hearing.id, speaker=None, search=None, limit=3, offset=0,
+            after=cursor, include_total=None, db=db_session,
+        )
+        indexes.extend(item.segment_index for item in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert indexes == list(range(7))
+
+    for i in range(3):
+        db_session.add(Hearing(state_code="FL", title=f"Storm {i}", full_text="storm costs"))
+    db_session.commit()
+
+    search = SearchService(db_session)
+    first = search.search_transcripts("storm", limit=2)
+    second = search.search_transcripts("storm", limit=2, after=first.next_cursor, include_total=False)
+    assert first.total == 4 and second.total is None
+    assert second.next_cursor is None
+    ids = [r.hearing_id for r in first.results + second.results]
+    assert len(set(ids)) == 4
+    scores = [r.score for r in first.results + second.results]
+    assert scores == sorted(scores, reverse=True)
@@ -0,0 +1,92 @@
+"""
+Test windowed transcript passages and passage search.
+"""
+
+import uuid
+
+import pytest
+
+from src.core.models.hearing import Hearing
+from src.core.models.transcript import TranscriptPassage
+from src.core.pipeline.transcribe import TranscribeStage
+from core.services.passages import (
+    build_passages,
+    match_segment_position,
+    match_start_time,
+    select_non_overlapping,
+)
+from src.core.services.search import SearchService
+
+
+def _segments(texts):
+    return [
+        {"segment_index": i, "start_time": i * 5.0, "end_time": i * 5.0 + 5.0, "text": text}
+        for i, text in enumerate(texts)
+    ]
+
+
+def test_build_passages_windows_and_offsets():
+    segments = [
+        {"segment_index": i, "start_time": float(i), "end_time": i + 1.0, "text": f" word{i} ",
+         "speaker_label": "SPEAKER_01" if i < 4 else "SPEAKER_02"}
+        for i in range(7)
+    ]
+
+    passages = build_passages(segments, window=4, stride=2)
+
+    assert [(p["first_segment_index"], p["last_segment_index"]) for p in passages] == [(0, 3), (2, 5), (4, 6)]
+    assert passages[0]["text"] == "word0 word1 word2 word3"
+    assert passages[1]["speakers"] == "SPEAKER_01, SPEAKER_02"
+    assert passages[2]["start_time"] == 4.0 and passages[2]["end_time"] == 7.0
+    assert match_start_time(passages[0]["text"], passages[0]["segment_offsets"], ["WORD2"]) == 2.0
+    assert match_segment_position(passages[1]["text"], passages[1]["segment_offsets"], ["WORD3 word4"]) == 1
+
+    with pytest.raises(ValueError):
+        build_passages(segments, window=3, stride=3)
+
+
+def test_select_non_overlapping_keeps_best_disjoint_spans():
+    hits = [("a", 10, 15), ("a", 0, 5), ("a", 4, 11), ("b", 4, 11), ("a", 16, 20), ("a", 6, 9), ("a", 20, 25)]
+
+    kept = select_non_overlapping(hits, lambda hit: hit, limit=10)
+
+    assert kept == [("a", 10, 15), ("a", 0, 5), ("b", 4, 11), ("a", 16, 20), ("a", 6, 9)]
+    assert select_non_overlapping(hits, lambda hit: hit, limit=2) == kept[:2]
+
+
+def test_transcribe_save_writes_searchable_passages(db_session):
+    hearing = Hearing(state_code="FL", title="Storm Protection Plan Hearing")
+    db_session.add(hearing)
+    db_session.commit()
+
+    segments = _segments([
+        "Good morning, commissioners.",
+        "The utility's storm",
+        "protection plan adds underground feeders.",
+        "We object to the cost allocation.",
+        "Thank you.",
+        "Next item.",
+        "Fuel clause.",
+        "Adjourned.",
+    ])
+    TranscribeStage()._save_transcript(hearing, "", [
+        {"index": s["segment_index"], "start": s["start_time"], "end": s["end_time"], "text": s["text"]}
+        for s in segments
+    ], 0.0, db_session)
+
+    assert db_session.query(TranscriptPassage).filter(
+        TranscriptPassage.hearing_id == hearing.id
+    ).count() == 2
+
+    # The phrase is split across segments 1 and 2; per-segment search misses it
+    search = SearchService(db_session)
+    assert search.search_segments("storm protection plan") == []
+
+    results = search.search_passages('"storm protection plan"')
+    assert len(results) == 1  # overlapping windows collapse to one hit
+    assert results[0]["hearing_id"] == str(hearing.id)
+    assert results[0]["match_time"] == 5.0
+    assert results[0]["timestamp"] == "0:05"
+
+    assert search.search_passages('"storm protection plan"', hearing_id=str(uuid.uuid4())) == []
+    assert search.search_passages('"plan storm"') == []
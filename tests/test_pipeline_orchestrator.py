@@ -0,0 +1,116 @@
+"""
+Test batch execution in the pipeline orchestrator.
+"""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core.models.base import Base
+from src.core.models.hearing import Hearing
+from src.core.pipeline.base import PipelineStage, StageResult
+from src.core.pipeline.orchestrator import PipelineOrchestrator
+
+
+class SlowStage(PipelineStage[Hearing]):
+    """Stage that sleeps like a remote API call and records its sessions."""
+
+    name = "slow"
+
+    def __init__(self, delay: float = 0.05, cost: float = 1.0):
+        self.delay = delay
+        self.cost = cost
+        self.sessions = set()
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def validate(self, hearing, db):
+        return True, ""
+
+    def execute(self, hearing, db):
+        with self.lock:
+            self.sessions.add(id(db))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        hearing.transcript_status = "transcribed"
+        db.commit()
+        with self.lock:
+            self.active -= 1
+        return StageResult(success=True, cost_usd=self.cost)
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """File-backed SQLite so worker sessions see committed hearings."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path}/orchestrator.db",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+
+    db = factory()
+    db.add_all([Hearing(state_code="FL", title=f"Hearing {i}") for i in range(12)])
+    db.commit()
+    db.close()
+
+    yield factory
+    engine.dispose()
+
+
+def test_concurrent_batch_uses_worker_sessions(session_factory):
+    db = session_factory()
+    stage = SlowStage()
+    orchestrator = PipelineOrchestrator(db, session_factory=session_factory)
+
+    result = orchestrator.run_stage_batch(stage, state_code="FL", concurrency=4)
+
+    assert result.total == 12
+    assert result.successful == 12
+    assert result.total_cost_usd == pytest.approx(12.0)
+    assert stage.peak == 4
+    assert id(db) not in stage.sessions
+    assert len(stage.sessions) == 4
+
+    db.expire_all()
+    assert db.query(Hearing).filter(Hearing.transcript_status == "transcribed").count() == 12
+    db.close()
+
+
+def test_cost_ceiling_stops_new_hearings(session_factory):
+    db = session_factory()
+    orchestrator = PipelineOrchestrator(db, session_factory=session_factory)
+
+    result = orchestrator.run_stage_batch(
+        SlowStage(), state_code="FL", concurrency=2, max_cost_usd=5.0
+    )
+
+    # Hearings already in flight when the ceiling is hit still finish
+    assert 5 <= result.total <= 6
+    assert result.stopped_reason.startswith("cost ceiling")
+    db.close()
+
+
+def test_cancel_stops_batch(session_factory):
+    db = session_factory()
+    orchestrator = PipelineOrchestrator(db, session_factory=session_factory)
+    stage = SlowStage(delay=0.1)
+
+    timer = threading.Timer(0.15, orchestrator.cancel)
+    timer.start()
+    result = orchestrator.run_stage_batch(stage, state_code="FL", concurrency=2)
+    timer.join()
+
+    assert 2 <= result.total < 12
+    assert result.stopped_reason == "cancelled"
+
+    # The next batch on the same orchestrator runs normally
+    result = orchestrator.run_stage_batch(SlowStage(delay=0), state_code="FL", concurrency=2)
+    assert result.total == 12
+    assert result.stopped_reason == ""
+    db.close()
@@ -0,0 +1,110 @@
+"""
+Test full-text search service.
+"""
+
+import pytest
+from datetime import date
+
+from src.core.models.hearing import Hearing
+from src.core.services.search import SearchService, parse_query
+
+
+def test_parse_query_terms_and_phrases():
+    """Test parsing bare terms, phrases and negation."""
+    parsed = parse_query('rate "storm hardening" -fuel')
+
+    assert len(parsed.groups) == 1
+    terms = parsed.groups[0]
+    assert [t.text for t in terms] == ["rate", "storm hardening", "fuel"]
+    assert terms[1].phrase
+    assert terms[2].negated
+    assert parsed.positive_terms == ["rate", "storm hardening"]
+
+
+def test_parse_query_operators():
+    """Test OR/AND/NOT operators and lower-case words."""
+    parsed = parse_query("storm OR hurricane AND NOT fuel or")
+
+    assert [[t.text for t in g] for g in parsed.groups] == [["storm"], ["hurricane", "fuel", "or"]]
+    assert parsed.groups[1][1].negated
+    assert parse_query("-fuel").groups == []
+
+
+def test_render_fts5_and_websearch():
+    """Test rendering to FTS5 and websearch_to_tsquery syntax."""
+    parsed = parse_query('"rate case" -fuel OR storm')
+
+    assert parsed.to_fts5() == '(("rate case") NOT "fuel") OR ("storm")'
+    assert parsed.to_websearch() == '"rate case" -"fuel" or "storm"'
+
+
+def test_match_uses_the_text_search_index_expression():
+    """Test that PostgreSQL matching uses the indexed tsvector, ILIKE elsewhere."""
+    from sqlalchemy.dialects import postgresql, sqlite
+    from src.core.models.transcript import TranscriptSegment
+
+    parsed = parse_query('"rate case" -fuel')
+
+    pg = str(parsed.to_match(TranscriptSegment.text, "postgresql").compile(dialect=postgresql.dialect()))
+    assert "to_tsvector('english'::regconfig, transcript_segments.text) @@ websearch_to_tsquery(" in pg
+
+    other = str(parsed.to_match(TranscriptSegment.text, "sqlite").compile(dialect=sqlite.dialect()))
+    assert "LIKE" in other.upper() and "tsvector" not in other
+
+
+@pytest.fixture
+def transcripts(db_session):
+    """Hearings with transcripts for ranking tests."""
+    hearings = [
+        Hearing(
+            state_code="FL",
+            title="Storm Protection Plan",
+            hearing_date=date(2024, 1, 10),
+            full_text="Testimony about storm hardening and underground lines.",
+        ),
+        Hearing(
+            state_code="FL",
+            title="Fuel Clause Hearing",
+            hearing_date=date(2024, 3, 5),
+            full_text="The fuel clause and a brief mention of storm costs.",
+        ),
+        Hearing(
+            state_code="FL",
+            title="Rate Case",
+            hearing_date=date(2024, 6, 1),
+            full_text="Base rate case testimony on return on equity.",
+        ),
+    ]
+    db_session.add_all(hearings)
+    db_session.commit()
+    return hearings
+
+
+def test_search_ranks_title_matches_first(db_session, transcripts):
+    """Test BM25 ranking on the SQLite FTS5 index."""
+    result = SearchService(db_session).search_transcripts("storm")
+
+    assert result.total == 2
+    assert [r.title for r in result.results] == ["Storm Protection Plan", "Fuel Clause Hearing"]
+    assert result.results[0].score > result.results[1].score
+
+
+def test_search_query_syntax(db_session, transcripts):
+    """Test phrases, OR and NOT against the index."""
+    search = SearchService(db_session)
+
+    assert search.search_transcripts('"rate case"').total == 1
+    assert search.search_transcripts('"case rate"').total == 0
+    assert search.search_transcripts("storm -fuel").total == 1
+    assert search.search_transcripts("equity OR hardening").total == 2
+
+
+def test_search_index_follows_updates(db_session, transcripts):
+    """Test that the FTS5 shadow table tracks transcript edits."""
+    hearing = transcripts[2]
+    hearing.full_text = "Revised transcript about decommissioning."
+    db_session.commit()
+
+    search = SearchService(db_session)
+    assert search.search_transcripts("decommissioning").total == 1
+    assert search.search_transcripts("equity").total == 0
@@ -0,0 +1,140 @@
+"""
+Test the embed stage and hybrid (full-text + vector) segment search.
+"""
+
+import uuid
+
+import pytest
+
+from src.core.database import bulk_insert
+from src.core.models.hearing import Hearing
+from src.core.models.transcript import TranscriptSegment
+from src.core.pipeline.embed import EmbedStage
+from src.core.services.embeddings import (
+    EmbeddingCache,
+    LocalEmbeddingProvider,
+    cosine_top_k,
+    embed_texts,
+    reciprocal_rank_fusion,
+)
+from src.core.services.search import SearchService
+
+
+class CountingProvider(LocalEmbeddingProvider):
+    """Local provider that records each request's inputs."""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def embed(self, texts):
+        self.requests.append(list(texts))
+        return super().embed(texts)
+
+
+def _hearing(db, title, texts):
+    hearing = Hearing(state_code="FL", title=title, transcript_status="transcribed")
+    db.add(hearing)
+    db.commit()
+    bulk_insert(db, TranscriptSegment.__table__, [
+        {"id": uuid.uuid4(), "hearing_id": hearing.id, "segment_index": i, "text": text}
+        for i, text in enumerate(texts)
+    ])
+    db.commit()
+    return hearing
+
+
+def test_embed_texts_dedups_batches_and_caches():
+    provider = CountingProvider()
+    cache = EmbeddingCache()
+    texts = ["Thank you.", "Storm hardening costs", "thank  you.", "Fuel clause", "Rate base"]
+
+    result = embed_texts(provider, texts, cache=cache, batch_size=2)
+
+    assert provider.requests == [["Thank you.", "Storm hardening costs"], ["Fuel clause", "Rate base"]]
+    assert result.cached == 1
+    assert result.vectors[0] == result.vectors[2]
+
+    again = embed_texts(provider, ["Rate base", "Thank you."], cache=cache)
+    assert again.requests == 0
+    assert again.cached == 2
+
+
+def test_embed_stage_fills_missing_vectors(db_session):
+    hearing = _hearing(db_session, "Agenda", ["Thank you.", "Item two: fuel clause.", "Thank you."])
+    provider = CountingProvider()
+    stage = EmbedStage(provider=provider, cache=EmbeddingCache())
+
+    result = stage.process(hearing, db_session)
+
+    assert result.success and not result.skipped
+    assert result.data["embedded"] == 3
+    assert result.data["cached"] == 1
+    assert len(provider.requests) == 1
+    assert db_session.query(TranscriptSegment).filter(
+        TranscriptSegment.hearing_id == hearing.id,
+        TranscriptSegment.embedding.is_(None),
+    ).count() == 0
+
+    assert stage.process(hearing, db_session).skipped
+
+
+def test_embed_stage_skips_blank_segments(db_session):
+    hearing = _hearing(db_session, "Agenda", ["Call to order.", "", "   ", "Adjourned."])
+    provider = CountingProvider()
+
+    result = EmbedStage(provider=provider, cache=EmbeddingCache()).process(hearing, db_session)
+
+    assert result.success
+    assert result.data["segments"] == 2
+    assert provider.requests == [["Call to order.", "Adjourned."]]
+
+
+def test_embed_texts_records_short_responses():
+    class ShortProvider(LocalEmbeddingProvider):
+        def embed(self, texts):
+            vectors, tokens = super().embed(texts)
+            return vectors[:-1], tokens
+
+    result = embed_texts(ShortProvider(), ["Fuel clause", "Rate base"])
+
+    assert result.vectors == [None, None]
+    assert result.errors == ["Embedding request of 2 texts returned 1 vectors"]
+
+
+def test_semantic_search_fuses_rankings(db_session):
+    storm = _hearing(db_session, "Storm Protection Plan", [
+        "Underground distribution lines reduce outages during hurricanes.",
+        "The storm protection plan covers vegetation management.",
+        "Next item on the agenda.",
+    ])
+    _hearing(db_session, "Fuel Clause", [
+        "Fuel cost recovery factors for the coming year.",
+    ])
+    provider = LocalEmbeddingProvider()
+    EmbedStage(provider=provider, cache=EmbeddingCache()).process(storm, db_session)
+
+    query = "storm protection plan"
+    query_vector = embed_texts(provider, [query]).vectors[0]
+    results = SearchService(db_session).semantic_search(query, query_vector=query_vector, limit=5)
+
+    # Found by both rankings first; the vector ranking adds segments the
+    # full-text match misses
+    assert results[0]["text"] == "The storm protection plan covers vegetation management."
+    assert results[0]["lexical_rank"] == 1 and results[0]["semantic_rank"] == 1
+    assert len(results) == 3
+    assert all(r["lexical_rank"] is None for r in results[1:])
+    assert all(r["hearing_id"] == str(storm.id) for r in results)
+
+    # Full-text only without a query vector
+    lexical = SearchService(db_session).semantic_search("fuel", limit=5)
+    assert [r["hearing_title"] for r in lexical] == ["Fuel Clause"]
+
+
+def test_cosine_top_k_and_rrf():
+    candidates = [("a", [1.0, 0.0]), ("b", [0.6, 0.8]), ("c", [0.0, 1.0])]
+    assert [item for item, _ in cosine_top_k([0.0, 1.0], candidates, 2)] == ["c", "b"]
+
+    scores = reciprocal_rank_fusion([["a", "b"], ["b", "c"]], k=60)
+    assert max(scores, key=scores.get) == "b"
+    assert scores["a"] == pytest.approx(1 / 61)
@@ -0,0 +1,122 @@
+"""
+Test the dashboard stats rollups.
+"""
+
+import uuid
+from datetime import date, datetime, timezone
+
+import pytest
+
+from core.services import stats_rollup
+
+from src.core.database import bulk_insert
+from src.core.models.analysis import Analysis
+from src.core.models.hearing import Hearing
+from src.core.models.transcript import TranscriptSegment
+from src.core.models.stats import StatsRollup
+from src.core.services.stats import (
+    ANALYSIS_COST,
+    HEARINGS,
+    HEARINGS_BY_STATUS,
+    SEGMENTS,
+    TRANSCRIPTION_COST,
+    expected_rollups,
+    reconcile_rollups,
+    rollup_tracker,
+    rollups,
+)
+
+
+@pytest.fixture
+def tracked_session(db_session):
+    rollup_tracker.listen(db_session)
+    return db_session
+
+
+def _totals(db):
+    return {
+        (state, metric, dimension): value
+        for (state, _, metric, dimension), value in expected_rollups(db).items()
+    }
+
+
+def test_flushes_maintain_rollups(tracked_session):
+    db = tracked_session
+    fl = Hearing(state_code="FL", title="Rate case", duration_seconds=3600)
+    tx = Hearing(state_code="TX", title="Workshop")
+    db.add_all([fl, tx])
+    db.commit()
+
+    # Status change on an expired object still subtracts the old status
+    fl.transcript_status = "transcribed"
+    fl.whisper_model = "whisper-1"
+    fl.processing_cost_usd = 0.36
+    db.commit()
+
+    db.add(Analysis(hearing_id=fl.id, model="gpt-4o-mini", cost_usd=0.02))
+    fl.transcript_status = "analyzed"
+    db.commit()
+
+    db.delete(tx)
+    db.commit()
+
+    totals = rollups.totals(db)
+    assert totals[HEARINGS] == {"": 1}
+    assert {k: v for k, v in totals[HEARINGS_BY_STATUS].items() if v} == {"analyzed": 1}
+    assert totals[TRANSCRIPTION_COST]["whisper-1"] == pytest.approx(0.36)
+    assert totals[ANALYSIS_COST]["gpt-4o-mini"] == pytest.approx(0.02)
+    assert rollups.by_state(db, HEARINGS) == {"FL": 1, "TX": 0}
+
+    # Nothing for reconciliation to fix
+    assert reconcile_rollups(db) == 0
+
+
+def test_reconcile_corrects_untracked_writes(tracked_session):
+    db = tracked_session
+    hearing = Hearing(state_code="FL", title="Agenda conference")
+    db.add(hearing)
+    db.commit()
+
+    # Bulk inserts bypass the flush hook
+    bulk_insert(db, TranscriptSegment.__table__, [
+        {"id": uuid.uuid4(), "hearing_id": hearing.id, "segment_index": i, "text": "testimony"}
+        for i in range(5)
+    ])
+    db.commit()
+    assert SEGMENTS not in rollups.totals(db)
+
+    assert reconcile_rollups(db) == 1
+    db.commit()
+
+    assert rollups.totals(db)[SEGMENTS] == {"": 5}
+    assert {
+        (state, metric, dimension): value
+        for (state, metric, dimension), value in _totals(db).items() if value
+    } == {
+        ("FL", metric, dimension): value
+        for metric, values in rollups.totals(db).items()
+        for dimension, value in values.items() if value
+    }
+
+
+def test_later_updates_stay_on_creation_day(tracked_session, monkeypatch):
+    db = tracked_session
+    created = datetime(2026, 1, 20, 15, 30, tzinfo=timezone.utc)
+    monkeypatch.setattr(stats_rollup, "utc_today", lambda: date(2026, 1, 20))
+    hearing = Hearing(state_code="FL", title="Rate case", created_at=created)
+    db.add(hearing)
+    db.commit()
+
+    # Transcribed a week later
+    monkeypatch.setattr(stats_rollup, "utc_today", lambda: date(2026, 1, 27))
+    hearing.transcript_status = "transcribed"
+    hearing.processing_cost_usd = 0.36
+    hearing.whisper_model = "whisper-1"
+    db.commit()
+
+    days = {
+        day if isinstance(day, date) else date.fromisoformat(day)
+        for (day,) in db.query(StatsRollup.day).filter(StatsRollup.value != 0)
+    }
+    assert days == {date(2026, 1, 20)}
+    assert reconcile_rollups(db) == 0
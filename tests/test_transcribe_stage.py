@@ -0,0 +1,235 @@
+"""
+Test transcription chunk handling.
+"""
+
+import random
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.database import _copy_buffer
+from src.core.models.hearing import Hearing
+from src.core.models.transcript import TranscriptSegment
+from src.core.pipeline.transcribe import (
+    CHUNK_BITRATE_KBPS,
+    MAX_FILE_SIZE_BYTES,
+    TranscribeStage,
+)
+from core.services.transcription_cache import TranscriptionCache
+
+
+def _fake_response(chunk_index: int):
+    """Whisper-like verbose_json response with two segments."""
+    return SimpleNamespace(
+        text=f"chunk {chunk_index}",
+        segments=[
+            {"start": 0.0, "end": 5.0, "text": f" c{chunk_index} first"},
+            {"start": 5.0, "end": 9.5, "text": f" c{chunk_index} second"},
+        ],
+    )
+
+
+@pytest.fixture
+def stage(tmp_path, monkeypatch):
+    """TranscribeStage with ffmpeg and the Whisper API stubbed out."""
+    stage = TranscribeStage(
+        audio_dir=tmp_path,
+        max_concurrency=4,
+        cache=TranscriptionCache(tmp_path / "cache"),
+    )
+    stage.provider = "groq"
+    stage._groq_client = object()
+    stage.api_calls = []
+
+    chunks = []
+    for i in range(6):
+        chunk_path = tmp_path / f"chunk_{i:03d}.mp3"
+        chunk_path.write_bytes(f"audio {i}".encode())
+        chunks.append((chunk_path, i * 600.0))
+    monkeypatch.setattr(stage, "_split_audio", lambda path, duration: chunks)
+    monkeypatch.setattr(stage, "_cleanup_chunks", lambda chunks: None)
+
+    def call_whisper(chunk_path: Path, prompt: str):
+        # Finish out of order to exercise reassembly
+        time.sleep(random.uniform(0, 0.02))
+        stage.api_calls.append(chunk_path.name)
+        return _fake_response(int(chunk_path.stem.split("_")[1]))
+
+    monkeypatch.setattr(stage, "_call_whisper", call_whisper)
+    return stage
+
+
+def test_chunks_reassembled_in_order(stage, tmp_path):
+    """Test that concurrent chunk results are merged in chunk order with offsets."""
+    audio = tmp_path / "hearing.mp3"
+    audio.write_bytes(b"\0")
+    hearing = Hearing(state_code="FL", duration_seconds=3600)
+
+    text, segments, cost = stage._transcribe_chunked(audio, hearing, "prompt")
+
+    assert text == " ".join(f"chunk {i}" for i in range(6))
+    assert [s["index"] for s in segments] == list(range(12))
+    assert [s["text"] for s in segments[:3]] == ["c0 first", "c0 second", "c1 first"]
+    assert segments[2]["start"] == 600.0
+    assert segments[-1]["end"] == 3009.5
+    assert cost > 0
+
+
+def test_failed_chunk_is_skipped(stage, tmp_path, monkeypatch):
+    """Test that one failing chunk does not abort the others."""
+    call_whisper = stage._call_whisper
+
+    def flaky(chunk_path: Path, prompt: str):
+        if chunk_path.stem == "chunk_002":
+            raise RuntimeError("429 Too Many Requests")
+        return call_whisper(chunk_path, prompt)
+
+    monkeypatch.setattr(stage, "_call_whisper", flaky)
+    audio = tmp_path / "hearing.mp3"
+    audio.write_bytes(b"\0")
+
+    _, segments, _ = stage._transcribe_chunked(audio, Hearing(state_code="FL", duration_seconds=3600), "")
+
+    assert len(segments) == 10
+    assert all("c2" not in s["text"] for s in segments)
+    assert [s["index"] for s in segments] == list(range(10))
+
+
+def test_rerun_served_from_cache(stage, tmp_path):
+    """Test that a second run only pays for chunks it has not seen."""
+    audio = tmp_path / "hearing.mp3"
+    audio.write_bytes(b"\0")
+    hearing = Hearing(state_code="FL", duration_seconds=3600)
+
+    stats = {"cache_hits": 0, "cache_misses": 0}
+    first_text, first_segments, first_cost = stage._transcribe_chunked(audio, hearing, "p", stats)
+    assert stats == {"cache_hits": 0, "cache_misses": 6}
+    assert len(stage.api_calls) == 6
+
+    # A new chunk appears; everything else comes from the cache
+    (tmp_path / "chunk_005.mp3").write_bytes(b"re-encoded audio")
+    stats = {"cache_hits": 0, "cache_misses": 0}
+    text, segments, cost = stage._transcribe_chunked(audio, hearing, "p", stats)
+
+    assert stats == {"cache_hits": 5, "cache_misses": 1}
+    assert stage.api_calls[6:] == ["chunk_005.mp3"]
+    assert (text, segments) == (first_text, first_segments)
+    assert cost == pytest.approx(first_cost / 6)
+
+    # A different prompt is a different cache key
+    stats = {"cache_hits": 0, "cache_misses": 0}
+    stage._transcribe_chunked(audio, hearing, "other prompt", stats)
+    assert stats["cache_misses"] == 6
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """Test size-bounded eviction of cache entries."""
+    entry = {"text": "x" * 1000, "segments": []}
+    cache = TranscriptionCache(tmp_path, max_bytes=3500)
+
+    for key in ["aa01", "bb02", "cc03"]:
+        cache.put(key, entry)
+        time.sleep(0.01)
+    assert cache.get("aa01") == entry  # Refresh aa01
+
+    cache.put("dd04", entry)
+
+    assert cache.get("bb02") is None
+    assert cache.get("aa01") == entry
+    assert cache.get("dd04") == entry
+    assert cache.stats == {"cache_hits": 3, "cache_misses": 1}
+
+
+def test_cache_overwrite_counts_size_once(tmp_path):
+    """Test that replacing an entry doesn't inflate the tracked size."""
+    entry = {"text": "x" * 1000, "segments": []}
+    cache = TranscriptionCache(tmp_path, max_bytes=2500)
+    cache.put("aa01", entry)
+    cache.put("bb02", entry)
+
+    for _ in range(3):
+        cache.put("bb02", entry)
+
+    assert cache._size == cache._scan_size()
+    assert cache.get("aa01") == entry
+
+
+def test_chunk_duration_respects_byte_limit(tmp_path):
+    """Test chunk length selection from the provider byte limit."""
+    stage = TranscribeStage(audio_dir=tmp_path, max_concurrency=4)
+    bytes_per_second = CHUNK_BITRATE_KBPS * 1000 / 8
+    max_seconds = stage._chunk_duration(0)  # Unknown duration: the byte-limited length
+    assert max_seconds * bytes_per_second < MAX_FILE_SIZE_BYTES
+
+    # The fewest chunks under the limit, evenly sized
+    assert stage._chunk_duration(6 * 3600) == 2701
+    assert stage._chunk_duration(3600) == 1801
+    assert stage._chunk_duration(max_seconds) == max_seconds
+    assert stage._chunk_duration(30) == 60
+
+    # Same split points whatever the concurrency, so re-runs hit the cache
+    assert TranscribeStage(audio_dir=tmp_path, max_concurrency=16)._chunk_duration(3600) == 1801
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_split_audio_single_pass(tmp_path):
+    """Test that the segment muxer produces ordered chunks with real offsets."""
+    wav = tmp_path / "tone.wav"
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-f", "lavfi",
+         "-i", "sine=frequency=440:sample_rate=16000:duration=300", str(wav)],
+        check=True,
+    )
+    stage = TranscribeStage(audio_dir=tmp_path, max_concurrency=4)
+
+    chunks = stage._split_audio(wav, 300)
+    try:
+        assert len(chunks) == 4
+        assert [round(offset) for _, offset in chunks] == [0, 76, 152, 228]
+    finally:
+        stage._cleanup_chunks(chunks)
+
+    assert not chunks[0][0].parent.exists()
+
+
+def test_save_transcript_bulk_inserts_segments(db_session, tmp_path):
+    """Segments are bulk-inserted and the word count comes from them."""
+    hearing = Hearing(state_code="FL", title="Bulk insert")
+    db_session.add(hearing)
+    db_session.flush()
+
+    segments = [
+        {"index": i, "start": i * 5.0, "end": i * 5.0 + 4.5, "text": f"segment {i} text"}
+        for i in range(2500)
+    ]
+    stage = TranscribeStage(audio_dir=tmp_path)
+    stage._save_transcript(hearing, "", segments, 0.25, db_session)
+
+    saved = (
+        db_session.query(TranscriptSegment)
+        .filter(TranscriptSegment.hearing_id == hearing.id)
+        .order_by(TranscriptSegment.segment_index)
+        .all()
+    )
+    assert len(saved) == 2500
+    assert saved[-1].text == "segment 2499 text"
+    assert hearing.word_count == 7500
+    assert hearing.full_text.startswith("segment 0 text segment 1 text")
+
+
+def test_copy_buffer_keeps_null_distinct_from_empty_string():
+    """COPY rows write None as a bare empty field and quote everything else."""
+    rows = [
+        {"text": 'say "hi"', "speaker_label": None, "note": "", "segment_index": 3, "meta": {"a": 1}},
+        {"text": "line\nbreak", "speaker_label": "A", "note": None, "segment_index": None, "meta": None},
+    ]
+    buffer = _copy_buffer(rows, ["text", "speaker_label", "note", "segment_index", "meta"])
+
+    assert buffer.read() == (
+        '"say ""hi""",,"","3","{""a"": 1}"\n'
+        '"line\nbreak","A",,,\n'
+    )